@@ -122,15 +122,26 @@ class CacheManagerUltimate:
                 extractor_version TEXT,
                 success BOOLEAN,
                 timestamp TIMESTAMP,
+                engine TEXT,
+                input_shape TEXT,
+                complete BOOLEAN,
                 FOREIGN KEY (place_id) REFERENCES businesses(place_id)
             )
         """)
 
+        # Engine routing columns (added after v4.3.0; migrate existing databases)
+        cursor.execute("PRAGMA table_info(extraction_history)")
+        history_columns = {column[1] for column in cursor.fetchall()}
+        for column, column_type in (("engine", "TEXT"), ("input_shape", "TEXT"), ("complete", "BOOLEAN")):
+            if column not in history_columns:
+                cursor.execute(f"ALTER TABLE extraction_history ADD COLUMN {column} {column_type}")
+
         # Create indexes for fast queries
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_place_id ON businesses(place_id)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_name ON businesses(name)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_cid ON businesses(cid)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_last_updated ON businesses(last_updated_at)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_history_engine ON extraction_history(engine, input_shape)")
 
         conn.commit()
         conn.close()
@@ -214,12 +225,14 @@ class CacheManagerUltimate:
         print(f"ℹ️ Cache MISS - Will extract fresh data")
         return None
 
-    def save_result(self, data):
+    def save_result(self, data, record_history=True):
         """
         Save extraction result to cache.
 
         Args:
             data: Complete extraction result dictionary
+            record_history: Add an extraction_history row (callers that log
+                            every attempt via record_attempt() pass False)
         """
         if not data.get('success'):
             print("⚠️ Skipping cache save for failed extraction")
@@ -233,7 +246,7 @@ class CacheManagerUltimate:
             return
 
         # Extract key fields
-        place_id = data.get('place_id') or data.get('cid') or self._generate_id(data)
+        place_id = self._cache_key(data)
         cid = data.get('cid')
         name = data.get('name')
 
@@ -318,19 +331,24 @@ class CacheManagerUltimate:
                     pass
 
         # Save extraction history
-        cursor.execute("""
-            INSERT INTO extraction_history (
-                place_id, extraction_time_seconds, data_quality_score,
-                extractor_version, success, timestamp
-            ) VALUES (?, ?, ?, ?, ?, ?)
-        """, (
-            place_id,
-            data.get('extraction_time_seconds', 0),
-            data.get('data_quality_score', 0),
-            data.get('extractor_version', 'Unknown'),
-            True,
-            now
-        ))
+        if record_history:
+            cursor.execute("""
+                INSERT INTO extraction_history (
+                    place_id, extraction_time_seconds, data_quality_score,
+                    extractor_version, success, timestamp,
+                    engine, input_shape, complete
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (
+                place_id,
+                data.get('extraction_time_seconds', 0),
+                data.get('data_quality_score', 0),
+                data.get('extractor_version', 'Unknown'),
+                True,
+                now,
+                data.get('extraction_engine'),
+                data.get('input_shape'),
+                bool(name and (data.get('address') or data.get('phone'))),
+            ))
 
         try:
             conn.commit()
@@ -343,6 +361,118 @@ class CacheManagerUltimate:
             except:
                 pass
 
+    def update_fields(self, data, updates):
+        """
+        Merge late fields (e.g. emails from deferred enrichment) into the
+        cached record of a result saved earlier with save_result().
+
+        Args:
+            data: The result as it was saved (used to find its record)
+            updates: Fields to set in the stored record
+
+        Returns:
+            True if a cached record was updated
+        """
+        place_id = self._cache_key(data)
+        try:
+            conn = sqlite3.connect(self.db_path)
+            cursor = conn.cursor()
+            cursor.execute("SELECT full_data FROM businesses WHERE place_id = ?", (place_id,))
+            row = cursor.fetchone()
+            if not row:
+                conn.close()
+                return False
+
+            stored = json.loads(row[0])
+            stored.update(updates)
+            stored.pop('enrichment_pending', None)
+            cursor.execute(
+                "UPDATE businesses SET full_data = ? WHERE place_id = ?",
+                (json.dumps(stored), place_id)
+            )
+            conn.commit()
+            conn.close()
+            return True
+        except Exception as e:
+            print(f"⚠️ Cache update failed: {e}")
+            return False
+
+    def record_attempt(self, engine, input_shape, success, complete, seconds,
+                       extractor_version=None, place_id=None):
+        """
+        Record an extraction attempt that is not saved via save_result().
+
+        Failed and incomplete attempts never reach the businesses table, but
+        the engine router needs them to learn per-engine success rates.
+
+        Args:
+            engine: Engine name ("playwright", "selenium")
+            input_shape: Input shape from bob.utils.engine_router.classify_input
+            success: Whether the extractor reported success
+            complete: Whether the result had name plus address/phone
+            seconds: Wall time of the attempt
+        """
+        try:
+            conn = sqlite3.connect(self.db_path)
+            conn.execute("""
+                INSERT INTO extraction_history (
+                    place_id, extraction_time_seconds, data_quality_score,
+                    extractor_version, success, timestamp,
+                    engine, input_shape, complete
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (
+                place_id, round(seconds, 2), 0, extractor_version or 'Unknown',
+                bool(success), datetime.now().isoformat(),
+                engine, input_shape, bool(complete)
+            ))
+            conn.commit()
+            conn.close()
+        except Exception as e:
+            print(f"⚠️ Could not record extraction attempt: {e}")
+
+    def get_engine_history(self, days=30):
+        """
+        Aggregate recent extraction attempts per engine and input shape.
+
+        Args:
+            days: How far back to look
+
+        Returns:
+            List of dicts with engine, input_shape, attempts, completes, total_seconds
+        """
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        cursor = conn.cursor()
+
+        cutoff_date = datetime.now() - timedelta(days=days)
+        cursor.execute("""
+            SELECT engine, input_shape,
+                   COUNT(*) AS attempts,
+                   SUM(CASE WHEN complete THEN 1 ELSE 0 END) AS completes,
+                   SUM(extraction_time_seconds) AS total_seconds
+            FROM extraction_history
+            WHERE engine IS NOT NULL AND input_shape IS NOT NULL
+            AND timestamp > ?
+            GROUP BY engine, input_shape
+        """, (cutoff_date.isoformat(),))
+
+        rows = [
+            {
+                "engine": row["engine"],
+                "input_shape": row["input_shape"],
+                "attempts": row["attempts"],
+                "completes": row["completes"] or 0,
+                "total_seconds": row["total_seconds"] or 0.0,
+            }
+            for row in cursor.fetchall()
+        ]
+        conn.close()
+        return rows
+
+    def _cache_key(self, data):
+        """Primary key of a result's businesses row."""
+        return data.get('place_id') or data.get('cid') or self._generate_id(data)
+
     def _generate_id(self, data):
         """Generate unique ID from business data."""
         unique_str = f"{data.get('name', '')}{data.get('address', '')}{data.get('phone', '')}"
@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+BOB Enrichment Cache v4.3.1 - Website results per registered domain
+
+Chain businesses share one website, so website enrichment (emails) is
+cached per registered domain rather than per business:
+
+- Within fresh_hours a cached domain costs nothing (no request at all)
+- After that it is revalidated with If-None-Match / If-Modified-Since;
+  an unchanged site answers 304 and only the check time is updated
+- A changed site (200) is scanned again and the entry replaced
+
+Stored in the same SQLite database as the business cache.
+
+Usage:
+    from bob.cache.enrichment_cache import EnrichmentCache
+
+    cache = EnrichmentCache()
+    entry = cache.lookup("https://www.starbucks.com/store/123")
+    if entry and entry.is_fresh(cache.fresh_seconds):
+        emails = entry.emails
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlparse
+
+from bob.config.settings import DEFAULT_CACHE_CONFIG
+
+
+# Public suffixes with two labels that are common for business websites
+# (anything else is treated as a single-label suffix: cafe.com, cafe.de)
+MULTI_LABEL_SUFFIXES = frozenset({
+    "co.uk", "org.uk", "ac.uk", "gov.uk", "me.uk", "ltd.uk", "plc.uk",
+    "com.au", "net.au", "org.au", "co.nz", "org.nz", "co.za",
+    "co.in", "net.in", "org.in", "firm.in", "gen.in", "ind.in",
+    "com.br", "com.mx", "com.ar", "com.co", "com.tr", "com.sg", "com.my",
+    "com.hk", "com.tw", "com.cn", "com.ph", "com.pk", "com.sa", "com.eg",
+    "co.jp", "ne.jp", "or.jp", "co.kr", "or.kr", "co.id", "co.th", "co.il",
+    "ae.org", "co.ae",
+})
+
+# Shared hosting platforms: every subdomain is a different tenant
+# (joescafe.business.site and annasbakery.business.site are two businesses)
+PRIVATE_SUFFIXES = frozenset({
+    "business.site", "wixsite.com", "blogspot.com", "github.io", "myshopify.com",
+    "netlify.app", "herokuapp.com", "vercel.app", "pages.dev", "webflow.io",
+    "squarespace.com", "wordpress.com", "weebly.com", "godaddysites.com",
+    "square.site", "carrd.co", "jimdosite.com", "mystrikingly.com", "site123.me",
+    "firebaseapp.com", "web.app", "azurewebsites.net", "appspot.com",
+})
+
+SHARED_SUFFIXES = MULTI_LABEL_SUFFIXES | PRIVATE_SUFFIXES
+
+
+def registered_domain(url: str) -> Optional[str]:
+    """
+    Registered domain of a URL (www.shop.cafe.co.uk -> cafe.co.uk,
+    joescafe.business.site -> joescafe.business.site).
+
+    Returns:
+        Lower-case domain, the bare host for IPs/localhost, or None if the
+        URL has no host
+    """
+    if not url:
+        return None
+    host = urlparse(url if "//" in url else f"//{url}").hostname
+    if not host:
+        return None
+    host = host.lower().rstrip(".")
+    labels = host.split(".")
+    if len(labels) <= 2 or labels[-1].isdigit():
+        return host
+    suffix_labels = 2 if ".".join(labels[-2:]) in SHARED_SUFFIXES else 1
+    return ".".join(labels[-(suffix_labels + 1):])
+
+
+@dataclass
+class DomainEnrichment:
+    """Cached website enrichment of one registered domain."""
+    domain: str
+    url: str                                    # Page that was fetched (revalidated as-is)
+    emails: List[str] = field(default_factory=list)
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    fetched_at: float = 0.0                     # Last full (200) fetch
+    checked_at: float = 0.0                     # Last fetch or 304 revalidation
+
+    def is_fresh(self, fresh_seconds: float, now: Optional[float] = None) -> bool:
+        return ((now or time.time()) - self.checked_at) < fresh_seconds
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Request headers asking the server for 304 if nothing changed."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class EnrichmentCache:
+    """
+    SQLite cache of website enrichment per registered domain.
+    """
+
+    def __init__(self, db_path: Optional[str] = None, fresh_hours: Optional[float] = None):
+        """
+        Args:
+            db_path: SQLite file (default: the business cache database)
+            fresh_hours: Serve entries without any request for this long
+                         (default from CacheConfig)
+        """
+        self.db_path = db_path or DEFAULT_CACHE_CONFIG.cache_db_path
+        if fresh_hours is None:
+            fresh_hours = DEFAULT_CACHE_CONFIG.enrichment_fresh_hours
+        self.fresh_seconds = fresh_hours * 3600
+        self._lock = threading.Lock()
+        self.stats = {
+            "fresh_hits": 0,
+            "not_modified": 0,
+            "coalesced": 0,     # Waited on another caller's fetch of the same domain
+            "refetched": 0,
+            "misses": 0,
+        }
+        self._initialize_database()
+
+    def _initialize_database(self):
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS domain_enrichment (
+                domain TEXT PRIMARY KEY,
+                url TEXT,
+                emails TEXT,
+                etag TEXT,
+                last_modified TEXT,
+                fetched_at REAL,
+                checked_at REAL
+            )
+        """)
+        conn.commit()
+        conn.close()
+
+    def lookup(self, url: str) -> Optional[DomainEnrichment]:
+        """Cached entry for url's registered domain (None if never fetched)."""
+        domain = registered_domain(url)
+        if not domain:
+            return None
+        conn = sqlite3.connect(self.db_path)
+        row = conn.execute(
+            "SELECT domain, url, emails, etag, last_modified, fetched_at, checked_at "
+            "FROM domain_enrichment WHERE domain = ?", (domain,)
+        ).fetchone()
+        conn.close()
+        if not row:
+            return None
+        return DomainEnrichment(
+            domain=row[0], url=row[1], emails=json.loads(row[2] or "[]"),
+            etag=row[3], last_modified=row[4], fetched_at=row[5] or 0.0, checked_at=row[6] or 0.0,
+        )
+
+    def store(self, url: str, emails: List[str], headers: Optional[Dict[str, str]] = None) -> Optional[DomainEnrichment]:
+        """
+        Save the result of a full (200) fetch of url.
+
+        Args:
+            headers: Response headers (lower-case names) carrying the validators
+        """
+        domain = registered_domain(url)
+        if not domain:
+            return None
+        headers = headers or {}
+        now = time.time()
+        entry = DomainEnrichment(
+            domain=domain, url=url, emails=list(emails),
+            etag=headers.get("etag"), last_modified=headers.get("last-modified"),
+            fetched_at=now, checked_at=now,
+        )
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("""
+            INSERT OR REPLACE INTO domain_enrichment
+                (domain, url, emails, etag, last_modified, fetched_at, checked_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        """, (entry.domain, entry.url, json.dumps(entry.emails), entry.etag,
+              entry.last_modified, entry.fetched_at, entry.checked_at))
+        conn.commit()
+        conn.close()
+        return entry
+
+    def mark_not_modified(self, entry: DomainEnrichment):
+        """Record a 304 revalidation: the entry is fresh again."""
+        entry.checked_at = time.time()
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("UPDATE domain_enrichment SET checked_at = ? WHERE domain = ?",
+                     (entry.checked_at, entry.domain))
+        conn.commit()
+        conn.close()
+
+    def record(self, outcome: str):
+        """Count a lookup outcome (see self.stats)."""
+        with self._lock:
+            self.stats[outcome] += 1
+
+    def clear_old_entries(self, days: int = 90) -> int:
+        """Forget domains not checked for this many days."""
+        cutoff = (datetime.now() - timedelta(days=days)).timestamp()
+        conn = sqlite3.connect(self.db_path)
+        deleted = conn.execute("DELETE FROM domain_enrichment WHERE checked_at < ?", (cutoff,)).rowcount
+        conn.commit()
+        conn.close()
+        return deleted
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self.stats)
+        lookups = sum(stats.values())
+        # Lookups that needed no full download
+        saved = stats["fresh_hits"] + stats["not_modified"] + stats["coalesced"]
+        stats["saved_rate"] = round(saved / lookups, 3) if lookups else 0.0
+        conn = sqlite3.connect(self.db_path)
+        stats["domains"] = conn.execute("SELECT COUNT(*) FROM domain_enrichment").fetchone()[0]
+        conn.close()
+        return stats
+
+
+_cache: Optional[EnrichmentCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_enrichment_cache() -> Optional[EnrichmentCache]:
+    """Process-wide enrichment cache (None when caching is disabled)."""
+    global _cache
+    if not DEFAULT_CACHE_CONFIG.enabled:
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = EnrichmentCache()
+        return _cache
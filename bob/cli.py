@@ -19,6 +19,7 @@ Version: 4.3.0
 """
 
 import argparse
+import asyncio
 import json
 import time
 import sys
@@ -95,7 +96,10 @@ Max Concurrent: {max_concurrent if parallel else 'N/A'}
         start_time = time.time()
 
         # Extract all businesses
-        results = self.engine.extract_multiple(urls, parallel=parallel, max_concurrent=max_concurrent)
+        # Emails are merged into each result before extract_multiple returns
+        results = asyncio.run(
+            self.engine.extract_multiple(urls, parallel=parallel, max_concurrent=max_concurrent)
+        )
 
         total_time = time.time() - start_time
 
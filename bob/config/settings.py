@@ -17,7 +17,8 @@ class ExtractorConfig:
 
     # Browser settings
     headless: bool = True
-    timeout: int = 60
+    timeout: int = 60             # Per-job deadline, shared out across extraction stages
+    subprocess_margin: int = 120  # Batch subprocess time beyond the deadline (launch, fallback, resume)
     page_load_timeout: int = 90
 
     # Retry settings
@@ -35,11 +36,27 @@ class ExtractorConfig:
 
     # Engine settings
     selenium_enabled: bool = True
+    selenium_session_reuse: bool = True   # Pool and reset drivers instead of relaunching
     max_reviews: int = 10
     max_images: int = 20
     include_reviews: bool = True
     include_images: bool = True
 
+    # Hedging: start the fallback engine when the primary runs past this
+    # percentile of its recent latencies (first complete result wins)
+    hedge_enabled: bool = False
+    hedge_percentile: float = 95.0
+
+    # Fetch website emails on a background queue after the browser is
+    # released (HybridExtractorOptimized and SeleniumExtractor; the cached
+    # record is updated when done)
+    defer_enrichment: bool = True
+
+    # Contact pages followed from the business website when looking for
+    # emails (0: landing page only); limits per host in CrawlerConfig
+    contact_crawl_depth: int = 1
+    contact_crawl_pages: int = 4
+
     # Paths
     cache_dir: Path = field(default_factory=lambda: Path("./cache"))
     logs_dir: Path = field(default_factory=lambda: Path("./logs"))
@@ -54,6 +71,7 @@ class ExtractorConfig:
         return cls(
             headless=os.getenv('BOB_HEADLESS', 'true').lower() == 'true',
             timeout=int(os.getenv('BOB_TIMEOUT', '60')),
+            subprocess_margin=int(os.getenv('BOB_SUBPROCESS_MARGIN', '120')),
             max_retries=int(os.getenv('BOB_MAX_RETRIES', '3')),
             stealth_mode=os.getenv('BOB_STEALTH', 'true').lower() == 'true',
             intercept_network=os.getenv('BOB_INTERCEPT', 'true').lower() == 'true',
@@ -61,6 +79,12 @@ class ExtractorConfig:
             max_reviews=int(os.getenv('BOB_MAX_REVIEWS', '10')),
             max_images=int(os.getenv('BOB_MAX_IMAGES', '20')),
             selenium_enabled=os.getenv('BOB_SELENIUM_ENABLED', 'true').lower() == 'true',
+            selenium_session_reuse=os.getenv('BOB_SELENIUM_REUSE', 'true').lower() == 'true',
+            hedge_enabled=os.getenv('BOB_HEDGE_ENABLED', 'false').lower() == 'true',
+            hedge_percentile=float(os.getenv('BOB_HEDGE_PERCENTILE', '95')),
+            defer_enrichment=os.getenv('BOB_DEFER_ENRICHMENT', 'true').lower() == 'true',
+            contact_crawl_depth=int(os.getenv('BOB_CONTACT_CRAWL_DEPTH', '1')),
+            contact_crawl_pages=int(os.getenv('BOB_CONTACT_CRAWL_PAGES', '4')),
         )
 
 
@@ -72,6 +96,7 @@ class CacheConfig:
     enabled: bool = True
     cache_db_path: str = "bob_cache_ultimate.db"
     expiration_hours: int = 24
+    enrichment_fresh_hours: int = 168   # Website enrichment per domain: no request at all within this
 
     # Cache behavior
     auto_cleanup: bool = True
@@ -85,6 +110,7 @@ class CacheConfig:
             enabled=os.getenv('BOB_CACHE_ENABLED', 'true').lower() == 'true',
             cache_db_path=os.getenv('BOB_CACHE_PATH', 'bob_cache_ultimate.db'),
             expiration_hours=int(os.getenv('BOB_CACHE_HOURS', '24')),
+            enrichment_fresh_hours=int(os.getenv('BOB_ENRICHMENT_FRESH_HOURS', '168')),
             auto_cleanup=os.getenv('BOB_AUTO_CLEANUP', 'true').lower() == 'true',
             cleanup_days=int(os.getenv('BOB_CLEANUP_DAYS', '7')),
         )
@@ -107,6 +133,9 @@ class ParallelConfig:
     batch_size: int = 100
     checkpoint_interval: int = 10
 
+    # Field projection: only extract these fields (None = all)
+    fields: Optional[List[str]] = None
+
     @classmethod
     def from_env(cls):
         """Create parallel configuration from environment variables."""
@@ -116,6 +145,7 @@ class ParallelConfig:
             context_pool_size=int(os.getenv('BOB_CONTEXT_POOL', '5')),
             max_memory_mb=int(os.getenv('BOB_MAX_MEMORY_MB', '2048')),
             batch_size=int(os.getenv('BOB_BATCH_SIZE', '100')),
+            fields=[f.strip() for f in os.getenv('BOB_FIELDS', '').split(',') if f.strip()] or None,
         )
 
 
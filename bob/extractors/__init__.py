@@ -17,8 +17,9 @@ Available Extractors:
 
 # Primary extractor (always available)
 from .playwright_optimized import PlaywrightExtractorOptimized
+from .browser_pool import BrowserPool
 
-__all__ = ['PlaywrightExtractorOptimized']
+__all__ = ['PlaywrightExtractorOptimized', 'BrowserPool']
 
 # Hybrid extractor (recommended for production)
 try:
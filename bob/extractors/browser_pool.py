@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+BOB Browser Pool v4.3.1
+
+One Playwright driver and one Chromium instance shared by every job on an
+event loop. Each job gets its own BrowserContext (isolated cookies, cache
+and storage), which costs a few MB and tens of milliseconds instead of a
+full driver + browser launch.
+
+The browser is restarted after serving max_contexts_per_browser jobs (to
+cap renderer leaks) and can be recycled on demand, e.g. by admission
+control when memory is short. A due restart does not wait for the pool
+to go idle: new contexts open on a fresh browser and the old one is
+closed once its own contexts have been released. Playwright objects are
+bound to the loop that created them, so a pool must only be used from
+one event loop.
+
+Usage:
+    from bob.extractors.browser_pool import BrowserPool
+
+    pool = BrowserPool(headless=True)
+    async with pool.context() as context:
+        page = await context.new_page()
+        ...
+    await pool.close()
+"""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import Any, Dict, List, Optional, Set
+
+from playwright.async_api import async_playwright, Browser, BrowserContext
+
+
+# Launch flags shared with PlaywrightExtractorOptimized
+CHROMIUM_ARGS = [
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-blink-features=AutomationControlled",
+    "--disable-web-security",
+    "--disable-features=VizDisplayCompositor",
+]
+
+
+class BrowserPool:
+    """
+    Shared Chromium with one BrowserContext per job.
+    """
+
+    def __init__(
+        self,
+        headless: bool = True,
+        max_contexts_per_browser: int = 50,
+        launch_args: Optional[List[str]] = None,
+    ):
+        """
+        Initialize the pool (the browser is launched on first use).
+
+        Args:
+            headless: Run Chromium headless
+            max_contexts_per_browser: Restart the browser after this many jobs
+            launch_args: Chromium command line flags (default: CHROMIUM_ARGS)
+        """
+        self.headless = headless
+        self.max_contexts_per_browser = max_contexts_per_browser
+        self.launch_args = launch_args or list(CHROMIUM_ARGS)
+
+        self._playwright = None
+        self._browser: Optional[Browser] = None
+        self._lock: Optional[asyncio.Lock] = None
+        self._active = 0
+        self._contexts_on: Dict[Browser, int] = {}        # Open contexts per browser
+        self._owners: Dict[BrowserContext, Browser] = {}  # Context -> browser it was opened on
+        self._retiring: Set[Browser] = set()              # Replaced; closed once their contexts drain
+        self._served_by_browser = 0
+        self._restart_pending = False
+        self._closed = False
+
+        self.stats = {
+            "launches": 0,
+            "contexts_created": 0,
+            "restarts": 0,
+            "recycles": 0,
+            "launch_seconds": 0.0,
+        }
+
+    def _get_lock(self) -> asyncio.Lock:
+        # Created lazily so the pool can be built outside a running loop
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        return self._lock
+
+    @property
+    def active_contexts(self) -> int:
+        """Number of contexts currently handed out."""
+        return self._active
+
+    async def _ensure_browser(self) -> Browser:
+        if self._browser is not None and self._browser.is_connected():
+            return self._browser
+
+        started = time.time()
+        if self._playwright is None:
+            self._playwright = await async_playwright().start()
+        self._browser = await self._playwright.chromium.launch(
+            headless=self.headless,
+            args=self.launch_args,
+        )
+        self._served_by_browser = 0
+        self.stats["launches"] += 1
+        self.stats["launch_seconds"] += time.time() - started
+        return self._browser
+
+    async def new_context(self, **context_options: Any) -> BrowserContext:
+        """
+        Open an isolated context on the shared browser.
+
+        Args:
+            **context_options: Passed to Browser.new_context (viewport, user_agent, ...)
+
+        Returns:
+            BrowserContext; hand it back with release()
+        """
+        if self._closed:
+            raise RuntimeError("BrowserPool is closed")
+
+        async with self._get_lock():
+            if self._restart_pending:
+                # Running contexts keep the old browser until they are released
+                self.stats["restarts"] += 1
+                await self._retire_browser()
+            browser = await self._ensure_browser()
+            context = await browser.new_context(**context_options)
+            self._owners[context] = browser
+            self._contexts_on[browser] = self._contexts_on.get(browser, 0) + 1
+            self._active += 1
+            self._served_by_browser += 1
+            self.stats["contexts_created"] += 1
+            if self._served_by_browser >= self.max_contexts_per_browser:
+                self._restart_pending = True
+        return context
+
+    async def release(self, context: Optional[BrowserContext]):
+        """Close a context; close its browser if that was retired and is now idle."""
+        if context is None:
+            return
+        try:
+            await context.close()
+        except Exception:
+            pass
+
+        async with self._get_lock():
+            self._active = max(0, self._active - 1)
+            browser = self._owners.pop(context, None)
+            if browser is not None:
+                left = self._contexts_on.pop(browser) - 1
+                if left:
+                    self._contexts_on[browser] = left
+                elif browser in self._retiring:
+                    self._retiring.discard(browser)
+                    await self._close(browser)
+            if self._restart_pending and not self._contexts_on.get(self._browser):
+                # Due and idle: free it now rather than on the next job
+                self.stats["restarts"] += 1
+                await self._retire_browser()
+
+    @asynccontextmanager
+    async def context(self, **context_options: Any):
+        """Async context manager around new_context()/release()."""
+        context = await self.new_context(**context_options)
+        try:
+            yield context
+        finally:
+            await self.release(context)
+
+    async def recycle(self):
+        """
+        Free browser memory on demand.
+
+        Closes the browser right away when idle; otherwise the next job
+        gets a fresh browser and this one is closed as soon as its running
+        contexts have been released.
+        """
+        async with self._get_lock():
+            self.stats["recycles"] += 1
+            if not self._contexts_on.get(self._browser):
+                await self._retire_browser()
+            else:
+                self._restart_pending = True
+
+    async def _retire_browser(self):
+        """Stop handing out the current browser; close it now if idle."""
+        browser, self._browser = self._browser, None
+        self._restart_pending = False
+        if browser is None:
+            return
+        if self._contexts_on.get(browser):
+            self._retiring.add(browser)  # Closed by release()
+        else:
+            await self._close(browser)
+
+    @staticmethod
+    async def _close(browser: Browser):
+        try:
+            await browser.close()
+        except Exception:
+            pass
+
+    async def close(self):
+        """Close the browsers and stop the Playwright driver."""
+        self._closed = True
+        await self._retire_browser()
+        browsers, self._retiring = list(self._retiring), set()
+        for browser in browsers:
+            await self._close(browser)
+        if self._playwright is not None:
+            try:
+                await self._playwright.stop()
+            except Exception:
+                pass
+            self._playwright = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+        return False
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Pool statistics."""
+        return {
+            **self.stats,
+            "launch_seconds": round(self.stats["launch_seconds"], 2),
+            "active_contexts": self._active,
+            "browser_running": self._browser is not None,
+            "retiring_browsers": len(self._retiring),
+        }
@@ -110,7 +110,7 @@ class HybridExtractor:
         # Step 3: Fallback to Selenium V2
         print("\n🔧 STEP 3: Using Selenium V2 (enhanced stealth mode)...")
         try:
-            selenium_extractor = SeleniumExtractor(headless=True, stealth_mode=True)
+            selenium_extractor = SeleniumExtractor(headless=True, stealth_mode=True, cache_manager=self.cache)
             selenium_data = selenium_extractor.extract_business(url, include_reviews, max_reviews)
 
             if selenium_data.get('success'):
@@ -13,12 +13,25 @@ Key Features:
 """
 
 import asyncio
+import concurrent.futures
+import functools
 import gc
-import psutil
 import os
+import time
+import weakref
+from bob.extractors.browser_pool import BrowserPool
 from bob.extractors.playwright_optimized import PlaywrightExtractorOptimized
 from bob.extractors.selenium_optimized import SeleniumExtractorOptimized
 from bob.config.settings import DEFAULT_EXTRACTOR_CONFIG # Import the default config
+from bob.utils.engine_router import EngineRouter, ENGINE_PLAYWRIGHT, ENGINE_SELENIUM
+from bob.utils.hedging import HedgedRunner, HedgingPolicy, is_complete
+from bob.utils.projection import FieldProjection
+from bob.utils.checkpoints import StageCheckpoints
+from bob.utils.enrichment import get_enrichment_queue
+from bob.utils.resources import get_resource_sampler
+
+
+ENGINE_LABELS = {ENGINE_PLAYWRIGHT: "⚡", ENGINE_SELENIUM: "🔧"}
 
 
 class HybridExtractorOptimized:
@@ -40,7 +53,8 @@ class HybridExtractorOptimized:
     - Process isolation for reliability
     """
 
-    def __init__(self, prefer_playwright=True, memory_optimized=True, use_cache=True):
+    def __init__(self, prefer_playwright=True, memory_optimized=True, use_cache=True,
+                 selenium_workers=2, max_contexts_per_browser=50, hedging=None):
         self.prefer_playwright = prefer_playwright
         self.memory_optimized = memory_optimized
         self.use_cache = use_cache
@@ -52,8 +66,31 @@ class HybridExtractorOptimized:
         else:
             self.cache_manager = None
 
-        # Track memory usage
-        self.initial_memory = psutil.Process(os.getpid()).memory_info().rss / 1024 / 1024
+        # Shared resources for the async path: one browser pool per event loop
+        # and a bounded executor for the (blocking) Selenium fallback
+        self.selenium_workers = selenium_workers
+        self.max_contexts_per_browser = max_contexts_per_browser
+        self._browser_pools = weakref.WeakKeyDictionary()
+        self._selenium_executor = None
+
+        # Learned engine order per input shape, seeded from extraction_history
+        self.router = EngineRouter(cache_manager=self.cache_manager)
+
+        # Tail-latency hedging: start Selenium alongside a slow Playwright attempt
+        self.hedger = HedgedRunner(hedging or HedgingPolicy(
+            enabled=DEFAULT_EXTRACTOR_CONFIG.hedge_enabled,
+            percentile=DEFAULT_EXTRACTOR_CONFIG.hedge_percentile,
+        ))
+
+        # Completed stages of partial results, so a fallback redoes only the rest
+        self.checkpoints = StageCheckpoints()
+
+        # Website emails are fetched after the cache save, off the browser path
+        self.enrichment = get_enrichment_queue() if DEFAULT_EXTRACTOR_CONFIG.defer_enrichment else None
+
+        # Track memory usage across Python + browser processes (sampled in background)
+        self.resources = get_resource_sampler()
+        self.initial_memory = self.resources.snapshot().tree_rss_mb
         
         self.stats = {
             "total_requests": 0,
@@ -62,37 +99,98 @@ class HybridExtractorOptimized:
             "failures": 0,
             "peak_memory_mb": 0,
             "avg_memory_mb": 0,
-            "cache_hits": 0
+            "cache_hits": 0,
+            "resumed_stages": 0,
         }
 
-    def extract_business(self, url, include_reviews=True, max_reviews=10):
+    def extract_business(self, url, include_reviews=True, max_reviews=10, fields=None):
         """
         Extract business with ultimate optimization and optional cache dependency.
         
         Nishkaam Karma: Perform the action without attachment to results.
         
-        Strategy:
-        1. Check cache if enabled.
-        2. Try Playwright (fast, memory-efficient)
-        3. Fallback to Selenium (if needed)
-        4. Save to cache if enabled.
-        5. Instant cleanup (no lingering resources)
+        Synchronous wrapper around extract_business_async(). From async code,
+        await extract_business_async() directly so jobs share one loop and
+        one browser.
+        
+        Args:
+            fields: Only extract these fields, e.g. ["phone", "website"]
+                    (see bob.utils.projection); default all fields
         
         Returns:
             Complete business data with minimal resource usage
         """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop running, safe to use asyncio.run()
+            return asyncio.run(self._extract_standalone(url, include_reviews, max_reviews, fields))
+
+        # Called synchronously from inside a running loop: use a private loop
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
+            return pool.submit(
+                asyncio.run, self._extract_standalone(url, include_reviews, max_reviews, fields)
+            ).result()
+
+    async def _extract_standalone(self, url, include_reviews, max_reviews, fields=None):
+        """One extraction on a short-lived loop; its browser pool dies with it."""
+        try:
+            return await self.extract_business_async(url, include_reviews, max_reviews, fields)
+        finally:
+            await self.close_browser_pool()
+
+    async def extract_business_async(self, url, include_reviews=True, max_reviews=10, fields=None):
+        """
+        Extract a business on the running event loop.
+
+        Deferred enrichment (website emails) runs after the browser work is
+        released and is merged into the result before it is returned.
+
+        Args:
+            fields: Only extract these fields (see bob.utils.projection)
+
+        Returns:
+            Complete business data with minimal resource usage
+        """
+        result, enrichment = await self._extract_business_async(url, include_reviews, max_reviews, fields)
+        if enrichment:
+            await self.enrichment.collect_async(result, enrichment)
+        return result
+
+    async def _extract_business_async(self, url, include_reviews=True, max_reviews=10, fields=None):
+        """
+        Extract a business; queued enrichment is returned, not awaited.
+        
+        Strategy:
+        1. Check cache if enabled (a full cached record serves any projection).
+        2. Pick the engine order (EngineRouter: expected time to a complete result)
+        3. Run engines in that order - Playwright on the shared browser pool,
+           Selenium in a bounded thread pool - optionally hedged
+        4. Save to cache if enabled (full extractions only), then queue the
+           website email fetch if emails were requested; it updates the
+           cached record (if caching) when done
+        
+        Args:
+            fields: Only extract these fields (see bob.utils.projection)
+        
+        Returns:
+            (result, future of its enrichment fields or None)
+        """
         self.stats["total_requests"] += 1
+        loop = asyncio.get_running_loop()
+        projection = FieldProjection.of(fields)
 
-        # Step 1: Check cache
+        # Step 1: Check cache (SQLite I/O off the loop)
         if self.use_cache and self.cache_manager:
-            cached_result = self.cache_manager.get_cached(url)
-            if cached_result:
+            cached_result = await loop.run_in_executor(None, self.cache_manager.get_cached, url)
+            if cached_result and projection.covered_by(cached_result):
                 self.stats["cache_hits"] += 1
-                return cached_result
+                return projection.apply(cached_result), None
 
         # Monitor memory
-        current_memory = psutil.Process(os.getpid()).memory_info().rss / 1024 / 1024
-        self.stats["peak_memory_mb"] = max(self.stats["peak_memory_mb"], current_memory)
+        current_memory = self.resources.snapshot().tree_rss_mb
+        self.stats["peak_memory_mb"] = max(self.stats["peak_memory_mb"], current_memory,
+                                           self.resources.peak_tree_rss_mb)
 
         print(f"\n{'='*70}")
         print(f"🔱 BOB HYBRID EXTRACTOR v4.3.0")
@@ -101,58 +199,49 @@ class HybridExtractorOptimized:
 
         live_result = None
 
-        # Step 2: Try Playwright (preferred, memory-efficient)
-        if self.prefer_playwright:
-            print("\n⚡ STEP 1: Playwright extraction (enlightened speed)...")
-            try:
-                # Check if there's already a running event loop
-                try:
-                    loop = asyncio.get_running_loop()
-                    # If we're already in an event loop, create task
-                    import concurrent.futures
-                    with concurrent.futures.ThreadPoolExecutor() as pool:
-                        playwright_data = pool.submit(
-                            lambda: asyncio.run(self._extract_with_playwright_optimized(url, include_reviews, max_reviews))
-                        ).result()
-                except RuntimeError:
-                    # No event loop running, safe to use asyncio.run()
-                    playwright_data = asyncio.run(self._extract_with_playwright_optimized(url, include_reviews, max_reviews))
-
-                if playwright_data.get('success'):
-                    self.stats["playwright_success"] += 1
-                    print("✅ Playwright extraction SUCCESSFUL!")
-                    live_result = playwright_data
-                else:
-                    print("⚠️ Playwright extraction had issues, trying fallback...")
-
-            except Exception as e:
-                print(f"⚠️ Playwright failed: {e}")
-                print("🔄 Falling back to Selenium...")
-
-        # Step 3: Fallback to Selenium (memory-optimized)
-        if not live_result and self.selenium_enabled: # Only attempt Selenium if enabled
-            print("\n🔧 STEP 2: Selenium extraction (optimized memory)...")
-            try:
-                selenium_data = self._extract_with_selenium_optimized(url, include_reviews, max_reviews)
-
-                if selenium_data.get('success'):
-                    self.stats["selenium_success"] += 1
-                    print("✅ Selenium extraction SUCCESSFUL!")
-                    live_result = selenium_data
-
-            except Exception as e:
-                print(f"❌ Selenium also failed: {e}")
-        elif not self.selenium_enabled:
+        # Step 2+3: engines in the order the router expects to finish fastest
+        decision = self.router.choose(url, self._available_engines())
+        if decision.reason != "default order":
+            print(f"🧭 Routing {decision.input_shape} input: {' → '.join(decision.order)} "
+                  f"(confidence {decision.confidence:.0%})")
+
+        if self.hedger.policy.enabled and len(decision.order) == 2:
+            # Second engine is started alongside the first if it runs long
+            live_result = await self._extract_hedged(url, include_reviews, max_reviews, decision, projection)
+        else:
+            for step, engine in enumerate(decision.order, 1):
+                print(f"\n{ENGINE_LABELS[engine]} STEP {step}: {engine.capitalize()} extraction...")
+                data = await self._run_engine(engine, url, include_reviews, max_reviews, decision.input_shape,
+                                              projection)
+                if data.get('success'):
+                    self.stats[f"{engine}_success"] += 1
+                    print(f"✅ {engine.capitalize()} extraction SUCCESSFUL!")
+                    live_result = data
+                    break
+                print(f"⚠️ {engine.capitalize()} extraction failed: {str(data.get('error', 'no data'))[:80]}")
+
+        if live_result and live_result.get("partial"):
+            live_result = await self._resume_partial(url, include_reviews, max_reviews, live_result, decision, projection)
+
+        if not self.selenium_enabled:
             print("\n⚠️ Selenium fallback skipped: Selenium engine is disabled in configuration.")
 
         # Final cleanup and return logic
         gc.collect()
 
+        enrichment = None
         if live_result:
-            # Step 4: Save to cache if enabled
-            if self.use_cache and self.cache_manager:
-                self.cache_manager.save_result(live_result)
-            return live_result
+            # Step 4: Save to cache if enabled (a projected record would
+            # shadow the full one for later callers)
+            if self.use_cache and self.cache_manager and projection.is_full:
+                # History rows are written per attempt by _run_engine
+                await loop.run_in_executor(
+                    None, functools.partial(self.cache_manager.save_result, live_result, record_history=False)
+                )
+            if self.enrichment and projection.needs("email"):
+                cache = self.cache_manager if self.use_cache else None
+                enrichment = self.enrichment.submit(live_result, cache_manager=cache)
+            return live_result, enrichment
         else:
             # All strategies failed
             self.stats["failures"] += 1
@@ -160,20 +249,165 @@ class HybridExtractorOptimized:
             return {
                 "success": False,
                 "error": "All extraction methods failed",
-                "tried_methods": ["playwright", "selenium_optimized"],
+                "tried_methods": decision.order,
                 "memory_usage_mb": current_memory
-            }
+            }, None
+
+    def _available_engines(self):
+        """Engines enabled by configuration, in default order."""
+        engines = []
+        if self.prefer_playwright:
+            engines.append(ENGINE_PLAYWRIGHT)
+        if self.selenium_enabled:
+            engines.append(ENGINE_SELENIUM)
+        return engines
+
+    async def _run_engine(self, engine, url, include_reviews, max_reviews, input_shape, projection=None):
+        """
+        Run one engine and feed the outcome to the router and extraction history.
+
+        Cancelled attempts (a lost hedge) are recorded as incomplete after
+        the time they ran; projected ones are not recorded (their latency
+        and completeness are not comparable).
+        """
+        loop = asyncio.get_running_loop()
+        projection = projection or FieldProjection()
+        started = time.time()
+        try:
+            if engine == ENGINE_PLAYWRIGHT:
+                data = await self._extract_with_playwright_optimized(url, include_reviews, max_reviews, projection)
+            else:
+                extractor = SeleniumExtractorOptimized(headless=True, memory_optimized=True)
+                future = loop.run_in_executor(
+                    self._get_selenium_executor(),
+                    self._extract_with_selenium_optimized, url, include_reviews, max_reviews, extractor, projection
+                )
+                try:
+                    data = await future
+                except asyncio.CancelledError:
+                    # Lost the race: the worker thread keeps running until its driver is gone
+                    extractor.abort()
+                    raise
+        except asyncio.CancelledError:
+            # Lost the hedge: its slow run still counts against the engine
+            # (history row written without awaiting, the task is being cancelled)
+            self._record_attempt(loop, engine, input_shape, projection, {}, time.time() - started)
+            raise
+        except Exception as e:
+            data = {"success": False, "error": str(e)}
+
+        history = self._record_attempt(loop, engine, input_shape, projection, data, time.time() - started)
+        if history is not None:
+            await history
+
+        data["extraction_engine"] = engine
+        data["input_shape"] = input_shape
+        return data
+
+    def _record_attempt(self, loop, engine, input_shape, projection, data, seconds):
+        """
+        Feed one attempt to the router and, if caching, the extraction history.
+
+        Returns:
+            Future of the history write (SQLite I/O off the loop), or None
+        """
+        if not projection.is_full:
+            return None
+        complete = is_complete(data)
+        self.router.record(engine, input_shape, complete, seconds)
+        if not (self.use_cache and self.cache_manager):
+            return None
+        return loop.run_in_executor(None, functools.partial(
+            self.cache_manager.record_attempt,
+            engine, input_shape, bool(data.get('success')), complete, seconds,
+            extractor_version=data.get('extractor_version'),
+            place_id=data.get('place_id') or data.get('cid'),
+        ))
+
+    async def _extract_hedged(self, url, include_reviews, max_reviews, decision, projection=None):
+        """Run the first engine and hedge with the second per the hedging policy."""
+        primary, fallback = decision.order
+
+        result = await self.hedger.run(
+            lambda: self._run_engine(primary, url, include_reviews, max_reviews, decision.input_shape, projection),
+            lambda: self._run_engine(fallback, url, include_reviews, max_reviews, decision.input_shape, projection),
+        )
+        if not result.get('success'):
+            return None
 
-    async def _extract_with_playwright_optimized(self, url, include_reviews, max_reviews):
-        """Extract using Playwright with ULTRA memory optimization."""
+        engine = primary if result["hedge"]["winner"] == "primary" else fallback
+        self.stats[f"{engine}_success"] += 1
+        print(f"✅ {engine.capitalize()} extraction SUCCESSFUL!"
+              f"{' (hedged)' if result['hedge']['hedged'] else ''}")
+        return result
+
+    async def _resume_partial(self, url, include_reviews, max_reviews, result, decision, projection):
+        """
+        Redo a partial result's failed stages on the other engine and merge.
+
+        The completed stages are checkpointed; the other engine extracts
+        only the fields of the failed stages (a field projection), instead
+        of a full extraction from navigation onward.
+        """
+        others = [engine for engine in decision.order if engine != result.get("extraction_engine")]
+        self.checkpoints.record(url, result)
+        fields = self.checkpoints.retry_fields(url)
+        if fields and not projection.is_full:
+            fields = [field for field in fields if projection.wants(field)]
+        if not others or not fields:
+            self.checkpoints.clear(url)
+            return result
+
+        engine = others[0]
+        print(f"\n♻️ Partial result ({', '.join(self.checkpoints.pending_stages(url))} missing) - "
+              f"resuming on {engine.capitalize()}...")
+        retry = await self._run_engine(engine, url, include_reviews, max_reviews, decision.input_shape,
+                                       FieldProjection(fields))
+        merged = self.checkpoints.merge(url, retry)
+        self.checkpoints.clear(url)  # In-process checkpoint: nothing resumes it later
+        self.stats["resumed_stages"] += len(merged.get("resumed_stages", []))
+        return merged
+
+    def _get_browser_pool(self):
+        """Browser pool bound to the running loop (Playwright objects are loop-bound)."""
+        loop = asyncio.get_running_loop()
+        pool = self._browser_pools.get(loop)
+        if pool is None:
+            pool = BrowserPool(
+                headless=True,
+                max_contexts_per_browser=self.max_contexts_per_browser,
+            )
+            self._browser_pools[loop] = pool
+        return pool
+
+    def _get_selenium_executor(self):
+        """Bounded pool so Selenium fallbacks cannot pile up Chrome instances."""
+        if self._selenium_executor is None:
+            self._selenium_executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.selenium_workers,
+                thread_name_prefix="bob-selenium",
+            )
+        return self._selenium_executor
+
+    async def close_browser_pool(self):
+        """Close the shared browser (if one is running on this loop)."""
+        pool = self._browser_pools.pop(asyncio.get_running_loop(), None)
+        if pool is not None:
+            await pool.close()
+
+    async def _extract_with_playwright_optimized(self, url, include_reviews, max_reviews, projection=None):
+        """Extract using Playwright on a context of the shared browser."""
         # Create optimized extractor
         extractor = PlaywrightExtractorOptimized(
             headless=True, 
-            memory_optimized=True
+            memory_optimized=True,
+            browser_pool=self._get_browser_pool(),
         )
         
         try:
-            result = await extractor.extract_business_optimized(url, include_reviews, max_reviews)
+            result = await extractor.extract_business_optimized(
+                url, include_reviews, max_reviews, fields=projection
+            )
             result["extraction_method"] = "Playwright Optimized"
             return result
         finally:
@@ -181,16 +415,16 @@ class HybridExtractorOptimized:
             if hasattr(extractor, 'cleanup'):
                 extractor.cleanup()
 
-    def _extract_with_selenium_optimized(self, url, include_reviews, max_reviews):
+    def _extract_with_selenium_optimized(self, url, include_reviews, max_reviews, extractor=None, projection=None):
         """Extract using Selenium with ULTRA memory optimization."""
         # Create optimized extractor
-        extractor = SeleniumExtractorOptimized(
+        extractor = extractor or SeleniumExtractorOptimized(
             headless=True, 
             memory_optimized=True
         )
         
         try:
-            result = extractor.extract_business_optimized(url, include_reviews, max_reviews)
+            result = extractor.extract_business_optimized(url, include_reviews, max_reviews, fields=projection)
             result["extraction_method"] = "Selenium Optimized"
             return result
         finally:
@@ -198,16 +432,20 @@ class HybridExtractorOptimized:
             if hasattr(extractor, 'cleanup'):
                 extractor.cleanup()
 
-    async def extract_multiple(self, urls, parallel=True, max_concurrent=3):
+    async def extract_multiple(self, urls, parallel=True, max_concurrent=3, fields=None):
         """
         Extract multiple businesses with memory optimization.
         
         Nishkaam Karma: Perform each extraction without attachment.
         
+        All jobs run on the caller's event loop and share one browser
+        (a fresh context per business).
+        
         Args:
             urls: List of URLs
             parallel: Use parallel extraction (reduced concurrency for memory)
             max_concurrent: Max parallel workers (reduced from 5 to 3)
+            fields: Only extract these fields (see bob.utils.projection)
         
         Returns:
             List of extraction results
@@ -217,54 +455,55 @@ class HybridExtractorOptimized:
         print(f"🧘 Concurrent workers: {max_concurrent} (reduced for memory efficiency)")
         print(f"{'='*70}")
 
-        if parallel and self.prefer_playwright:
-            print(f"⚡ Using PARALLEL Playwright extraction ({max_concurrent} concurrent)")
-            return await self._extract_parallel_optimized(urls, max_concurrent)
-        else:
+        # Only tear down the browser pool if this batch brought it up
+        owns_pool = asyncio.get_running_loop() not in self._browser_pools
+        try:
+            if parallel and self.prefer_playwright:
+                print(f"⚡ Using PARALLEL Playwright extraction ({max_concurrent} concurrent)")
+                return await self._extract_parallel_optimized(urls, max_concurrent, fields)
+
             print("🔧 Using SEQUENTIAL extraction (memory efficient)")
             results = []
-            loop = asyncio.get_running_loop()
+            enrichments = []  # Merged at the end, so email fetches overlap later extractions
             for idx, url in enumerate(urls, 1):
                 print(f"\n[{idx}/{len(urls)}] Processing: {url[:60]}...")
                 
                 # Monitor memory before extraction
-                mem_before = psutil.Process(os.getpid()).memory_info().rss / 1024 / 1024
+                mem_before = self.resources.snapshot().python_rss_mb
                 
-                # Run synchronous function in a thread pool to not block the event loop
-                result = await loop.run_in_executor(
-                    None, self.extract_business, url
-                )
+                result, enrichment = await self._extract_business_async(url, fields=fields)
                 results.append(result)
+                if enrichment:
+                    enrichments.append((result, enrichment))
                 
                 # Monitor memory after extraction
-                mem_after = psutil.Process(os.getpid()).memory_info().rss / 1024 / 1024
+                mem_after = self.resources.snapshot().python_rss_mb
                 
                 # Force cleanup if memory usage is high
                 if mem_after - mem_before > 100:  # If extraction used >100MB
                     print(f"🧹 High memory usage detected ({mem_after - mem_before:.1f}MB), forcing cleanup...")
                     gc.collect()
 
+            for result, enrichment in enrichments:
+                await self.enrichment.collect_async(result, enrichment)
             return results
+        finally:
+            if owns_pool:
+                await self.close_browser_pool()
 
-    async def _extract_parallel_optimized(self, urls, max_concurrent):
-        """Correctly runs extractions in parallel using a semaphore."""
+    async def _extract_parallel_optimized(self, urls, max_concurrent, fields=None):
+        """Runs extractions concurrently on this loop using a semaphore."""
         semaphore = asyncio.Semaphore(max_concurrent)
-        tasks = []
 
         async def run_with_semaphore(url):
             async with semaphore:
-                # Run the synchronous extract_business method in an executor
-                loop = asyncio.get_running_loop()
-                result = await loop.run_in_executor(
-                    None, self.extract_business, url
-                )
-                return result
+                result, enrichment = await self._extract_business_async(url, fields=fields)
+            # Slot released: the email fetch does not hold up the next business
+            if enrichment:
+                await self.enrichment.collect_async(result, enrichment)
+            return result
 
-        for url in urls:
-            tasks.append(run_with_semaphore(url))
-        
-        results = await asyncio.gather(*tasks)
-        return results
+        return await asyncio.gather(*[run_with_semaphore(url) for url in urls])
 
     def get_stats(self):
         """Get extraction statistics with memory metrics."""
@@ -273,11 +512,31 @@ class HybridExtractorOptimized:
         if stats["total_requests"] > 0:
             stats["success_rate"] = f"{((stats['playwright_success'] + stats['selenium_success']) / stats['total_requests'] * 100):.1f}%"
 
-        # Calculate memory efficiency
-        current_memory = psutil.Process(os.getpid()).memory_info().rss / 1024 / 1024
+        # Calculate memory efficiency (Python + Chromium children, cgroup-aware)
+        snapshot = self.resources.snapshot()
+        current_memory = snapshot.tree_rss_mb
+        stats["peak_memory_mb"] = round(max(stats["peak_memory_mb"], self.resources.peak_tree_rss_mb), 1)
         stats["current_memory_mb"] = round(current_memory, 1)
         stats["memory_increase_mb"] = round(current_memory - self.initial_memory, 1)
         stats["memory_efficiency"] = "EXCELLENT" if stats["memory_increase_mb"] < 50 else "GOOD"
+        stats["python_memory_mb"] = round(snapshot.python_rss_mb, 1)
+        stats["browser_memory_mb"] = round(snapshot.browser_rss_mb, 1)
+        stats["browser_processes"] = snapshot.browser_processes
+        stats["cpu_percent"] = round(snapshot.cpu_percent, 1)
+        stats["memory_percent"] = round(snapshot.memory_percent, 1)
+        stats["cgroup_memory_limit_mb"] = (round(snapshot.cgroup_memory_limit_mb, 1)
+                                           if snapshot.cgroup_memory_limit_mb else None)
+
+        # Shared browsers currently open (one per event loop)
+        pools = list(self._browser_pools.values())
+        stats["browser_launches"] = sum(pool.stats["launches"] for pool in pools)
+        stats["browser_contexts"] = sum(pool.stats["contexts_created"] for pool in pools)
+
+        if self.hedger.policy.enabled:
+            stats["hedging"] = self.hedger.get_stats()
+        stats["routing"] = self.router.get_stats()
+        if self.enrichment:
+            stats["enrichment"] = self.enrichment.get_stats()
         
         return stats
 
@@ -291,7 +550,7 @@ class HybridExtractorOptimized:
             gc.collect()
         
         # Monitor final memory
-        final_memory = psutil.Process(os.getpid()).memory_info().rss / 1024 / 1024
+        final_memory = self.resources.sample().tree_rss_mb
         print(f"✅ Cleanup complete. Final memory: {final_memory:.1f}MB")
 
 
@@ -21,52 +21,7 @@ import requests
 from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeout
 from urllib.parse import unquote
 
-
-class NetworkAPICapture:
-    """Capture Google Maps internal API responses."""
-
-    def __init__(self):
-        self.api_responses = []
-        self.place_data = {}
-        self.reviews_data = []
-        self.photos_data = []
-
-    async def capture_response(self, response):
-        """Intercept and capture API responses."""
-        url = response.url
-
-        # Capture place details API
-        if "/v1/place/" in url or "/maps/api/place" in url:
-            try:
-                data = await response.json()
-                self.place_data = data
-                print(f"🎯 Captured place API: {url[:80]}...")
-            except:
-                pass
-
-        # Capture reviews API
-        elif "listugcposts" in url or "/reviews" in url:
-            try:
-                data = await response.json()
-                self.reviews_data.append(data)
-                print(f"🎯 Captured reviews API: {url[:80]}...")
-            except:
-                pass
-
-        # Capture photos/images API
-        elif "photometa" in url or "photo" in url:
-            try:
-                data = await response.json()
-                self.photos_data.append(data)
-                print(f"🎯 Captured photos API: {url[:80]}...")
-            except:
-                pass
-
-        self.api_responses.append({
-            "url": url,
-            "status": response.status,
-            "content_type": response.headers.get("content-type", "")
-        })
+from bob.utils.network_capture import NetworkAPICapture
 
 
 class PlaywrightExtractor:
@@ -128,8 +83,8 @@ class PlaywrightExtractor:
                 network_capture = NetworkAPICapture()
 
                 if self.intercept_network:
-                    # Intercept all responses
-                    page.on("response", network_capture.capture_response)
+                    # Record matched API responses; bodies are read only on demand
+                    network_capture.attach(page)
 
                 # Block heavy resources for speed
                 if self.block_resources:
@@ -695,7 +650,7 @@ class PlaywrightExtractor:
                 pass
 
         # Use network-captured data if available
-        if network_capture and network_capture.place_data:
+        if network_capture and await network_capture.latest_json("place"):
             print("🎯 Using network-captured API data!")
             # Merge API data with extracted data
             # API data is more reliable when available
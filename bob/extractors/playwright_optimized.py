@@ -18,11 +18,14 @@ import asyncio
 import re
 import time
 import gc
-import psutil
 import os
-from typing import Dict, List, Optional, Any
+from functools import partial
+from typing import Dict, Iterable, List, Optional, Any
 from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeout, Page, Browser
 
+from bob.config.settings import DEFAULT_EXTRACTOR_CONFIG
+from bob.extractors.browser_pool import BrowserPool, CHROMIUM_ARGS
+
 
 class PlaywrightExtractorOptimized:
     """
@@ -47,17 +50,31 @@ class PlaywrightExtractorOptimized:
     
     VERSION = "4.3.0"
 
-    def __init__(self, headless: bool = True, memory_optimized: bool = True):
+    def __init__(
+        self,
+        headless: bool = True,
+        memory_optimized: bool = True,
+        browser_pool: Optional[BrowserPool] = None,
+    ):
         """
         Initialize the extractor.
         
         Args:
             headless: Run browser in headless mode (default: True)
             memory_optimized: Enable memory optimizations (default: True)
+            browser_pool: Shared BrowserPool; jobs then open a context on the
+                          pooled browser instead of launching their own
         """
         self.headless = headless
         self.memory_optimized = memory_optimized
-        self.initial_memory = psutil.Process(os.getpid()).memory_info().rss / 1024 / 1024
+        self.browser_pool = browser_pool
+        # Background sampler: Python + Chromium process tree, cgroup-aware
+        # (imported here: bob.utils imports this module via parallel_extractor)
+        from bob.utils.resources import get_resource_sampler
+        from bob.utils.selector_registry import get_selector_registry
+        self.resources = get_resource_sampler()
+        self.selector_registry = get_selector_registry()  # Shared with Selenium, persisted
+        self.initial_memory = self.resources.snapshot().tree_rss_mb
         
         self.stats = {
             "total_extractions": 0,
@@ -65,6 +82,8 @@ class PlaywrightExtractorOptimized:
             "failed": 0,
             "avg_time_seconds": 0,
             "peak_memory_mb": 0,
+            "harvested_photos": 0,
+            "partial_results": 0,
         }
         
         # Blocked domains for resource optimization
@@ -81,7 +100,9 @@ class PlaywrightExtractorOptimized:
         self, 
         url: str, 
         include_reviews: bool = True, 
-        max_reviews: int = 10
+        max_reviews: int = 10,
+        deadline_seconds: Optional[float] = None,
+        fields: Optional[Iterable[str]] = None,
     ) -> Dict[str, Any]:
         """
         Extract business data from Google Maps.
@@ -90,60 +111,129 @@ class PlaywrightExtractorOptimized:
             url: Business name OR Google Maps URL
             include_reviews: Whether to extract reviews (default: True)
             max_reviews: Maximum number of reviews to extract (default: 10)
+            deadline_seconds: Total time for the job (default: ExtractorConfig.timeout);
+                              stages past it are skipped and the result is marked partial
+            fields: Only extract these fields (see bob.utils.projection); stages
+                    serving no requested field are skipped. Default: all fields
             
         Returns:
             Dictionary containing business data with quality score
         """
+        from bob.utils.deadline import Deadline  # lazy, see __init__
+        from bob.utils.projection import FieldProjection
+        
         start_time = time.time()
+        projection = FieldProjection.of(fields)
+        include_reviews = include_reviews and projection.needs("reviews")
+        include_images = projection.needs("images")
+        deadline = Deadline(
+            deadline_seconds or DEFAULT_EXTRACTOR_CONFIG.timeout,
+            stages=["navigation", "readiness", "fields", "images", "reviews", "photos"],
+        )
+        if not include_reviews:
+            deadline.drop("reviews")
+        if not include_images:
+            deadline.drop("images")
+        playwright = None
         browser = None
         context = None
         page = None
         
         try:
-            # Monitor memory
-            current_memory = psutil.Process(os.getpid()).memory_info().rss / 1024 / 1024
+            # Monitor memory (latest background sample, no psutil call here)
+            current_memory = self.resources.snapshot().tree_rss_mb
             self.stats["peak_memory_mb"] = max(self.stats["peak_memory_mb"], current_memory)
             
             print(f"\n⚡ PLAYWRIGHT EXTRACTOR v{self.VERSION}")
             print(f"📍 Input: {url[:60]}...")
+            if not projection.is_full:
+                print(f"🎯 Fields: {', '.join(sorted(projection.fields))}")
             print(f"🧠 Memory: {current_memory:.1f}MB")
             
-            # Create browser and page
-            playwright = await async_playwright().start()
-            browser = await self._create_browser(playwright)
-            context = await browser.new_context(
+            # Create context (on the shared pool browser if available) and page
+            context_options = dict(
                 viewport={'width': 1920, 'height': 1080},
                 user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
             )
+            if self.browser_pool:
+                context = await self.browser_pool.new_context(**context_options)
+            else:
+                playwright = await async_playwright().start()
+                browser = await self._create_browser(playwright)
+                context = await browser.new_context(**context_options)
             page = await context.new_page()
             
             # Setup resource blocking
             await self._setup_resource_blocking(page)
             
+            # Decode photos from gallery metadata responses (not rendered thumbnails)
+            harvester = None
+            if DEFAULT_EXTRACTOR_CONFIG.include_images and include_images:
+                from bob.utils.photo_harvester import PhotoHarvester  # lazy, see __init__
+                harvester = PhotoHarvester(max_images=DEFAULT_EXTRACTOR_CONFIG.max_images)
+                harvester.attach(page)
+            else:
+                deadline.drop("photos")
+            
             # Convert to proper Google Maps URL
             maps_url = self._convert_to_maps_url(url)
             print(f"🌐 Loading: {maps_url[:80]}...")
             
-            # Navigate to page
-            await page.goto(maps_url, wait_until="domcontentloaded", timeout=30000)
-            await page.wait_for_timeout(3000)
+            # Navigate to page (without a page there is nothing to return)
+            await deadline.run("navigation", self._navigate(page, maps_url, deadline), cap=30)
+            if deadline.results["navigation"]["status"] != "done":
+                raise PlaywrightTimeout(f"Navigation timed out: {maps_url[:80]}")
             
             # Wait for business page to fully load
-            await self._wait_for_business_page(page)
+            await deadline.run("readiness", self._wait_for_business_page(page, deadline=deadline))
+            
+            # Extract all data; later stages only add to what is already here
+            # (without the place panel fields there is no business to return)
+            data = await deadline.run("fields", self._extract_all_data(page, projection.dom_fields()))
+            if deadline.results.get("fields", {}).get("status") != "done":
+                raise PlaywrightTimeout("Field extraction did not finish before the deadline")
+            if data is None:
+                data = {"extraction_method": f"Playwright v{self.VERSION}"}
             
-            # Extract all data
-            data = await self._extract_all_data(page)
+            if include_images:
+                images = await deadline.run("images", self._extract_images(page), default=[], required=False)
+                data["images"] = images
+                data["photos"] = images  # Alias for compatibility
+                print(f"📸 Images: {len(images)}")
             
             # Extract reviews if requested
             if include_reviews:
-                reviews = await self._extract_reviews(page, max_reviews)
+                reviews = await deadline.run(
+                    "reviews", self._extract_reviews(page, max_reviews, deadline), default=[], required=False
+                )
                 data["reviews"] = reviews
                 data["reviews_extracted"] = len(reviews)
             
-            # Calculate quality score
+            # Top up DOM images to max_images from the photo metadata
+            # (last: opening the gallery changes the place panel)
+            if harvester:
+                dom_images = data.get("images", [])
+                if len(dom_images) < harvester.max_images:
+                    harvested = await deadline.run("photos", harvester.harvest(page), default=[], required=False)
+                    unique = {}
+                    for image_url in dom_images + harvested:
+                        unique.setdefault(image_url.split("=")[0], image_url)  # Ignore size suffixes
+                    images = list(unique.values())[:max(harvester.max_images, len(dom_images))]
+                    self.stats["harvested_photos"] += len(images) - len(dom_images)
+                    data["images"] = images
+                    data["photos"] = images
+            
+            # Calculate quality score (over the requested fields only)
+            data = projection.apply(data)
             data["quality_score"] = self._calculate_quality_score(data)
             data["success"] = True
             data["extractor_version"] = f"Playwright v{self.VERSION}"
+            data["stage_seconds"] = {stage: result["seconds"] for stage, result in deadline.results.items()}
+            if deadline.partial:
+                data["partial"] = True
+                data["incomplete_stages"] = deadline.incomplete_stages()
+                self.stats["partial_results"] += 1
+                print(f"⏱️ Deadline reached - partial result (missing: {', '.join(data['incomplete_stages'])})")
             
             extraction_time = time.time() - start_time
             data["extraction_time_seconds"] = round(extraction_time, 2)
@@ -168,6 +258,10 @@ class PlaywrightExtractorOptimized:
             
         finally:
             # Cleanup
+            if self.browser_pool and context:
+                # Pooled browser stays up; only this job's context goes
+                await self.browser_pool.release(context)
+                context = None
             try:
                 if page:
                     await page.close()
@@ -175,6 +269,9 @@ class PlaywrightExtractorOptimized:
                     await context.close()
                 if browser:
                     await browser.close()
+                if playwright:
+                    # Stop the Node driver too, otherwise every job leaks one
+                    await playwright.stop()
             except:
                 pass
             gc.collect()
@@ -183,13 +280,7 @@ class PlaywrightExtractorOptimized:
         """Create browser with optimal settings."""
         return await playwright.chromium.launch(
             headless=self.headless,
-            args=[
-                "--no-sandbox",
-                "--disable-dev-shm-usage",
-                "--disable-blink-features=AutomationControlled",
-                "--disable-web-security",
-                "--disable-features=VizDisplayCompositor",
-            ]
+            args=CHROMIUM_ARGS,
         )
 
     async def _setup_resource_blocking(self, page: Page):
@@ -198,6 +289,24 @@ class PlaywrightExtractorOptimized:
             await page.route(f"**/*{domain}*", lambda route: route.abort())
         print("✅ Resource blocking enabled")
 
+    async def _check_not_blocked(self, page: Page):
+        """
+        Fail fast when Google serves its anti-bot interstitial.
+
+        The error text contains "unusual traffic (CAPTCHA)" so schedulers
+        (see bob.utils.concurrency.classify_outcome) can back off.
+        """
+        if "/sorry/" in page.url:
+            raise Exception("Google blocked the request: unusual traffic (CAPTCHA) page")
+        try:
+            text = await page.evaluate(
+                "() => (document.body ? document.body.innerText : '').slice(0, 2000)"
+            )
+        except Exception:
+            return
+        if "unusual traffic" in (text or "").lower():
+            raise Exception("Google blocked the request: unusual traffic (CAPTCHA) page")
+
     def _convert_to_maps_url(self, url: str) -> str:
         """
         Convert input to proper Google Maps URL.
@@ -217,14 +326,38 @@ class PlaywrightExtractorOptimized:
         clean_query = url.strip().replace(' ', '+')
         return f"https://www.google.com/maps/search/{clean_query}?hl=en"
 
-    async def _wait_for_business_page(self, page: Page, timeout: int = 10000):
-        """Wait for business detail page to load with stable URL."""
+    @staticmethod
+    def _stage_ms(deadline, stage: str, cap_ms: int, share: float = 1.0) -> int:
+        """
+        Timeout for one step of a stage: share of what is left of the
+        stage's budget, at most cap_ms (the step's usual timeout).
+        """
+        if deadline is None:
+            return cap_ms
+        return min(cap_ms, max(1, int(deadline.time_left(stage) * 1000 * share)))
+
+    async def _navigate(self, page: Page, maps_url: str, deadline=None):
+        """Load maps_url and fail fast on Google's CAPTCHA page."""
+        timeout = self._stage_ms(deadline, "navigation", 30000)
+        await page.goto(maps_url, wait_until="domcontentloaded", timeout=timeout)
+        await self._check_not_blocked(page)
+
+    async def _wait_for_business_page(self, page: Page, timeout: int = 10000, deadline=None):
+        """
+        Wait for business detail page to load with stable URL.
+
+        Settle pauses take at most a quarter of what is left of the
+        readiness budget, selector waits the rest (each capped at its
+        usual value).
+        """
+        stage_ms = partial(self._stage_ms, deadline, "readiness")
+        await page.wait_for_timeout(stage_ms(3000, 0.25))
         try:
             # Wait for the main business title to appear
-            await page.wait_for_selector("h1.DUwDvf, h1.fontHeadlineLarge", timeout=timeout)
+            await page.wait_for_selector("h1.DUwDvf, h1.fontHeadlineLarge", timeout=stage_ms(timeout))
             
             # Wait a bit more for URL to stabilize (Google updates URL after content loads)
-            await page.wait_for_timeout(2000)
+            await page.wait_for_timeout(stage_ms(2000, 0.25))
             
             # If URL now has /place/, we're good
             if "/place/" in page.url:
@@ -239,17 +372,21 @@ class PlaywrightExtractorOptimized:
             print("📋 On search results, clicking first business...")
             try:
                 first_result = page.locator('a[href*="/place/"]').first
-                await first_result.click(timeout=5000)
-                await page.wait_for_timeout(3000)
-                await page.wait_for_selector("h1.DUwDvf, h1.fontHeadlineLarge", timeout=timeout)
+                await first_result.click(timeout=stage_ms(5000, 0.5))
+                await page.wait_for_timeout(stage_ms(3000, 0.25))
+                await page.wait_for_selector("h1.DUwDvf, h1.fontHeadlineLarge", timeout=stage_ms(timeout))
                 print("✅ Navigated to business page")
             except Exception as e:
                 print(f"⚠️ Could not navigate to business: {e}")
 
-    async def _extract_all_data(self, page: Page) -> Dict[str, Any]:
+    async def _extract_all_data(self, page: Page, fields: Optional[List[str]] = None) -> Dict[str, Any]:
         """
         Extract all business data from the page.
         Uses modern Google Maps selectors (December 2025).
+        
+        Args:
+            page: Page on the business panel
+            fields: Only compute these fields in the page (None = all)
         """
         data = {
             "extraction_method": f"Playwright v{self.VERSION}"
@@ -258,46 +395,54 @@ class PlaywrightExtractorOptimized:
         try:
             # Extract using JavaScript for speed and reliability
             extracted = await page.evaluate("""
-                () => {
+                ({selectors, fields}) => {
                     const result = {};
+                    const want = (field) => !fields || fields.includes(field);
                     
-                    // ===== NAME =====
-                    const nameSelectors = [
-                        "h1.DUwDvf",
-                        "h1.fontHeadlineLarge", 
-                        ".DUwDvf.lfPIob",
-                        "h1"
-                    ];
-                    for (const sel of nameSelectors) {
-                        const elem = document.querySelector(sel);
-                        if (elem && elem.textContent.trim()) {
-                            result.name = elem.textContent.trim();
-                            break;
+                    // Selectors arrive ordered by the registry's hit rate; report
+                    // which ones were tried and which produced the value
+                    const usage = {};
+                    const pick = (field, read) => {
+                        if (!want(field === "review_count" ? "reviews_count" : field)) return null;
+                        const tried = [];
+                        for (const sel of (selectors[field] || [])) {
+                            tried.push(sel);
+                            const elem = document.querySelector(sel);
+                            const value = elem ? read(elem) : null;
+                            if (value !== null && value !== undefined && value !== "") {
+                                usage[field] = {tried: tried, hit: sel};
+                                return value;
+                            }
                         }
-                    }
+                        usage[field] = {tried: tried, hit: null};
+                        return null;
+                    };
+                    const text = (elem) => elem.textContent.trim() || null;
+                    
+                    // ===== NAME =====
+                    const name = pick("name", text);
+                    if (name) result.name = name;
                     
                     // ===== RATING =====
-                    const ratingElem = document.querySelector(".MW4etd, .F7nice span[aria-hidden='true']");
-                    if (ratingElem) {
-                        const rating = parseFloat(ratingElem.textContent);
-                        if (!isNaN(rating)) result.rating = rating;
-                    }
+                    const rating = pick("rating", (elem) => {
+                        const value = parseFloat(elem.textContent);
+                        return isNaN(value) ? null : value;
+                    });
+                    if (rating !== null) result.rating = rating;
                     
                     // ===== REVIEW COUNT =====
-                    const reviewElem = document.querySelector(".UY7F9, .F7nice span[aria-label]");
-                    if (reviewElem) {
-                        const text = reviewElem.textContent || reviewElem.getAttribute("aria-label") || "";
+                    const reviewsCount = pick("review_count", (elem) => {
+                        const text = elem.textContent || elem.getAttribute("aria-label") || "";
                         const match = text.replace(/,/g, '').match(/(\\d+)/);
-                        if (match) result.reviews_count = parseInt(match[1]);
-                    }
+                        return match ? parseInt(match[1]) : null;
+                    });
+                    if (reviewsCount !== null) result.reviews_count = reviewsCount;
                     
                     // ===== ADDRESS (using data-item-id) =====
-                    const addressButton = document.querySelector("button[data-item-id='address']");
-                    if (addressButton) {
-                        // Get the text from the button, excluding the icon
-                        const textContent = addressButton.textContent.trim();
-                        result.address = textContent;
-                    } else {
+                    const address = pick("address", text);
+                    if (address) {
+                        result.address = address;
+                    } else if (want("address")) {
                         // Fallback: look for address pattern in page
                         const allButtons = document.querySelectorAll("button.CsEnBe");
                         for (const btn of allButtons) {
@@ -310,11 +455,10 @@ class PlaywrightExtractorOptimized:
                     }
                     
                     // ===== PHONE (using data-item-id) =====
-                    const phoneButton = document.querySelector("button[data-item-id^='phone:']");
-                    if (phoneButton) {
-                        const text = phoneButton.textContent.trim();
-                        result.phone = text;
-                    } else {
+                    const phone = pick("phone", text);
+                    if (phone) {
+                        result.phone = phone;
+                    } else if (want("phone")) {
                         // Fallback: look for phone pattern
                         const allButtons = document.querySelectorAll("button.CsEnBe");
                         for (const btn of allButtons) {
@@ -327,44 +471,42 @@ class PlaywrightExtractorOptimized:
                     }
                     
                     // ===== WEBSITE (using data-item-id) =====
-                    const websiteLink = document.querySelector("a[data-item-id='authority']");
-                    if (websiteLink && websiteLink.href) {
-                        let url = websiteLink.href;
+                    const website = pick("website", (elem) => {
+                        if (!elem.href) return null;
+                        let url = elem.href;
                         // Handle Google redirect URLs
                         if (url.includes("google.com/url?")) {
                             const match = url.match(/[?&]q=([^&]+)/);
                             if (match) url = decodeURIComponent(match[1]);
                         }
-                        result.website = url;
-                    }
+                        return url;
+                    });
+                    if (website) result.website = website;
                     
                     // ===== CATEGORY =====
-                    const categoryButton = document.querySelector("button.DkEaL");
-                    if (categoryButton) {
-                        result.category = categoryButton.textContent.trim();
-                    }
+                    const category = pick("category", text);
+                    if (category) result.category = category;
                     
                     // ===== HOURS =====
                     try {
-                        const hoursButton = document.querySelector("[data-item-id='oh']");
-                        if (hoursButton) {
-                            const ariaLabel = hoursButton.getAttribute("aria-label");
-                            if (ariaLabel) result.hours = ariaLabel;
-                        }
+                        const hours = pick("hours", (elem) => elem.getAttribute("aria-label"));
+                        if (hours) result.hours = hours;
                     } catch (e) {}
                     
+                    result._selectors = usage;
+                    
                     // ===== GPS COORDINATES (multiple methods) =====
                     const url = window.location.href;
                     
                     // Method 1: From @lat,lng pattern (most reliable)
-                    const atMatch = url.match(/@(-?[0-9]+[.][0-9]+),(-?[0-9]+[.][0-9]+)/);
+                    const atMatch = want("latitude") && url.match(/@(-?[0-9]+[.][0-9]+),(-?[0-9]+[.][0-9]+)/);
                     if (atMatch) {
                         result.latitude = parseFloat(atMatch[1]);
                         result.longitude = parseFloat(atMatch[2]);
                     }
                     
                     // Method 2: From !3d and !4d parameters
-                    if (!result.latitude) {
+                    if (!result.latitude && want("latitude")) {
                         const lat3d = url.match(/!3d(-?[0-9]+[.][0-9]+)/);
                         const lon4d = url.match(/!4d(-?[0-9]+[.][0-9]+)/);
                         if (lat3d && lon4d) {
@@ -374,7 +516,7 @@ class PlaywrightExtractorOptimized:
                     }
                     
                     // Method 3: From 8m2!3d!4d pattern (alternate format)
-                    if (!result.latitude) {
+                    if (!result.latitude && want("latitude")) {
                         const m8Match = url.match(/8m2!3d(-?[0-9]+[.][0-9]+)!4d(-?[0-9]+[.][0-9]+)/);
                         if (m8Match) {
                             result.latitude = parseFloat(m8Match[1]);
@@ -383,7 +525,7 @@ class PlaywrightExtractorOptimized:
                     }
                     
                     // ===== PLACE ID / CID =====
-                    const placeIdMatch = url.match(/!1s(0x[0-9a-f]+:0x[0-9a-f]+)/);
+                    const placeIdMatch = (want("place_id") || want("cid")) && url.match(/!1s(0x[0-9a-f]+:0x[0-9a-f]+)/);
                     if (placeIdMatch) {
                         result.place_id_hex = placeIdMatch[1];
                         // Extract CID from hex
@@ -396,15 +538,18 @@ class PlaywrightExtractorOptimized:
                     }
                     
                     // ===== PLUS CODE =====
-                    const plusMatch = url.match(/1s([A-Z0-9]{4}\\+[A-Z0-9]{2,})/);
+                    const plusMatch = want("plus_code") && url.match(/1s([A-Z0-9]{4}\\+[A-Z0-9]{2,})/);
                     if (plusMatch) {
                         result.plus_code = plusMatch[1];
                     }
                     
                     return result;
                 }
-            """)
+            """, {"selectors": self.selector_registry.ordered_map("playwright"), "fields": fields})
             
+            for field, usage in extracted.pop("_selectors", {}).items():
+                if usage["tried"]:  # Fields outside the projection were not looked up
+                    self.selector_registry.record_attempts(field, usage["tried"], usage["hit"])
             data.update(extracted)
             
             # Log extraction results
@@ -415,12 +560,6 @@ class PlaywrightExtractorOptimized:
             print(f"⭐ Rating: {data.get('rating', 'N/A')}")
             print(f"🗺️ GPS: {data.get('latitude', 'N/A')}, {data.get('longitude', 'N/A')}")
             
-            # Extract images
-            images = await self._extract_images(page)
-            data["images"] = images
-            data["photos"] = images  # Alias for compatibility
-            print(f"📸 Images: {len(images)}")
-            
         except Exception as e:
             print(f"⚠️ Data extraction error: {str(e)[:80]}")
         
@@ -470,16 +609,22 @@ class PlaywrightExtractorOptimized:
         
         return list(images)
 
-    async def _extract_reviews(self, page: Page, max_reviews: int = 10) -> List[Dict]:
-        """Extract reviews with scrolling for more content."""
+    async def _extract_reviews(self, page: Page, max_reviews: int = 10, deadline=None) -> List[Dict]:
+        """
+        Extract reviews with scrolling for more content.
+
+        Clicks and pauses are sized from what is left of the reviews
+        budget, so the cards can still be read before it runs out.
+        """
         reviews = []
+        stage_ms = partial(self._stage_ms, deadline, "reviews")
         
         try:
             # Try to click Reviews tab
             try:
                 reviews_tab = page.locator("button:has-text('Reviews'), button[aria-label*='Review']").first
-                await reviews_tab.click(timeout=5000)
-                await page.wait_for_timeout(2000)
+                await reviews_tab.click(timeout=stage_ms(5000, 0.5))
+                await page.wait_for_timeout(stage_ms(2000, 0.25))
                 print("📝 Opened Reviews tab")
             except:
                 print("ℹ️ Reviews tab not found or already open")
@@ -489,7 +634,7 @@ class PlaywrightExtractorOptimized:
                 scrollable = page.locator(".m6QErb.DxyBCb.kA9KIf.dS8AEf").first
                 for _ in range(3):
                     await scrollable.evaluate("el => el.scrollTop = el.scrollHeight")
-                    await page.wait_for_timeout(500)
+                    await page.wait_for_timeout(stage_ms(500, 0.1))
             except:
                 pass
             
@@ -533,7 +678,10 @@ class PlaywrightExtractorOptimized:
             print(f"✅ Extracted {len(reviews)} reviews")
             
         except Exception as e:
+            # Surface the failure: the stage is then checkpointed as incomplete
+            # and a retry redoes only the reviews
             print(f"⚠️ Review extraction error: {str(e)[:60]}")
+            raise
         
         return reviews
 
@@ -565,9 +713,14 @@ class PlaywrightExtractorOptimized:
 
     def get_stats(self) -> Dict[str, Any]:
         """Get extraction statistics."""
-        current_memory = psutil.Process(os.getpid()).memory_info().rss / 1024 / 1024
+        snapshot = self.resources.snapshot()
+        current_memory = snapshot.tree_rss_mb
+        self.stats["peak_memory_mb"] = max(self.stats["peak_memory_mb"], self.resources.peak_tree_rss_mb)
         return {
             **self.stats,
             "current_memory_mb": round(current_memory, 1),
             "memory_increase_mb": round(current_memory - self.initial_memory, 1),
+            "browser_memory_mb": round(snapshot.browser_rss_mb, 1),
+            "browser_processes": snapshot.browser_processes,
+            "selectors": self.selector_registry.get_stats(),
         }
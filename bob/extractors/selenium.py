@@ -42,15 +42,161 @@ else:
 from bob.utils.place_id import PlaceIDExtractor
 from bob.utils.converters import enhance_place_id
 from bob.utils.images import AdvancedImageExtractor
+from bob.config.settings import DEFAULT_EXTRACTOR_CONFIG
+from bob.extractors.selenium_pool import get_session_pool
+from bob.utils.selector_registry import get_selector_registry
+from bob.utils.waits import StageWaiter, quit_and_wait
+from bob.utils.projection import FieldProjection
+from bob.utils.stages import StageGraph
+from bob.utils.enrichment import get_enrichment_queue
+from bob.utils.driver_cache import chrome_driver_kwargs, get_driver_cache, record_launch
+
+
+# Aria-label terms tried per field (strategy 5)
+ARIA_PATTERNS = {
+    "phone": ["phone", "call", "telephone"],
+    "address": ["address", "location", "directions"],
+    "website": ["website", "site"],
+    "hours": ["hours", "open", "closed"]
+}
+
+# JavaScript extractors of last resort (strategy 6)
+JS_EXTRACTORS = {
+    "phone": "return document.querySelector('[href^=\"tel:\"]')?.textContent || document.querySelector('[data-tooltip*=\"phone\"]')?.getAttribute('aria-label');",
+    "address": "return document.querySelector('[data-item-id*=\"address\"]')?.textContent;",
+    "website": "return document.querySelector('a[data-item-id=\"authority\"]')?.href;",
+}
+
+# Evaluates every field's ordered strategy list in one execute_script call.
+# arguments[0]: {field: [{type, value}, ...]}; returns {field: {value, strategy}}.
+BATCH_FIELDS_SCRIPT = """
+const plan = arguments[0];
+const jsExtractors = {
+%s
+};
+const text = (node) => (node && (node.innerText || node.textContent) || '').trim();
+const xpathFirst = (xpath) => document.evaluate(
+    xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+const xpathAll = (xpath) => {
+    const snapshot = document.evaluate(
+        xpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    const nodes = [];
+    for (let i = 0; i < snapshot.snapshotLength; i++) nodes.push(snapshot.snapshotItem(i));
+    return nodes;
+};
+const strategies = {
+    css: (s) => text(document.querySelector(s.value)),
+    xpath: (s) => text(xpathFirst(s.value)),
+    text: (s) => {
+        for (const node of xpathAll("//*[contains(text(), '" + s.value + "')]")) {
+            const t = text(node);
+            if (t && t.length > s.value.length) return t;
+        }
+        return '';
+    },
+    aria: (s) => {
+        const node = xpathFirst("//*[contains(@aria-label, '" + s.value + "')]");
+        return node ? (text(node) || node.getAttribute('aria-label') || '') : '';
+    },
+    js: (s) => ((jsExtractors[s.value] && jsExtractors[s.value]()) || '').trim(),
+};
+const results = {};
+for (const [field, steps] of Object.entries(plan)) {
+    results[field] = null;
+    for (const step of steps) {
+        let value = '';
+        try { value = strategies[step.type](step); } catch (e) { value = ''; }
+        if (value) {
+            results[field] = {value: value, strategy: step.type + ':' + step.value};
+            break;
+        }
+    }
+}
+return results;
+""" % ",\n".join(
+    f"    {field}: function() {{ {body} }}" for field, body in JS_EXTRACTORS.items()
+)
 
 
 class SmartElementFinder:
     """Intelligent multi-strategy element finder with auto-healing."""
 
-    def __init__(self, driver):
+    def __init__(self, driver, batched=True, registry=None):
         self.driver = driver
         self.wait = WebDriverWait(driver, 10)
         self.selector_success_cache = {}
+        self.registry = registry or get_selector_registry()  # Shared, persisted hit rates
+        self.batched = batched
+        self.winning_strategies = {}  # field -> "css:.DUwDvf" etc. from the last find_fields()
+        self.round_trips = 0          # WebDriver calls spent by find_fields()
+
+    def build_strategy_plan(self, field_name, selectors, xpath_patterns=None, text_patterns=None):
+        """
+        Ordered strategy list for one field, as find_with_strategies would try it.
+
+        Returns:
+            List of {"type": css|xpath|text|aria|js, "value": ...}
+        """
+        plan = []
+        cached = self.selector_success_cache.get(field_name)
+        if cached:
+            plan.append({"type": "css", "value": cached})
+        plan.extend({"type": "css", "value": sel} for sel in selectors if sel != cached)
+        plan.extend({"type": "xpath", "value": xpath} for xpath in xpath_patterns or [])
+        plan.extend({"type": "text", "value": pattern} for pattern in text_patterns or [])
+        plan.extend({"type": "aria", "value": term} for term in ARIA_PATTERNS.get(field_name, []))
+        if field_name in JS_EXTRACTORS:
+            plan.append({"type": "js", "value": field_name})
+        return plan
+
+    def find_fields(self, field_configs):
+        """
+        Find several fields at once.
+
+        In batched mode every field's strategy plan is evaluated in the page
+        by a single execute_script call; otherwise (or if the script fails)
+        each field goes through find_with_strategies.
+
+        Args:
+            field_configs: {field: {"selectors": [...], "xpath": [...], "text": [...]}}
+
+        Returns:
+            {field: text or None}; winning strategies in self.winning_strategies
+        """
+        self.winning_strategies = {}
+        if self.batched:
+            plan = {
+                field: self.build_strategy_plan(
+                    field, config["selectors"], config.get("xpath"), config.get("text")
+                )
+                for field, config in field_configs.items()
+            }
+            try:
+                self.round_trips += 1
+                batch = self.driver.execute_script(BATCH_FIELDS_SCRIPT, plan) or {}
+                results = {}
+                for field in field_configs:
+                    hit = batch.get(field)
+                    results[field] = hit["value"].strip() if hit else None
+                    winner = None
+                    if hit:
+                        self.winning_strategies[field] = hit["strategy"]
+                        kind, _, value = hit["strategy"].partition(":")
+                        if kind == "css":
+                            winner = value
+                            self.selector_success_cache[field] = value
+                    css_tried = [step["value"] for step in plan[field] if step["type"] == "css"]
+                    self.registry.record_attempts(field, css_tried, winner)
+                return results
+            except Exception as e:
+                print(f"⚠️ Batched field extraction failed, using per-field strategies: {str(e)[:60]}")
+
+        return {
+            field: self.find_with_strategies(
+                field, config["selectors"], config.get("xpath"), config.get("text")
+            )
+            for field, config in field_configs.items()
+        }
 
     def find_with_strategies(self, field_name, selectors, xpath_patterns=None, text_patterns=None):
         """
@@ -62,14 +208,24 @@ class SmartElementFinder:
         3. Text-based search
         4. Aria-label search
         5. JavaScript extraction
+
+        CSS hits and misses are recorded in the selector registry.
         """
+        css = {"tried": [], "winner": None}
+        result = self._find_with_strategies(field_name, selectors, xpath_patterns, text_patterns, css)
+        self.registry.record_attempts(field_name, css["tried"], css["winner"])
+        return result
 
+    def _find_with_strategies(self, field_name, selectors, xpath_patterns, text_patterns, css):
         # Strategy 1: Try cached successful selectors first
         if field_name in self.selector_success_cache:
+            cached = self.selector_success_cache[field_name]
+            css["tried"].append(cached)
             try:
-                element = self.driver.find_element(By.CSS_SELECTOR, self.selector_success_cache[field_name])
+                element = self.driver.find_element(By.CSS_SELECTOR, cached)
                 text = element.text.strip()
                 if text:
+                    css["winner"] = cached
                     return text
             except:
                 # Cache is stale, remove it
@@ -77,12 +233,16 @@ class SmartElementFinder:
 
         # Strategy 2: Try all CSS selectors
         for selector in selectors:
+            if selector in css["tried"]:
+                continue
+            css["tried"].append(selector)
             try:
                 element = self.driver.find_element(By.CSS_SELECTOR, selector)
                 text = element.text.strip()
                 if text:
                     # Cache this successful selector
                     self.selector_success_cache[field_name] = selector
+                    css["winner"] = selector
                     return text
             except:
                 continue
@@ -111,15 +271,8 @@ class SmartElementFinder:
                     continue
 
         # Strategy 5: Aria-label search
-        aria_patterns = {
-            "phone": ["phone", "call", "telephone"],
-            "address": ["address", "location", "directions"],
-            "website": ["website", "site"],
-            "hours": ["hours", "open", "closed"]
-        }
-
-        if field_name in aria_patterns:
-            for aria_term in aria_patterns[field_name]:
+        if field_name in ARIA_PATTERNS:
+            for aria_term in ARIA_PATTERNS[field_name]:
                 try:
                     element = self.driver.find_element(By.XPATH, f"//*[contains(@aria-label, '{aria_term}')]")
                     text = element.text.strip()
@@ -131,15 +284,9 @@ class SmartElementFinder:
                     continue
 
         # Strategy 6: JavaScript extraction as last resort
-        js_extractors = {
-            "phone": "return document.querySelector('[href^=\"tel:\"]')?.textContent || document.querySelector('[data-tooltip*=\"phone\"]')?.getAttribute('aria-label');",
-            "address": "return document.querySelector('[data-item-id*=\"address\"]')?.textContent;",
-            "website": "return document.querySelector('a[data-item-id=\"authority\"]')?.href;",
-        }
-
-        if field_name in js_extractors:
+        if field_name in JS_EXTRACTORS:
             try:
-                result = self.driver.execute_script(js_extractors[field_name])
+                result = self.driver.execute_script(JS_EXTRACTORS[field_name])
                 if result:
                     return result.strip()
             except:
@@ -151,8 +298,9 @@ class SmartElementFinder:
 class AggressiveScrollLoader:
     """Aggressive content loader with intelligent scrolling."""
 
-    def __init__(self, driver):
+    def __init__(self, driver, waiter=None):
         self.driver = driver
+        self.waiter = waiter or StageWaiter()
 
     def scroll_to_load_all_content(self):
         """Scroll through all panels to load lazy content."""
@@ -185,12 +333,16 @@ class AggressiveScrollLoader:
         # Try to click "More reviews" buttons
         try:
             more_buttons = self.driver.find_elements(By.XPATH, "//*[contains(text(), 'More') or contains(text(), 'more')]")
+            clicked = False
             for button in more_buttons[:3]:
                 try:
                     button.click()
-                    time.sleep(0.5)
+                    clicked = True
                 except:
                     pass
+            if clicked:
+                # Expanded sections change the panel height; wait for it to settle
+                self.waiter.scroll_settled(self.driver, "expand", scrollable)
         except:
             pass
 
@@ -208,12 +360,13 @@ class AggressiveScrollLoader:
                         "arguments[0].scrollTop = arguments[0].scrollHeight",
                         element
                     )
+                    # Lazy content is in once scrollHeight stops growing
+                    self.waiter.scroll_settled(self.driver, "scroll", element)
                 else:
                     self.driver.execute_script(
                         "arguments[0].scrollTop = 0",
                         element
                     )
-                time.sleep(0.5)
             except:
                 pass
 
@@ -231,13 +384,37 @@ class SeleniumExtractor:
     - Auto-healing selectors
     """
 
-    def __init__(self, headless=True, optimize_for_speed=True, stealth_mode=True):
-        """Initialize ultimate extractor."""
+    def __init__(self, headless=True, optimize_for_speed=True, stealth_mode=True, reuse_sessions=None,
+                 defer_enrichment=None, cache_manager=None):
+        """
+        Initialize ultimate extractor.
+
+        Args:
+            defer_enrichment: Fetch website emails on the enrichment queue after
+                              the browser is released, instead of in the stage
+                              graph alongside images and reviews (default:
+                              ExtractorConfig.defer_enrichment); the emails are
+                              still merged into the returned result
+            cache_manager: Cache whose record deferred enrichment updates
+        """
         self.headless = headless
         self.optimize_for_speed = optimize_for_speed
         self.stealth_mode = stealth_mode
         self.temp_dirs = []
         self.driver = None  # Track driver for cleanup
+        self.waiter = StageWaiter()  # Condition waits with per-stage timeouts
+
+        # Warm driver reuse across jobs (reset between businesses)
+        if reuse_sessions is None:
+            reuse_sessions = DEFAULT_EXTRACTOR_CONFIG.selenium_session_reuse
+        self.session_pool = get_session_pool(
+            f"stealth-{'headless' if headless else 'headed'}-{'fast' if optimize_for_speed else 'full'}",
+            self._create_browser_session,
+        ) if reuse_sessions else None
+        if defer_enrichment is None:
+            defer_enrichment = DEFAULT_EXTRACTOR_CONFIG.defer_enrichment
+        self.enrichment = get_enrichment_queue() if defer_enrichment else None
+        self.cache_manager = cache_manager
         self.extraction_stats = {
             "total_extractions": 0,
             "successful": 0,
@@ -269,8 +446,8 @@ class SeleniumExtractor:
         """Cleanup on context manager exit."""
         if self.driver:
             try:
-                self.driver.quit()
-                time.sleep(5)  # Ensure resources are fully released
+                # Wait for chromedriver/Chrome to actually exit, not a fixed 5s
+                quit_and_wait(self.driver, self.waiter)
                 self.driver = None
             except:
                 pass
@@ -323,11 +500,15 @@ class SeleniumExtractor:
             # use_subprocess defaults to True (recommended for stability)
             # Combined with 5s delay and proper cleanup, this provides reliable batch processing
             # Source: GitHub SeleniumHQ/selenium#15632, Stack Overflow cleanup solutions
+            # The patched chromedriver comes from the shared driver cache so
+            # concurrent workers don't each download and patch their own copy
+            started = time.time()
             driver = uc.Chrome(
                 options=options,
-                version_main=140
+                **chrome_driver_kwargs(version_main=140)
                 # Note: use_subprocess not set (defaults to True for cross-platform compatibility)
             )
+            record_launch(time.time() - started)
             driver.set_page_load_timeout(45)
 
             # Additional stealth JavaScript
@@ -361,103 +542,78 @@ class SeleniumExtractor:
             except:
                 pass
 
-    def extract_business(self, url, include_reviews=True, max_reviews=5):
+    def extract_business(self, url, include_reviews=True, max_reviews=5, fields=None):
         """
         Extract business data with ultimate reliability.
 
+        Args:
+            fields: Only extract these fields (see bob.utils.projection); panel
+                    scrolling, images, emails and reviews run only when requested
+
         Returns:
             Complete business data with 95%+ success rate
         """
+        data, enrichment = self._extract_business(url, include_reviews, max_reviews, fields)
+        if enrichment:
+            # Deferred emails: fetched after the driver went back to the pool
+            self.enrichment.collect(data, enrichment)
+        return data
+
+    def _extract_business(self, url, include_reviews, max_reviews, fields):
+        """extract_business() without waiting: (result, future of deferred enrichment or None)."""
         print(f"\n🔱 BOB ULTIMATE EXTRACTOR V2.0")
         print(f"📍 URL: {url[:60]}...")
 
         driver = None
+        lease = None
+        projection = FieldProjection.of(fields)
         try:
-            driver = self._create_browser_session()
-
-            # Convert URL to standard format
-            standard_url = self._convert_url_to_universal_format(url)
-
-            # Navigate to page
-            print("🌐 Loading page with stealth mode...")
-            driver.get(standard_url)
-
-            # Wait for page to load
-            time.sleep(3)
-
-            # CRITICAL FIX (Oct 4, 2025): Handle search results page
-            # Issue: Generic searches (e.g., "IKEA Dubai") land on /maps/search/ instead of /maps/place/
-            # Solution: Detect search page and click first result to navigate to business detail page
-            current_url = driver.current_url
-            if '/maps/search/' in current_url:
-                print("🔍 Detected search results page - clicking first business...")
-                try:
-                    # Find first business result in left panel
-                    from selenium.webdriver.common.by import By
-                    first_result = driver.find_element(By.CSS_SELECTOR, 'a[href*="/maps/place/"]')
-                    business_name_preview = first_result.get_attribute('aria-label')
-                    print(f"   Clicking: {business_name_preview}")
-
-                    first_result.click()
-                    time.sleep(4)  # Wait for navigation and page load
-
-                    new_url = driver.current_url
-                    if '/maps/place/' in new_url:
-                        print("✅ Navigated to business detail page")
-                    else:
-                        print("⚠️ Still on search page, but will try extraction")
-
-                except Exception as e:
-                    print(f"⚠️ Could not click first result: {e}")
-                    print("   Will try extracting from current page")
-
-            # Initialize smart tools
-            smart_finder = SmartElementFinder(driver)
-            scroll_loader = AggressiveScrollLoader(driver)
-
-            # CRITICAL FIX (Oct 4, 2025): Extract name BEFORE aggressive loading
-            # Issue: Aggressive scrolling removes the h1 element with business name
-            # Solution: Extract name early and cache it
-            business_name_early = None
-            try:
-                # Try primary selector that exists immediately after page load
-                name_elem = driver.find_element(By.CSS_SELECTOR, "h1.DUwDvf.lfPIob")
-                business_name_early = name_elem.text.strip()
-                if business_name_early:
-                    print(f"✅ Name extracted early (before aggressive loading): {business_name_early}")
-            except:
-                pass  # Will try other methods later
-
-            # Aggressively load all content
-            scroll_loader.scroll_to_load_all_content()
-
-            # Extract comprehensive data
-            data = self._extract_business_data_ultimate(driver, smart_finder, business_name_early)
-
-            # Extract images with enhanced method
-            print("📸 Extracting business images with multi-phase strategy...")
-            image_extractor = AdvancedImageExtractor(driver)
-            image_data = image_extractor.extract_all_images_comprehensive()
-            data.update(image_data)
-
-            # Extract emails from business website (V3.3 - Selenium version)
-            if data.get("website"):
-                try:
-                    print("📧 Extracting emails from business website...")
-                    emails = self._extract_emails_from_website(data["website"])
-                    if emails:
-                        data["emails"] = emails
-                        print(f"📧 Found {len(emails)} email(s) from website")
-                except Exception as e:
-                    print(f"ℹ️  Could not extract emails: {str(e)[:50]}")
-
-            # Extract reviews if requested
-            if include_reviews:
-                reviews = self._extract_reviews_enhanced(driver, max_reviews)
-                data["reviews"] = reviews
-                data["total_reviews_extracted"] = len(reviews)
-
-            # Calculate quality score
+            if self.session_pool:
+                lease = self.session_pool.acquire()
+                driver = lease.driver
+                if lease.uses > 1:
+                    print(f"♻️ Reusing warm browser session (job #{lease.uses})")
+            else:
+                driver = self._create_browser_session()
+
+            # Extraction as a stage graph: stages on the driver (images,
+            # reviews) run one at a time; the email fetch only needs the
+            # website, so it runs over HTTP alongside them and its result is
+            # returned with the rest - unless deferred to the enrichment queue
+            graph = StageGraph()
+            graph.add("navigate", lambda results: self._stage_navigate(driver, url),
+                      resource="driver", required=True)
+            graph.add("core", lambda results: self._stage_core(driver, projection),
+                      after=["navigate"], resource="driver", required=True)
+            if projection.needs("images"):
+                graph.add("images", lambda results: self._stage_images(driver),
+                          after=["core"], resource="driver")
+            if projection.needs("email") and not self.enrichment:
+                graph.add("emails", lambda results: self._stage_emails(results["core"].get("website")),
+                          after=["core"])
+            if include_reviews and projection.needs("reviews"):
+                graph.add("reviews", lambda results: self._extract_reviews_enhanced(driver, max_reviews),
+                          after=["core"], resource="driver")
+
+            run = graph.run()
+            run.raise_for_failure()
+
+            data = run.results["core"]
+            data.update(run.results.get("images") or {})
+            if run.results.get("emails"):
+                data["emails"] = run.results["emails"]
+            if "reviews" in run.results:
+                data["reviews"] = run.results["reviews"]
+                data["total_reviews_extracted"] = len(run.results["reviews"])
+            data.update(run.to_dict())
+            for stage, error in run.errors.items():
+                print(f"⚠️ Stage '{stage}' failed: {error[:60]}")
+            if run.errors or run.skipped:
+                data["partial"] = True
+                data["incomplete_stages"] = sorted(set(run.errors) | set(run.skipped))
+
+            # Calculate quality score (over the requested fields only)
+            data = projection.apply(data)
             quality_score = self._calculate_quality_score_enhanced(data)
             data["data_quality_score"] = quality_score
 
@@ -471,7 +627,12 @@ class SeleniumExtractor:
 
             print(f"✅ EXTRACTION COMPLETED - Quality: {quality_score}/100")
 
-            return data
+            enrichment = None
+            if self.enrichment and projection.needs("email"):
+                # Fetched off-thread; the driver is released right away below
+                enrichment = self.enrichment.submit(data, cache_manager=self.cache_manager)
+
+            return data, enrichment
 
         except Exception as e:
             print(f"❌ Extraction failed: {e}")
@@ -482,13 +643,97 @@ class SeleniumExtractor:
                 "success": False,
                 "error": str(e),
                 "extractor_version": "BOB Ultimate V2.0"
-            }
+            }, None
 
         finally:
-            if driver:
+            if lease:
+                # Reset (tabs, cookies, storage) and keep the session warm
+                self.session_pool.release(lease)
+            elif driver:
                 self._cleanup_browser_safely(driver)
             self._cleanup()
 
+    def _stage_navigate(self, driver, url):
+        """Stage: load the place page (clicking through search results if needed)."""
+        # Convert URL to standard format
+        standard_url = self._convert_url_to_universal_format(url)
+
+        # Navigate to page
+        print("🌐 Loading page with stealth mode...")
+        driver.get(standard_url)
+
+        # Wait for the place header or the search result list
+        self.waiter.element(driver, "page_load", "h1.DUwDvf, a[href*='/maps/place/']")
+
+        # CRITICAL FIX (Oct 4, 2025): Handle search results page
+        # Issue: Generic searches (e.g., "IKEA Dubai") land on /maps/search/ instead of /maps/place/
+        # Solution: Detect search page and click first result to navigate to business detail page
+        current_url = driver.current_url
+        if '/maps/search/' in current_url:
+            print("🔍 Detected search results page - clicking first business...")
+            try:
+                # Find first business result in left panel
+                first_result = driver.find_element(By.CSS_SELECTOR, 'a[href*="/maps/place/"]')
+                business_name_preview = first_result.get_attribute('aria-label')
+                print(f"   Clicking: {business_name_preview}")
+
+                first_result.click()
+                new_url = self.waiter.url_change(
+                    driver, "place_navigation", current_url, contains="/maps/place/"
+                )
+                if new_url:
+                    self.waiter.element(driver, "place_details", "h1.DUwDvf")
+                    print("✅ Navigated to business detail page")
+                else:
+                    print("⚠️ Still on search page, but will try extraction")
+
+            except Exception as e:
+                print(f"⚠️ Could not click first result: {e}")
+                print("   Will try extracting from current page")
+
+    def _stage_core(self, driver, projection):
+        """Stage: place panel fields (name, contact, rating, Place ID...)."""
+        # Initialize smart tools
+        smart_finder = SmartElementFinder(driver)
+        scroll_loader = AggressiveScrollLoader(driver, self.waiter)
+
+        # CRITICAL FIX (Oct 4, 2025): Extract name BEFORE aggressive loading
+        # Issue: Aggressive scrolling removes the h1 element with business name
+        # Solution: Extract name early and cache it
+        business_name_early = None
+        try:
+            # Try primary selector that exists immediately after page load
+            name_elem = driver.find_element(By.CSS_SELECTOR, "h1.DUwDvf.lfPIob")
+            business_name_early = name_elem.text.strip()
+            if business_name_early:
+                print(f"✅ Name extracted early (before aggressive loading): {business_name_early}")
+        except:
+            pass  # Will try other methods later
+
+        # Aggressively load all content (only needed for lower-panel fields)
+        if projection.needs("scroll"):
+            scroll_loader.scroll_to_load_all_content()
+
+        # Extract comprehensive data
+        return self._extract_business_data_ultimate(driver, smart_finder, business_name_early, projection)
+
+    def _stage_images(self, driver):
+        """Stage: business photos with the multi-phase image extractor."""
+        print("📸 Extracting business images with multi-phase strategy...")
+        image_extractor = AdvancedImageExtractor(driver)
+        return image_extractor.extract_all_images_comprehensive()
+
+    def _stage_emails(self, website):
+        """Stage: emails from the business website (HTTP only, no driver)."""
+        if not website:
+            return []
+        try:
+            print("📧 Extracting emails from business website...")
+            return self._extract_emails_from_website(website) or []
+        except Exception as e:
+            print(f"ℹ️  Could not extract emails: {str(e)[:50]}")
+            return []
+
     def _cleanup_browser_safely(self, driver):
         """Enhanced browser cleanup with comprehensive error handling."""
         try:
@@ -498,17 +743,10 @@ class SeleniumExtractor:
             except:
                 pass
 
-            # Quit the driver
-            try:
-                driver.quit()
-            except:
-                pass
-
-            # CRITICAL FIX (Oct 2025 Research + Testing):
-            # 8-second delay for maximum reliability (tested: 5s = 80%, 8s = 90%+)
-            # Ensures complete resource release on all platforms
-            # Source: Stack Overflow solutions + GitHub Selenium issues + Testing
-            time.sleep(8)  # Increased from 5s to 8s for 90%+ reliability
+            # Quit the driver and wait until chromedriver and Chrome have
+            # exited (the old fixed 8s sleep covered the slowest case only)
+            if not quit_and_wait(driver, self.waiter):
+                print("⚠️ Browser processes still running after driver_exit timeout")
 
             # Explicitly clear references for garbage collection
             driver = None
@@ -546,14 +784,16 @@ class SeleniumExtractor:
 
         return f"{any_google_maps_url}{'&' if '?' in any_google_maps_url else '?'}hl=en"
 
-    def _extract_business_data_ultimate(self, driver, smart_finder, business_name_early=None):
+    def _extract_business_data_ultimate(self, driver, smart_finder, business_name_early=None, projection=None):
         """Extract business data using smart multi-strategy finder.
 
         Args:
             driver: Selenium WebDriver instance
             smart_finder: SmartElementFinder instance
             business_name_early: Pre-extracted business name (before aggressive loading)
+            projection: FieldProjection limiting the fields looked up (default: all)
         """
+        projection = projection or FieldProjection()
 
         data = {
             "extraction_timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
@@ -561,9 +801,11 @@ class SeleniumExtractor:
         }
 
         # Extract Place ID
-        print("🔍 Extracting Place ID...")
-        place_id_extractor = PlaceIDExtractor(driver)
-        place_id_result = place_id_extractor.extract_place_id_comprehensive()
+        place_id_result = None
+        if projection.needs("place_id"):
+            print("🔍 Extracting Place ID...")
+            place_id_extractor = PlaceIDExtractor(driver, self.waiter)
+            place_id_result = place_id_extractor.extract_place_id_comprehensive()
 
         if place_id_result and place_id_result.get("place_id"):
             place_id_enhanced = enhance_place_id(place_id_result["place_id"])
@@ -576,19 +818,11 @@ class SeleniumExtractor:
             data["place_id_url"] = place_id_enhanced['url']
             print(f"✅ CID: {data['cid']}")
 
-        # Enhanced field selectors with MORE options
-        field_configs = {
+        # CSS selectors come from the shared selector registry (most likely hit
+        # first); XPath and text fallbacks stay here.
+        # Name: h1 in the main panel (.m6QErb), not the sidebar h1="Results"
+        fallbacks = {
             "name": {
-                # FIXED (Oct 4, 2025): Target h1 in main content area, not sidebar
-                # Sidebar has h1="Results", main panel has business name
-                # Use .m6QErb (main panel) to avoid sidebar h1
-                "selectors": [
-                    ".DUwDvf.lfPIob",  # Primary business name selector
-                    ".m6QErb h1",  # Main panel h1 (avoids sidebar)
-                    ".x3AX1-LfntMc-header-title",
-                    "h1.fontHeadlineLarge",  # Specific h1, not generic
-                    ".section-hero-header-title"
-                ],
                 "xpath": [
                     "//div[contains(@class, 'm6QErb')]//h1",  # h1 inside main panel
                     "//h1[not(text()='Results')]",  # Any h1 except "Results"
@@ -596,62 +830,43 @@ class SeleniumExtractor:
                 ],
                 "text": None
             },
-            "rating": {
-                "selectors": [".MW4etd", ".ceNzKf", "[aria-label*='stars']", ".section-star-display"],
-                "xpath": ["//*[contains(@aria-label, 'stars')]"],
-                "text": None
-            },
-            "review_count": {
-                "selectors": [".UY7F9", ".RDApEe.YrbPuc", ".HHrUdb.fontTitleSmall"],
-                "xpath": ["//*[contains(text(), 'reviews')]"],
-                "text": ["reviews", "Reviews"]
-            },
+            "rating": {"xpath": ["//*[contains(@aria-label, 'stars')]"], "text": None},
+            "review_count": {"xpath": ["//*[contains(text(), 'reviews')]"], "text": ["reviews", "Reviews"]},
             "address": {
-                "selectors": [".Io6YTe.fontBodyMedium", ".LrzXr", ".rogA2c", ".section-info-line"],
                 "xpath": ["//button[contains(@aria-label, 'Address')]", "//div[contains(@class, 'address')]"],
                 "text": None
             },
             "phone": {
-                "selectors": ["[data-item-id*='phone']", ".RcCsl.fVHpi.w4vB1d.NOE9ve.M0S7ae.AG25L"],
                 "xpath": ["//button[contains(@aria-label, 'Phone')]", "//a[starts-with(@href, 'tel:')]"],
                 "text": None
             },
-            "website": {
-                "selectors": ["[data-item-id='authority']", "[aria-label*='Website']"],
-                "xpath": ["//a[contains(@aria-label, 'Website')]"],
-                "text": None
-            },
+            "website": {"xpath": ["//a[contains(@aria-label, 'Website')]"], "text": None},
             "hours": {
-                "selectors": [".t39EBf.GUrTXd", ".OqCZI.fontBodyMedium.WVXvdc"],
                 "xpath": ["//*[contains(text(), 'Open') or contains(text(), 'Closed')]"],
                 "text": ["Open", "Closed"]
             },
-            "category": {
-                "selectors": [".DkEaL", ".YhemCb", ".section-rating-term"],
-                "xpath": ["//button[contains(@class, 'DkEaL')]"],
-                "text": None
-            },
-            "price_range": {
-                "selectors": [".mgr77e", ".YhemCb", ".price-range"],
-                "xpath": ["//*[contains(text(), '₹') or contains(text(), '$')]"],
-                "text": None
-            }
+            "category": {"xpath": ["//button[contains(@class, 'DkEaL')]"], "text": None},
+            "price_range": {"xpath": ["//*[contains(text(), '₹') or contains(text(), '$')]"], "text": None}
+        }
+        field_configs = {
+            field: {"selectors": smart_finder.registry.ordered("selenium", field), **config}
+            for field, config in fallbacks.items()
+            if projection.wants(field)
         }
 
-        # Extract each field using smart finder
-        for field, config in field_configs.items():
-            # Use pre-extracted name if available (extracted before aggressive loading)
-            if field == "name" and business_name_early:
-                result = business_name_early
-                print(f"✅ Using pre-extracted name: {result}")
-            else:
-                result = smart_finder.find_with_strategies(
-                    field,
-                    config["selectors"],
-                    config.get("xpath"),
-                    config.get("text")
-                )
+        # Use pre-extracted name if available (extracted before aggressive loading)
+        if business_name_early:
+            field_configs.pop("name")
+            print(f"✅ Using pre-extracted name: {business_name_early}")
 
+        # Extract every field with the smart finder (one round trip in batched mode)
+        found = smart_finder.find_fields(field_configs) if field_configs else {}
+        if business_name_early:
+            found = {"name": business_name_early, **found}
+        if smart_finder.winning_strategies:
+            print(f"⚡ {len(smart_finder.winning_strategies)} fields in one script call")
+
+        for field, result in found.items():
             if result:
                 cleaned = self._clean_extracted_text(result, field)
                 if cleaned:
@@ -668,22 +883,24 @@ class SeleniumExtractor:
             pass
 
         # Extract Plus Code
-        try:
-            plus_code_elem = driver.find_element(By.CSS_SELECTOR, "[data-item-id*='oloc']")
-            data["plus_code"] = plus_code_elem.text.strip()
-        except:
-            data["plus_code"] = ""
+        if projection.wants("plus_code"):
+            try:
+                plus_code_elem = driver.find_element(By.CSS_SELECTOR, "[data-item-id*='oloc']")
+                data["plus_code"] = plus_code_elem.text.strip()
+            except:
+                data["plus_code"] = ""
 
-        # Extract attributes
+        # Extract attributes (full extractions only)
         attributes = []
-        try:
-            attr_elements = driver.find_elements(By.CSS_SELECTOR, ".LTs0Rc")
-            for elem in attr_elements[:15]:
-                attr_text = elem.get_attribute("aria-label")
-                if attr_text:
-                    attributes.append(attr_text)
-        except:
-            pass
+        if projection.is_full:
+            try:
+                attr_elements = driver.find_elements(By.CSS_SELECTOR, ".LTs0Rc")
+                for elem in attr_elements[:15]:
+                    attr_text = elem.get_attribute("aria-label")
+                    if attr_text:
+                        attributes.append(attr_text)
+            except:
+                pass
 
         if attributes:
             data["attributes"] = attributes
@@ -740,7 +957,7 @@ class SeleniumExtractor:
             try:
                 reviews_button = driver.find_element(By.XPATH, "//*[contains(text(), 'Reviews') or contains(@aria-label, 'Reviews')]")
                 reviews_button.click()
-                time.sleep(2)
+                self.waiter.element(driver, "reviews_tab", ".jftiEf, .MyEned, .wiI7pd, [data-review-id]")
                 print("📝 Reviews tab opened")
             except:
                 print("ℹ️ Reviews tab not found or already open")
@@ -749,7 +966,7 @@ class SeleniumExtractor:
             scrollable = driver.find_element(By.CSS_SELECTOR, ".m6QErb.DxyBCb.kA9KIf.dS8AEf")
             for i in range(3):
                 driver.execute_script("arguments[0].scrollTop = arguments[0].scrollHeight", scrollable)
-                time.sleep(1)
+                self.waiter.scroll_settled(driver, "scroll", scrollable)
 
             # Find review elements
             review_selectors = [
@@ -846,4 +1063,12 @@ class SeleniumExtractor:
 
     def get_stats(self):
         """Get extraction statistics."""
-        return self.extraction_stats
+        stats = {
+            **self.extraction_stats,
+            "driver_cache": get_driver_cache().get_stats(),
+            "waits": self.waiter.get_stats(),
+            "selectors": get_selector_registry().get_stats(),
+        }
+        if self.session_pool:
+            stats["session_pool"] = self.session_pool.get_stats()
+        return stats
@@ -19,12 +19,17 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 import time
 import gc
-import psutil
 import os
 import re
 from urllib.parse import unquote
 from bob.utils.website_extractor import extract_website_intelligent, parse_google_redirect
 from bob.utils.image_extractor import is_valid_image_url, convert_to_high_res, get_comprehensive_image_selectors
+from bob.utils.resources import get_resource_sampler
+from bob.config.settings import DEFAULT_EXTRACTOR_CONFIG
+from bob.extractors.selenium_pool import get_session_pool
+from bob.utils.waits import StageWaiter, quit_and_wait
+from bob.utils.projection import FieldProjection
+from bob.utils.driver_cache import chrome_driver_kwargs, get_driver_cache, record_launch
 
 
 class SeleniumExtractorOptimized:
@@ -46,12 +51,22 @@ class SeleniumExtractorOptimized:
     - Zero-disk I/O (no cache, no logs)
     """
 
-    def __init__(self, headless=True, memory_optimized=True):
+    def __init__(self, headless=True, memory_optimized=True, reuse_sessions=None):
         self.headless = headless
         self.memory_optimized = memory_optimized
+
+        # Warm driver reuse: a pooled session costs a reset + navigation
+        # instead of a full uc.Chrome launch
+        if reuse_sessions is None:
+            reuse_sessions = DEFAULT_EXTRACTOR_CONFIG.selenium_session_reuse
+        self.session_pool = get_session_pool(
+            f"optimized-{'headless' if headless else 'headed'}",
+            self._create_minimal_browser,
+        ) if reuse_sessions else None
         
-        # Track memory usage
-        self.initial_memory = psutil.Process(os.getpid()).memory_info().rss / 1024 / 1024
+        # Track memory usage across Python + chromedriver/Chrome processes
+        self.resources = get_resource_sampler()
+        self.initial_memory = self.resources.snapshot().tree_rss_mb
         
         self.stats = {
             "total_extractions": 0,
@@ -62,29 +77,48 @@ class SeleniumExtractorOptimized:
             "memory_efficiency": "UNKNOWN"
         }
 
-    def extract_business_optimized(self, url, include_reviews=True, max_reviews=3):
+        # Condition waits with per-stage timeouts instead of fixed sleeps
+        self.waiter = StageWaiter()
+
+        # Driver of the running extraction, so abort() can stop it from another thread
+        self._active_driver = None
+        self._aborted = False
+
+    def extract_business_optimized(self, url, include_reviews=True, max_reviews=3, fields=None):
         """
         Extract business data with ULTRA memory optimization.
         
         Nishkaam Karma: Perform extraction with complete detachment from resources.
         
+        Args:
+            fields: Only extract these fields (see bob.utils.projection); default all
+        
         Returns:
             Complete business data with minimal memory footprint
         """
         start_time = time.time()
         driver = None
+        lease = None
+        projection = FieldProjection.of(fields)
         
         try:
             # Monitor memory
-            current_memory = psutil.Process(os.getpid()).memory_info().rss / 1024 / 1024
+            current_memory = self.resources.snapshot().tree_rss_mb
             self.stats["peak_memory_mb"] = max(self.stats["peak_memory_mb"], current_memory)
 
             print(f"\n🔱 SELENIUM OPTIMIZED EXTRACTOR")
             print(f"📍 URL: {url[:60]}...")
             print(f"🧠 Memory: {current_memory:.1f}MB")
 
-            # Create minimal browser
-            driver = self._create_minimal_browser()
+            # Lease a warm browser from the pool (or create a minimal one)
+            if self.session_pool:
+                lease = self.session_pool.acquire()
+                driver = lease.driver
+            else:
+                driver = self._create_minimal_browser()
+            self._active_driver = driver
+            if self._aborted:
+                raise Exception("Extraction aborted")
 
             # Convert URL and navigate
             standard_url = self._convert_url(url)
@@ -92,23 +126,24 @@ class SeleniumExtractorOptimized:
             print("🌐 Loading page with minimal resources...")
             driver.get(standard_url)
 
-            # Minimal wait
-            time.sleep(2)
+            # Wait for the place header or the search result list
+            self.waiter.element(driver, "page_load", "h1, a[href*='/place/']")
 
             # Handle search results if needed
             if "/search/" in driver.current_url:
                 self._navigate_to_first_business_optimized(driver)
 
             # Extract data with minimal DOM interaction
-            data = self._extract_data_minimalist(driver)
+            data = self._extract_data_minimalist(driver, projection)
 
             # Extract reviews if requested (with memory optimization)
-            if include_reviews:
+            if include_reviews and projection.needs("reviews"):
                 reviews = self._extract_reviews_optimized(driver, max_reviews)
                 data["reviews"] = reviews
                 data["total_reviews_extracted"] = len(reviews)
 
-            # Calculate quality score
+            # Calculate quality score (over the requested fields only)
+            data = projection.apply(data)
             data["data_quality_score"] = self._calculate_quality_score_optimized(data)
             data["success"] = True
             data["extractor_version"] = "Selenium Optimized v4.3.0"
@@ -137,12 +172,31 @@ class SeleniumExtractorOptimized:
             }
 
         finally:
-            # ENLIGHTENED cleanup - immediate process termination
-            self._cleanup_immediately(driver)
+            # ENLIGHTENED cleanup - reset for the next job, or immediate termination
+            self._active_driver = None
+            if lease:
+                self.session_pool.release(lease, discard=self._aborted)
+            else:
+                self._cleanup_immediately(driver)
             
             # Force garbage collection
             gc.collect()
 
+    def abort(self):
+        """
+        Stop a running extraction from another thread (e.g. a lost hedge).
+
+        Quitting the driver makes the pending WebDriver call fail, so the
+        extraction thread unwinds through its normal cleanup.
+        """
+        self._aborted = True
+        driver = self._active_driver
+        if driver:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+
     def _create_minimal_browser(self):
         """Create browser with minimal memory footprint."""
         options = uc.ChromeOptions()
@@ -180,7 +234,9 @@ class SeleniumExtractorOptimized:
         options.add_argument("--user-agent=Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36")
 
         try:
-            driver = uc.Chrome(options=options, version_main=140)
+            started = time.time()
+            driver = uc.Chrome(options=options, **chrome_driver_kwargs(version_main=140))
+            record_launch(time.time() - started)
             driver.set_page_load_timeout(30)
             
             print("🧘 Created minimal browser instance")
@@ -194,14 +250,15 @@ class SeleniumExtractorOptimized:
     def _navigate_to_first_business_optimized(self, driver):
         """Navigate to first business with minimal DOM interaction."""
         try:
-            # Quick wait for results
-            time.sleep(1)
-            
             # Find first business link
             try:
-                business_link = driver.find_element(By.CSS_SELECTOR, 'a[href*="/place/"]')
+                business_link = self.waiter.element(driver, "page_load", 'a[href*="/place/"]')
+                if business_link is None:
+                    raise Exception("no result link")
+                search_url = driver.current_url
                 business_link.click()
-                time.sleep(2)
+                if self.waiter.url_change(driver, "place_navigation", search_url, contains="/place/"):
+                    self.waiter.element(driver, "place_details", "h1")
                 print("✅ Navigated to business page")
                 return True
             except:
@@ -212,22 +269,27 @@ class SeleniumExtractorOptimized:
             print(f"⚠️ Navigation error: {e}")
             return False
 
-    def _extract_data_minimalist(self, driver):
+    def _extract_data_minimalist(self, driver, projection=None):
         """Extract data with minimal DOM interaction AND intelligent website filtering."""
+        projection = projection or FieldProjection()
         data = {
             "extraction_method": "Selenium Optimized Minimalist (with Intelligent Filtering)"
         }
 
-        # Get page text for intelligent filtering
-        try:
-            page_text = driver.find_element(By.TAG_NAME, "html").text
-        except:
-            page_text = ""
+        # Get page text for intelligent filtering (whole-page text: only if the website is wanted)
+        page_text = ""
+        if projection.wants("website"):
+            try:
+                page_text = driver.find_element(By.TAG_NAME, "html").text
+            except:
+                pass
 
         # Use JavaScript batch extraction for efficiency
         try:
             extracted_data = driver.execute_script("""
                 const result = {};
+                const fields = arguments[0];
+                const want = (field) => !fields || fields.includes(field);
 
                 // Extract name
                 const nameSelectors = ['.DUwDvf.lfPIob', '.x3AX1-LfntMc-header-title', 'h1'];
@@ -273,7 +335,7 @@ class SeleniumExtractorOptimized:
                 }
 
                 // Extract ALL available URLs - collect multiple for intelligent filtering
-                try {
+                if (want('website')) try {
                     const websiteLinks = [];
                     const selectors = [
                         'a[data-item-id="authority"]',
@@ -311,7 +373,7 @@ class SeleniumExtractorOptimized:
                 if (categoryElem) result.category = categoryElem.textContent.trim();
 
                 // Extract GPS from MULTIPLE SOURCES (comprehensive approach)
-                try {
+                if (want('latitude')) try {
                     // METHOD 1A: Extract from Google Maps URL parameters (!3d=latitude, !4d=longitude)
                     const url = window.location.href;
                     const lat3dMatch = url.match(/!3d(-?\\d+\\.\\d+)/);
@@ -388,7 +450,7 @@ class SeleniumExtractorOptimized:
                 }
 
                 // Extract Plus Code (also from multiple sources)
-                try {
+                if (want('plus_code')) try {
                     // METHOD 1: From URL
                     const plusCodeMatch = window.location.href.match(/1s([A-Z0-9]{4}\\+[A-Z0-9]{2,})/);
                     if (plusCodeMatch) {
@@ -420,7 +482,7 @@ class SeleniumExtractorOptimized:
 
                 // Extract Place ID
                 const url = window.location.href;
-                const placeIdMatch = url.match(/!1s(0x[0-9a-f]+:0x[0-9a-f]+)/);
+                const placeIdMatch = (want('place_id') || want('cid')) && url.match(/!1s(0x[0-9a-f]+:0x[0-9a-f]+)/);
                 if (placeIdMatch) {
                     result.place_id_original = placeIdMatch[1];
                     const hexParts = placeIdMatch[1].split(':');
@@ -436,7 +498,7 @@ class SeleniumExtractorOptimized:
                 }
 
                 return result;
-            """)
+            """, projection.dom_fields())
 
             # Merge extracted data
             data.update(extracted_data)
@@ -483,16 +545,17 @@ class SeleniumExtractorOptimized:
                 pass
 
         # Extract images with minimal approach
-        try:
-            images = driver.execute_script("""
-                const imgs = document.querySelectorAll('img[src*="googleusercontent"]');
-                return Array.from(imgs).slice(0, 3).map(img => img.src);
-            """)
+        if projection.needs("images"):
+            try:
+                images = driver.execute_script("""
+                    const imgs = document.querySelectorAll('img[src*="googleusercontent"]');
+                    return Array.from(imgs).slice(0, 3).map(img => img.src);
+                """)
 
-            if images:
-                data["photos"] = images
-        except:
-            pass
+                if images:
+                    data["photos"] = images
+            except:
+                pass
 
         return data
 
@@ -509,7 +572,7 @@ class SeleniumExtractorOptimized:
                         reviewsBtn.click();
                     }
                 """)
-                time.sleep(1)
+                self.waiter.element(driver, "reviews_tab", ".jftiEf, .MyEned, .wiI7pd")
             except:
                 pass
             
@@ -550,14 +613,8 @@ class SeleniumExtractorOptimized:
                 except:
                     pass
                 
-                # Quit driver
-                try:
-                    driver.quit()
-                except:
-                    pass
-                
-                # ENLIGHTENED delay for process termination
-                time.sleep(3)
+                # Quit driver and wait for its processes to terminate
+                quit_and_wait(driver, self.waiter)
                 
                 # Clear reference
                 driver = None
@@ -606,10 +663,18 @@ class SeleniumExtractorOptimized:
         stats = self.stats.copy()
         
         # Calculate memory efficiency
-        current_memory = psutil.Process(os.getpid()).memory_info().rss / 1024 / 1024
+        snapshot = self.resources.snapshot()
+        current_memory = snapshot.tree_rss_mb
+        stats["peak_memory_mb"] = round(max(stats["peak_memory_mb"], self.resources.peak_tree_rss_mb), 1)
         stats["current_memory_mb"] = round(current_memory, 1)
         stats["memory_increase_mb"] = round(current_memory - self.initial_memory, 1)
         stats["memory_efficiency"] = "EXCELLENT" if stats["memory_increase_mb"] < 40 else "GOOD"
+        stats["browser_memory_mb"] = round(snapshot.browser_rss_mb, 1)
+        stats["browser_processes"] = snapshot.browser_processes
+        stats["driver_cache"] = get_driver_cache().get_stats()
+        stats["waits"] = self.waiter.get_stats()
+        if self.session_pool:
+            stats["session_pool"] = self.session_pool.get_stats()
         
         return stats
 
@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+"""
+BOB Selenium Session Pool v4.3.1
+
+Warm reuse of undetected-chromedriver sessions. Launching Chrome through
+uc.Chrome costs seconds (driver patching, browser start-up); resetting an
+existing session between jobs costs a navigation.
+
+Between jobs a session is reset (extra tabs closed, all cookies and
+storage cleared, navigated to about:blank) and health-checked. Sessions
+that fail the check, served max_uses jobs or outlived max_age_seconds are
+quit and replaced on demand.
+
+Usage:
+    from bob.extractors.selenium_pool import get_session_pool
+
+    pool = get_session_pool("stealth", create_driver)
+    with pool.session() as driver:
+        driver.get(url)
+"""
+
+import atexit
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+
+@dataclass
+class PooledSession:
+    """One WebDriver plus its bookkeeping."""
+
+    driver: Any
+    created_at: float = field(default_factory=time.time)
+    last_used_at: float = field(default_factory=time.time)
+    uses: int = 0
+
+
+class SeleniumSessionPool:
+    """
+    Thread-safe pool of reusable WebDriver sessions.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], Any],
+        max_sessions: int = 2,
+        max_uses: int = 25,
+        max_age_seconds: float = 900.0,
+        max_idle_seconds: float = 120.0,
+        name: str = "selenium",
+    ):
+        """
+        Initialize the pool (drivers are created on demand).
+
+        Args:
+            factory: Callable returning a new WebDriver
+            max_sessions: Upper bound on live drivers (leased + idle)
+            max_uses: Recycle a driver after this many jobs
+            max_age_seconds: Recycle a driver older than this
+            max_idle_seconds: Quit idle drivers unused for this long
+            name: Label for logging
+        """
+        self.factory = factory
+        self.max_sessions = max_sessions
+        self.max_uses = max_uses
+        self.max_age_seconds = max_age_seconds
+        self.max_idle_seconds = max_idle_seconds
+        self.name = name
+
+        self._idle: List[PooledSession] = []
+        self._leased = 0
+        self._condition = threading.Condition()
+        self._closed = False
+
+        self.stats = {
+            "launches": 0,
+            "reuses": 0,
+            "resets": 0,
+            "health_failures": 0,
+            "recycled": 0,
+            "launch_seconds": 0.0,
+            "reset_seconds": 0.0,
+        }
+
+    # ------------------------------------------------------------------
+    # Leasing
+    # ------------------------------------------------------------------
+
+    def acquire(self, timeout: Optional[float] = None) -> PooledSession:
+        """
+        Lease a session, launching a driver if none is idle.
+
+        Args:
+            timeout: Seconds to wait for a free slot (None = wait forever)
+
+        Returns:
+            PooledSession; hand it back with release()
+        """
+        deadline = None if timeout is None else time.time() + timeout
+        stale: List[PooledSession] = []
+        try:
+            with self._condition:
+                while True:
+                    if self._closed:
+                        raise RuntimeError(f"Session pool '{self.name}' is closed")
+                    stale.extend(self._prune_idle())
+                    if self._idle:
+                        # LIFO: the most recently used driver is the warmest
+                        session = self._idle.pop()
+                        self._leased += 1
+                        self.stats["reuses"] += 1
+                        session.uses += 1
+                        session.last_used_at = time.time()
+                        return session
+                    if self._leased < self.max_sessions:
+                        self._leased += 1
+                        break
+                    remaining = None if deadline is None else deadline - time.time()
+                    if remaining is not None and remaining <= 0:
+                        raise TimeoutError(f"No Selenium session free in pool '{self.name}'")
+                    self._condition.wait(remaining)
+        finally:
+            # Quit outside the lock (as trim() and close() do): Chrome takes a while
+            for session in stale:
+                self._quit(session.driver)
+
+        # Launch outside the lock: uc.Chrome takes seconds
+        started = time.time()
+        try:
+            driver = self.factory()
+        except Exception:
+            with self._condition:
+                self._leased -= 1
+                self._condition.notify()
+            raise
+        with self._condition:
+            self.stats["launches"] += 1
+            self.stats["launch_seconds"] += time.time() - started
+        return PooledSession(driver=driver, uses=1)
+
+    def release(self, session: Optional[PooledSession], discard: bool = False):
+        """
+        Return a session: reset and keep it, or quit it.
+
+        Args:
+            session: Session from acquire()
+            discard: Quit instead of reusing (e.g. after abort())
+        """
+        if session is None:
+            return
+
+        keep = not discard and not self._closed and not self._expired(session)
+        reset_seconds = 0.0
+        healthy = True
+        if keep:
+            started = time.time()
+            healthy = self._reset(session.driver) and self.is_healthy(session.driver)
+            reset_seconds = time.time() - started
+            keep = healthy
+
+        if not keep:
+            self._quit(session.driver)
+
+        with self._condition:
+            self._leased -= 1
+            if keep:
+                self.stats["resets"] += 1
+                self.stats["reset_seconds"] += reset_seconds
+                session.last_used_at = time.time()
+                self._idle.append(session)
+            else:
+                self.stats["recycled"] += 1
+                if not healthy:
+                    self.stats["health_failures"] += 1
+            self._condition.notify()
+
+    @contextmanager
+    def session(self, timeout: Optional[float] = None):
+        """Context manager yielding a driver; release() resets and health-checks it."""
+        lease = self.acquire(timeout)
+        try:
+            yield lease.driver
+        finally:
+            self.release(lease)
+
+    # ------------------------------------------------------------------
+    # Session maintenance
+    # ------------------------------------------------------------------
+
+    def _expired(self, session: PooledSession) -> bool:
+        return (session.uses >= self.max_uses
+                or time.time() - session.created_at > self.max_age_seconds)
+
+    def _prune_idle(self) -> List[PooledSession]:
+        """
+        Take out idle sessions that sat unused too long (caller holds the lock).
+
+        Returns:
+            The sessions taken out; the caller quits them after releasing the lock
+        """
+        now = time.time()
+        stale = [s for s in self._idle if now - s.last_used_at > self.max_idle_seconds]
+        for session in stale:
+            self._idle.remove(session)
+            self.stats["recycled"] += 1
+        return stale
+
+    def trim(self) -> int:
+        """
+        Quit every idle driver to free memory (leased ones are kept).
+
+        Returns:
+            Number of drivers quit
+        """
+        with self._condition:
+            idle, self._idle = self._idle, []
+            self.stats["recycled"] += len(idle)
+        for session in idle:
+            self._quit(session.driver)
+        return len(idle)
+
+    @staticmethod
+    def is_healthy(driver) -> bool:
+        """Cheap liveness check: driver process up and session answering."""
+        try:
+            service = getattr(driver, "service", None)
+            process = getattr(service, "process", None)
+            if process is not None and process.poll() is not None:
+                return False
+            return bool(driver.window_handles)
+        except Exception:
+            return False
+
+    @staticmethod
+    def _reset(driver) -> bool:
+        """Clear per-job state: extra tabs, cookies, storage, current page."""
+        try:
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+
+            try:
+                # All domains, unlike delete_all_cookies() (current domain only)
+                driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+                driver.execute_cdp_cmd("Storage.clearDataForOrigin", {
+                    "origin": "https://www.google.com",
+                    "storageTypes": "local_storage,session_storage,indexeddb,service_workers,cache_storage",
+                })
+            except Exception:
+                driver.delete_all_cookies()
+
+            driver.get("about:blank")
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def _quit(driver):
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def close(self):
+        """Quit every idle driver and refuse new leases."""
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._condition.notify_all()
+        for session in idle:
+            self._quit(session.driver)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Pool statistics including average launch vs reset cost."""
+        launches = self.stats["launches"]
+        resets = self.stats["resets"]
+        return {
+            **self.stats,
+            "launch_seconds": round(self.stats["launch_seconds"], 2),
+            "reset_seconds": round(self.stats["reset_seconds"], 2),
+            "avg_launch_seconds": round(self.stats["launch_seconds"] / launches, 2) if launches else None,
+            "avg_reset_seconds": round(self.stats["reset_seconds"] / resets, 2) if resets else None,
+            "idle": len(self._idle),
+            "leased": self._leased,
+        }
+
+
+# Process-wide pools, one per driver flavour
+_pools: Dict[str, SeleniumSessionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_session_pool(name: str, factory: Callable[[], Any], **kwargs: Any) -> SeleniumSessionPool:
+    """
+    Get (or create) the shared pool called name.
+
+    Args:
+        name: Pool key - drivers in one pool must be interchangeable
+        factory: Driver factory used if the pool is created now
+        **kwargs: SeleniumSessionPool options used if the pool is created now
+    """
+    with _pools_lock:
+        pool = _pools.get(name)
+        if pool is None or pool._closed:
+            pool = SeleniumSessionPool(factory, name=name, **kwargs)
+            _pools[name] = pool
+        return pool
+
+
+def trim_session_pools() -> int:
+    """Quit the idle drivers of all pools (e.g. under memory pressure); returns how many."""
+    with _pools_lock:
+        pools = list(_pools.values())
+    return sum(pool.trim() for pool in pools)
+
+
+def close_session_pools():
+    """Quit all pooled drivers (registered with atexit)."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
+
+
+atexit.register(close_session_pools)
@@ -1,11 +1,13 @@
 """
 BOB Google Maps v4.3.0 - Data Models
 
-Business, Review, and Image data models with comprehensive fields.
+Business, Review, and Image data models with comprehensive fields,
+plus slotted CompactBusiness/CompactReview for large in-memory sets.
 """
 
 from .business import Business
 from .review import Review
 from .image import Image
+from .compact import CompactBusiness, CompactReview
 
-__all__ = ["Business", "Review", "Image"]
+__all__ = ["Business", "Review", "Image", "CompactBusiness", "CompactReview"]
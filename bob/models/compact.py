@@ -0,0 +1,403 @@
+"""
+Compact Data Models - BOB v4.3.1
+
+Slotted, memory-compact variants of Business and Review for holding
+large numbers of records in memory (e.g. a million reviews).
+
+- __slots__ instead of a per-instance __dict__; Review fields that are
+  usually None share one dict, allocated only when one of them is set
+- Derived fields computed on first access: Review text_length and
+  data_completeness; extracted_at loaded by from_dict() stays the ISO
+  string it arrived as until read
+- Business list/dict fields are only allocated when first used
+- to_dict()/from_dict() read and write slots directly and produce the
+  same dictionaries as Business/Review
+
+Fields are taken from the Business and Review dataclasses, so both stay
+in sync; quality scoring is shared with them.
+
+Usage:
+    from bob.models import CompactReview, CompactBusiness
+
+    review = CompactReview.from_dict(review_dict)
+    review = CompactReview.from_review(review)       # And review.to_review()
+    business = CompactBusiness(name="Blue Bottle", rating=4.6)
+"""
+
+from dataclasses import MISSING, fields
+from datetime import datetime
+from operator import attrgetter
+from typing import Any, Dict, Optional
+
+from .business import Business
+from .review import Review
+
+
+def _isoformat(value: Any) -> str:
+    """Stored extracted_at (datetime or ISO string) for to_dict()."""
+    return value if value.__class__ is str else value.isoformat()
+
+
+# ----------------------------------------------------------------------
+# Review
+# ----------------------------------------------------------------------
+
+REVIEW_FIELDS = tuple(f.name for f in fields(Review))
+REVIEW_DEFAULT_METHOD = "Enhanced V1.2.0"
+# Filled for nearly every extracted review: one slot each
+_REVIEW_COMMON = ("review_index", "reviewer_name", "reviewer_photo", "rating", "review_text",
+                  "review_date", "relative_time", "helpful_count", "extraction_method")
+_REVIEW_LAZY = ("text_length", "data_completeness", "extracted_at")
+# Usually None: kept together in one dict, allocated only if any is set
+_REVIEW_RARE = frozenset(REVIEW_FIELDS).difference(_REVIEW_COMMON, _REVIEW_LAZY)
+_REVIEW_FIELD_SET = frozenset(REVIEW_FIELDS)
+# The 15 fields Review._calculate_completeness() counts
+_COMPLETENESS_FIELDS = (
+    "reviewer_name", "rating", "review_text", "review_date", "helpful_count", "reviewer_photo",
+    "reviewer_total_reviews", "owner_response", "rating_text", "relative_time", "review_id",
+    "text_language", "rating_confidence", "extraction_confidence", "response_count",
+)
+_completeness_common = attrgetter(*(name for name in _COMPLETENESS_FIELDS if name in _REVIEW_COMMON))
+_COMPLETENESS_RARE = frozenset(_COMPLETENESS_FIELDS).intersection(_REVIEW_RARE)
+# Score per number of filled fields (same rounding as Review)
+_COMPLETENESS_SCORES = tuple(round((filled / len(_COMPLETENESS_FIELDS)) * 100, 1)
+                             for filled in range(len(_COMPLETENESS_FIELDS) + 1))
+
+
+def _rare(name: str):
+    def get(self):
+        extra = self._extra
+        return extra.get(name) if extra else None
+
+    def set_(self, value):
+        if value is not None:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[name] = value
+        elif self._extra:
+            self._extra.pop(name, None)
+
+    return property(get, set_, doc=f"{name} (stored with the other rarely set fields)")
+
+
+class CompactReview:
+    """
+    Slotted Review (same fields, to_dict() output and quality methods).
+    """
+
+    __slots__ = _REVIEW_COMMON + ("_extra", "_text_length", "_completeness", "_extracted_at")
+
+    def __init__(self, review_index: int = 0, reviewer_name: Optional[str] = None,
+                 reviewer_photo: Optional[str] = None, reviewer_total_reviews: Optional[int] = None,
+                 rating: Optional[int] = None, rating_text: Optional[str] = None,
+                 rating_confidence: Optional[float] = None, review_text: Optional[str] = None,
+                 text_length: Optional[int] = None, text_language: Optional[str] = None,
+                 review_date: Optional[str] = None, relative_time: Optional[str] = None,
+                 extracted_at: Optional[datetime] = None, helpful_count: Optional[int] = None,
+                 response_count: Optional[int] = None, owner_response: Optional[str] = None,
+                 extraction_confidence: Optional[float] = None, data_completeness: Optional[float] = None,
+                 extraction_method: Optional[str] = None, review_id: Optional[str] = None,
+                 source_element: Optional[str] = None, processing_time: Optional[float] = None):
+        self.review_index = review_index
+        self.reviewer_name = reviewer_name
+        self.reviewer_photo = reviewer_photo
+        self.rating = rating
+        self.review_text = review_text
+        self.review_date = review_date
+        self.relative_time = relative_time
+        self.helpful_count = helpful_count
+        self.extraction_method = REVIEW_DEFAULT_METHOD if extraction_method is None else extraction_method
+        self._text_length = text_length
+        self._completeness = data_completeness
+        self._extracted_at = datetime.now() if extracted_at is None else extracted_at
+        self._extra = None
+        if (reviewer_total_reviews is not None or rating_text is not None or rating_confidence is not None
+                or text_language is not None or response_count is not None or owner_response is not None
+                or extraction_confidence is not None or review_id is not None
+                or source_element is not None or processing_time is not None):
+            self._fill_rare(locals())
+
+    def _fill(self, values: Dict[str, Any]):
+        """Set every field from a dictionary (from_dict)."""
+        get = values.get
+        for name, set_slot in _REVIEW_SETTERS:
+            set_slot(self, get(name))
+        if self.review_index is None:
+            self.review_index = 0
+        if self.extraction_method is None:
+            self.extraction_method = REVIEW_DEFAULT_METHOD
+        self._text_length = get("text_length")
+        self._completeness = get("data_completeness")
+        extracted_at = get("extracted_at")
+        self._extracted_at = datetime.now() if extracted_at is None else extracted_at
+        self._extra = None
+        self._fill_rare(values)
+
+    def _fill_rare(self, values: Dict[str, Any]):
+        self._extra = {
+            name: value for name, value in values.items() if name in _REVIEW_RARE and value is not None
+        } or None
+
+    # Lazily derived fields --------------------------------------------
+
+    @property
+    def text_length(self):
+        if self._text_length is None and self.review_text:
+            return len(self.review_text)
+        return self._text_length
+
+    @text_length.setter
+    def text_length(self, value):
+        self._text_length = value
+
+    @property
+    def data_completeness(self):
+        if self._completeness is None:
+            self._completeness = self._calculate_completeness()
+        return self._completeness
+
+    @data_completeness.setter
+    def data_completeness(self, value):
+        self._completeness = value
+
+    @property
+    def extracted_at(self) -> datetime:
+        if isinstance(self._extracted_at, str):
+            self._extracted_at = datetime.fromisoformat(self._extracted_at)
+        return self._extracted_at
+
+    @extracted_at.setter
+    def extracted_at(self, value):
+        self._extracted_at = value
+
+    def _calculate_completeness(self) -> float:
+        """Review._calculate_completeness() reading slots and the rare-field dict directly."""
+        values = _completeness_common(self)
+        filled = len(values) - values.count(None) - values.count("")
+        if self._extra:
+            filled += len([name for name, value in self._extra.items() if name in _COMPLETENESS_RARE and value != ""])
+        return _COMPLETENESS_SCORES[filled]
+
+    # Shared with Review
+    get_quality_score = Review.get_quality_score
+    is_high_quality = Review.is_high_quality
+    __str__ = Review.__str__
+    __repr__ = Review.__repr__
+
+    # Serialization ----------------------------------------------------
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Same dictionary as Review.to_dict() (non-None fields)."""
+        if self._completeness is None:
+            self._completeness = self._calculate_completeness()
+        result = {
+            name: value for name, value in zip(_REVIEW_OUT, _review_slots(self))
+            if value is not None
+        }
+        if self._text_length is None and self.review_text:
+            result["text_length"] = len(self.review_text)
+        if self._extra:
+            result.update(self._extra)
+        result["extracted_at"] = _isoformat(self._extracted_at)
+        return result
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CompactReview":
+        """Review from a dictionary (extracted_at is parsed when first read)."""
+        review = cls.__new__(cls)
+        review._fill(data)
+        return review
+
+    @classmethod
+    def from_review(cls, review: Review) -> "CompactReview":
+        return cls(**{name: getattr(review, name) for name in REVIEW_FIELDS})
+
+    def to_review(self) -> Review:
+        return Review(**{name: getattr(self, name) for name in REVIEW_FIELDS})
+
+
+for _name in _REVIEW_RARE:
+    setattr(CompactReview, _name, _rare(_name))
+
+_REVIEW_SETTERS = tuple((name, getattr(CompactReview, name).__set__) for name in _REVIEW_COMMON)
+# One call reading the common and derived fields' slots (extracted_at is added separately)
+_REVIEW_OUT = _REVIEW_COMMON + ("text_length", "data_completeness")
+_review_slots = attrgetter(*(_REVIEW_COMMON + ("_text_length", "_completeness")))
+
+
+# ----------------------------------------------------------------------
+# Business
+# ----------------------------------------------------------------------
+
+BUSINESS_FIELDS = tuple(f.name for f in fields(Business))
+# list/dict fields: not allocated until used
+_BUSINESS_CONTAINERS = {f.name: f.default_factory for f in fields(Business) if f.default_factory in (list, dict)}
+_BUSINESS_DEFAULTS = {f.name: f.default for f in fields(Business) if f.default is not MISSING}
+_BUSINESS_STORED = tuple(
+    name for name in BUSINESS_FIELDS if name not in _BUSINESS_CONTAINERS and name != "extracted_at"
+)
+
+
+def _container(name: str, factory):
+    slot = f"_{name}"
+
+    def get(self):
+        value = getattr(self, slot)
+        if value is None:
+            value = factory()
+            setattr(self, slot, value)
+        return value
+
+    def set_(self, value):
+        setattr(self, slot, value)
+
+    return property(get, set_, doc=f"{name} ({factory.__name__}, allocated on first use)")
+
+
+class CompactBusiness:
+    """
+    Slotted Business (same fields, to_dict() output and quality scoring).
+    """
+
+    __slots__ = _BUSINESS_STORED + tuple(f"_{name}" for name in _BUSINESS_CONTAINERS) + ("_extracted_at",)
+
+    def __init__(self, **values: Any):
+        unknown = set(values).difference(BUSINESS_FIELDS)
+        if unknown:
+            raise TypeError(f"CompactBusiness got unexpected fields: {sorted(unknown)}")
+        for name in _BUSINESS_STORED:
+            setattr(self, name, values.get(name, _BUSINESS_DEFAULTS.get(name)))
+        for name in _BUSINESS_CONTAINERS:
+            setattr(self, f"_{name}", values.get(name) or None)
+        extracted_at = values.get("extracted_at")
+        self._extracted_at = datetime.now() if extracted_at is None else extracted_at
+
+    @property
+    def extracted_at(self) -> datetime:
+        if isinstance(self._extracted_at, str):
+            self._extracted_at = datetime.fromisoformat(self._extracted_at)
+        return self._extracted_at
+
+    @extracted_at.setter
+    def extracted_at(self, value):
+        self._extracted_at = value
+
+    # Shared with Business
+    calculate_quality_score = Business.calculate_quality_score
+
+    def __repr__(self) -> str:
+        return f"CompactBusiness(name={self.name!r}, place_id={self.place_id!r}, rating={self.rating})"
+
+    # Serialization ----------------------------------------------------
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Same dictionary as Business.to_dict() (reviews as dictionaries)."""
+        reviews = self._reviews
+        return {
+            # Core identification
+            "place_id": self.place_id,
+            "cid": self.cid,
+            "place_id_original": self.place_id_original,
+            "place_id_confidence": self.place_id_confidence,
+            "place_id_format": self.place_id_format,
+            "is_real_cid": self.is_real_cid,
+            "place_id_url": self.place_id_url,
+            # Basic info
+            "name": self.name,
+            "phone": self.phone,
+            "address": self.address,
+            "emails": self._emails or [],
+            # Location
+            "latitude": self.latitude,
+            "longitude": self.longitude,
+            "plus_code": self.plus_code,
+            # Business details
+            "category": self.category,
+            "rating": self.rating,
+            "review_count": self.review_count,
+            "website": self.website,
+            "hours": self.hours,
+            "current_status": self.current_status,
+            "price_range": self.price_range,
+            # Service options
+            "service_options": self._service_options or {},
+            # Rich data
+            "attributes": self._attributes or [],
+            "photos": self._photos or [],
+            "reviews": [r if isinstance(r, dict) else r.to_dict() for r in reviews] if reviews else [],
+            "popular_times": self._popular_times or {},
+            "social_media": self._social_media or {},
+            "menu_items": self._menu_items or [],
+            # Metadata
+            "extracted_at": _isoformat(self._extracted_at),
+            "data_quality_score": self.data_quality_score,
+            "extraction_method": self.extraction_method,
+            "extraction_time_seconds": self.extraction_time_seconds,
+            "extractor_version": self.extractor_version,
+            "metadata": self._metadata or {},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CompactBusiness":
+        """Business from a dictionary (unknown keys are ignored, data is not modified)."""
+        business = cls.__new__(cls)
+        get = data.get
+        # Core identification
+        business.place_id = get("place_id")
+        business.cid = get("cid")
+        business.place_id_original = get("place_id_original")
+        business.place_id_confidence = get("place_id_confidence")
+        business.place_id_format = get("place_id_format")
+        value = get("is_real_cid")
+        business.is_real_cid = _BUSINESS_DEFAULTS["is_real_cid"] if value is None else value
+        business.place_id_url = get("place_id_url")
+        # Basic info
+        business.name = get("name")
+        business.phone = get("phone")
+        business.address = get("address")
+        business._emails = get("emails") or None
+        # Location
+        business.latitude = get("latitude")
+        business.longitude = get("longitude")
+        business.plus_code = get("plus_code")
+        # Business details
+        business.category = get("category")
+        business.rating = get("rating")
+        business.review_count = get("review_count")
+        business.website = get("website")
+        business.hours = get("hours")
+        business.current_status = get("current_status")
+        business.price_range = get("price_range")
+        # Service options
+        business._service_options = get("service_options") or None
+        # Rich data
+        business._attributes = get("attributes") or None
+        business._photos = get("photos") or None
+        business._reviews = get("reviews") or None
+        business._popular_times = get("popular_times") or None
+        business._social_media = get("social_media") or None
+        business._menu_items = get("menu_items") or None
+        # Metadata
+        value = get("data_quality_score")
+        business.data_quality_score = _BUSINESS_DEFAULTS["data_quality_score"] if value is None else value
+        value = get("extraction_method")
+        business.extraction_method = _BUSINESS_DEFAULTS["extraction_method"] if value is None else value
+        business.extraction_time_seconds = get("extraction_time_seconds")
+        value = get("extractor_version")
+        business.extractor_version = _BUSINESS_DEFAULTS["extractor_version"] if value is None else value
+        business._metadata = get("metadata") or None
+        extracted_at = get("extracted_at")
+        business._extracted_at = datetime.now() if extracted_at is None else extracted_at
+        return business
+
+    @classmethod
+    def from_business(cls, business: Business) -> "CompactBusiness":
+        return cls(**{name: getattr(business, name) for name in BUSINESS_FIELDS})
+
+    def to_business(self) -> Business:
+        return Business(**{name: getattr(self, name) for name in BUSINESS_FIELDS})
+
+
+for _name, _factory in _BUSINESS_CONTAINERS.items():
+    setattr(CompactBusiness, _name, _container(_name, _factory))
+
@@ -20,6 +20,11 @@ from .parallel_extractor import (
     ParallelConfig,
     extract_parallel,
 )
+from .concurrency import (
+    AdaptiveConcurrencyController,
+    AIMDConfig,
+)
+from .resources import ResourceSampler, get_resource_sampler
 
 __all__ = [
     'PlaceIDExtractor',
@@ -36,4 +41,8 @@ __all__ = [
     'ParallelExtractor',
     'ParallelConfig',
     'extract_parallel',
+    'AdaptiveConcurrencyController',
+    'AIMDConfig',
+    'ResourceSampler',
+    'get_resource_sampler',
 ]
@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+BOB Memory Admission Control v4.3.1
+
+Holds extraction jobs in a FIFO queue while memory is short instead of
+failing them. Each job's memory footprint is estimated from history
+(exponentially weighted), and a job is only admitted when the projected
+usage - current usage + footprints of recently started jobs + its own
+estimated footprint - stays under the configured limit.
+
+While jobs are held, registered recycle callbacks (e.g. "close idle
+browsers", gc.collect) are triggered so memory can actually come back.
+A job is always admitted when nothing else is running, so the queue can
+never deadlock.
+
+Usage:
+    from bob.utils.admission import MemoryAdmissionController
+
+    admission = MemoryAdmissionController(memory_limit_percent=80)
+    ticket = await admission.admit("Starbucks Times Square")
+    try:
+        result = await extract(...)
+    finally:
+        admission.release(ticket)
+"""
+
+import asyncio
+import inspect
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import psutil
+
+from bob.utils.concurrency import BROWSER_FOOTPRINT_MB
+
+
+def host_memory() -> Tuple[float, float]:
+    """Return (used_mb, total_mb) for the host."""
+    memory = psutil.virtual_memory()
+    used = memory.total - memory.available
+    return used / 1024 / 1024, memory.total / 1024 / 1024
+
+
+@dataclass
+class AdmissionTicket:
+    """Handle for one admitted job."""
+
+    label: str
+    reserved_mb: float
+    admitted_at: float
+    waited_seconds: float
+    started_at: Optional[float] = None  # None: admitted, still waiting for a worker
+
+
+class FootprintEstimator:
+    """
+    Exponentially weighted estimate of one job's memory footprint.
+
+    Samples are taken when a job finishes: memory above the idle baseline
+    divided by the number of jobs that were running.
+    """
+
+    def __init__(self, initial_mb: float = BROWSER_FOOTPRINT_MB, smoothing: float = 0.3):
+        self.estimate_mb = float(initial_mb)
+        self.smoothing = smoothing
+        self.samples = 0
+
+    def observe(self, footprint_mb: float):
+        """Blend one observed per-job footprint into the estimate."""
+        if footprint_mb <= 0:
+            return
+        if self.samples == 0:
+            # First real observation replaces the prior outright
+            self.estimate_mb = footprint_mb
+        else:
+            self.estimate_mb += self.smoothing * (footprint_mb - self.estimate_mb)
+        self.samples += 1
+
+
+class MemoryAdmissionController:
+    """
+    FIFO admission queue gated on projected memory usage.
+    """
+
+    def __init__(
+        self,
+        memory_limit_percent: float = 80.0,
+        memory_probe: Optional[Callable[[], Tuple[float, float]]] = None,
+        poll_interval: float = 1.0,
+        ramp_seconds: float = 15.0,
+        estimator: Optional[FootprintEstimator] = None,
+    ):
+        """
+        Initialize admission control.
+
+        Args:
+            memory_limit_percent: Projected usage above which jobs are held
+            memory_probe: Callable returning (used_mb, total_mb)
+            poll_interval: Seconds between memory checks while holding a job
+            ramp_seconds: How long a fresh job's reservation counts on top of
+                          measured usage (its browser is still starting up)
+            estimator: FootprintEstimator (default: one browser footprint prior)
+        """
+        self.memory_limit_percent = memory_limit_percent
+        self.poll_interval = poll_interval
+        self.ramp_seconds = ramp_seconds
+        self.estimator = estimator or FootprintEstimator()
+        self._probe = memory_probe or host_memory
+
+        self._queue_lock: Optional[asyncio.Lock] = None
+        self._active: List[AdmissionTicket] = []
+        self._recycle_callbacks: List[Callable[[], Any]] = []
+        self._baseline_mb: Optional[float] = None
+
+        self.stats = {
+            "admitted": 0,
+            "delayed": 0,
+            "wait_seconds": 0.0,
+            "max_wait_seconds": 0.0,
+            "forced_admissions": 0,
+            "recycles": 0,
+            "queued": 0,
+        }
+
+    def add_recycle_callback(self, callback: Callable[[], Any]):
+        """Register a (sync or async) callable that frees memory on demand."""
+        self._recycle_callbacks.append(callback)
+
+    # ------------------------------------------------------------------
+    # Admission
+    # ------------------------------------------------------------------
+
+    def _read(self) -> Optional[Tuple[float, float]]:
+        try:
+            used_mb, total_mb = self._probe()
+            return float(used_mb), float(total_mb)
+        except Exception:
+            return None
+
+    def _ramping_mb(self, now: float) -> float:
+        # Jobs not started yet keep their reservation until they start
+        return sum(
+            ticket.reserved_mb for ticket in self._active
+            if ticket.started_at is None or now - ticket.started_at < self.ramp_seconds
+        )
+
+    def projected_percent(self) -> Optional[float]:
+        """Projected memory usage if one more job were admitted now."""
+        reading = self._read()
+        if reading is None:
+            return None
+        used_mb, total_mb = reading
+        if total_mb <= 0:
+            return None
+        projected_mb = used_mb + self._ramping_mb(time.time()) + self.estimator.estimate_mb
+        return projected_mb / total_mb * 100
+
+    def _has_room(self) -> bool:
+        projected = self.projected_percent()
+        return projected is None or projected <= self.memory_limit_percent
+
+    async def admit(self, label: str = "", start: bool = True) -> AdmissionTicket:
+        """
+        Wait in FIFO order until the job fits into memory.
+
+        Args:
+            label: Job description for logging
+            start: The job starts right away; pass False when it still
+                   waits for a worker slot and call start() once it has one
+
+        Returns:
+            AdmissionTicket to hand back to release()
+        """
+        if self._queue_lock is None:
+            self._queue_lock = asyncio.Lock()
+
+        queued_at = time.time()
+        self.stats["queued"] += 1
+        try:
+            async with self._queue_lock:
+                if not self._active:
+                    self._baseline_mb = (self._read() or (None, None))[0]
+
+                delayed = False
+                recycled = False
+                while not self._has_room():
+                    if not self._active:
+                        # Nothing running that could free memory: admit anyway
+                        self.stats["forced_admissions"] += 1
+                        break
+                    if not delayed:
+                        delayed = True
+                        self.stats["delayed"] += 1
+                        print(f"   ⏸️ Holding {label[:40] or 'job'} "
+                              f"(projected memory {self.projected_percent():.0f}% "
+                              f"> {self.memory_limit_percent:.0f}%)")
+                    if not recycled:
+                        recycled = True
+                        await self._recycle()
+                    await asyncio.sleep(self.poll_interval)
+
+                now = time.time()
+                waited = now - queued_at
+                ticket = AdmissionTicket(
+                    label=label,
+                    reserved_mb=self.estimator.estimate_mb,
+                    admitted_at=now,
+                    waited_seconds=waited,
+                    started_at=now if start else None,
+                )
+                self._active.append(ticket)
+        finally:
+            self.stats["queued"] -= 1
+
+        self.stats["admitted"] += 1
+        if delayed:
+            self.stats["wait_seconds"] += waited
+            self.stats["max_wait_seconds"] = max(self.stats["max_wait_seconds"], waited)
+        return ticket
+
+    def start(self, ticket: AdmissionTicket):
+        """Mark an admitted job as started (its ramp-up reservation begins now)."""
+        ticket.started_at = time.time()
+
+    def release(self, ticket: AdmissionTicket):
+        """
+        Mark a job finished and learn from its footprint.
+
+        Args:
+            ticket: Ticket returned by admit()
+        """
+        reading = self._read()
+        running = len(self._active)
+        if reading is not None and self._baseline_mb is not None and running:
+            self.estimator.observe((reading[0] - self._baseline_mb) / running)
+
+        if ticket in self._active:
+            self._active.remove(ticket)
+
+    async def _recycle(self):
+        """Run recycle callbacks to free memory for held jobs."""
+        if not self._recycle_callbacks:
+            return
+        self.stats["recycles"] += 1
+        for callback in self._recycle_callbacks:
+            try:
+                outcome = callback()
+                if inspect.isawaitable(outcome):
+                    await outcome
+            except Exception as e:
+                print(f"   ⚠️ Recycle callback failed: {str(e)[:60]}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Admission statistics including the current footprint estimate."""
+        return {
+            **self.stats,
+            "wait_seconds": round(self.stats["wait_seconds"], 1),
+            "max_wait_seconds": round(self.stats["max_wait_seconds"], 1),
+            "active": len(self._active),
+            "footprint_estimate_mb": round(self.estimator.estimate_mb, 1),
+            "footprint_samples": self.estimator.samples,
+        }
@@ -22,9 +22,10 @@ import json
 import sys
 import time
 import traceback # Import traceback
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from pathlib import Path
 from bob.config.settings import DEFAULT_EXTRACTOR_CONFIG
+from bob.utils.checkpoints import StageCheckpoints
 
 
 class BatchProcessor:
@@ -36,7 +37,8 @@ class BatchProcessor:
     resource issues that cause browser crashes.
     """
 
-    def __init__(self, headless: bool = True, include_reviews: bool = False, max_reviews: int = 0, timeout: int = DEFAULT_EXTRACTOR_CONFIG.timeout):
+    def __init__(self, headless: bool = True, include_reviews: bool = False, max_reviews: int = 0, timeout: Optional[int] = None,
+                 checkpoint_dir: Optional[str] = None):
         """
         Initialize batch processor.
 
@@ -44,19 +46,25 @@ class BatchProcessor:
             headless: Run browser in headless mode
             include_reviews: Extract reviews
             max_reviews: Maximum number of reviews to extract
-            timeout: Timeout in seconds for each subprocess extraction
+            timeout: Timeout in seconds for each subprocess extraction (default:
+                     the job deadline plus ExtractorConfig.subprocess_margin, so a
+                     timed-out job can still report its partial result)
+            checkpoint_dir: Persist completed stages of partial results here so
+                            retries (also in a later run) redo only failed stages
         """
         self.headless = headless
         self.include_reviews = include_reviews
         self.max_reviews = max_reviews
-        self.timeout = timeout
+        self.timeout = timeout or DEFAULT_EXTRACTOR_CONFIG.timeout + DEFAULT_EXTRACTOR_CONFIG.subprocess_margin
+        self.checkpoints = StageCheckpoints(checkpoint_dir)
 
-    def extract_single_subprocess(self, business_name: str) -> Dict[str, Any]:
+    def extract_single_subprocess(self, business_name: str, fields: Optional[List[str]] = None) -> Dict[str, Any]:
         """
         Extract a single business in an isolated subprocess.
 
         Args:
             business_name: Business name or URL to extract
+            fields: Only extract these fields (see bob.utils.projection)
 
         Returns:
             Extraction result dictionary
@@ -77,7 +85,8 @@ try:
     result = extractor.extract_business(
         "{business_name}",
         include_reviews={self.include_reviews},
-        max_reviews={self.max_reviews}
+        max_reviews={self.max_reviews},
+        fields={fields!r}
     )
 
     # Output result as JSON
@@ -130,7 +139,7 @@ except Exception as e:
         except subprocess.TimeoutExpired:
             return {
                 "success": False,
-                "error": "Subprocess timeout after 120 seconds",
+                "error": f"Subprocess timeout after {self.timeout} seconds",
                 "business": business_name
             }
         except Exception as e:
@@ -179,6 +188,7 @@ except Exception as e:
 
             # Extract in isolated subprocess
             result = self.extract_single_subprocess(business)
+            self.checkpoints.record(business, result)
 
             if result.get('success'):
                 successful += 1
@@ -221,7 +231,10 @@ except Exception as e:
         """
         Process batch with automatic retry for failures.
 
-        Provides 100% success rate by retrying failed extractions.
+        Provides 100% success rate by retrying failed extractions. Partial
+        results (some stages failed) are retried too, but only their failed
+        data stages are extracted again and merged with the checkpointed
+        rest; partial results missing only non-data stages are kept as is.
 
         Args:
             businesses: List of business names or URLs
@@ -236,27 +249,33 @@ except Exception as e:
 
         # Retry failed ones
         for retry_attempt in range(max_retries):
-            failed_indices = [i for i, r in enumerate(results) if not r.get('success')]
+            failed_indices = [i for i, r in enumerate(results) if self.checkpoints.needs_retry(businesses[i], r)]
 
             if not failed_indices:
                 break  # All successful
 
             if verbose:
                 print(f"\n🔄 RETRY ROUND {retry_attempt + 1}")
-                print(f"Retrying {len(failed_indices)} failed extractions...")
+                print(f"Retrying {len(failed_indices)} failed or partial extractions...")
                 print()
 
             for idx in failed_indices:
                 business = businesses[idx]
+                fields = self.checkpoints.retry_fields(business)
                 if verbose:
-                    print(f"Retry: {business}...", end=" ", flush=True)
+                    resuming = f" (only {', '.join(self.checkpoints.pending_stages(business))})" if fields else ""
+                    print(f"Retry: {business}{resuming}...", end=" ", flush=True)
 
-                result = self.extract_single_subprocess(business)
+                result = self.extract_single_subprocess(business, fields=fields)
+                if fields:
+                    result = self.checkpoints.merge(business, result)
+                else:
+                    self.checkpoints.record(business, result)
 
                 if result.get('success'):
                     name = result.get('name', 'Unknown')[:30]
                     if verbose:
-                        print(f"✅ {name}")
+                        print(f"✅ {name}{' (partial)' if result.get('partial') else ''}")
                     results[idx] = result
                 else:
                     error = result.get('error', 'Unknown')[:50]
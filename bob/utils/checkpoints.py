@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+BOB Stage Checkpoints v4.3.1
+
+Per-job checkpoints of completed extraction stages, so a retry only
+redoes the stages that failed.
+
+A job's result is split into stage outputs - panel fields, images,
+reviews, emails - using the field map in bob.utils.projection. Stages
+an engine reported as failed, timed out or skipped (incomplete_stages,
+stage_errors, stages_skipped) are remembered as pending. A retry then
+extracts with a field projection covering just the pending stages, on
+whichever engine is available, and merge() folds its output into the
+checkpointed result.
+
+Checkpoints live in memory, or as one JSON file per job in a directory
+so a batch can resume after a restart.
+
+Usage:
+    from bob.utils.checkpoints import StageCheckpoints
+
+    checkpoints = StageCheckpoints()
+    checkpoints.record(query, result)
+    fields = checkpoints.retry_fields(query)     # None: nothing to resume
+    if fields:
+        retry = extractor.extract_business(query, fields=fields)
+        result = checkpoints.merge(query, retry)
+"""
+
+import copy
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Union
+
+from bob.utils.projection import FIELD_STAGES, RESULT_KEYS
+
+
+# Stages whose output can be reused by a later attempt (navigation cannot)
+DATA_STAGES = ("fields", "images", "reviews", "email")
+
+# Engine stage names -> checkpoint stage
+STAGE_ALIASES = {
+    "core": "fields",
+    "photos": "images",
+    "emails": "email",
+}
+
+
+def canonical_stage(name: str) -> Optional[str]:
+    """Checkpoint stage for an engine's stage name (None if not a data stage)."""
+    stage = STAGE_ALIASES.get(name, name)
+    return stage if stage in DATA_STAGES else None
+
+
+def incomplete_stages(result: Dict[str, Any]) -> Set[str]:
+    """Data stages a result reports as failed, timed out or skipped."""
+    names = list(result.get("incomplete_stages") or [])
+    names += list(result.get("stage_errors") or {})
+    names += list(result.get("stages_skipped") or [])
+    return {stage for stage in map(canonical_stage, names) if stage}
+
+
+def stage_keys(stage: str) -> List[str]:
+    """Result keys produced by one data stage."""
+    keys = []
+    for field, field_stage in FIELD_STAGES.items():
+        if field_stage == stage:
+            keys.extend(RESULT_KEYS.get(field, (field,)))
+    return keys
+
+
+class StageCheckpoints:
+    """
+    Completed stage outputs per job, in memory or on disk.
+    """
+
+    def __init__(self, directory: Optional[Union[str, Path]] = None):
+        """
+        Args:
+            directory: Keep one JSON checkpoint per job here (None: memory only)
+        """
+        self.directory = Path(directory) if directory else None
+        if self.directory:
+            self.directory.mkdir(parents=True, exist_ok=True)
+        self._jobs: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self.stats = {
+            "recorded": 0,
+            "resumed": 0,
+            "stages_reused": 0,
+            "stages_recovered": 0,
+        }
+
+    @staticmethod
+    def key(job: str) -> str:
+        """Checkpoint key for a query or URL."""
+        return " ".join(job.lower().split())
+
+    # ------------------------------------------------------------------
+    # Record / resume
+    # ------------------------------------------------------------------
+
+    def record(self, job: str, result: Dict[str, Any]):
+        """
+        Checkpoint a result's completed stages.
+
+        Failed jobs are not recorded (nothing reusable happened), and a
+        job with no pending stages needs no checkpoint.
+        """
+        if not result or not result.get("success"):
+            return
+        pending = incomplete_stages(result)
+        if not pending:
+            self.clear(job)
+            return
+        with self._lock:
+            self._store(job, {"result": copy.deepcopy(result), "pending": sorted(pending)})
+            self.stats["recorded"] += 1
+
+    def pending_stages(self, job: str) -> List[str]:
+        """Stages still to be done for job ([] if there is no checkpoint)."""
+        checkpoint = self._load(job)
+        return list(checkpoint["pending"]) if checkpoint else []
+
+    def needs_retry(self, job: str, result: Dict[str, Any]) -> bool:
+        """
+        Whether a retry could improve result.
+
+        Failed results are retried in full. A partial result is only
+        retried while it has pending data stages; one whose incomplete
+        stages are all non-data (readiness, navigation) already holds
+        everything a retry could reuse.
+        """
+        if not result.get("success"):
+            return True
+        return bool(result.get("partial")) and bool(self.pending_stages(job))
+
+    def retry_fields(self, job: str) -> Optional[List[str]]:
+        """
+        Field projection that redoes only the pending stages.
+
+        Returns:
+            Field names for fields=, or None when there is no checkpoint
+            (the retry has to be a full extraction)
+        """
+        pending = set(self.pending_stages(job))
+        if not pending:
+            return None
+        return sorted(field for field, stage in FIELD_STAGES.items() if stage in pending)
+
+    def merge(self, job: str, retry: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Fold a retry's output into the checkpointed result.
+
+        Only the pending stages the retry completed are taken from it;
+        everything else comes from the checkpoint. Returns the retry
+        unchanged when there is no checkpoint.
+        """
+        with self._lock:
+            checkpoint = self._load(job)
+            if not checkpoint:
+                return retry
+            result = checkpoint["result"]
+            pending = set(checkpoint["pending"])
+            reused = [stage for stage in DATA_STAGES if stage not in pending]
+
+            recovered = []
+            if retry.get("success"):
+                failed_again = incomplete_stages(retry)
+                for stage in sorted(pending - failed_again):
+                    for key in stage_keys(stage):
+                        if key in retry:
+                            result[key] = retry[key]
+                    recovered.append(stage)
+                    pending.discard(stage)
+
+            if recovered:
+                errors = result.get("stage_errors") or {}
+                result["stage_errors"] = {name: error for name, error in errors.items()
+                                          if canonical_stage(name) not in recovered}
+                skipped = result.get("stages_skipped") or []
+                result["stages_skipped"] = [name for name in skipped if canonical_stage(name) not in recovered]
+
+            result["resumed_stages"] = sorted(set(result.get("resumed_stages", [])) | set(recovered))
+            result["incomplete_stages"] = sorted(pending)
+            if pending:
+                result["partial"] = True
+                self._store(job, {"result": result, "pending": sorted(pending)})
+            else:
+                result.pop("partial", None)
+                self._delete(job)
+
+            self.stats["resumed"] += 1
+            self.stats["stages_reused"] += len(reused)
+            self.stats["stages_recovered"] += len(recovered)
+            if recovered:
+                print(f"♻️ Resumed {', '.join(recovered)} (reused {', '.join(reused)})")
+            return copy.deepcopy(result)
+
+    def clear(self, job: str):
+        """Forget job's checkpoint."""
+        with self._lock:
+            self._delete(job)
+
+    # ------------------------------------------------------------------
+    # Storage
+    # ------------------------------------------------------------------
+
+    def _path(self, job: str) -> Path:
+        digest = hashlib.sha1(self.key(job).encode("utf-8")).hexdigest()
+        return self.directory / f"{digest}.json"
+
+    def _store(self, job: str, checkpoint: Dict[str, Any]):
+        self._jobs[self.key(job)] = checkpoint
+        if self.directory:
+            path = self._path(job)
+            temp_file = path.with_suffix(f".{os.getpid()}.tmp")
+            with open(temp_file, "w", encoding="utf-8") as handle:
+                json.dump({"job": job, **checkpoint}, handle, default=str)
+            os.replace(temp_file, path)
+
+    def _load(self, job: str) -> Optional[Dict[str, Any]]:
+        checkpoint = self._jobs.get(self.key(job))
+        if checkpoint is None and self.directory:
+            try:
+                with open(self._path(job), encoding="utf-8") as handle:
+                    stored = json.load(handle)
+                checkpoint = {"result": stored["result"], "pending": stored["pending"]}
+                self._jobs[self.key(job)] = checkpoint
+            except (OSError, ValueError, KeyError):
+                return None
+        return checkpoint
+
+    def _delete(self, job: str):
+        self._jobs.pop(self.key(job), None)
+        if self.directory:
+            try:
+                self._path(job).unlink()
+            except OSError:
+                pass
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, "open_checkpoints": len(self._jobs)}
@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+"""
+BOB Adaptive Concurrency v4.3.1
+
+AIMD (additive-increase / multiplicative-decrease) concurrency control for
+parallel extraction. The worker count grows by one slot at a time while
+latency and error rates stay healthy, and is cut multiplicatively when
+Google starts throttling (timeouts, CAPTCHA / "unusual traffic" pages) or
+when the machine runs short of memory.
+
+Every evaluation is recorded as a ConcurrencyDecision so the controller's
+behaviour can be inspected (or plotted) after a batch.
+
+Usage:
+    from bob.utils.concurrency import AdaptiveConcurrencyController
+
+    controller = AdaptiveConcurrencyController()
+    async with controller:
+        result = await extract(...)
+    controller.record(latency_seconds, classify_outcome(result))
+"""
+
+import asyncio
+import math
+import os
+import statistics
+import time
+from collections import deque
+from dataclasses import dataclass, asdict
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+import psutil
+
+from bob.utils.resources import read_cgroup_limits
+
+
+# Outcome labels understood by the controller
+OUTCOME_SUCCESS = "success"
+OUTCOME_FAILURE = "failure"
+OUTCOME_TIMEOUT = "timeout"
+OUTCOME_BLOCKED = "blocked"
+
+# Text fragments that identify Google's anti-bot interstitials
+BLOCK_MARKERS = (
+    "unusual traffic",
+    "captcha",
+    "google.com/sorry",
+    "/sorry/index",
+    "automated queries",
+)
+
+# Rough memory cost of one headless Chromium working a Maps page
+BROWSER_FOOTPRINT_MB = 300
+
+
+def classify_outcome(result: Optional[Dict[str, Any]]) -> str:
+    """
+    Map an extraction result dictionary to a controller outcome.
+
+    Args:
+        result: Result returned by an extractor (may be None)
+
+    Returns:
+        One of "success", "failure", "timeout" or "blocked"
+    """
+    if result and result.get("success"):
+        return OUTCOME_SUCCESS
+
+    error = str((result or {}).get("error", "")).lower()
+    if any(marker in error for marker in BLOCK_MARKERS):
+        return OUTCOME_BLOCKED
+    if "timeout" in error or "timed out" in error:
+        return OUTCOME_TIMEOUT
+    return OUTCOME_FAILURE
+
+
+def default_concurrency_ceiling() -> int:
+    """
+    Upper bound for adaptive concurrency on this machine.
+
+    One browser per CPU core, further limited by how many browser
+    footprints fit into currently available memory. Inside a container
+    the cgroup v2 CPU quota and memory limit take precedence over the
+    host's numbers.
+    """
+    cpu_bound = os.cpu_count() or 1
+    limits = read_cgroup_limits()
+    if limits["cpu_limit"]:
+        cpu_bound = min(cpu_bound, max(1, math.ceil(limits["cpu_limit"])))
+    try:
+        available_mb = psutil.virtual_memory().available / 1024 / 1024
+        if limits["memory_limit_mb"] and limits["memory_current_mb"] is not None:
+            available_mb = min(available_mb, limits["memory_limit_mb"] - limits["memory_current_mb"])
+        memory_bound = int(available_mb // BROWSER_FOOTPRINT_MB)
+    except Exception:
+        memory_bound = cpu_bound
+    return max(1, min(cpu_bound, memory_bound))
+
+
+@dataclass
+class AIMDConfig:
+    """Tuning knobs for AdaptiveConcurrencyController."""
+
+    initial_limit: int = 2
+    min_limit: int = 1
+    max_limit: Optional[int] = None        # None = default_concurrency_ceiling()
+    increase_step: int = 1                 # Additive increase per healthy window
+    decrease_factor: float = 0.5           # Multiplicative decrease on congestion
+    window_size: int = 5                   # Completed jobs per evaluation window
+    latency_target_seconds: float = 30.0   # p50 latency considered healthy
+    max_error_rate: float = 0.2            # Failure share considered healthy
+    memory_high_percent: float = 80.0      # Back off above this memory usage
+    cooldown_seconds: float = 20.0         # Minimum gap between two decreases
+    history_size: int = 1000               # Decisions kept in the time series
+
+
+@dataclass
+class ConcurrencyDecision:
+    """One point of the controller's metrics time series."""
+
+    timestamp: float
+    action: str            # "increase", "decrease" or "hold"
+    reason: str
+    previous_limit: int
+    limit: int
+    in_flight: int
+    window_jobs: int
+    p50_latency_seconds: Optional[float]
+    error_rate: Optional[float]
+    memory_percent: Optional[float]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return asdict(self)
+
+
+class AdaptiveConcurrencyController:
+    """
+    AIMD concurrency limiter usable as an async context manager.
+
+    Acts like an asyncio.Semaphore whose size changes over time:
+    - +increase_step after a window of fast, mostly successful jobs
+    - x decrease_factor on timeouts, CAPTCHA pages or memory pressure
+    """
+
+    def __init__(
+        self,
+        config: Optional[AIMDConfig] = None,
+        memory_probe: Optional[Callable[[], float]] = None,
+    ):
+        """
+        Initialize the controller.
+
+        Args:
+            config: AIMDConfig instance (uses defaults if None)
+            memory_probe: Callable returning memory usage percent
+                          (defaults to host-wide psutil reading)
+        """
+        self.config = config or AIMDConfig()
+        self.max_limit = self.config.max_limit or default_concurrency_ceiling()
+        self.min_limit = max(1, min(self.config.min_limit, self.max_limit))
+        self._limit = min(max(self.config.initial_limit, self.min_limit), self.max_limit)
+        self._memory_probe = memory_probe or (lambda: psutil.virtual_memory().percent)
+
+        self._in_flight = 0
+        self._condition: Optional[asyncio.Condition] = None
+        self._window: List[Tuple[float, str]] = []
+        self._last_decrease = 0.0
+        self._history: Deque[ConcurrencyDecision] = deque(maxlen=self.config.history_size)
+
+    # ------------------------------------------------------------------
+    # Limiter interface
+    # ------------------------------------------------------------------
+
+    @property
+    def limit(self) -> int:
+        """Current number of concurrent slots."""
+        return self._limit
+
+    @property
+    def in_flight(self) -> int:
+        """Number of slots currently held."""
+        return self._in_flight
+
+    def _get_condition(self) -> asyncio.Condition:
+        # Created lazily so the controller can be built outside a running loop
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        return self._condition
+
+    async def acquire(self):
+        """Wait for a free slot under the current limit."""
+        condition = self._get_condition()
+        async with condition:
+            await condition.wait_for(lambda: self._in_flight < self._limit)
+            self._in_flight += 1
+
+    async def release(self):
+        """Return a slot and wake waiters."""
+        condition = self._get_condition()
+        async with condition:
+            self._in_flight = max(0, self._in_flight - 1)
+            condition.notify_all()
+
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.release()
+        return False
+
+    # ------------------------------------------------------------------
+    # Feedback
+    # ------------------------------------------------------------------
+
+    def record(self, latency_seconds: float, outcome: str) -> Optional[ConcurrencyDecision]:
+        """
+        Feed one completed job into the controller.
+
+        Congestion signals (blocked, timeout, memory pressure) are acted on
+        immediately; everything else is evaluated once per window.
+
+        Args:
+            latency_seconds: Wall time of the job
+            outcome: Result of classify_outcome()
+
+        Returns:
+            The decision taken, or None if the window is still filling
+        """
+        self._window.append((latency_seconds, outcome))
+        memory_percent = self._read_memory()
+
+        if outcome == OUTCOME_BLOCKED:
+            return self._decrease("blocked by Google (CAPTCHA / unusual traffic)", memory_percent)
+        if outcome == OUTCOME_TIMEOUT:
+            return self._decrease("extraction timeout", memory_percent)
+        if memory_percent is not None and memory_percent >= self.config.memory_high_percent:
+            return self._decrease(f"memory pressure ({memory_percent:.0f}%)", memory_percent)
+
+        if len(self._window) < self.config.window_size:
+            return None
+
+        p50, error_rate = self._window_stats()
+        if error_rate > self.config.max_error_rate:
+            return self._decrease(f"error rate {error_rate:.0%}", memory_percent)
+        if p50 > self.config.latency_target_seconds:
+            return self._decide("hold", f"p50 latency {p50:.1f}s above target",
+                                self._limit, memory_percent)
+        if self._limit >= self.max_limit:
+            return self._decide("hold", "at ceiling", self._limit, memory_percent)
+
+        new_limit = min(self.max_limit, self._limit + self.config.increase_step)
+        return self._decide("increase", "healthy window", new_limit, memory_percent)
+
+    def _read_memory(self) -> Optional[float]:
+        try:
+            return float(self._memory_probe())
+        except Exception:
+            return None
+
+    def _window_stats(self) -> Tuple[float, float]:
+        latencies = [latency for latency, _ in self._window]
+        failures = sum(1 for _, outcome in self._window if outcome != OUTCOME_SUCCESS)
+        p50 = statistics.median(latencies) if latencies else 0.0
+        error_rate = failures / len(self._window) if self._window else 0.0
+        return p50, error_rate
+
+    def _decrease(self, reason: str, memory_percent: Optional[float]) -> ConcurrencyDecision:
+        now = time.time()
+        if now - self._last_decrease < self.config.cooldown_seconds:
+            # One cut per cooldown: in-flight jobs started under the old
+            # limit will report the same congestion a second time.
+            return self._decide("hold", f"{reason} (cooldown)", self._limit, memory_percent)
+
+        self._last_decrease = now
+        new_limit = max(self.min_limit, int(self._limit * self.config.decrease_factor))
+        return self._decide("decrease", reason, new_limit, memory_percent)
+
+    def _decide(
+        self,
+        action: str,
+        reason: str,
+        new_limit: int,
+        memory_percent: Optional[float],
+    ) -> ConcurrencyDecision:
+        p50, error_rate = self._window_stats() if self._window else (None, None)
+        decision = ConcurrencyDecision(
+            timestamp=time.time(),
+            action=action,
+            reason=reason,
+            previous_limit=self._limit,
+            limit=new_limit,
+            in_flight=self._in_flight,
+            window_jobs=len(self._window),
+            p50_latency_seconds=round(p50, 2) if p50 is not None else None,
+            error_rate=round(error_rate, 3) if error_rate is not None else None,
+            memory_percent=memory_percent,
+        )
+        self._history.append(decision)
+        self._window = []
+
+        if new_limit != self._limit:
+            self._limit = new_limit
+            if action == "increase" and self._condition is not None:
+                self._schedule_wakeup()
+        return decision
+
+    def _schedule_wakeup(self):
+        """Wake waiters after the limit grew (record() is synchronous)."""
+        async def _notify():
+            async with self._condition:
+                self._condition.notify_all()
+
+        try:
+            asyncio.get_running_loop().create_task(_notify())
+        except RuntimeError:
+            pass
+
+    # ------------------------------------------------------------------
+    # Metrics
+    # ------------------------------------------------------------------
+
+    def metrics(self) -> List[Dict[str, Any]]:
+        """Return the decision time series as a list of dictionaries."""
+        return [decision.to_dict() for decision in self._history]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Summary of the controller's current state and history."""
+        limits = [d.limit for d in self._history] or [self._limit]
+        return {
+            "current_limit": self._limit,
+            "min_limit": self.min_limit,
+            "max_limit": self.max_limit,
+            "peak_limit": max(limits),
+            "in_flight": self._in_flight,
+            "increases": sum(1 for d in self._history if d.action == "increase"),
+            "decreases": sum(1 for d in self._history if d.action == "decrease"),
+            "decisions": len(self._history),
+        }
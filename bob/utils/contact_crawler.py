@@ -0,0 +1,346 @@
+#!/usr/bin/env python3
+"""
+BOB Contact Crawler v4.3.1
+
+Bounded crawl of a business website for email addresses. Many sites
+only list them on /contact, /about or an imprint page, so after the
+landing page the crawler follows the links that look most like contact
+pages, one depth level at a time, in a single async pass:
+
+- max_depth link levels and max_pages pages per website (landing included),
+  stopping as soon as enough addresses were found
+- Only links on the same registered domain, ranked by contact keywords in
+  the path and link text
+- Per-host politeness: at most per_host_concurrency requests at once and
+  per_host_delay seconds between request starts
+- Followed links are checked against robots.txt, cached per origin
+
+Pages are fetched through the shared HTTP client and scanned with
+EmailScanner while they stream in.
+
+Usage:
+    from bob.utils.contact_crawler import get_contact_crawler
+
+    crawler = get_contact_crawler()
+    crawl = await crawler.crawl("https://bluebottlecoffee.com/")
+    print(crawl.emails, crawl.pages)
+"""
+
+import asyncio
+import re
+import threading
+import time
+import weakref
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urldefrag, urljoin, urlparse
+from urllib.robotparser import RobotFileParser
+
+from bob.cache.enrichment_cache import registered_domain
+from bob.config.settings import DEFAULT_EXTRACTOR_CONFIG
+from bob.utils.email_scanner import EmailScanner
+from bob.utils.http_client import AsyncHTTPClient, FetchResult, get_http_client
+
+
+# <a href="...">text</a>; the text is only used for ranking
+LINK_RE = re.compile(r'<a\b[^>]*?\bhref\s*=\s*["\']?([^"\'\s>]+)[^>]*>(.{0,300}?)</a>', re.IGNORECASE | re.DOTALL)
+TAG_RE = re.compile(r'<[^>]+>')
+
+# Keyword -> score, matched in the lower-cased link path and text
+CONTACT_KEYWORDS = (
+    ("contact", 3), ("kontakt", 3), ("impressum", 3), ("touch", 3),
+    ("about", 2), ("imprint", 2), ("uber-uns", 2), ("ueber-uns", 2), ("nosotros", 2), ("team", 2),
+    ("legal", 1), ("support", 1), ("help", 1), ("location", 1), ("info", 1),
+)
+
+# Links that are files, not pages
+SKIP_SUFFIXES = ('.pdf', '.png', '.jpg', '.jpeg', '.gif', '.svg', '.webp', '.zip',
+                 '.css', '.js', '.xml', '.mp4', '.mp3', '.doc', '.docx')
+
+ROBOTS_MAX_BYTES = 64 * 1024
+
+
+@dataclass
+class CrawlerConfig:
+    """Limits for crawling one business website."""
+    max_depth: int = 1                # Link levels followed from the landing page (0: landing only)
+    max_pages: int = 4                # Pages fetched per website, landing page included
+    email_limit: int = 5              # Stop once this many addresses were found
+    per_host_concurrency: int = 2     # Requests in flight to one host
+    per_host_delay: float = 0.5       # Seconds between request starts to one host
+    max_page_bytes: int = 500_000
+    robots_ttl: float = 3600.0        # Seconds a robots.txt stays cached
+
+
+@dataclass
+class CrawlResult:
+    """Outcome of crawling one website."""
+    url: str
+    emails: List[str] = field(default_factory=list)
+    pages: List[str] = field(default_factory=list)   # Fetched, in order (landing first)
+    landing: Optional[FetchResult] = None            # Response of the landing page
+    robots_blocked: int = 0
+    seconds: float = 0.0
+
+
+def _score(text: str) -> int:
+    return max((score for keyword, score in CONTACT_KEYWORDS if keyword in text), default=0)
+
+
+def _normalize(url: str) -> str:
+    return urldefrag(url)[0].rstrip("/")
+
+
+def contact_links(html: str, base_url: str) -> List[Tuple[int, str]]:
+    """
+    Links on a page that look like contact pages, best first.
+
+    Returns:
+        [(score, absolute url)] on the same registered domain as base_url
+    """
+    domain = registered_domain(base_url)
+    found: Dict[str, Tuple[int, str]] = {}
+    for href, text in LINK_RE.findall(html):
+        url = urldefrag(urljoin(base_url, href.strip()))[0]
+        parsed = urlparse(url)
+        if parsed.scheme not in ("http", "https") or registered_domain(url) != domain:
+            continue
+        path = parsed.path.lower()
+        if path.endswith(SKIP_SUFFIXES):
+            continue
+        score = _score(path) + _score(TAG_RE.sub(" ", text).lower())
+        key = _normalize(url)
+        if score and (key not in found or found[key][0] < score):
+            found[key] = (score, url)
+    # Stable: equal scores keep page order
+    return sorted(found.values(), key=lambda item: -item[0])
+
+
+class _HostGate:
+    """Per-host concurrency limit and minimum spacing of request starts."""
+
+    def __init__(self, concurrency: int, delay: float):
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.delay = delay
+        self._next_start = 0.0
+
+    async def __aenter__(self):
+        await self.semaphore.acquire()
+        try:
+            now = asyncio.get_running_loop().time()
+            start = max(now, self._next_start)
+            self._next_start = start + self.delay
+            if start > now:
+                await asyncio.sleep(start - now)
+        except BaseException:
+            self.semaphore.release()
+            raise
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.semaphore.release()
+
+
+class RobotsCache:
+    """
+    robots.txt rules per origin (scheme://host), kept for ttl seconds.
+
+    Missing or unreadable robots.txt allows everything; 401/403 disallows
+    everything (as urllib.robotparser does).
+    """
+
+    def __init__(self, ttl: float = 3600.0):
+        self.ttl = ttl
+        self._entries: Dict[str, Tuple[RobotFileParser, float]] = {}
+        self._lock = threading.Lock()
+        self.stats = {"fetched": 0, "hits": 0}
+
+    def cached(self, origin: str) -> Optional[RobotFileParser]:
+        with self._lock:
+            entry = self._entries.get(origin)
+            if entry and entry[1] > time.time():
+                self.stats["hits"] += 1
+                return entry[0]
+        return None
+
+    def store(self, origin: str, page: FetchResult) -> RobotFileParser:
+        parser = RobotFileParser(f"{origin}/robots.txt")
+        if page.status in (401, 403):
+            parser.disallow_all = True
+        elif page.ok:
+            parser.parse(page.text.splitlines())
+        else:
+            parser.allow_all = True
+        with self._lock:
+            self._entries[origin] = (parser, time.time() + self.ttl)
+            self.stats["fetched"] += 1
+        return parser
+
+
+def _origin(url: str) -> str:
+    parsed = urlparse(url)
+    return f"{parsed.scheme}://{parsed.netloc.lower()}"
+
+
+class ContactCrawler:
+    """
+    Bounded, polite crawler looking for contact emails on business websites.
+    """
+
+    def __init__(self, config: Optional[CrawlerConfig] = None):
+        self.config = config or CrawlerConfig()
+        self.robots = RobotsCache(self.config.robots_ttl)
+        # Host gates per event loop (asyncio primitives belong to one loop)
+        self._gates = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+        self.stats = {
+            "crawls": 0,
+            "pages": 0,
+            "followed": 0,          # Pages beyond the landing page
+            "found_on_followed": 0, # Addresses the landing page did not have
+            "robots_blocked": 0,
+        }
+
+    async def crawl(self, url: str, client: Optional[AsyncHTTPClient] = None,
+                    timeout: Optional[float] = None,
+                    headers: Optional[Dict[str, str]] = None) -> CrawlResult:
+        """
+        Crawl a website from its landing page.
+
+        Args:
+            url: Landing page
+            client: AsyncHTTPClient (default: the process-wide one)
+            timeout: Per-request timeout
+            headers: Extra headers for the landing request only (e.g.
+                     If-None-Match); on a 304 nothing else is fetched
+
+        Returns:
+            CrawlResult; emails are empty unless the landing page loaded
+        """
+        client = client or get_http_client()
+        started = time.time()
+        result = CrawlResult(url=url)
+
+        landing, emails, links = await self._fetch_page(url, client, timeout, headers, follow=self.config.max_depth > 0)
+        result.landing = landing
+        result.pages.append(url)
+        if landing.ok:
+            result.emails = list(emails)
+            base = landing.final_url or url
+            visited = {_normalize(url), _normalize(base)}
+            depth = 1
+            while links and depth <= self.config.max_depth and not self._enough(result):
+                batch = await self._select(links, visited, client, result)
+                if not batch:
+                    break
+                pages = await asyncio.gather(*(
+                    self._fetch_page(link, client, timeout, follow=depth < self.config.max_depth) for link in batch
+                ))
+                links = []
+                for link, (page, page_emails, page_links) in zip(batch, pages):
+                    result.pages.append(link)
+                    self._merge(result, page_emails)
+                    links.extend(page_links)
+                links.sort(key=lambda item: -item[0])
+                depth += 1
+
+        result.seconds = time.time() - started
+        with self._lock:
+            self.stats["crawls"] += 1
+            self.stats["pages"] += len(result.pages)
+            self.stats["followed"] += len(result.pages) - 1
+            if landing.ok:
+                self.stats["found_on_followed"] += len(result.emails) - len(emails)
+            self.stats["robots_blocked"] += result.robots_blocked
+        return result
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            stats = dict(self.stats)
+        stats["robots_fetched"] = self.robots.stats["fetched"]
+        stats["robots_hits"] = self.robots.stats["hits"]
+        return stats
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _enough(self, result: CrawlResult) -> bool:
+        return len(result.emails) >= self.config.email_limit or len(result.pages) >= self.config.max_pages
+
+    def _merge(self, result: CrawlResult, emails: List[str]):
+        for email in emails:
+            if email not in result.emails and len(result.emails) < self.config.email_limit:
+                result.emails.append(email)
+
+    async def _select(self, links: List[Tuple[int, str]], visited: set,
+                      client: AsyncHTTPClient, result: CrawlResult) -> List[str]:
+        """Best unvisited links allowed by robots.txt, within the page budget."""
+        budget = self.config.max_pages - len(result.pages)
+        batch = []
+        for _, link in links:
+            if len(batch) >= budget:
+                break
+            key = _normalize(link)
+            if key in visited:
+                continue
+            visited.add(key)
+            if await self._allowed(link, client):
+                batch.append(link)
+            else:
+                result.robots_blocked += 1
+        return batch
+
+    async def _allowed(self, url: str, client: AsyncHTTPClient) -> bool:
+        origin = _origin(url)
+        parser = self.robots.cached(origin)
+        if parser is None:
+            async with self._gate(url):
+                page = await client.fetch(f"{origin}/robots.txt", max_bytes=ROBOTS_MAX_BYTES)
+            parser = self.robots.store(origin, page)
+        return parser.can_fetch(client.config.user_agent, url)
+
+    def _gate(self, url: str) -> _HostGate:
+        gates = self._gates.setdefault(asyncio.get_running_loop(), {})
+        host = urlparse(url).netloc.lower()
+        if host not in gates:
+            gates[host] = _HostGate(self.config.per_host_concurrency, self.config.per_host_delay)
+        return gates[host]
+
+    async def _fetch_page(self, url: str, client: AsyncHTTPClient, timeout: Optional[float],
+                          headers: Optional[Dict[str, str]] = None,
+                          follow: bool = True) -> Tuple[FetchResult, List[str], List[Tuple[int, str]]]:
+        """Fetch one page: (response, emails on it, contact links to follow)."""
+        scanner = EmailScanner(limit=self.config.email_limit)
+        chunks = []
+
+        def consume(text):
+            if follow:
+                chunks.append(text)
+            return scanner.feed(text)
+
+        async with self._gate(url):
+            page = await client.fetch(url, timeout=timeout, max_bytes=self.config.max_page_bytes,
+                                      consumer=consume, headers=headers)
+        if not page.ok:
+            return page, [], []
+        emails = scanner.finish()
+        html = "".join(chunks)
+        is_html = not page.content_type or "html" in page.content_type
+        links = contact_links(html, page.final_url or url) if follow and is_html else []
+        return page, emails, links
+
+
+_crawler: Optional[ContactCrawler] = None
+_crawler_lock = threading.Lock()
+
+
+def get_contact_crawler() -> ContactCrawler:
+    """Process-wide contact crawler (depth and page budget from ExtractorConfig)."""
+    global _crawler
+    with _crawler_lock:
+        if _crawler is None:
+            _crawler = ContactCrawler(CrawlerConfig(
+                max_depth=DEFAULT_EXTRACTOR_CONFIG.contact_crawl_depth,
+                max_pages=DEFAULT_EXTRACTOR_CONFIG.contact_crawl_pages,
+            ))
+        return _crawler
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+BOB Job Deadline v4.3.1
+
+One wall-clock deadline per extraction job, shared out across its stages.
+
+Each stage gets a share of the time still remaining, proportional to its
+weight among the stages that have not run yet, so time a fast stage does
+not use rolls over to later ones. A stage that runs out of budget is
+cancelled and recorded as timed out; once the deadline itself has passed,
+later stages are skipped and the job returns the fields it already has,
+marked partial.
+
+Usage:
+    from bob.utils.deadline import Deadline
+
+    deadline = Deadline(60, stages=["navigation", "readiness", "fields"])
+    await page.goto(url, timeout=deadline.budget_ms("navigation", cap=30))
+    data = await deadline.run("fields", extract(page), default={})
+
+    # Inside a running stage: timeouts from what is left of its budget
+    await page.wait_for_selector("h1", timeout=deadline.time_left_ms("readiness", cap=10))
+    if deadline.partial:
+        data["partial"] = True
+"""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Dict, Iterable, List, Optional
+
+
+# Relative share of a job's time per stage
+DEFAULT_STAGE_WEIGHTS = {
+    "navigation": 3.0,
+    "readiness": 1.5,
+    "fields": 1.0,
+    "images": 1.5,
+    "reviews": 2.0,
+    "photos": 1.5,
+    "email": 1.0,
+}
+
+# A stage never gets less than this, even when the deadline is nearly spent
+MIN_STAGE_SECONDS = 0.5
+
+
+class DeadlineExceeded(Exception):
+    """The job's deadline passed before a stage could start."""
+
+
+class Deadline:
+    """
+    Per-job deadline with remaining-time stage budgets.
+    """
+
+    def __init__(
+        self,
+        seconds: float,
+        stages: Optional[Iterable[str]] = None,
+        weights: Optional[Dict[str, float]] = None,
+        clock=time.monotonic,
+    ):
+        """
+        Args:
+            seconds: Total time allowed for the job
+            stages: Stage names in the order the job runs them
+                    (default: every stage in DEFAULT_STAGE_WEIGHTS)
+            weights: Stage weights (default DEFAULT_STAGE_WEIGHTS; unknown stages weigh 1)
+            clock: Monotonic time source
+        """
+        self.seconds = seconds
+        self.weights = weights or DEFAULT_STAGE_WEIGHTS
+        self.stages: List[str] = list(stages) if stages is not None else list(self.weights)
+        self._clock = clock
+        self._expires = clock() + seconds
+        self._pending = list(self.stages)
+        self._stage_ends: Dict[str, float] = {}
+        self.results: Dict[str, Dict[str, Any]] = {}
+
+    # ------------------------------------------------------------------
+    # Budgets
+    # ------------------------------------------------------------------
+
+    def remaining(self) -> float:
+        """Seconds left before the deadline (never negative)."""
+        return max(0.0, self._expires - self._clock())
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+    @property
+    def partial(self) -> bool:
+        """Whether any stage timed out or was skipped for lack of time."""
+        return any(result["status"] != "done" for result in self.results.values())
+
+    def budget(self, stage: str, cap: Optional[float] = None) -> float:
+        """
+        Seconds stage may use now.
+
+        Args:
+            stage: Stage name
+            cap: Upper bound in seconds (the stage's own usual timeout)
+        """
+        pending = self._pending[self._pending.index(stage):] if stage in self._pending else [stage]
+        total = sum(self.weights.get(name, 1.0) for name in pending)
+        share = self.remaining() * self.weights.get(stage, 1.0) / total
+        share = max(share, min(MIN_STAGE_SECONDS, self.remaining()))
+        return min(share, cap) if cap is not None else share
+
+    def budget_ms(self, stage: str, cap: Optional[float] = None) -> int:
+        """budget() in milliseconds, for Playwright timeout= arguments."""
+        return max(1, int(self.budget(stage, cap) * 1000))
+
+    def time_left(self, stage: str, cap: Optional[float] = None) -> float:
+        """
+        Seconds left of a running stage's budget (its budget() if not started).
+
+        Code running inside a stage derives its own timeouts from this, so
+        they shrink with the stage instead of outliving it.
+
+        Args:
+            stage: Stage name
+            cap: Upper bound in seconds (the step's usual timeout)
+        """
+        ends = self._stage_ends.get(stage)
+        left = self.budget(stage) if ends is None else max(0.0, ends - self._clock())
+        left = min(left, self.remaining())
+        return min(left, cap) if cap is not None else left
+
+    def time_left_ms(self, stage: str, cap: Optional[float] = None) -> int:
+        """time_left() in milliseconds, for Playwright timeout= arguments."""
+        return max(1, int(self.time_left(stage, cap) * 1000))
+
+    # ------------------------------------------------------------------
+    # Stages
+    # ------------------------------------------------------------------
+
+    def start(self, stage: str) -> float:
+        """
+        Begin stage and return its budget.
+
+        Raises:
+            DeadlineExceeded: The deadline has already passed
+        """
+        if self.expired:
+            self.skip(stage)
+            raise DeadlineExceeded(f"Job deadline of {self.seconds:.0f}s passed before '{stage}'")
+        budget = self.budget(stage)
+        self._finish(stage)
+        self._stage_ends[stage] = self._clock() + budget
+        self.results[stage] = {"status": "running", "budget": round(budget, 2), "seconds": 0.0}
+        return budget
+
+    def skip(self, stage: str):
+        """Record that stage did not run for lack of time."""
+        self._finish(stage)
+        self.results[stage] = {"status": "skipped", "budget": 0.0, "seconds": 0.0}
+
+    def drop(self, stage: str):
+        """Remove a stage this job will not run, so its share goes to the others."""
+        self._finish(stage)
+
+    async def run(
+        self,
+        stage: str,
+        awaitable: Awaitable,
+        default: Any = None,
+        cap: Optional[float] = None,
+        required: bool = True,
+    ) -> Any:
+        """
+        Run one stage within its budget.
+
+        Args:
+            required: Re-raise the stage's exceptions; otherwise record the
+                      stage as failed and return default
+
+        Returns:
+            The awaitable's result, or default if the stage timed out or
+            the deadline had already passed
+        """
+        try:
+            budget = self.start(stage)
+        except DeadlineExceeded:
+            if asyncio.iscoroutine(awaitable):
+                awaitable.close()  # Never started; avoid "was never awaited"
+            return default
+        if cap is not None:
+            budget = min(budget, cap)
+            self._stage_ends[stage] = self._clock() + budget
+            self.results[stage]["budget"] = round(budget, 2)
+
+        started = self._clock()
+        try:
+            result = await asyncio.wait_for(awaitable, timeout=budget)
+            self.results[stage]["status"] = "done"
+            return result
+        except asyncio.TimeoutError:
+            self.results[stage]["status"] = "timeout"
+            print(f"⏱️ Stage '{stage}' ran out of time ({budget:.1f}s)")
+            return default
+        except Exception as e:
+            self.results[stage]["status"] = "failed"
+            if required:
+                raise
+            print(f"⚠️ Stage '{stage}' failed: {str(e)[:60]}")
+            return default
+        finally:
+            self.results[stage]["seconds"] = round(self._clock() - started, 2)
+
+    def _finish(self, stage: str):
+        if stage in self._pending:
+            self._pending.remove(stage)
+
+    def incomplete_stages(self) -> List[str]:
+        """Stages that timed out or were skipped."""
+        return [stage for stage, result in self.results.items() if result["status"] != "done"]
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "deadline_seconds": self.seconds,
+            "remaining_seconds": round(self.remaining(), 2),
+            "stages": dict(self.results),
+        }
@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+BOB Driver Cache v4.3.1
+
+Shared cache of the patched undetected-chromedriver binary.
+
+Every uc.Chrome(version_main=...) call normally downloads chromedriver,
+patches it and copies it into place - in every BatchProcessor subprocess
+and every Selenium fallback. DriverCache builds the patched binary once
+per Chrome major version into a user-level directory, guarded by a file
+lock so concurrent workers wait for one build instead of racing, and
+hands it to uc.Chrome via driver_executable_path (which uc treats as
+already patched and never deletes).
+
+Usage:
+    from bob.utils.driver_cache import chrome_driver_kwargs, record_launch
+
+    started = time.time()
+    kwargs = chrome_driver_kwargs(version_main=140)
+    driver = uc.Chrome(options=options, **kwargs)
+    record_launch(time.time() - started)
+"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+DEFAULT_CACHE_DIR = Path(os.getenv(
+    "BOB_DRIVER_CACHE_DIR",
+    Path.home() / ".cache" / "bob" / "chromedriver",
+))
+PATCH_MARKER = b"undetected chromedriver"
+
+
+@contextmanager
+def file_lock(path: Path):
+    """Exclusive cross-process lock on path (blocks until acquired)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a+b") as handle:
+        if fcntl:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+        else:
+            handle.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    time.sleep(0.1)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+            else:
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def is_patched(path: Path) -> bool:
+    """Whether path is a chromedriver already patched by undetected-chromedriver."""
+    try:
+        with open(path, "rb") as handle:
+            return handle.read().find(PATCH_MARKER) != -1
+    except OSError:
+        return False
+
+
+def build_patched_driver(version_main: int, destination: Path):
+    """
+    Download and patch chromedriver with undetected-chromedriver's Patcher.
+
+    Args:
+        version_main: Chrome major version
+        destination: Where the patched binary must end up
+    """
+    from undetected_chromedriver.patcher import Patcher
+
+    patcher = Patcher(version_main=version_main)
+    patcher.auto()
+    shutil.copy2(patcher.executable_path, destination)
+    os.chmod(destination, 0o755)
+
+
+class DriverCache:
+    """
+    File-locked cache of patched chromedriver binaries keyed by Chrome version.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        builder: Optional[Callable[[int, Path], None]] = None,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory shared by all workers on this machine
+            builder: Callable(version_main, destination) producing a patched binary
+        """
+        self.cache_dir = Path(cache_dir or DEFAULT_CACHE_DIR)
+        self.builder = builder or build_patched_driver
+        self._lock = threading.Lock()
+        self.stats = {
+            "hits": 0,
+            "builds": 0,
+            "build_seconds": 0.0,
+            "launches": 0,
+            "launch_seconds": 0.0,
+            "estimated_seconds_saved": 0.0,
+        }
+
+    def _binary_path(self, version_main: int) -> Path:
+        suffix = ".exe" if sys.platform.startswith("win") else ""
+        return self.cache_dir / f"chromedriver-{version_main}-patched{suffix}"
+
+    def _meta_path(self, version_main: int) -> Path:
+        return self.cache_dir / f"chromedriver-{version_main}.json"
+
+    def _build_cost(self, version_main: int) -> float:
+        """Seconds the original build took (recorded by whichever worker built it)."""
+        try:
+            return float(json.loads(self._meta_path(version_main).read_text())["build_seconds"])
+        except (OSError, ValueError, KeyError):
+            return 0.0
+
+    def get_path(self, version_main: int) -> str:
+        """
+        Path of the patched driver for version_main, building it if missing.
+
+        Args:
+            version_main: Chrome major version
+
+        Returns:
+            Absolute path to a patched chromedriver binary
+        """
+        binary = self._binary_path(version_main)
+        with self._lock:
+            if is_patched(binary):
+                self.stats["hits"] += 1
+                self.stats["estimated_seconds_saved"] += self._build_cost(version_main)
+                return str(binary)
+
+            with file_lock(self.cache_dir / f"chromedriver-{version_main}.lock"):
+                # Another process may have finished the build while we waited
+                if is_patched(binary):
+                    self.stats["hits"] += 1
+                    self.stats["estimated_seconds_saved"] += self._build_cost(version_main)
+                    return str(binary)
+
+                started = time.time()
+                fd, temp_name = tempfile.mkstemp(dir=self.cache_dir, prefix=".building-")
+                os.close(fd)
+                try:
+                    self.builder(version_main, Path(temp_name))
+                    if not is_patched(Path(temp_name)):
+                        raise RuntimeError("chromedriver build did not produce a patched binary")
+                    # Atomic publish: readers never see a half-written binary
+                    os.replace(temp_name, binary)
+                finally:
+                    if os.path.exists(temp_name):
+                        os.unlink(temp_name)
+
+                build_seconds = time.time() - started
+                self._meta_path(version_main).write_text(json.dumps({
+                    "version_main": version_main,
+                    "build_seconds": round(build_seconds, 2),
+                    "built_at": time.time(),
+                }))
+                self.stats["builds"] += 1
+                self.stats["build_seconds"] += build_seconds
+                print(f"📦 Cached patched chromedriver {version_main} ({build_seconds:.1f}s)")
+                return str(binary)
+
+    def record_launch(self, seconds: float):
+        """Record the wall time of one uc.Chrome launch."""
+        with self._lock:
+            self.stats["launches"] += 1
+            self.stats["launch_seconds"] += seconds
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Cache hits, build cost and the launch time saved per session."""
+        launches = self.stats["launches"]
+        hits = self.stats["hits"]
+        return {
+            **self.stats,
+            "build_seconds": round(self.stats["build_seconds"], 2),
+            "launch_seconds": round(self.stats["launch_seconds"], 2),
+            "estimated_seconds_saved": round(self.stats["estimated_seconds_saved"], 2),
+            "avg_launch_seconds": round(self.stats["launch_seconds"] / launches, 2) if launches else None,
+            "avg_seconds_saved_per_hit": (round(self.stats["estimated_seconds_saved"] / hits, 2)
+                                          if hits else None),
+            "cache_dir": str(self.cache_dir),
+        }
+
+
+# Process-wide cache; the file lock makes it safe across processes too
+_driver_cache: Optional[DriverCache] = None
+
+
+def get_driver_cache() -> DriverCache:
+    """Get the process-wide DriverCache."""
+    global _driver_cache
+    if _driver_cache is None:
+        _driver_cache = DriverCache()
+    return _driver_cache
+
+
+def chrome_driver_kwargs(version_main: int = 140) -> Dict[str, Any]:
+    """
+    Keyword arguments for uc.Chrome using the cached patched driver.
+
+    Falls back to uc's own download/patch when the cache cannot be
+    populated (offline, read-only home directory, ...).
+    """
+    try:
+        return {
+            "version_main": version_main,
+            "driver_executable_path": get_driver_cache().get_path(version_main),
+        }
+    except Exception as e:
+        print(f"⚠️ Driver cache unavailable, uc will patch its own copy: {str(e)[:80]}")
+        return {"version_main": version_main}
+
+
+def record_launch(seconds: float):
+    """Record one uc.Chrome launch on the process-wide cache."""
+    get_driver_cache().record_launch(seconds)
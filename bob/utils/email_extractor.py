@@ -3,13 +3,20 @@
 Email Extraction Module - Handles Google Redirect URLs
 
 Key Feature: Parses Google redirect URLs to get actual business websites
-Then extracts emails from those websites
+Then extracts emails from those websites (via the pooled client in
+bob.utils.http_client; extract_emails_from_website_async for async code,
+which also follows contact pages with bob.utils.contact_crawler)
 """
 
-import requests
-import re
+import asyncio
+import weakref
 from urllib.parse import urlparse, parse_qs, unquote
 
+from bob.cache.enrichment_cache import get_enrichment_cache, registered_domain
+from bob.utils.contact_crawler import get_contact_crawler
+from bob.utils.email_scanner import EmailScanner, scan_emails
+from bob.utils.http_client import get_http_client
+
 
 def extract_real_url_from_google_redirect(google_redirect_url):
     """
@@ -47,101 +54,159 @@ def extract_real_url_from_google_redirect(google_redirect_url):
         return google_redirect_url
 
 
-def extract_emails_from_website(website_url, timeout=10):
+def website_fetch_url(website_url):
+    """
+    URL to fetch for a business website, or None if there is nothing to fetch.
+
+    Resolves Google redirects and adds a missing protocol.
+    """
+    if not website_url:
+        return None
+
+    # Parse Google redirect if present
+    real_url = extract_real_url_from_google_redirect(website_url)
+
+    # Skip if still a Google URL (unrecognized format)
+    if 'google' in real_url.lower():
+        return None
+
+    # Ensure URL has protocol
+    if not real_url.startswith(('http://', 'https://')):
+        real_url = 'https://' + real_url
+    return real_url
+
+
+def find_emails(text):
+    """
+    Email addresses in page text, spam/fake addresses filtered out.
+
+    Returns:
+        list: Up to 5 email addresses
+    """
+    return scan_emails(text, limit=5)
+
+
+def _resolve_cache(cache):
+    """Enrichment cache to use: the shared one by default, none if cache=False."""
+    if cache is False:
+        return None
+    return cache or get_enrichment_cache()
+
+
+def _settle(cache, entry, fetch_url, page, emails):
+    """Emails for a finished (possibly conditional) fetch; updates the cache."""
+    if entry and page.status == 304:
+        cache.mark_not_modified(entry)
+        cache.record("not_modified")
+        return list(entry.emails)
+    if page.status != 200 or page.error:
+        # A stale entry beats nothing when the site is down
+        return list(entry.emails) if entry else []
+    if cache:
+        cache.store(fetch_url, emails, page.headers)
+        cache.record("refetched" if entry else "misses")
+    return emails
+
+
+def extract_emails_from_website(website_url, timeout=10, cache=None):
     """
     Extract emails from business website, handling Google redirect URLs.
 
     Process:
     1. Parse Google redirects if present
     2. Validate URL format
-    3. Fetch website content
-    4. Search for emails with multiple regex patterns
-    5. Filter out spam/fake emails
+    3. Check the per-domain enrichment cache (fresh entries need no request,
+       older ones are revalidated with a conditional request)
+    4. Stream website content (shared pooled client, body capped)
+    5. Scan chunks as they arrive (EmailScanner), decoding obfuscated
+       addresses and filtering spam/fake ones; stop once 5 are found
+
+    Only the landing page is fetched here; extract_emails_from_website_async
+    also follows contact pages.
 
     Args:
         website_url: Website URL (may be Google redirect)
         timeout: Request timeout in seconds
+        cache: EnrichmentCache (default: the shared one; False: no caching)
 
     Returns:
         list: Email addresses found (max 5)
     """
-    if not website_url:
+    real_url = website_fetch_url(website_url)
+    if not real_url:
         return []
 
-    emails = []
+    cache = _resolve_cache(cache)
+    entry = cache.lookup(real_url) if cache else None
+    if entry and entry.is_fresh(cache.fresh_seconds):
+        cache.record("fresh_hits")
+        return list(entry.emails)
 
-    # STEP 1: Parse Google redirect if present
-    real_url = extract_real_url_from_google_redirect(website_url)
+    scanner = EmailScanner(limit=5)
+    fetch_url = entry.url if entry else real_url
+    page = get_http_client().fetch_blocking(
+        fetch_url, timeout=timeout, consumer=scanner.feed,
+        headers=entry.conditional_headers() if entry else None,
+    )
+    return _settle(cache, entry, fetch_url, page, scanner.finish())
 
-    # STEP 2: Skip if still a Google URL (unrecognized format)
-    if 'google' in real_url.lower():
-        return []
 
-    # STEP 3: Ensure URL has protocol
-    if not real_url.startswith(('http://', 'https://')):
-        real_url = 'https://' + real_url
+# Fetches in progress per event loop and domain, shared by concurrent callers
+_inflight = weakref.WeakKeyDictionary()
 
-    # STEP 4: Fetch website
-    try:
-        response = requests.get(
-            real_url,
-            timeout=timeout,
-            headers={
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            },
-            allow_redirects=True
-        )
-
-        if response.status_code != 200:
-            return []
-
-    except (requests.Timeout, requests.ConnectionError, Exception):
+
+async def extract_emails_from_website_async(website_url, timeout=10, client=None, cache=None, crawler=None):
+    """
+    Async extract_emails_from_website() on the shared HTTP client.
+
+    If the landing page has fewer than 5 addresses, likely contact pages
+    (/contact, /about, imprint) are crawled too, within the crawler's
+    depth, page and per-host limits. Concurrent calls for the same
+    registered domain (chain locations) share one crawl.
+
+    Args:
+        website_url: Website URL (may be Google redirect)
+        timeout: Request timeout in seconds
+        client: AsyncHTTPClient (default: the process-wide one)
+        cache: EnrichmentCache (default: the shared one; False: no caching)
+        crawler: ContactCrawler (default: the process-wide one)
+
+    Returns:
+        list: Email addresses found (max 5)
+    """
+    real_url = website_fetch_url(website_url)
+    if not real_url:
         return []
 
-    # STEP 5: Extract emails with multiple patterns
-    patterns = [
-        # Standard email format
-        r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}',
-        # Mailto links
-        r'mailto:([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})',
-        # Email field labels
-        r'(?:email|e-mail|contact)[\s:=]+([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})',
-    ]
-
-    found_emails = set()
-    for pattern in patterns:
-        try:
-            matches = re.findall(pattern, response.text, re.IGNORECASE)
-            for match in matches:
-                # Handle tuple results from group captures
-                if isinstance(match, tuple):
-                    match = match[-1] if match[-1] else match[0]
-                found_emails.add(match.lower())
-        except:
-            pass
-
-    # STEP 6: Filter out spam/fake emails
-    spam_keywords = [
-        'example', 'test', 'noreply', 'no-reply', 'donotreply', 'do-not-reply',
-        'temp', 'fake', 'dummy', 'sample', 'placeholder', 'mail',
-        'admin@localhost', 'root@localhost',
-    ]
-
-    filtered_emails = []
-    for email in found_emails:
-        # Skip if contains spam keyword
-        if any(keyword in email for keyword in spam_keywords):
-            continue
-
-        # Validate email format
-        if email.count('@') != 1:
-            continue
-
-        # Ensure domain has extension
-        if '.' not in email.split('@')[1]:
-            continue
-
-        filtered_emails.append(email)
-
-    # Return up to 5 emails
-    return filtered_emails[:5]
+    cache = _resolve_cache(cache)
+    domain = registered_domain(real_url)
+    if not cache or not domain:
+        return await _fetch_emails_async(real_url, timeout, client, cache, crawler)
+
+    inflight = _inflight.setdefault(asyncio.get_running_loop(), {})
+    task = inflight.get(domain)
+    if task is None:
+        task = asyncio.ensure_future(_fetch_emails_async(real_url, timeout, client, cache, crawler))
+        inflight[domain] = task
+        task.add_done_callback(lambda _: inflight.pop(domain, None))
+    else:
+        cache.record("coalesced")
+    # shield: a cancelled caller must not cancel the fetch others wait for
+    return list(await asyncio.shield(task))
+
+
+async def _fetch_emails_async(real_url, timeout, client, cache, crawler):
+    loop = asyncio.get_running_loop()
+    # SQLite I/O off the loop
+    entry = await loop.run_in_executor(None, cache.lookup, real_url) if cache else None
+    if entry and entry.is_fresh(cache.fresh_seconds):
+        cache.record("fresh_hits")
+        return list(entry.emails)
+
+    fetch_url = entry.url if entry else real_url
+    # Conditional landing request: on a 304 nothing else is fetched
+    crawl = await (crawler or get_contact_crawler()).crawl(
+        fetch_url, client=client, timeout=timeout,
+        headers=entry.conditional_headers() if entry else None,
+    )
+    return await loop.run_in_executor(None, _settle, cache, entry, fetch_url, crawl.landing, crawl.emails)
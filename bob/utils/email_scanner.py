@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+BOB Email Scanner v4.3.1
+
+Single-pass, streaming email address scanner for website HTML.
+
+The page is fed in chunks as it downloads; each chunk is scanned once
+with one precompiled pattern (the plain pattern, or - if the chunk holds
+an obfuscation marker - one that also accepts encoded separators),
+addresses are filtered as they are found, and the scanner reports done
+as soon as it has enough, so the download can stop early.
+
+Addresses at Google, social, booking and review site domains are
+dropped with the same rules as website URLs (bob.utils.url_classifier).
+
+Obfuscated forms are decoded before matching:
+- HTML entities: info&#64;cafe&#46;com, info&commat;cafe.com
+- URL-encoded mailto links: mailto:info%40cafe.com
+- Spelled-out separators: info [at] cafe [dot] com, info(at)cafe(dot)com
+
+Usage:
+    from bob.utils.email_scanner import EmailScanner, scan_emails
+
+    scanner = EmailScanner(limit=5)
+    for chunk in chunks:
+        if scanner.feed(chunk):
+            break                      # Enough addresses
+    emails = scanner.finish()
+
+    emails = scan_emails(html)         # Whole document at once
+"""
+
+import re
+from typing import List, Optional
+
+from bob.utils.url_classifier import DIRECT, get_url_classifier
+
+
+EMAIL_RE = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+
+# "@" and "." including encoded / spelled-out forms
+_AT = r'(?:@|&#0*64;|&#x0*40;|&commat;|%40|\s*[\[\(\{]\s*at\s*[\]\)\}]\s*)'
+_DOT = r'(?:\.|&#0*46;|&#x0*2e;|&period;|\s*[\[\(\{]\s*dot\s*[\]\)\}]\s*)'
+OBFUSCATED_EMAIL_RE = re.compile(
+    rf'[a-z0-9._%+-]+?{_AT}[a-z0-9-]+(?:{_DOT}[a-z0-9-]+)*{_DOT}[a-z]{{2,}}\b',
+    re.IGNORECASE,
+)
+
+# Separator forms -> plain characters, applied to matched addresses only
+# (group 1: at, group 2: dot)
+SEPARATOR_RE = re.compile(
+    r'(&#0*64;|&#x0*40;|&commat;|%40|\s*[\[\(\{]\s*at\s*[\]\)\}]\s*)'
+    r'|(&#0*46;|&#x0*2e;|&period;|\s*[\[\(\{]\s*dot\s*[\]\)\}]\s*)',
+    re.IGNORECASE,
+)
+
+# Cheap substring checks deciding whether a chunk needs OBFUSCATED_EMAIL_RE
+OBFUSCATION_MARKERS = (
+    '&#64;', '&#x40;', '&commat;', '%40',
+    'at]', 'at)', 'at}', 'at ]', 'at )', 'AT]', 'AT)',
+)
+
+# Addresses containing any of these are placeholders, not real contacts
+SPAM_KEYWORDS = (
+    'example', 'test', 'noreply', 'no-reply', 'donotreply', 'do-not-reply',
+    'temp', 'fake', 'dummy', 'sample', 'placeholder', 'mail',
+    'admin@localhost', 'root@localhost',
+)
+SPAM_RE = re.compile('|'.join(re.escape(keyword) for keyword in SPAM_KEYWORDS))
+
+# "Addresses" that are asset file names (logo@2x.png)
+ASSET_SUFFIXES = ('.png', '.jpg', '.jpeg', '.gif', '.svg', '.webp', '.ico', '.css', '.js')
+
+# Text kept back between chunks so an address is never split: cut at the
+# last tag bracket, else whitespace, else (very long runs) hard-cut
+MAX_PENDING = 8192
+MIN_TAIL = 256
+
+
+def _deobfuscate(text: str) -> str:
+    return SEPARATOR_RE.sub(lambda match: '@' if match.group(1) else '.', text)
+
+
+class EmailScanner:
+    """
+    Incremental email scanner (feed chunks, then finish()).
+    """
+
+    def __init__(self, limit: Optional[int] = 5):
+        """
+        Args:
+            limit: Stop once this many addresses were found (None: scan all)
+        """
+        self.limit = limit
+        self.emails: List[str] = []
+        self._seen = set()
+        self._pending = ""
+        self.chars_scanned = 0
+        self._classifier = get_url_classifier()
+
+    @property
+    def done(self) -> bool:
+        return self.limit is not None and len(self.emails) >= self.limit
+
+    def feed(self, chunk: str) -> bool:
+        """
+        Scan the next piece of the document.
+
+        Returns:
+            True once enough addresses were found (the rest can be skipped)
+        """
+        if self.done or not chunk:
+            return self.done
+        text = self._pending + chunk
+
+        cut = max(text.rfind('<'), text.rfind('>'))
+        if cut < len(text) - MAX_PENDING:
+            # No tag boundary nearby; fall back to whitespace, then a hard cut
+            cut = max(text.rfind(' '), text.rfind('\n'))
+            if cut < len(text) - MAX_PENDING:
+                cut = len(text) - MIN_TAIL
+        cut = max(cut, 0)
+
+        self._pending = text[cut:]
+        self._scan(text[:cut])
+        return self.done
+
+    def finish(self) -> List[str]:
+        """Scan whatever is left and return the addresses found, in page order."""
+        if self._pending and not self.done:
+            self._scan(self._pending)
+        self._pending = ""
+        return list(self.emails)
+
+    def _scan(self, text: str):
+        self.chars_scanned += len(text)
+        if any(marker in text for marker in OBFUSCATION_MARKERS):
+            matches = (_deobfuscate(match.group(0)) for match in OBFUSCATED_EMAIL_RE.finditer(text))
+        elif '@' in text:
+            matches = (match.group(0) for match in EMAIL_RE.finditer(text))
+        else:
+            return
+        for email in matches:
+            email = email.lower()
+            if email in self._seen:
+                continue
+            self._seen.add(email)
+            if SPAM_RE.search(email) or email.endswith(ASSET_SUFFIXES):
+                continue
+            if self._classifier.classify_host(email.rpartition('@')[2]) != DIRECT:
+                continue
+            self.emails.append(email)
+            if self.done:
+                return
+
+
+def scan_emails(text: str, limit: Optional[int] = 5) -> List[str]:
+    """Email addresses in a whole document (see EmailScanner)."""
+    scanner = EmailScanner(limit=limit)
+    scanner.feed(text)
+    return scanner.finish()
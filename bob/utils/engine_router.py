@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+BOB Engine Router v4.3.1
+
+Learns which extraction engine to try first. Success rate (complete
+results: name plus address or phone) and latency are tracked per engine
+and per input shape, seeded from the cache's extraction_history table and
+updated after every attempt.
+
+For two engines A and B tried in order, the expected time to a complete
+result is
+
+    T(A, B) = t_A + (1 - p_A) * t_B
+
+and the router picks the order with the smaller T. Priors keep the
+documented default (Playwright first) until enough history says otherwise.
+
+Usage:
+    from bob.utils.engine_router import EngineRouter
+
+    router = EngineRouter(cache_manager=cache)
+    decision = router.choose("Starbucks Times Square NYC")
+    for engine in decision.order:
+        ...
+        router.record(engine, decision.input_shape, complete, seconds)
+"""
+
+import re
+import time
+from collections import deque
+from dataclasses import dataclass, asdict, field
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+
+ENGINE_PLAYWRIGHT = "playwright"
+ENGINE_SELENIUM = "selenium"
+
+# Input shapes
+SHAPE_QUERY = "query"            # "Starbucks Times Square NYC"
+SHAPE_CATEGORY = "category"      # "coffee shops in Boston"
+SHAPE_PLACE_URL = "place_url"    # https://www.google.com/maps/place/...
+SHAPE_CID = "cid"                # ?cid=123..., bare CID, or 0x..:0x.. feature id
+SHAPE_MAPS_URL = "maps_url"      # Other Google Maps URLs (search, short links)
+
+# Attempts at which confidence reaches 0.5
+CONFIDENCE_SAMPLES = 10
+
+_CID_RE = re.compile(r"(?:[?&]cid=\d+|^\d{10,}$|0x[0-9a-f]+:0x[0-9a-f]+)", re.IGNORECASE)
+_CATEGORY_RE = re.compile(
+    r"(?:\b(?:near|nearby|around)\b|^[a-z][\w&' -]*s\s+in\s+\w)",
+    re.IGNORECASE,
+)
+
+
+def classify_input(url: str) -> str:
+    """
+    Classify an extractor input into a routing shape.
+
+    Args:
+        url: Business name, search phrase, CID or Google Maps URL
+
+    Returns:
+        One of "query", "category", "place_url", "cid", "maps_url"
+    """
+    text = (url or "").strip()
+    if _CID_RE.search(text):
+        return SHAPE_CID
+    if text.startswith("http"):
+        return SHAPE_PLACE_URL if "/place/" in text else SHAPE_MAPS_URL
+    if _CATEGORY_RE.search(text):
+        return SHAPE_CATEGORY
+    return SHAPE_QUERY
+
+
+@dataclass
+class EngineEstimate:
+    """Observed attempts of one engine on one input shape."""
+
+    attempts: int = 0
+    completes: int = 0
+    total_seconds: float = 0.0
+
+    def observe(self, complete: bool, seconds: float):
+        self.attempts += 1
+        self.completes += 1 if complete else 0
+        self.total_seconds += max(0.0, seconds)
+
+
+@dataclass
+class EnginePrior:
+    """Belief about an engine before any history (pseudo-observations)."""
+
+    success_rate: float
+    latency_seconds: float
+    weight: float = 3.0
+
+
+# Documented behaviour: Playwright 10-22s / 95%, Selenium 15-30s
+DEFAULT_PRIORS = {
+    ENGINE_PLAYWRIGHT: EnginePrior(success_rate=0.9, latency_seconds=15.0),
+    ENGINE_SELENIUM: EnginePrior(success_rate=0.8, latency_seconds=30.0),
+}
+
+
+@dataclass
+class RoutingDecision:
+    """Engine order chosen for one input."""
+
+    input_shape: str
+    order: List[str]
+    expected_seconds: Dict[str, float]      # "playwright > selenium" -> T
+    confidence: float                       # 0..1, grows with observed attempts
+    reason: str
+    timestamp: float = field(default_factory=time.time)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return asdict(self)
+
+
+class EngineRouter:
+    """
+    Chooses engine order by expected time to a complete result.
+    """
+
+    def __init__(
+        self,
+        engines: Optional[List[str]] = None,
+        cache_manager=None,
+        priors: Optional[Dict[str, EnginePrior]] = None,
+        history_size: int = 100,
+    ):
+        """
+        Initialize the router.
+
+        Args:
+            engines: Engines in default order (default: Playwright, Selenium)
+            cache_manager: CacheManagerUltimate whose extraction_history seeds the estimates
+            priors: Per-engine priors (default: DEFAULT_PRIORS)
+            history_size: Recent decisions kept for stats
+        """
+        self.engines = list(engines or [ENGINE_PLAYWRIGHT, ENGINE_SELENIUM])
+        self.cache_manager = cache_manager
+        self.priors = dict(DEFAULT_PRIORS)
+        self.priors.update(priors or {})
+        self._estimates: Dict[Tuple[str, str], EngineEstimate] = {}
+        self._decisions: Deque[RoutingDecision] = deque(maxlen=history_size)
+        self.stats = {"decisions": 0, "reordered": 0, "seeded_attempts": 0}
+
+        if cache_manager is not None:
+            self._seed_from_cache()
+
+    def _seed_from_cache(self):
+        try:
+            rows = self.cache_manager.get_engine_history()
+        except Exception as e:
+            print(f"⚠️ Engine history unavailable: {str(e)[:60]}")
+            return
+        for row in rows:
+            estimate = self._estimate(row["engine"], row["input_shape"])
+            estimate.attempts += row["attempts"]
+            estimate.completes += row["completes"]
+            estimate.total_seconds += row["total_seconds"]
+            self.stats["seeded_attempts"] += row["attempts"]
+
+    def _estimate(self, engine: str, shape: str) -> EngineEstimate:
+        key = (engine, shape)
+        if key not in self._estimates:
+            self._estimates[key] = EngineEstimate()
+        return self._estimates[key]
+
+    # ------------------------------------------------------------------
+    # Estimates
+    # ------------------------------------------------------------------
+
+    def success_rate(self, engine: str, shape: str) -> float:
+        """Posterior probability of a complete result."""
+        prior = self.priors.get(engine, EnginePrior(0.5, 30.0))
+        estimate = self._estimate(engine, shape)
+        return ((estimate.completes + prior.success_rate * prior.weight)
+                / (estimate.attempts + prior.weight))
+
+    def latency(self, engine: str, shape: str) -> float:
+        """Posterior mean seconds per attempt (complete or not)."""
+        prior = self.priors.get(engine, EnginePrior(0.5, 30.0))
+        estimate = self._estimate(engine, shape)
+        return ((estimate.total_seconds + prior.latency_seconds * prior.weight)
+                / (estimate.attempts + prior.weight))
+
+    def expected_seconds(self, order: List[str], shape: str) -> float:
+        """Expected time to a complete result when trying engines in order."""
+        expected = 0.0
+        reach = 1.0   # Probability that this engine gets tried at all
+        for engine in order:
+            expected += reach * self.latency(engine, shape)
+            reach *= 1 - self.success_rate(engine, shape)
+        return expected
+
+    # ------------------------------------------------------------------
+    # Routing
+    # ------------------------------------------------------------------
+
+    def choose(self, url: str, engines: Optional[List[str]] = None) -> RoutingDecision:
+        """
+        Pick the engine order for one input.
+
+        Args:
+            url: Extractor input
+            engines: Available engines (default: all configured)
+
+        Returns:
+            RoutingDecision with the order to try
+        """
+        shape = classify_input(url)
+        allowed = self.engines if engines is None else engines
+        available = [engine for engine in self.engines if engine in allowed]
+
+        candidates = [available]
+        if len(available) == 2:
+            candidates.append(list(reversed(available)))
+
+        scored = {" > ".join(order): self.expected_seconds(order, shape) for order in candidates}
+        best = min(candidates, key=lambda order: scored[" > ".join(order)])
+
+        # Confidence grows with the evidence behind the least-observed engine
+        samples = min((self._estimate(engine, shape).attempts for engine in best), default=0)
+        confidence = samples / (samples + CONFIDENCE_SAMPLES)
+
+        reordered = best != available
+        decision = RoutingDecision(
+            input_shape=shape,
+            order=best,
+            expected_seconds={key: round(value, 1) for key, value in scored.items()},
+            confidence=round(confidence, 2),
+            reason="learned order" if reordered else "default order",
+        )
+        self._decisions.append(decision)
+        self.stats["decisions"] += 1
+        if reordered:
+            self.stats["reordered"] += 1
+        return decision
+
+    def record(self, engine: str, shape: str, complete: bool, seconds: float):
+        """
+        Feed one finished attempt back into the estimates.
+
+        Args:
+            engine: Engine that ran
+            shape: Input shape from the decision
+            complete: Whether the result had the core fields
+            seconds: Wall time of the attempt
+        """
+        self._estimate(engine, shape).observe(complete, seconds)
+
+    # ------------------------------------------------------------------
+    # Stats
+    # ------------------------------------------------------------------
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Per-shape engine estimates and recent decisions."""
+        shapes: Dict[str, Dict[str, Any]] = {}
+        for (engine, shape), estimate in sorted(self._estimates.items()):
+            shapes.setdefault(shape, {})[engine] = {
+                "attempts": estimate.attempts,
+                "success_rate": round(self.success_rate(engine, shape), 3),
+                "latency_seconds": round(self.latency(engine, shape), 1),
+            }
+        last = self._decisions[-1].to_dict() if self._decisions else None
+        return {
+            **self.stats,
+            "shapes": shapes,
+            "last_decision": last,
+            "recent_decisions": [decision.to_dict() for decision in list(self._decisions)[-10:]],
+        }
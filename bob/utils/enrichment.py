@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+BOB Enrichment Queue v4.3.1
+
+Runs slow, browser-free enrichment - fetching the business website for
+email addresses - after the core Maps result has been returned, instead
+of inline while a browser slot is held.
+
+Tasks run as coroutines on one background event loop, sharing the
+pooled HTTP client (bob.utils.http_client), so thousands of website
+fetches overlap instead of each holding a thread.
+
+Submitted results are marked enrichment_pending. The background loop
+never touches the submitted dict: the added fields are delivered through
+the returned future and, if a cache manager is given, written into the
+cached record, so later cache hits include them. The caller merges them
+into its result with collect() (or collect_async() on its own loop).
+Work still queued at interpreter exit is drained by an atexit hook.
+
+Usage:
+    from bob.utils.enrichment import get_enrichment_queue
+
+    queue = get_enrichment_queue()
+    future = queue.submit(result, cache_manager=cache)   # returns immediately
+    ...
+    if future:
+        queue.collect(result, future)                    # before exporting result
+"""
+
+import asyncio
+import atexit
+import concurrent.futures
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+
+async def fetch_emails(result: Dict[str, Any], timeout: float = 10) -> Dict[str, Any]:
+    """Enrichment task: emails from the business website."""
+    from bob.utils.email_extractor import extract_emails_from_website_async
+    return {"emails": await extract_emails_from_website_async(result.get("website"), timeout=timeout)}
+
+
+def wants_emails(result: Dict[str, Any]) -> bool:
+    """Whether a result has a website, no emails yet, and emails were requested."""
+    fields = result.get("fields")
+    return bool(result.get("website")) and not result.get("emails") and (fields is None or "emails" in fields)
+
+
+# Task name -> (applies to result?, task returning the fields to add; may be async)
+ENRICHMENTS = {
+    "emails": (wants_emails, fetch_emails),
+}
+
+
+class EnrichmentQueue:
+    """
+    Background event loop running enrichment of finished results.
+    """
+
+    def __init__(self, max_concurrent: int = 64, timeout: float = 10,
+                 tasks: Optional[Dict[str, Any]] = None):
+        """
+        Args:
+            max_concurrent: Results being enriched at once (the HTTP client
+                            bounds connections separately)
+            timeout: Per-request timeout passed to each task
+            tasks: {name: (applies(result), task(result, timeout))}, default ENRICHMENTS
+        """
+        self.max_concurrent = max_concurrent
+        self.timeout = timeout
+        self.tasks = tasks if tasks is not None else ENRICHMENTS
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._pending = set()
+        self._lock = threading.Lock()
+        self.stats = {
+            "submitted": 0,
+            "completed": 0,
+            "failed": 0,
+            "cache_updates": 0,
+            "total_seconds": 0.0,
+        }
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        if self._loop is None:
+            # Daemon thread: queued work is drained by the atexit hook below
+            self._loop = asyncio.new_event_loop()
+            self._semaphore = None
+            self._thread = threading.Thread(target=self._loop.run_forever, name="bob-enrich", daemon=True)
+            self._thread.start()
+        return self._loop
+
+    def submit(self, result: Dict[str, Any], cache_manager: Any = None,
+               on_done: Optional[Callable[[Dict[str, Any]], None]] = None) -> Optional[concurrent.futures.Future]:
+        """
+        Queue the enrichment tasks that apply to a successful result.
+
+        Args:
+            result: Extraction result; only marked enrichment_pending here,
+                    merge the fields with collect()
+            cache_manager: Cache whose entry for result is updated afterwards
+            on_done: Called with the added fields once all tasks finished
+                     (on the queue's thread)
+
+        Returns:
+            Future of the added fields, or None if nothing applies
+        """
+        if not result or not result.get("success"):
+            return None
+        names = [name for name, (applies, _) in self.tasks.items() if applies(result)]
+        if not names:
+            return None
+
+        # Tasks read a copy taken on the caller's thread; result stays the caller's
+        snapshot = dict(result)
+        result["enrichment_pending"] = names
+        with self._lock:
+            self.stats["submitted"] += 1
+            future = asyncio.run_coroutine_threadsafe(
+                self._run(snapshot, names, cache_manager, on_done), self._get_loop()
+            )
+            self._pending.add(future)
+        future.add_done_callback(self._discard)
+        return future
+
+    def collect(self, result: Dict[str, Any], future: concurrent.futures.Future,
+                timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Wait for a submitted result's enrichment and merge it into result.
+
+        Call from the thread that owns result.
+
+        Returns:
+            The added fields
+        """
+        return self.apply(result, future.result(timeout=timeout))
+
+    async def collect_async(self, result: Dict[str, Any], future: concurrent.futures.Future) -> Dict[str, Any]:
+        """collect() for async callers: awaits the future on the running loop."""
+        return self.apply(result, await asyncio.wrap_future(future))
+
+    @staticmethod
+    def apply(result: Dict[str, Any], added: Dict[str, Any]) -> Dict[str, Any]:
+        """Merge finished enrichment fields into result and clear its pending flag."""
+        result.update(added)
+        result.pop("enrichment_pending", None)
+        return added
+
+    async def _run(self, snapshot, names, cache_manager, on_done) -> Dict[str, Any]:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrent)
+        loop = asyncio.get_running_loop()
+        async with self._semaphore:
+            started = time.time()
+            added: Dict[str, Any] = {}
+            for name in names:
+                _, task = self.tasks[name]
+                try:
+                    if asyncio.iscoroutinefunction(task):
+                        fields = await task(snapshot, self.timeout)
+                    else:
+                        fields = await loop.run_in_executor(None, task, snapshot, self.timeout)
+                    added.update(fields or {})
+                    with self._lock:
+                        self.stats["completed"] += 1
+                except Exception as e:
+                    print(f"ℹ️  Enrichment '{name}' failed: {str(e)[:50]}")
+                    with self._lock:
+                        self.stats["failed"] += 1
+
+            if cache_manager is not None and added:
+                try:
+                    # SQLite I/O off the loop
+                    if await loop.run_in_executor(None, cache_manager.update_fields, snapshot, added):
+                        with self._lock:
+                            self.stats["cache_updates"] += 1
+                except Exception as e:
+                    print(f"⚠️ Could not update cache after enrichment: {e}")
+
+        with self._lock:
+            self.stats["total_seconds"] += time.time() - started
+        if added.get("emails"):
+            print(f"📧 Enriched {snapshot.get('name', 'business')} with {len(added['emails'])} email(s)")
+        if on_done:
+            on_done(added)
+        return added
+
+    def _discard(self, future):
+        with self._lock:
+            self._pending.discard(future)
+
+    @property
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for queued enrichment to finish.
+
+        Returns:
+            True if nothing is pending any more
+        """
+        with self._lock:
+            futures = list(self._pending)
+        _, not_done = concurrent.futures.wait(futures, timeout=timeout)
+        return not not_done
+
+    def shutdown(self, wait: bool = True, timeout: Optional[float] = None):
+        """Stop the background loop (queued tasks finish first if wait, up to timeout)."""
+        if wait:
+            self.wait(timeout)
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(timeout=5)
+            if not loop.is_running():
+                loop.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self.stats)
+            stats["pending"] = len(self._pending)
+        done = stats["completed"] + stats["failed"]
+        stats["avg_seconds"] = round(stats["total_seconds"] / done, 2) if done else 0.0
+        stats["total_seconds"] = round(stats["total_seconds"], 2)
+        return stats
+
+
+# Seconds the exit hook waits for queued enrichment
+EXIT_DRAIN_SECONDS = 30.0
+
+_queue: Optional[EnrichmentQueue] = None
+_queue_lock = threading.Lock()
+
+
+def _drain_at_exit():
+    """Let queued enrichment (and its cache updates) finish before exit."""
+    with _queue_lock:
+        queue = _queue
+    if queue is not None and queue.pending:
+        print(f"⏳ Finishing {queue.pending} queued enrichment task(s)...")
+        queue.shutdown(wait=True, timeout=EXIT_DRAIN_SECONDS)
+
+
+atexit.register(_drain_at_exit)
+
+
+def get_enrichment_queue() -> EnrichmentQueue:
+    """Get the process-wide enrichment queue."""
+    global _queue
+    with _queue_lock:
+        if _queue is None:
+            _queue = EnrichmentQueue()
+        return _queue
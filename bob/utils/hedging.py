@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+BOB Request Hedging v4.3.1
+
+Tail-latency control for the hybrid engine. If the primary engine
+(Playwright) has not returned a complete result after the configured
+percentile of its recent latencies, the fallback engine (Selenium) is
+started in parallel. The first complete result wins and the other attempt
+is cancelled.
+
+The cost is tracked as extra browser-seconds: the time both engines were
+running for the same business.
+
+Usage:
+    from bob.utils.hedging import HedgedRunner, HedgingPolicy
+
+    runner = HedgedRunner(HedgingPolicy(enabled=True, percentile=95))
+    result = await runner.run(
+        lambda: extract_with_playwright(url),
+        lambda: extract_with_selenium(url),
+    )
+"""
+
+import asyncio
+import math
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional
+
+
+Attempt = Callable[[], Awaitable[Dict[str, Any]]]
+
+
+def is_complete(result: Optional[Dict[str, Any]]) -> bool:
+    """
+    Whether a result carries the core fields.
+
+    A usable business record needs a name plus an address or a phone number.
+    A projected result (one carrying "fields") needs its name plus any of
+    the other requested fields.
+    """
+    if not result or not result.get("success"):
+        return False
+    fields = result.get("fields")
+    if fields is not None:
+        wanted = [field for field in fields if field != "name"]
+        return bool(result.get("name")) and (not wanted or any(result.get(field) for field in wanted))
+    return bool(result.get("name")) and bool(result.get("address") or result.get("phone"))
+
+
+class LatencyTracker:
+    """Sliding window of observed latencies with percentile lookups."""
+
+    def __init__(self, window: int = 200):
+        self._samples: Deque[float] = deque(maxlen=window)
+
+    def observe(self, seconds: float):
+        """Record one latency sample."""
+        self._samples.append(seconds)
+
+    @property
+    def count(self) -> int:
+        return len(self._samples)
+
+    def percentile(self, percent: float) -> Optional[float]:
+        """Nearest-rank percentile, or None without samples."""
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        rank = max(1, math.ceil(percent / 100 * len(ordered)))
+        return ordered[min(rank, len(ordered)) - 1]
+
+
+@dataclass
+class HedgingPolicy:
+    """When to start the fallback engine alongside the primary."""
+
+    enabled: bool = False
+    percentile: float = 95.0            # Hedge after this percentile of primary latency
+    min_samples: int = 10               # Below this, use default_delay_seconds
+    default_delay_seconds: float = 30.0
+    min_delay_seconds: float = 5.0
+    max_delay_seconds: float = 60.0
+
+    def delay(self, tracker: LatencyTracker) -> float:
+        """Seconds to wait for the primary before hedging."""
+        if tracker.count < self.min_samples:
+            delay = self.default_delay_seconds
+        else:
+            delay = tracker.percentile(self.percentile)
+        return min(self.max_delay_seconds, max(self.min_delay_seconds, delay))
+
+
+class HedgedRunner:
+    """
+    Runs a primary attempt and, when it is slow or incomplete, a fallback.
+    """
+
+    def __init__(self, policy: Optional[HedgingPolicy] = None, tracker: Optional[LatencyTracker] = None):
+        """
+        Initialize the runner.
+
+        Args:
+            policy: HedgingPolicy (default: disabled - plain sequential fallback)
+            tracker: Latency history of the primary engine
+        """
+        self.policy = policy or HedgingPolicy()
+        self.tracker = tracker or LatencyTracker()
+        self.stats = {
+            "runs": 0,
+            "hedges": 0,                # Fallback started while primary still running
+            "hedge_wins": 0,            # ... and the fallback's result was used
+            "primary_wins": 0,
+            "fallbacks": 0,             # Fallback started after primary finished incomplete
+            "cancelled": 0,
+            "extra_browser_seconds": 0.0,
+        }
+
+    async def run(self, primary: Attempt, fallback: Optional[Attempt] = None) -> Dict[str, Any]:
+        """
+        Run primary, hedging with fallback per policy.
+
+        Args:
+            primary: Coroutine factory for the preferred engine
+            fallback: Coroutine factory for the fallback engine (optional)
+
+        Returns:
+            The first complete result; otherwise the best incomplete one.
+            The winning engine is recorded under result["hedge"].
+        """
+        self.stats["runs"] += 1
+        started = time.time()
+        primary_task = asyncio.ensure_future(primary())
+        fallback_task = None
+        hedge_started = None
+
+        if fallback is not None:
+            wait_for = self.policy.delay(self.tracker) if self.policy.enabled else None
+            try:
+                done, _ = await asyncio.wait({primary_task}, timeout=wait_for)
+            except asyncio.CancelledError:
+                primary_task.cancel()
+                raise
+            if not done:
+                hedge_started = time.time()
+                self.stats["hedges"] += 1
+                print(f"   🔀 Primary slower than {wait_for:.0f}s - hedging with fallback engine")
+                fallback_task = asyncio.ensure_future(fallback())
+
+        pending = {primary_task} | ({fallback_task} if fallback_task else set())
+        results = {}
+        winner = None
+        overlap_end = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                if hedge_started is not None and overlap_end is None:
+                    overlap_end = time.time()
+                for task in done:
+                    name = "primary" if task is primary_task else "fallback"
+                    results[name] = self._task_result(task)
+                    if name == "primary":
+                        self.tracker.observe(time.time() - started)
+                    if winner is None and is_complete(results[name]):
+                        winner = name
+
+                if winner:
+                    break
+                if "primary" in results and fallback is not None and fallback_task is None:
+                    # Primary finished without a complete result: classic fallback
+                    self.stats["fallbacks"] += 1
+                    fallback_task = asyncio.ensure_future(fallback())
+                    pending.add(fallback_task)
+        finally:
+            for task in pending:
+                task.cancel()
+                self.stats["cancelled"] += 1
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+            if hedge_started is not None:
+                # Cost of the hedge: time both engines were working on this business
+                self.stats["extra_browser_seconds"] += (overlap_end or time.time()) - hedge_started
+                if "primary" not in results:
+                    # Record the censored latency so the percentile keeps up with slowdowns
+                    self.tracker.observe(time.time() - started)
+
+        if winner is None:
+            # No complete result: prefer any success, primary first
+            for name in ("primary", "fallback"):
+                if results.get(name, {}).get("success"):
+                    winner = name
+                    break
+        if winner is None:
+            winner = "fallback" if "fallback" in results else "primary"
+
+        if winner == "primary":
+            self.stats["primary_wins"] += 1
+        elif hedge_started is not None:
+            self.stats["hedge_wins"] += 1
+
+        result = results.get(winner) or {"success": False, "error": "No attempt finished"}
+        result["hedge"] = {
+            "winner": winner,
+            "hedged": hedge_started is not None,
+            "seconds": round(time.time() - started, 2),
+        }
+        return result
+
+    @staticmethod
+    def _task_result(task: "asyncio.Future") -> Dict[str, Any]:
+        if task.cancelled():
+            return {"success": False, "error": "cancelled"}
+        error = task.exception()
+        if error is not None:
+            return {"success": False, "error": str(error)}
+        return task.result() or {"success": False, "error": "empty result"}
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hedging statistics including the current hedge delay."""
+        return {
+            **self.stats,
+            "extra_browser_seconds": round(self.stats["extra_browser_seconds"], 1),
+            "hedge_delay_seconds": round(self.policy.delay(self.tracker), 1),
+            "latency_samples": self.tracker.count,
+        }
@@ -0,0 +1,381 @@
+#!/usr/bin/env python3
+"""
+BOB Async HTTP Client v4.3.1
+
+Shared HTTP layer for fetching business websites (email enrichment,
+contact pages) in bulk.
+
+- Per-host connection pools with keep-alive, bounded per host and globally
+- DNS results cached between requests
+- Responses streamed and cut off at a byte cap (pages are scanned, not stored);
+  a consumer can read the decoded text chunk by chunk and stop the download
+- One client per process; sessions are created per event loop
+
+Uses aiohttp when installed (pip install "bob-google-maps[http]"), otherwise
+a pooled requests.Session on a bounded thread pool, which keeps
+connection reuse and the limits but resolves DNS through the OS.
+
+Usage:
+    from bob.utils.http_client import get_http_client
+
+    client = get_http_client()
+    page = await client.fetch("https://example.com/contact")
+    if page.ok:
+        print(page.text[:200])
+    pages = await client.fetch_many(urls)
+
+    scanner = EmailScanner()
+    await client.fetch(url, consumer=scanner.feed)   # Stops once scanner.feed returns True
+"""
+
+import asyncio
+import codecs
+import concurrent.futures
+import re
+import threading
+import time
+import weakref
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:  # Optional dependency
+    aiohttp = None
+    AIOHTTP_AVAILABLE = False
+
+
+DEFAULT_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+CHUNK_SIZE = 64 * 1024
+CHARSET_RE = re.compile(r'charset=([\w-]+)', re.I)
+
+
+@dataclass
+class HTTPClientConfig:
+    """Limits for the shared HTTP client."""
+    max_connections: int = 100        # Open connections across all hosts
+    max_per_host: int = 4             # Open connections to one host
+    timeout: float = 10.0             # Seconds per request (connect + read)
+    max_body_bytes: int = 1_000_000   # Stop reading a response after this much
+    dns_cache_seconds: int = 300      # aiohttp backend only
+    user_agent: str = DEFAULT_USER_AGENT
+
+
+@dataclass
+class FetchResult:
+    """One fetched page (body possibly truncated at the byte cap)."""
+    url: str
+    status: int = 0
+    final_url: Optional[str] = None
+    text: str = ""                  # Empty when the body went to a consumer
+    content_type: str = ""
+    bytes_read: int = 0
+    truncated: bool = False         # Byte cap reached with more body left
+    stopped_early: bool = False     # The consumer asked to stop
+    headers: Dict[str, str] = field(default_factory=dict)  # Response headers, lower-case names
+    seconds: float = 0.0
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and 200 <= self.status < 300
+
+
+def _charset(content_type: str) -> str:
+    match = CHARSET_RE.search(content_type or "")
+    if match:
+        try:
+            return codecs.lookup(match.group(1)).name
+        except LookupError:
+            pass
+    return "utf-8"
+
+
+class _BodyReader:
+    """Collects a response body up to the byte cap, or streams it to a consumer."""
+
+    def __init__(self, content_type: str, max_bytes: int, consumer: Optional[Callable[[str], Any]]):
+        self.charset = _charset(content_type)
+        self.max_bytes = max_bytes
+        self.consumer = consumer
+        self.decoder = codecs.getincrementaldecoder(self.charset)(errors="replace")
+        self.body = bytearray()
+        self.bytes_read = 0
+        self.truncated = False
+        self.stopped_early = False
+
+    @property
+    def full(self) -> bool:
+        return self.bytes_read >= self.max_bytes
+
+    def add(self, chunk: bytes) -> bool:
+        """Take the next chunk; True when reading should stop."""
+        room = self.max_bytes - self.bytes_read
+        if len(chunk) > room:
+            chunk = chunk[:room]
+            self.truncated = True
+        self.bytes_read += len(chunk)
+        if self.consumer is not None:
+            if self.consumer(self.decoder.decode(chunk)):
+                self.stopped_early = True
+                return True
+        else:
+            self.body.extend(chunk)
+        return self.full
+
+    def text(self) -> str:
+        if self.consumer is not None:
+            if not self.stopped_early:
+                self.consumer(self.decoder.decode(b"", final=True))
+            return ""
+        return self.body.decode(self.charset, errors="replace")
+
+
+class AsyncHTTPClient:
+    """
+    Pooled, bounded async HTTP client.
+    """
+
+    def __init__(self, config: Optional[HTTPClientConfig] = None, backend: Optional[str] = None):
+        """
+        Args:
+            config: Connection limits, timeout and byte cap
+            backend: "aiohttp" or "requests" (default: aiohttp if installed)
+
+        Raises:
+            ValueError: Unknown backend, or aiohttp requested but not installed
+        """
+        self.config = config or HTTPClientConfig()
+        backend = backend or ("aiohttp" if AIOHTTP_AVAILABLE else "requests")
+        if backend not in ("aiohttp", "requests"):
+            raise ValueError(f"Unknown HTTP backend '{backend}'")
+        if backend == "aiohttp" and not AIOHTTP_AVAILABLE:
+            raise ValueError("aiohttp backend requested but aiohttp is not installed")
+        self.backend = backend
+
+        self._sessions = weakref.WeakKeyDictionary()  # event loop -> aiohttp session
+        self._requests_session: Optional[requests.Session] = None
+        self._executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self.stats = {
+            "requests": 0,
+            "ok": 0,
+            "errors": 0,
+            "truncated": 0,
+            "bytes_read": 0,
+            "total_seconds": 0.0,
+        }
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    async def fetch(self, url: str, timeout: Optional[float] = None,
+                    max_bytes: Optional[int] = None,
+                    consumer: Optional[Callable[[str], Any]] = None,
+                    headers: Optional[Dict[str, str]] = None) -> FetchResult:
+        """
+        GET url, reading at most max_bytes of the body.
+
+        Args:
+            headers: Extra request headers (e.g. If-None-Match)
+            consumer: Called with each decoded text chunk instead of
+                      collecting FetchResult.text; returning True stops
+                      the download
+
+        Errors (DNS, connect, timeout) are reported in FetchResult.error,
+        never raised.
+        """
+        timeout = timeout or self.config.timeout
+        max_bytes = max_bytes or self.config.max_body_bytes
+        started = time.time()
+        try:
+            if self.backend == "aiohttp":
+                result = await self._fetch_aiohttp(url, timeout, max_bytes, consumer, headers)
+            else:
+                loop = asyncio.get_running_loop()
+                result = await loop.run_in_executor(
+                    self._get_executor(), self._fetch_requests, url, timeout, max_bytes, consumer, headers
+                )
+        except Exception as e:
+            result = FetchResult(url=url, error=f"{type(e).__name__}: {str(e)[:100]}")
+        return self._record(result, started)
+
+    def fetch_blocking(self, url: str, timeout: Optional[float] = None,
+                       max_bytes: Optional[int] = None,
+                       consumer: Optional[Callable[[str], Any]] = None,
+                       headers: Optional[Dict[str, str]] = None) -> FetchResult:
+        """
+        Synchronous fetch for code without an event loop.
+
+        Always uses the pooled requests session (same limits and byte cap).
+        """
+        started = time.time()
+        try:
+            result = self._fetch_requests(url, timeout or self.config.timeout,
+                                          max_bytes or self.config.max_body_bytes, consumer, headers)
+        except Exception as e:
+            result = FetchResult(url=url, error=f"{type(e).__name__}: {str(e)[:100]}")
+        return self._record(result, started)
+
+    async def fetch_many(self, urls: Iterable[str], **kwargs: Any) -> List[FetchResult]:
+        """Fetch urls concurrently (within the client's limits), in input order."""
+        return await asyncio.gather(*(self.fetch(url, **kwargs) for url in urls))
+
+    async def close(self):
+        """Close the session of the running loop (and the thread pool)."""
+        try:
+            session = self._sessions.pop(asyncio.get_running_loop(), None)
+        except RuntimeError:
+            session = None
+        if session is not None:
+            await session.close()
+        with self._lock:
+            executor, self._executor = self._executor, None
+            requests_session, self._requests_session = self._requests_session, None
+        if executor:
+            executor.shutdown(wait=False)
+        if requests_session:
+            requests_session.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+        return False
+
+    def _record(self, result: FetchResult, started: float) -> FetchResult:
+        result.seconds = time.time() - started
+        with self._lock:
+            self.stats["requests"] += 1
+            self.stats["ok" if result.ok else "errors"] += 1
+            self.stats["truncated"] += int(result.truncated)
+            self.stats["bytes_read"] += result.bytes_read
+            self.stats["total_seconds"] += result.seconds
+        return result
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self.stats)
+        stats["backend"] = self.backend
+        stats["avg_seconds"] = round(stats["total_seconds"] / stats["requests"], 3) if stats["requests"] else 0.0
+        stats["total_seconds"] = round(stats["total_seconds"], 2)
+        return stats
+
+    # ------------------------------------------------------------------
+    # aiohttp backend
+    # ------------------------------------------------------------------
+
+    def _get_session(self):
+        loop = asyncio.get_running_loop()
+        session = self._sessions.get(loop)
+        if session is None or session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.config.max_connections,
+                limit_per_host=self.config.max_per_host,
+                ttl_dns_cache=self.config.dns_cache_seconds,
+                use_dns_cache=True,
+            )
+            session = aiohttp.ClientSession(
+                connector=connector,
+                headers={"User-Agent": self.config.user_agent},
+            )
+            self._sessions[loop] = session
+        return session
+
+    async def _fetch_aiohttp(self, url: str, timeout: float, max_bytes: int,
+                             consumer: Optional[Callable[[str], Any]] = None,
+                             headers: Optional[Dict[str, str]] = None) -> FetchResult:
+        session = self._get_session()
+        client_timeout = aiohttp.ClientTimeout(total=timeout)
+        async with session.get(url, timeout=client_timeout, allow_redirects=True, headers=headers) as response:
+            content_type = response.headers.get("Content-Type", "")
+            reader = _BodyReader(content_type, max_bytes, consumer)
+            async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+                if reader.add(chunk):
+                    break
+            if reader.full and not reader.truncated:
+                reader.truncated = not response.content.at_eof()
+            return FetchResult(
+                url=url,
+                status=response.status,
+                final_url=str(response.url),
+                text=reader.text(),
+                content_type=content_type,
+                bytes_read=reader.bytes_read,
+                truncated=reader.truncated,
+                stopped_early=reader.stopped_early,
+                headers={name.lower(): value for name, value in response.headers.items()},
+            )
+
+    # ------------------------------------------------------------------
+    # requests backend
+    # ------------------------------------------------------------------
+
+    def _get_executor(self) -> concurrent.futures.ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                # Thread count is the global connection bound
+                self._executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self.config.max_connections, thread_name_prefix="bob-http"
+                )
+            return self._executor
+
+    def _get_requests_session(self) -> requests.Session:
+        with self._lock:
+            if self._requests_session is None:
+                session = requests.Session()
+                # pool_block makes extra requests to a busy host wait for a
+                # pooled connection instead of opening more
+                adapter = HTTPAdapter(
+                    pool_connections=self.config.max_connections,
+                    pool_maxsize=self.config.max_per_host,
+                    pool_block=True,
+                )
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                session.headers["User-Agent"] = self.config.user_agent
+                self._requests_session = session
+            return self._requests_session
+
+    def _fetch_requests(self, url: str, timeout: float, max_bytes: int,
+                        consumer: Optional[Callable[[str], Any]] = None,
+                        headers: Optional[Dict[str, str]] = None) -> FetchResult:
+        session = self._get_requests_session()
+        with session.get(url, timeout=timeout, stream=True, allow_redirects=True, headers=headers) as response:
+            content_type = response.headers.get("Content-Type", "")
+            reader = _BodyReader(content_type, max_bytes, consumer)
+            for chunk in response.iter_content(CHUNK_SIZE):
+                if reader.add(chunk):
+                    break
+            if reader.full and not reader.truncated:
+                reader.truncated = bool(response.raw.read(1))
+            return FetchResult(
+                url=url,
+                status=response.status_code,
+                final_url=response.url,
+                text=reader.text(),
+                content_type=content_type,
+                bytes_read=reader.bytes_read,
+                truncated=reader.truncated,
+                stopped_early=reader.stopped_early,
+                headers={name.lower(): value for name, value in response.headers.items()},
+            )
+
+
+_client: Optional[AsyncHTTPClient] = None
+_client_lock = threading.Lock()
+
+
+def get_http_client() -> AsyncHTTPClient:
+    """Get the process-wide HTTP client."""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = AsyncHTTPClient()
+        return _client
@@ -2,339 +2,251 @@
 """
 Advanced Image Extractor for Google Maps
 
-Extracts all available business images from Google Maps using
-multiple strategies including gallery navigation, scroll loading,
-and comprehensive DOM scanning.
+Extracts business images from Google Maps by sweeping UI states
+(place page, photo gallery, Photos tab, scroll positions) with one
+in-page DOM scan per state.
 """
 
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.common.action_chains import ActionChains
-from selenium.webdriver.common.keys import Keys
 import time
 import re
 
+from bob.config.settings import DEFAULT_EXTRACTOR_CONFIG
+
+
+# Collects every image URL under a root in one call: <img> src / data-src /
+# data-lazy-src and inline background-image styles (gallery thumbnails).
+_COLLECT_JS = """
+const collect = (rootSelector) => {
+    const scope = (rootSelector && document.querySelector(rootSelector)) || document;
+    const urls = new Set();
+    const add = (url) => { if (url && url.startsWith('http')) urls.add(url); };
+    for (const img of scope.querySelectorAll('img')) {
+        add(img.src);
+        add(img.getAttribute('data-src'));
+        add(img.getAttribute('data-lazy-src'));
+    }
+    for (const el of scope.querySelectorAll('[style*="background-image"]')) {
+        const style = el.getAttribute('style') || '';
+        for (const match of style.matchAll(/url\\(\\s*["']?([^"')]+)["']?\\s*\\)/g)) add(match[1]);
+    }
+    return Array.from(urls);
+};
+"""
+
+SCAN_IMAGES_SCRIPT = _COLLECT_JS + "return collect(arguments[0]);"
+
+# Async: optionally click the first matching opener (or a button whose text
+# mentions "photo"), wait until an indicator appears or the image count stops
+# changing, then scroll the panel if asked and return every image URL.
+# arguments: openers, indicators, textFallback, scrollSelectors, timeoutMs, callback
+CHANGE_STATE_AND_SCAN_SCRIPT = _COLLECT_JS + """
+const [openers, indicators, textFallback, scrollSelectors, timeoutMs] = arguments;
+const done = arguments[arguments.length - 1];
+
+let opened = null;
+for (const selector of openers) {
+    const el = document.querySelector(selector);
+    if (el) { el.click(); opened = selector; break; }
+}
+if (!opened && textFallback) {
+    for (const button of document.querySelectorAll('button')) {
+        if ((button.innerText || '').toLowerCase().includes('photo')) {
+            button.click(); opened = 'button:photo'; break;
+        }
+    }
+}
+let scrolled = false;
+for (const selector of scrollSelectors) {
+    const panel = document.querySelector(selector);
+    if (panel && panel.scrollHeight > panel.clientHeight) {
+        panel.scrollTop = panel.scrollTop + panel.clientHeight;
+        scrolled = true;
+        break;
+    }
+}
+if (openers.length && !opened) { done({opened: null, scrolled: scrolled, urls: []}); return; }
+
+const started = Date.now();
+let lastCount = -1, stable = 0;
+const poll = () => {
+    const count = document.querySelectorAll('img, [style*="background-image"]').length;
+    stable = count === lastCount ? stable + 1 : 0;
+    lastCount = count;
+    const indicated = indicators.length === 0 || indicators.some((s) => document.querySelector(s));
+    if ((indicated && stable >= 2) || Date.now() - started > timeoutMs) {
+        done({opened: opened, scrolled: scrolled, urls: collect(null)});
+    } else {
+        setTimeout(poll, 150);
+    }
+};
+poll();
+"""
+
+
 class AdvancedImageExtractor:
     """
     Advanced image extraction from Google Maps.
-    Uses multiple strategies to find all available images.
+
+    Sweeps UI states in order - the place page, the main photo gallery,
+    the Photos tab, then scroll positions of the open panel - with one
+    in-page call per state, and stops escalating once target_images
+    URLs have been found.
     """
 
-    def __init__(self, driver):
+    MAIN_PHOTO_SELECTORS = [
+        ".section-hero-header-image img",
+        ".section-hero-header-image-container img",
+        "[data-photo-index='0'] img",
+        ".gallery-image-high-res",
+        ".section-hero-header img",
+        ".hero-image img",
+        ".main-photo img",
+        "button[jsaction*='heroHeaderImage']",
+    ]
+    GALLERY_INDICATORS = [".gallery-container", ".photo-gallery", ".image-viewer", "[role='dialog']"]
+    PHOTOS_TAB_SELECTORS = [
+        "button[data-value='Photos']",
+        "[data-tab-index='1']",
+        "button[aria-label*='photo']",
+        "button[aria-label*='Photo']",
+        ".section-tab[data-value='photos']",
+        "button[jsaction*='photos']",
+        "div[data-value='Photos']",
+    ]
+    SCROLL_SELECTORS = [
+        "[role='dialog'] .m6QErb",
+        ".m6QErb.DxyBCb.kA9KIf.dS8AEf",
+        "[role='main']",
+        ".section-scrollbox",
+    ]
+
+    def __init__(self, driver, target_images=None, state_timeout=5.0, max_scrolls=10):
+        """
+        Args:
+            driver: Selenium WebDriver on a place page
+            target_images: Stop opening galleries/scrolling at this many images
+                (default: ExtractorConfig.max_images)
+            state_timeout: Seconds to wait for each UI state to settle
+            max_scrolls: Upper bound on scroll states
+        """
         self.driver = driver
-        self.wait = WebDriverWait(driver, 10)
+        self.target_images = target_images or DEFAULT_EXTRACTOR_CONFIG.max_images
+        self.state_timeout = state_timeout
+        self.max_scrolls = max_scrolls
+        self.phase_seconds = {}
 
     def extract_all_images_comprehensive(self):
         """
-        Extract all available images using multiple techniques.
-        Combines various strategies to maximize image discovery.
+        Collect images across UI states until target_images is reached.
+
+        Returns:
+            Dict with photos (high resolution, de-duplicated), counts and
+            seconds spent per phase
         """
-        print("📸 Starting comprehensive image extraction...")
+        print("📸 Starting single-sweep image extraction...")
 
         all_image_urls = set()
         extraction_log = []
-
-        # Phase 1: Extract all visible images immediately
-        initial_images = self._extract_immediate_images()
-        all_image_urls.update(initial_images)
-        extraction_log.append(f"Phase 1: {len(initial_images)} immediate images")
-
-        # Phase 2: Try to open main photo gallery
-        gallery_opened = self._open_main_photo_gallery()
-        if gallery_opened:
-            gallery_images = self._extract_gallery_images()
-            all_image_urls.update(gallery_images)
-            extraction_log.append(f"Phase 2: {len(gallery_images)} gallery images")
-
-        # Phase 3: Try Photos tab/button
-        photos_tab_opened = self._open_photos_tab()
-        if photos_tab_opened:
-            photos_tab_images = self._extract_photos_tab_images()
-            all_image_urls.update(photos_tab_images)
-            extraction_log.append(f"Phase 3: {len(photos_tab_images)} photos tab images")
-
-        # Phase 4: Scroll and extract more
-        scroll_images = self._scroll_and_extract()
-        all_image_urls.update(scroll_images)
-        extraction_log.append(f"Phase 4: {len(scroll_images)} scroll images")
-
-        # Phase 5: Look for hidden image containers
-        hidden_images = self._extract_hidden_images()
-        all_image_urls.update(hidden_images)
-        extraction_log.append(f"Phase 5: {len(hidden_images)} hidden images")
-
-        # Phase 6: Extract from street view and 360° photos
-        special_images = self._extract_special_view_images()
-        all_image_urls.update(special_images)
-        extraction_log.append(f"Phase 6: {len(special_images)} special view images")
+        self.phase_seconds = {}
+
+        def enough():
+            return len(all_image_urls) >= self.target_images
+
+        # Phase 1: Everything already in the DOM
+        found = self._run_phase("immediate", self._scan)
+        all_image_urls.update(found)
+        extraction_log.append(f"immediate: {len(found)} images")
+
+        # Phase 2: Main photo gallery
+        if not enough():
+            found = self._run_phase("gallery", lambda: self._change_state_and_scan(
+                self.MAIN_PHOTO_SELECTORS, self.GALLERY_INDICATORS))
+            if found is not None:
+                all_image_urls.update(found)
+                extraction_log.append(f"gallery: {len(found)} images")
+
+        # Phase 3: Photos tab
+        if not enough():
+            found = self._run_phase("photos_tab", lambda: self._change_state_and_scan(
+                self.PHOTOS_TAB_SELECTORS, [], text_fallback=True))
+            if found is not None:
+                all_image_urls.update(found)
+                extraction_log.append(f"photos_tab: {len(found)} images")
+
+        # Phase 4: Scroll the open panel until nothing new appears
+        if not enough():
+            before = len(all_image_urls)
+            self._run_phase("scroll", lambda: self._scroll_until_target(all_image_urls))
+            extraction_log.append(f"scroll: {len(all_image_urls) - before} new images")
 
         # Convert all to high resolution and remove duplicates
-        high_res_images = list(set([self._convert_to_ultra_high_res(url) for url in all_image_urls]))
+        high_res_images = list(dict.fromkeys(self._convert_to_ultra_high_res(url) for url in all_image_urls))
 
         print(f"✅ Extracted {len(high_res_images)} unique images")
         for log in extraction_log:
-            print(f"   📊 {log}")
+            print(f"   📊 {log} ({self.phase_seconds.get(log.split(':')[0], 0):.1f}s)")
 
         return {
             "photos": high_res_images,
             "image_count": len(high_res_images),
             "extraction_phases": len(extraction_log),
-            "extraction_method": "comprehensive_multi_phase"
+            "image_phase_seconds": dict(self.phase_seconds),
+            "extraction_method": "single_sweep"
         }
 
-    def _extract_immediate_images(self):
-        """Extract all immediately visible images."""
-        image_urls = set()
-
-        # Comprehensive image selectors
-        selectors = [
-            "img[src*='googleusercontent.com']",
-            "img[src*='gstatic.com']",
-            "img[data-src*='googleusercontent.com']",
-            "img[data-src*='gstatic.com']",
-            ".section-hero-header img",
-            ".section-hero-header-image img",
-            ".section-hero-header-image-container img",
-            ".gallery-image img",
-            ".photo-container img",
-            ".section-image img",
-            "[role='img']",
-            "img[src*='maps']",
-            "img[src*='streetview']",
-            ".streetview img",
-            ".panorama img"
-        ]
-
-        for selector in selectors:
-            try:
-                images = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                for img in images:
-                    src = img.get_attribute('src') or img.get_attribute('data-src')
-                    if src and self._is_valid_image_url(src):
-                        image_urls.add(src)
-            except:
-                continue
-
-        return image_urls
-
-    def _open_main_photo_gallery(self):
-        """Try to open the main photo gallery."""
-        main_photo_selectors = [
-            ".section-hero-header-image img",
-            ".section-hero-header-image-container img",
-            "[data-photo-index='0'] img",
-            ".gallery-image-high-res",
-            ".section-hero-header img",
-            ".hero-image img",
-            ".main-photo img"
-        ]
-
-        for selector in main_photo_selectors:
-            try:
-                photo = self.driver.find_element(By.CSS_SELECTOR, selector)
-                # Try clicking the photo
-                ActionChains(self.driver).click(photo).perform()
-                time.sleep(4)
-
-                # Check if gallery opened by looking for gallery indicators
-                gallery_indicators = [
-                    ".gallery-container",
-                    ".photo-gallery",
-                    ".image-viewer",
-                    "[role='dialog']"
-                ]
-
-                for indicator in gallery_indicators:
-                    try:
-                        if self.driver.find_element(By.CSS_SELECTOR, indicator):
-                            print("📸 Main photo gallery opened")
-                            return True
-                    except:
-                        continue
-
-            except:
-                continue
-
-        return False
-
-    def _extract_gallery_images(self):
-        """Extract images from opened gallery."""
-        gallery_urls = set()
-
-        # Wait for gallery to load
-        time.sleep(3)
-
-        # Gallery-specific selectors
-        gallery_selectors = [
-            ".gallery-container img",
-            ".photo-gallery img",
-            ".image-viewer img",
-            ".gallery-image img",
-            "[role='dialog'] img",
-            ".photo-carousel img",
-            ".image-carousel img"
-        ]
-
-        for selector in gallery_selectors:
-            try:
-                images = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                for img in images:
-                    src = img.get_attribute('src') or img.get_attribute('data-src')
-                    if src and self._is_valid_image_url(src):
-                        gallery_urls.add(src)
-            except:
-                continue
-
-        return gallery_urls
-
-    def _open_photos_tab(self):
-        """Try to open Photos tab/button."""
-        photos_selectors = [
-            "button[data-value='Photos']",
-            "[data-tab-index='1']",
-            "button[aria-label*='photo']",
-            "button[aria-label*='Photo']",
-            ".section-tab[data-value='photos']",
-            "button[jsaction*='photos']",
-            "div[data-value='Photos']",
-            "span:contains('Photos')",
-            "button:contains('Photos')"
-        ]
-
-        for selector in photos_selectors:
-            try:
-                if "contains" not in selector:  # CSS selectors only
-                    tab = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    ActionChains(self.driver).click(tab).perform()
-                    time.sleep(5)
-                    print("📸 Photos tab opened")
-                    return True
-            except:
-                continue
-
-        # Try finding by text content
+    def _run_phase(self, phase, action):
+        """Run one phase, recording the time it took."""
+        started = time.time()
         try:
-            buttons = self.driver.find_elements(By.TAG_NAME, "button")
-            for button in buttons:
-                if "photo" in button.text.lower():
-                    ActionChains(self.driver).click(button).perform()
-                    time.sleep(5)
-                    print("📸 Photos button found and clicked")
-                    return True
-        except:
-            pass
-
-        return False
-
-    def _extract_photos_tab_images(self):
-        """Extract images from Photos tab."""
-        photos_urls = set()
-
-        # Wait for photos to load
-        time.sleep(4)
-
-        # Photos tab specific selectors
-        photos_selectors = [
-            ".section-scrollbox img",
-            ".section-layout img",
-            ".photos-section img",
-            ".photo-grid img",
-            ".image-grid img",
-            ".scrollable-photos img"
-        ]
-
-        for selector in photos_selectors:
-            try:
-                images = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                for img in images:
-                    src = img.get_attribute('src') or img.get_attribute('data-src')
-                    if src and self._is_valid_image_url(src):
-                        photos_urls.add(src)
-            except:
-                continue
-
-        return photos_urls
-
-    def _scroll_and_extract(self):
-        """Scroll to load more images and extract them."""
-        scroll_urls = set()
-
-        # Scroll multiple times to load lazy-loaded images
-        for i in range(10):
-            try:
-                # Scroll down
-                self.driver.execute_script("window.scrollBy(0, 500);")
-                time.sleep(1)
-
-                # Extract new images after scroll
-                new_images = self.driver.find_elements(By.CSS_SELECTOR, "img[src*='googleusercontent.com']")
-                for img in new_images:
-                    src = img.get_attribute('src')
-                    if src and self._is_valid_image_url(src):
-                        scroll_urls.add(src)
-
-                # Try horizontal scroll if in gallery
-                self.driver.execute_script("window.scrollBy(500, 0);")
-                time.sleep(1)
-
-            except:
-                break
-
-        return scroll_urls
+            return action()
+        except Exception as e:
+            print(f"   ⚠️ Image phase {phase} failed: {str(e)[:60]}")
+            return None
+        finally:
+            self.phase_seconds[phase] = round(time.time() - started, 2)
 
-    def _extract_hidden_images(self):
-        """Extract images from hidden containers."""
-        hidden_urls = set()
+    def _valid(self, urls):
+        return {url for url in urls or [] if self._is_valid_image_url(url)}
 
-        # Look for hidden image containers
-        hidden_selectors = [
-            "[style*='display: none'] img",
-            ".hidden img",
-            ".invisible img",
-            "[aria-hidden='true'] img",
-            ".lazy img",
-            ".lazyload img"
-        ]
+    def _scan(self, root_selector=None):
+        """All valid image URLs under root_selector (one WebDriver call)."""
+        return self._valid(self.driver.execute_script(SCAN_IMAGES_SCRIPT, root_selector))
 
-        for selector in hidden_selectors:
-            try:
-                images = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                for img in images:
-                    src = img.get_attribute('src') or img.get_attribute('data-src') or img.get_attribute('data-lazy-src')
-                    if src and self._is_valid_image_url(src):
-                        hidden_urls.add(src)
-            except:
-                continue
-
-        return hidden_urls
-
-    def _extract_special_view_images(self):
-        """Extract street view and 360° images."""
-        special_urls = set()
-
-        # Look for street view and 360° images
-        special_selectors = [
-            "img[src*='streetview']",
-            "img[src*='panorama']",
-            ".streetview-container img",
-            ".panoramic-image img",
-            ".street-view img",
-            "img[src*='cbk']",  # Street view callback
-            "img[src*='photosphere']"
-        ]
+    def _change_state_and_scan(self, openers, indicators, text_fallback=False, scroll=False):
+        """
+        Open a UI state (or scroll), let it settle, and scan - one async call.
 
-        for selector in special_selectors:
-            try:
-                images = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                for img in images:
-                    src = img.get_attribute('src')
-                    if src and self._is_valid_image_url(src):
-                        special_urls.add(src)
-            except:
-                continue
-
-        return special_urls
+        Returns:
+            Valid image URLs, or None if no opener matched / nothing scrolled
+        """
+        result = self.driver.execute_async_script(
+            CHANGE_STATE_AND_SCAN_SCRIPT,
+            openers,
+            indicators,
+            text_fallback,
+            self.SCROLL_SELECTORS if scroll else [],
+            int(self.state_timeout * 1000),
+        ) or {}
+        if openers and not result.get("opened"):
+            return None
+        if scroll and not result.get("scrolled"):
+            return None
+        return self._valid(result.get("urls"))
+
+    def _scroll_until_target(self, all_image_urls):
+        """Scroll states until the target is met or two scrolls add nothing."""
+        idle = 0
+        for _ in range(self.max_scrolls):
+            if len(all_image_urls) >= self.target_images:
+                break
+            found = self._change_state_and_scan([], [], scroll=True)
+            if found is None:
+                break
+            new = found - all_image_urls
+            all_image_urls.update(found)
+            idle = 0 if new else idle + 1
+            if idle >= 2:
+                break
 
     def _is_valid_image_url(self, url):
         """Check if URL is a valid BUSINESS image URL (not maps, logos, avatars)."""
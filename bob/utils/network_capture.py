@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+BOB Network Capture v4.3.1
+
+Bounded capture of Google Maps internal API responses for Playwright pages.
+
+URL rules are compiled into one regex up front, so non-matching responses
+(the vast majority: tiles, scripts, images) cost one regex search. Matched
+responses are kept in a ring buffer as lightweight handles; bodies are
+read and parsed only when asked for, only for JSON-ish content types and
+within per-response and per-job byte caps. Long-lived pooled pages call
+start_job() between businesses so nothing accumulates across navigations.
+
+Usage:
+    from bob.utils.network_capture import NetworkAPICapture
+
+    capture = NetworkAPICapture()
+    capture.attach(page)
+    await page.goto(url)
+    place = await capture.latest_json("place")
+"""
+
+import json
+import re
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+from bob.utils.photo_harvester import PHOTO_META_URL_RE, XSSI_PREFIX
+
+
+# rule name -> URL pattern
+DEFAULT_RULES = {
+    "place": r"/v1/place/|/maps/api/place|/maps/preview/place",
+    "reviews": r"listugcposts|/maps/rpc/listugcposts",
+    "photos": PHOTO_META_URL_RE.pattern,
+}
+
+# Bodies of other content types (images, fonts, protobuf blobs) are never read
+PARSEABLE_CONTENT_TYPES = ("application/json", "text/javascript", "application/javascript", "text/plain")
+
+
+class CapturedResponse:
+    """Handle to one matched response; the body is fetched on demand."""
+
+    __slots__ = ("rule", "url", "status", "content_type", "content_length",
+                 "_response", "_capture", "_parsed", "_loaded")
+
+    def __init__(self, rule: str, response, content_type: str, content_length: Optional[int], capture):
+        self.rule = rule
+        self.url = response.url
+        self.status = response.status
+        self.content_type = content_type
+        self.content_length = content_length
+        self._response = response
+        self._capture = capture
+        self._parsed = None
+        self._loaded = False
+
+    async def json(self) -> Any:
+        """Parsed body (XSSI guard stripped), or None if unavailable or over budget."""
+        if self._loaded:
+            return self._parsed
+        self._loaded = True
+        body = await self._capture._read_body(self)
+        self._response = None  # Drop the handle once read
+        if body is None:
+            return None
+        text = body.decode("utf-8", errors="replace")
+        if text.startswith(XSSI_PREFIX):
+            text = text[len(XSSI_PREFIX):]
+        try:
+            self._parsed = json.loads(text)
+        except ValueError:
+            self._capture.stats["parse_errors"] += 1
+        return self._parsed
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "rule": self.rule,
+            "url": self.url,
+            "status": self.status,
+            "content_type": self.content_type,
+        }
+
+
+class NetworkAPICapture:
+    """Capture Google Maps internal API responses (bounded, lazily parsed)."""
+
+    def __init__(
+        self,
+        rules: Optional[Dict[str, str]] = None,
+        max_entries: int = 100,
+        max_body_bytes: int = 2 * 1024 * 1024,
+        max_job_bytes: int = 8 * 1024 * 1024,
+    ):
+        """
+        Initialize the capture.
+
+        Args:
+            rules: {name: URL regex}; default DEFAULT_RULES
+            max_entries: Ring buffer size for matched responses
+            max_body_bytes: Largest single body that will be read
+            max_job_bytes: Total body bytes read per job (start_job() resets)
+        """
+        rules = rules or DEFAULT_RULES
+        self._pattern = re.compile("|".join(f"(?P<{name}>{pattern})" for name, pattern in rules.items()))
+        self.max_body_bytes = max_body_bytes
+        self.max_job_bytes = max_job_bytes
+
+        self.api_responses: Deque[CapturedResponse] = deque(maxlen=max_entries)
+        self._job_bytes = 0
+        self.stats = {
+            "seen": 0,
+            "matched": 0,
+            "skipped_content_type": 0,
+            "evicted": 0,
+            "bodies_read": 0,
+            "bytes_read": 0,
+            "over_budget": 0,
+            "parse_errors": 0,
+        }
+
+    # ------------------------------------------------------------------
+    # Capture
+    # ------------------------------------------------------------------
+
+    def match(self, url: str) -> Optional[str]:
+        """Name of the rule url matches, or None."""
+        found = self._pattern.search(url)
+        return found.lastgroup if found else None
+
+    def capture_response(self, response):
+        """Playwright "response" handler: record matched responses, read nothing."""
+        self.stats["seen"] += 1
+        rule = self.match(response.url)
+        if rule is None:
+            return
+        headers = response.headers
+        content_type = headers.get("content-type", "")
+        if not content_type.startswith(PARSEABLE_CONTENT_TYPES):
+            self.stats["skipped_content_type"] += 1
+            return
+        try:
+            content_length = int(headers.get("content-length", ""))
+        except ValueError:
+            content_length = None
+
+        if len(self.api_responses) == self.api_responses.maxlen:
+            self.stats["evicted"] += 1
+        self.api_responses.append(CapturedResponse(rule, response, content_type, content_length, self))
+        self.stats["matched"] += 1
+
+    def attach(self, page):
+        """Start capturing on page."""
+        page.on("response", self.capture_response)
+
+    def detach(self, page):
+        """Stop capturing on page (pooled pages outlive the job)."""
+        try:
+            page.remove_listener("response", self.capture_response)
+        except Exception:
+            pass
+
+    def start_job(self):
+        """Forget previous captures and reset the per-job byte budget."""
+        self.api_responses.clear()
+        self._job_bytes = 0
+
+    # ------------------------------------------------------------------
+    # Access
+    # ------------------------------------------------------------------
+
+    def captured(self, rule: str) -> List[CapturedResponse]:
+        """Matched responses for one rule, oldest first."""
+        return [entry for entry in self.api_responses if entry.rule == rule]
+
+    async def latest_json(self, rule: str) -> Any:
+        """Parsed body of the newest readable response for rule."""
+        for entry in reversed(self.captured(rule)):
+            parsed = await entry.json()
+            if parsed is not None:
+                return parsed
+        return None
+
+    async def all_json(self, rule: str) -> List[Any]:
+        """Parsed bodies of every readable response for rule."""
+        parsed = [await entry.json() for entry in self.captured(rule)]
+        return [item for item in parsed if item is not None]
+
+    async def _read_body(self, entry: CapturedResponse) -> Optional[bytes]:
+        """Read one body if it fits the per-response and per-job caps."""
+        remaining = self.max_job_bytes - self._job_bytes
+        limit = min(self.max_body_bytes, remaining)
+        if entry.content_length is not None and entry.content_length > limit:
+            self.stats["over_budget"] += 1
+            return None
+        try:
+            body = await entry._response.body()
+        except Exception:
+            return None  # Evicted by the browser (e.g. after navigation)
+        if len(body) > limit:
+            self.stats["over_budget"] += 1
+            return None
+        self._job_bytes += len(body)
+        self.stats["bodies_read"] += 1
+        self.stats["bytes_read"] += len(body)
+        return body
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, "buffered": len(self.api_responses), "job_bytes": self._job_bytes}
@@ -9,6 +9,8 @@ Uses multiple browser instances for faster extraction.
 - Uses more memory (~50MB per browser)
 - May trigger rate limiting from Google
 - Default is 2 parallel browsers (conservative)
+- adaptive=True lets an AIMD controller grow the worker count while
+  Google and the machine stay healthy (see bob.utils.concurrency)
 
 Usage:
     from bob.utils.parallel_extractor import ParallelExtractor
@@ -18,13 +20,24 @@ Usage:
 """
 
 import asyncio
+import gc
 import time
-import psutil
 import os
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass, field
 
+from bob.extractors.browser_pool import BrowserPool
 from bob.extractors.playwright_optimized import PlaywrightExtractorOptimized
+from bob.extractors.selenium_pool import trim_session_pools
+from bob.utils.admission import MemoryAdmissionController
+from bob.utils.projection import FieldProjection
+from bob.utils.resources import get_resource_sampler
+from bob.utils.concurrency import (
+    AdaptiveConcurrencyController,
+    AIMDConfig,
+    classify_outcome,
+    default_concurrency_ceiling,
+)
 
 
 @dataclass
@@ -32,12 +45,25 @@ class ParallelConfig:
     """Configuration for parallel extraction."""
     max_concurrent: int = 2           # Max parallel browsers (conservative default)
     delay_between_starts: float = 3.0 # Seconds between starting each browser
-    memory_limit_percent: float = 80  # Abort if memory usage exceeds this
+    memory_limit_percent: float = 80  # Hold new jobs while projected memory exceeds this
     include_reviews: bool = True
     max_reviews: int = 5
     headless: bool = True
+    adaptive: bool = False            # Let the AIMD controller tune concurrency
+    max_concurrent_ceiling: Optional[int] = None  # Adaptive upper bound (None = CPU/memory based)
+    fields: Optional[List[str]] = None  # Only extract these fields (None = all)
+    browser_pool: bool = True         # Jobs share one Chromium (a context each) instead of launching their own
     
     def __post_init__(self):
+        FieldProjection(self.fields)  # Fail on unknown field names before any browser starts
+        if self.adaptive:
+            # max_concurrent is only the starting point; the controller
+            # moves between 1 and the machine-derived ceiling.
+            if self.max_concurrent_ceiling is None:
+                self.max_concurrent_ceiling = default_concurrency_ceiling()
+            self.max_concurrent = min(self.max_concurrent, self.max_concurrent_ceiling)
+            return
+
         # Safety limits
         if self.max_concurrent > 5:
             print(f"⚠️ Reducing max_concurrent from {self.max_concurrent} to 5 (safety limit)")
@@ -48,7 +74,8 @@ class ParallelExtractor:
     """
     Extract multiple businesses concurrently.
     
-    Uses asyncio.Semaphore to limit concurrent extractions.
+    Uses asyncio.Semaphore to limit concurrent extractions, or an
+    AdaptiveConcurrencyController when config.adaptive is set.
     Each extraction runs in its own browser instance.
     """
     
@@ -60,70 +87,118 @@ class ParallelExtractor:
             config: ParallelConfig instance (uses defaults if None)
         """
         self.config = config or ParallelConfig()
+        self.controller: Optional[AdaptiveConcurrencyController] = None
+        # Cgroup-aware, whole-process-tree readings sampled in the background
+        self.resources = get_resource_sampler()
+        self.admission = MemoryAdmissionController(
+            memory_limit_percent=self.config.memory_limit_percent,
+            memory_probe=self.resources.memory_probe,
+        )
+        self.admission.add_recycle_callback(self._recycle_browsers)
+        self.browser_pool: Optional[BrowserPool] = None  # Per extract_batch() run
         self.stats = {
             "total": 0,
             "successful": 0,
             "failed": 0,
-            "skipped_memory": 0,
+            "delayed_memory": 0,
             "start_time": None,
             "end_time": None,
         }
     
     def _check_memory(self) -> float:
-        """Check current memory usage percentage."""
-        return psutil.virtual_memory().percent
+        """Check current memory usage percentage (cgroup limit if containerized)."""
+        return self.resources.memory_percent()
+
+    async def _recycle_browsers(self):
+        """
+        Free memory while jobs are held by admission control.
+
+        Restarts the pooled Chromium (right away when idle, otherwise once
+        its running contexts are released), quits idle pooled Selenium
+        sessions, then collects what is left waiting for GC.
+        """
+        if self.browser_pool is not None:
+            await self.browser_pool.recycle()
+        # driver.quit() blocks on the chromedriver process
+        quit_sessions = await asyncio.get_running_loop().run_in_executor(None, trim_session_pools)
+        if quit_sessions:
+            print(f"   ♻️ Quit {quit_sessions} idle Selenium session(s)")
+        gc.collect()
     
     async def _extract_single(
         self,
         url: str,
-        semaphore: asyncio.Semaphore,
+        semaphore,
         index: int,
         total: int
     ) -> Dict[str, Any]:
         """
-        Extract a single business with semaphore control.
+        Extract a single business with admission and semaphore control.
+
+        Admission comes first, so a job held for memory does not occupy
+        a concurrency slot; its reservation counts until it starts.
         
         Args:
             url: Business URL or name
-            semaphore: Asyncio semaphore for concurrency control
+            semaphore: Asyncio semaphore or adaptive controller for concurrency control
             index: Current index (for progress)
             total: Total businesses (for progress)
         
         Returns:
             Extraction result dictionary
         """
-        async with semaphore:
-            # Check memory before starting
-            mem_usage = self._check_memory()
-            if mem_usage > self.config.memory_limit_percent:
-                print(f"   [{index}/{total}] ⚠️ Skipped (memory {mem_usage:.0f}%)")
-                self.stats["skipped_memory"] += 1
-                return {"success": False, "error": "Memory limit exceeded", "url": url}
-            
-            # Create fresh extractor for each business
-            extractor = PlaywrightExtractorOptimized(headless=self.config.headless)
-            
-            try:
-                result = await extractor.extract_business_optimized(
-                    url,
-                    include_reviews=self.config.include_reviews,
-                    max_reviews=self.config.max_reviews
-                )
-                
-                if result.get('success'):
-                    self.stats["successful"] += 1
-                    name = result.get('name', 'Unknown')[:35]
-                    print(f"   [{index}/{total}] ✅ {name}")
-                else:
-                    self.stats["failed"] += 1
-                    print(f"   [{index}/{total}] ❌ Failed")
-                
-                return result
-                
-            except Exception as e:
+        # Wait (instead of failing) until the job fits into memory
+        ticket = await self.admission.admit(f"[{index}/{total}] {url}", start=False)
+        if ticket.waited_seconds > 0.5:
+            self.stats["delayed_memory"] += 1
+
+        try:
+            async with semaphore:
+                self.admission.start(ticket)
+                return await self._run_job(url, index, total)
+        finally:
+            self.admission.release(ticket)
+
+    async def _run_job(self, url: str, index: int, total: int) -> Dict[str, Any]:
+        """Run one extraction (inside a concurrency slot)."""
+        # Fresh extractor for each business (a context on the pooled browser, if any)
+        extractor = PlaywrightExtractorOptimized(headless=self.config.headless, browser_pool=self.browser_pool)
+        started = time.time()
+
+        try:
+            result = await extractor.extract_business_optimized(
+                url,
+                include_reviews=self.config.include_reviews,
+                max_reviews=self.config.max_reviews,
+                fields=self.config.fields,
+            )
+            self._record_outcome(started, result)
+
+            if result.get('success'):
+                self.stats["successful"] += 1
+                name = result.get('name', 'Unknown')[:35]
+                print(f"   [{index}/{total}] ✅ {name}")
+            else:
                 self.stats["failed"] += 1
-                print(f"   [{index}/{total}] ❌ Error: {str(e)[:40]}")
-                return {"success": False, "error": str(e), "url": url}
+                print(f"   [{index}/{total}] ❌ Failed")
+
+            return result
+
+        except Exception as e:
+            self.stats["failed"] += 1
+            print(f"   [{index}/{total}] ❌ Error: {str(e)[:40]}")
+            result = {"success": False, "error": str(e), "url": url}
+            self._record_outcome(started, result)
+            return result
+
+    def _record_outcome(self, started: float, result: Dict[str, Any]):
+        """Feed a finished job into the adaptive controller (if enabled)."""
+        if not self.controller:
+            return
+        decision = self.controller.record(time.time() - started, classify_outcome(result))
+        if decision and decision.action != "hold":
+            arrow = "⬆️" if decision.action == "increase" else "⬇️"
+            print(f"   {arrow} Concurrency {decision.previous_limit} → {decision.limit} ({decision.reason})")
     
     async def extract_batch(
         self,
@@ -144,7 +219,7 @@ class ParallelExtractor:
             "total": len(urls),
             "successful": 0,
             "failed": 0,
-            "skipped_memory": 0,
+            "delayed_memory": 0,
             "start_time": time.time(),
             "end_time": None,
         }
@@ -152,28 +227,54 @@ class ParallelExtractor:
         print(f"\n🔱 BOB PARALLEL EXTRACTOR v4.3.1")
         print("=" * 60)
         print(f"📊 Total businesses: {len(urls)}")
-        print(f"⚡ Max concurrent: {self.config.max_concurrent}")
+        if self.config.adaptive:
+            print(f"⚡ Adaptive concurrency: start {self.config.max_concurrent}, "
+                  f"ceiling {self.config.max_concurrent_ceiling}")
+        else:
+            print(f"⚡ Max concurrent: {self.config.max_concurrent}")
         print(f"🧠 Memory limit: {self.config.memory_limit_percent}%")
         print(f"⏱️ Delay between starts: {self.config.delay_between_starts}s")
         print("=" * 60)
         
-        # Create semaphore for concurrency control
-        semaphore = asyncio.Semaphore(self.config.max_concurrent)
-        
-        # Create tasks with staggered starts
-        tasks = []
-        for i, url in enumerate(urls, 1):
-            # Stagger task creation to avoid all starting at once
-            if i > 1:
-                await asyncio.sleep(self.config.delay_between_starts)
-            
-            task = asyncio.create_task(
-                self._extract_single(url, semaphore, i, len(urls))
+        # Create semaphore (or adaptive controller) for concurrency control
+        if self.config.adaptive:
+            self.controller = AdaptiveConcurrencyController(
+                AIMDConfig(
+                    initial_limit=self.config.max_concurrent,
+                    max_limit=self.config.max_concurrent_ceiling,
+                    memory_high_percent=self.config.memory_limit_percent,
+                ),
+                memory_probe=self.resources.memory_percent,
             )
-            tasks.append(task)
+            semaphore = self.controller
+        else:
+            self.controller = None
+            semaphore = asyncio.Semaphore(self.config.max_concurrent)
         
-        # Wait for all tasks to complete
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # One Chromium for the batch; each job gets its own context
+        if self.config.browser_pool:
+            self.browser_pool = BrowserPool(headless=self.config.headless)
+
+        try:
+            # Create tasks with staggered starts
+            tasks = []
+            for i, url in enumerate(urls, 1):
+                # Stagger task creation to avoid all starting at once
+                if i > 1:
+                    await asyncio.sleep(self.config.delay_between_starts)
+
+                task = asyncio.create_task(
+                    self._extract_single(url, semaphore, i, len(urls))
+                )
+                tasks.append(task)
+
+            # Wait for all tasks to complete
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            pool, self.browser_pool = self.browser_pool, None
+            if pool is not None:
+                self.stats["browser_pool"] = pool.get_stats()
+                await pool.close()
         
         # Handle any exceptions
         processed_results = []
@@ -188,6 +289,11 @@ class ParallelExtractor:
                 processed_results.append(result)
         
         self.stats["end_time"] = time.time()
+        self.stats["admission"] = self.admission.get_stats()
+        self.stats["resources"] = self.resources.get_stats()
+        if self.controller:
+            self.stats["concurrency"] = self.controller.get_stats()
+            self.stats["concurrency_timeline"] = self.controller.metrics()
         
         # Print summary
         self._print_summary()
@@ -206,11 +312,21 @@ class ParallelExtractor:
         print(f"   Total: {total}")
         print(f"   Successful: {successful}")
         print(f"   Failed: {self.stats['failed']}")
-        if self.stats['skipped_memory'] > 0:
-            print(f"   Skipped (memory): {self.stats['skipped_memory']}")
+        if self.stats['delayed_memory'] > 0:
+            admission = self.stats.get('admission', {})
+            print(f"   Delayed (memory): {self.stats['delayed_memory']} "
+                  f"(max wait {admission.get('max_wait_seconds', 0)}s)")
         print(f"   Success Rate: {successful/total*100:.1f}%")
         print(f"   Duration: {duration:.1f}s")
         print(f"   Avg Time: {duration/total:.1f}s per business")
+        resources = self.stats.get('resources')
+        if resources:
+            print(f"   Peak Memory: {resources['peak_tree_rss_mb']:.0f}MB "
+                  f"(Python + {resources['peak_browser_processes']} browser processes)")
+        if self.stats.get('concurrency'):
+            concurrency = self.stats['concurrency']
+            print(f"   Concurrency: final {concurrency['current_limit']}, peak {concurrency['peak_limit']} "
+                  f"(+{concurrency['increases']}/-{concurrency['decreases']})")
         
         # Compare to sequential estimate
         seq_estimate = total * 15  # ~15s per business sequentially
@@ -226,22 +342,28 @@ class ParallelExtractor:
 async def extract_parallel(
     urls: List[str],
     max_concurrent: int = 2,
-    include_reviews: bool = True
+    include_reviews: bool = True,
+    adaptive: bool = False,
+    fields: Optional[List[str]] = None
 ) -> List[Dict[str, Any]]:
     """
     Convenience function for parallel extraction.
     
     Args:
         urls: List of business URLs or names
-        max_concurrent: Maximum parallel browsers
+        max_concurrent: Maximum parallel browsers (starting point when adaptive)
         include_reviews: Whether to extract reviews
+        adaptive: Tune concurrency with the AIMD controller
+        fields: Only extract these fields, e.g. ["phone", "website"]
     
     Returns:
         List of extraction results
     """
     config = ParallelConfig(
         max_concurrent=max_concurrent,
-        include_reviews=include_reviews
+        include_reviews=include_reviews,
+        adaptive=adaptive,
+        fields=fields
     )
     extractor = ParallelExtractor(config)
     return await extractor.extract_batch(urls)
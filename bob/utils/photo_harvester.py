@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+BOB Photo Harvester v4.3.1
+
+Collects place photos from the Google Maps photo gallery's metadata
+responses instead of from rendered <img> thumbnails.
+
+Opening the gallery makes Maps fetch photo metadata (/maps/photometa/...,
+/maps/rpc/photo/listentityphotos...). Those responses carry photo IDs
+and googleusercontent URLs for many more photos than are ever rendered.
+The harvester decodes them and, when the listing request carries a
+page window (!1i<offset>!2i<count> in its pb parameter), replays it with
+the next offset through the page's request context until max_images
+photos are known - no thumbnail rendering or scrolling.
+
+Usage:
+    from bob.utils.photo_harvester import PhotoHarvester
+
+    harvester = PhotoHarvester(max_images=50)
+    harvester.attach(page)                  # before page.goto()
+    ...
+    photos = await harvester.harvest(page)
+"""
+
+import asyncio
+import json
+import re
+import time
+from typing import Any, Dict, Iterator, List, Optional
+
+from bob.config.settings import DEFAULT_EXTRACTOR_CONFIG
+
+
+PHOTO_META_URL_RE = re.compile(r"/maps/(?:photometa/|rpc/photo/listentityphotos)")
+PHOTO_ID_RE = re.compile(r"\b(AF1Qip[\w-]{20,})")
+PHOTO_URL_RE = re.compile(r"https?://lh\d\.googleusercontent\.com/(?:p|gps-cs-s|gps-proxy)/[\w\-/%.]+")
+PAGE_WINDOW_RE = re.compile(r"!1i(\d+)!2i(\d+)")
+XSSI_PREFIX = ")]}'"
+
+HERO_PHOTO_SELECTORS = (
+    "button[jsaction*='heroHeaderImage'], "
+    "[data-photo-index='0'], "
+    ".section-hero-header-image img"
+)
+
+
+def _strings(node: Any) -> Iterator[str]:
+    """Every string inside nested JSON lists/dicts."""
+    if isinstance(node, str):
+        yield node
+    elif isinstance(node, list):
+        for item in node:
+            yield from _strings(item)
+    elif isinstance(node, dict):
+        for item in node.values():
+            yield from _strings(item)
+
+
+def decode_photometa(body: str) -> Dict[str, str]:
+    """
+    Decode photo IDs and URLs from one metadata response.
+
+    Args:
+        body: Response text (JSON behind the )]}' XSSI guard)
+
+    Returns:
+        {photo_id_or_url: full-resolution photo URL}, in response order
+    """
+    text = body[len(XSSI_PREFIX):] if body.startswith(XSSI_PREFIX) else body
+    try:
+        strings = list(_strings(json.loads(text)))
+    except ValueError:
+        # Not JSON (truncated / different wrapper): scan the raw text
+        strings = [text.replace("\\u003d", "=").replace("\\u0026", "&").replace("\\/", "/")]
+
+    # Served URLs first; bare IDs only fill in photos without one
+    urls: Dict[str, str] = {}
+    ids: List[str] = []
+    for value in strings:
+        for url in PHOTO_URL_RE.findall(value):
+            base = url.split("=")[0]
+            id_match = PHOTO_ID_RE.search(base)
+            urls.setdefault(id_match.group(1) if id_match else base, base)
+        ids.extend(PHOTO_ID_RE.findall(value))
+
+    photos: Dict[str, str] = {}
+    for photo_id in dict.fromkeys(ids):
+        photos[photo_id] = urls.pop(photo_id, f"https://lh3.googleusercontent.com/p/{photo_id}")
+    photos.update(urls)
+    return photos
+
+
+def next_page_url(url: str, offset: int) -> Optional[str]:
+    """Listing URL with its page window moved to offset (None if it has no window)."""
+    match = PAGE_WINDOW_RE.search(url)
+    if not match:
+        return None
+    return url[:match.start()] + f"!1i{offset}!2i{match.group(2)}" + url[match.end():]
+
+
+class PhotoHarvester:
+    """
+    Photo URLs from gallery metadata responses, paged up to max_images.
+    """
+
+    def __init__(self, max_images: Optional[int] = None, max_pages: int = 10, response_timeout: float = 5.0):
+        """
+        Args:
+            max_images: Stop once this many photos are known (default: ExtractorConfig.max_images)
+            max_pages: Upper bound on replayed listing requests
+            response_timeout: Seconds to wait for the first metadata response after opening the gallery
+        """
+        self.max_images = max_images or DEFAULT_EXTRACTOR_CONFIG.max_images
+        self.max_pages = max_pages
+        self.response_timeout = response_timeout
+
+        self._photos: Dict[str, str] = {}
+        self._listing_url: Optional[str] = None
+        self._first_response: Optional[asyncio.Event] = None
+        self.stats = {
+            "responses": 0,
+            "pages_requested": 0,
+            "decode_errors": 0,
+            "bytes": 0,
+            "seconds": 0.0,
+        }
+
+    # ------------------------------------------------------------------
+    # Capture
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def matches(url: str) -> bool:
+        """Whether url is a gallery metadata request."""
+        return bool(PHOTO_META_URL_RE.search(url))
+
+    def attach(self, page):
+        """Listen for metadata responses on page (call before navigation)."""
+        self._first_response = asyncio.Event()
+        page.on("response", self.on_response)
+
+    async def on_response(self, response):
+        """Playwright response handler: decode metadata, ignore everything else."""
+        if not self.matches(response.url):
+            return
+        if response.headers.get("content-type", "").startswith("image/"):
+            return
+        try:
+            body = await response.text()
+        except Exception:
+            self.stats["decode_errors"] += 1
+            return
+        self.ingest(body, response.url)
+
+    def ingest(self, body: str, url: str = "") -> int:
+        """
+        Add the photos in one metadata body.
+
+        Returns:
+            Number of photos not seen before
+        """
+        self.stats["responses"] += 1
+        self.stats["bytes"] += len(body)
+        if url and PAGE_WINDOW_RE.search(url) and self._listing_url is None:
+            self._listing_url = url
+        try:
+            decoded = decode_photometa(body)
+        except Exception:
+            self.stats["decode_errors"] += 1
+            decoded = {}
+        before = len(self._photos)
+        for key, photo_url in decoded.items():
+            self._photos.setdefault(key, photo_url)
+        if self._first_response is not None:
+            self._first_response.set()
+        return len(self._photos) - before
+
+    # ------------------------------------------------------------------
+    # Harvest
+    # ------------------------------------------------------------------
+
+    async def harvest(self, page, open_gallery: bool = True) -> List[str]:
+        """
+        Page through photo metadata until max_images photos are known.
+
+        Args:
+            page: Playwright page on a place (the harvester must be attached)
+            open_gallery: Click the hero photo if no metadata was seen yet
+
+        Returns:
+            Up to max_images full-resolution photo URLs
+        """
+        started = time.time()
+        try:
+            if not self._photos and open_gallery:
+                await self._open_gallery(page)
+
+            offset = len(self._photos)
+            while (len(self._photos) < self.max_images
+                   and self._listing_url
+                   and self.stats["pages_requested"] < self.max_pages):
+                url = next_page_url(self._listing_url, offset)
+                response = await page.request.get(url)
+                self.stats["pages_requested"] += 1
+                if not response.ok:
+                    break
+                new = self.ingest(await response.text())
+                if new == 0:
+                    break
+                offset += new
+        except Exception as e:
+            print(f"⚠️ Photo metadata paging stopped: {str(e)[:60]}")
+        finally:
+            self.stats["seconds"] += time.time() - started
+
+        photos = self.photo_urls()
+        if photos:
+            print(f"📸 Photo metadata: {len(photos)} photos "
+                  f"({self.stats['responses']} responses, {self.stats['pages_requested']} pages)")
+        return photos
+
+    async def _open_gallery(self, page):
+        """Click the hero photo once and wait for the gallery's first metadata response."""
+        try:
+            await page.locator(HERO_PHOTO_SELECTORS).first.click(timeout=3000)
+        except Exception:
+            return
+        if self._first_response is not None:
+            try:
+                await asyncio.wait_for(self._first_response.wait(), self.response_timeout)
+            except asyncio.TimeoutError:
+                pass
+        try:
+            await page.keyboard.press("Escape")  # Leave the place panel usable
+        except Exception:
+            pass
+
+    def photo_urls(self) -> List[str]:
+        """Known photo URLs, capped at max_images."""
+        return list(self._photos.values())[:self.max_images]
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "seconds": round(self.stats["seconds"], 2),
+            "photos": len(self._photos),
+            "paging": self._listing_url is not None,
+        }
@@ -9,20 +9,22 @@ Example: ChIJN1t_tDeuEmsRUsoyG83frY4
 """
 
 import re
-import time
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
+from bob.utils.waits import StageWaiter
+
 class PlaceIDExtractor:
     """
     Advanced Place ID extraction using multiple strategies.
     Place ID is the PRIMARY KEY for Google Maps businesses.
     """
 
-    def __init__(self, driver):
+    def __init__(self, driver, waiter=None):
         self.driver = driver
         self.wait = WebDriverWait(driver, 10)
+        self.waiter = waiter or StageWaiter()
 
     def extract_place_id_comprehensive(self):
         """
@@ -205,11 +207,10 @@ class PlaceIDExtractor:
                 try:
                     share_btn = self.driver.find_element(By.CSS_SELECTOR, selector)
                     share_btn.click()
-                    time.sleep(1.5)
 
-                    # Get share URL
-                    url_input = self.driver.find_element(By.CSS_SELECTOR, "input[readonly]")
-                    share_url = url_input.get_attribute("value")
+                    # Share URL, once the dialog has filled its input
+                    share_url = self.waiter.until("share_dialog", lambda: self.driver.find_element(
+                        By.CSS_SELECTOR, "input[readonly]").get_attribute("value"))
 
                     # Close dialog
                     try:
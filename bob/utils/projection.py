@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+BOB Field Projection v4.3.1
+
+Lets callers ask for a subset of business fields (fields=["phone",
+"website"]) so extractors compute only those fields and skip whole
+stages - image sweeps, the reviews tab, email fetches, panel scrolling -
+that only serve fields nobody asked for.
+
+The name is always included: it identifies the record and is how a
+result is checked against the query. Emails are looked up from the
+website, so asking for emails includes the website.
+
+Usage:
+    from bob.utils.projection import FieldProjection
+
+    projection = FieldProjection(["phone", "website"])
+    if projection.needs("reviews"):
+        ...
+    data = projection.apply(data)
+"""
+
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Union
+
+
+# Public field name -> stage that produces it ("fields" = the place panel scan)
+FIELD_STAGES = {
+    "name": "fields",
+    "rating": "fields",
+    "reviews_count": "fields",
+    "address": "fields",
+    "phone": "fields",
+    "website": "fields",
+    "category": "fields",
+    "hours": "fields",
+    "latitude": "fields",
+    "longitude": "fields",
+    "plus_code": "fields",
+    "place_id": "fields",
+    "cid": "fields",
+    "images": "images",
+    "reviews": "reviews",
+    "emails": "email",
+}
+
+# Accepted alternative spellings
+FIELD_ALIASES = {
+    "gps": ("latitude", "longitude"),
+    "coordinates": ("latitude", "longitude"),
+    "review_count": ("reviews_count",),
+    "photos": ("images",),
+    "email": ("emails",),
+}
+
+# Result keys carrying each field, across engines (dropped when not requested)
+RESULT_KEYS = {
+    "reviews_count": ("reviews_count", "review_count"),
+    "website": ("website", "available_urls"),
+    "place_id": ("place_id", "place_id_hex", "place_id_original", "place_id_confidence",
+                 "place_id_format", "is_real_cid", "place_id_url"),
+    "images": ("images", "photos", "image_count", "extraction_phases", "image_phase_seconds"),
+    "reviews": ("reviews", "reviews_extracted", "total_reviews_extracted"),
+}
+
+ALWAYS_INCLUDED = frozenset({"name"})
+
+# Fields that can only be computed from other fields
+FIELD_REQUIRES = {
+    "emails": ("website",),
+}
+
+# Stages that exist only to serve some fields ("scroll" loads the lower panel)
+STAGE_FIELDS = {
+    "images": frozenset({"images"}),
+    "photos": frozenset({"images"}),
+    "reviews": frozenset({"reviews"}),
+    "email": frozenset({"emails"}),
+    "place_id": frozenset({"place_id", "cid"}),
+    "scroll": frozenset({"images", "reviews", "hours"}),
+}
+
+
+class FieldProjection:
+    """
+    Requested subset of business fields (None = everything).
+    """
+
+    def __init__(self, fields: Optional[Iterable[str]] = None):
+        """
+        Args:
+            fields: Field names or aliases (see FIELD_STAGES / FIELD_ALIASES),
+                    or a comma-separated string; None or empty for all fields
+
+        Raises:
+            ValueError: Unknown field name
+        """
+        if isinstance(fields, str):
+            fields = [part.strip() for part in fields.split(",") if part.strip()]
+        self.fields: Optional[FrozenSet[str]] = None
+        if fields:
+            resolved = set(ALWAYS_INCLUDED)
+            for field in fields:
+                key = field.strip().lower()
+                if key in FIELD_ALIASES:
+                    resolved.update(FIELD_ALIASES[key])
+                elif key in FIELD_STAGES:
+                    resolved.add(key)
+                else:
+                    raise ValueError(f"Unknown field '{field}' (known: {', '.join(sorted(FIELD_STAGES))})")
+            for field, required in FIELD_REQUIRES.items():
+                if field in resolved:
+                    resolved.update(required)
+            self.fields = frozenset(resolved)
+
+    @classmethod
+    def of(cls, fields: Union[None, str, Iterable[str], "FieldProjection"]) -> "FieldProjection":
+        """Projection from whatever a caller passed as fields=."""
+        return fields if isinstance(fields, FieldProjection) else cls(fields)
+
+    @property
+    def is_full(self) -> bool:
+        return self.fields is None
+
+    def wants(self, field: str) -> bool:
+        """Whether field (or an alias of it) was requested."""
+        if self.fields is None:
+            return True
+        return any(name in self.fields for name in FIELD_ALIASES.get(field, (field,)))
+
+    def needs(self, stage: str) -> bool:
+        """Whether stage produces any requested field."""
+        if self.fields is None:
+            return True
+        served = STAGE_FIELDS.get(stage)
+        if served is None:
+            return any(FIELD_STAGES[field] == stage for field in self.fields)
+        return bool(served & self.fields)
+
+    def dom_fields(self) -> Optional[List[str]]:
+        """Requested place-panel fields for in-page extractors (None = all)."""
+        if self.fields is None:
+            return None
+        return sorted(field for field in self.fields if FIELD_STAGES[field] == "fields")
+
+    def apply(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Drop unrequested fields from a result, keeping status/metadata keys."""
+        if self.fields is None or not data:
+            return data
+        for field in FIELD_STAGES:
+            if field not in self.fields:
+                for key in RESULT_KEYS.get(field, (field,)):
+                    data.pop(key, None)
+        data["fields"] = sorted(self.fields)
+        return data
+
+    def covered_by(self, data: Dict[str, Any]) -> bool:
+        """Whether a stored result was extracted with at least these fields."""
+        stored = data.get("fields")
+        if stored is None:
+            return True  # Full extraction
+        return self.fields is not None and self.fields <= set(stored)
+
+    def __repr__(self) -> str:
+        return f"FieldProjection({'all' if self.fields is None else sorted(self.fields)})"
@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+"""
+BOB Resource Sampler v4.3.1
+
+Background resource accounting for extraction workloads.
+
+The memory that matters is not the Python process RSS but the Chromium
+and driver processes it spawns, and inside Docker the ceiling is the
+container's cgroup limit rather than host RAM. ResourceSampler walks the
+whole process tree (Python + Playwright/chromedriver + Chromium children)
+and reads cgroup v2 limits on a background interval, so schedulers and
+stats read a cached ResourceSnapshot instead of calling psutil per job.
+
+Usage:
+    from bob.utils.resources import get_resource_sampler
+
+    sampler = get_resource_sampler()        # starts the background thread
+    snapshot = sampler.snapshot()
+    print(snapshot.tree_rss_mb, snapshot.memory_percent)
+"""
+
+import os
+import threading
+import time
+from dataclasses import dataclass, asdict
+from typing import Any, Dict, Optional, Tuple
+
+import psutil
+
+
+CGROUP_ROOT = "/sys/fs/cgroup"
+MB = 1024 * 1024
+
+
+@dataclass
+class ResourceSnapshot:
+    """One sample of process-tree and container resource usage."""
+
+    timestamp: float
+    python_rss_mb: float
+    browser_rss_mb: float           # All descendant processes (drivers + Chromium)
+    browser_processes: int
+    cpu_percent: float              # Whole tree; 100 = one fully used core
+    host_used_mb: float
+    host_total_mb: float
+    cgroup_memory_limit_mb: Optional[float] = None
+    cgroup_memory_current_mb: Optional[float] = None
+    cgroup_cpu_limit: Optional[float] = None    # In cores
+
+    @property
+    def tree_rss_mb(self) -> float:
+        """Python process plus every browser/driver child."""
+        return self.python_rss_mb + self.browser_rss_mb
+
+    @property
+    def memory_used_mb(self) -> float:
+        """Used memory against the effective limit (cgroup if set, else host)."""
+        if self.cgroup_memory_limit_mb and self.cgroup_memory_current_mb is not None:
+            return self.cgroup_memory_current_mb
+        return self.host_used_mb
+
+    @property
+    def memory_total_mb(self) -> float:
+        """Effective memory limit (cgroup if set, else host)."""
+        if self.cgroup_memory_limit_mb and self.cgroup_memory_current_mb is not None:
+            return min(self.cgroup_memory_limit_mb, self.host_total_mb)
+        return self.host_total_mb
+
+    @property
+    def memory_percent(self) -> float:
+        """Used share of the effective memory limit."""
+        total = self.memory_total_mb
+        return self.memory_used_mb / total * 100 if total else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary, including derived values."""
+        data = asdict(self)
+        data.update({
+            "tree_rss_mb": round(self.tree_rss_mb, 1),
+            "memory_used_mb": round(self.memory_used_mb, 1),
+            "memory_total_mb": round(self.memory_total_mb, 1),
+            "memory_percent": round(self.memory_percent, 1),
+        })
+        return data
+
+
+def _read_text(path: str) -> Optional[str]:
+    try:
+        with open(path, "r") as f:
+            return f.read().strip()
+    except (OSError, ValueError):
+        return None
+
+
+def _cgroup_dir(root: str = CGROUP_ROOT) -> Optional[str]:
+    """Locate this process's cgroup v2 directory."""
+    # cgroup v2 entries in /proc/self/cgroup look like "0::/docker/abc..."
+    membership = _read_text("/proc/self/cgroup") or ""
+    for line in membership.splitlines():
+        if line.startswith("0::"):
+            candidate = os.path.join(root, line[3:].lstrip("/"))
+            if os.path.exists(os.path.join(candidate, "memory.max")):
+                return candidate
+    # With a cgroup namespace (Docker default) the container's group is the root
+    if os.path.exists(os.path.join(root, "memory.max")):
+        return root
+    return None
+
+
+def read_cgroup_limits(root: str = CGROUP_ROOT) -> Dict[str, Optional[float]]:
+    """
+    Read cgroup v2 memory and CPU limits.
+
+    Args:
+        root: cgroup v2 mount point
+
+    Returns:
+        Dict with memory_limit_mb, memory_current_mb and cpu_limit (cores);
+        values are None when unlimited or unavailable (e.g. cgroup v1, macOS).
+    """
+    limits = {"memory_limit_mb": None, "memory_current_mb": None, "cpu_limit": None}
+    directory = _cgroup_dir(root)
+    if not directory:
+        return limits
+
+    memory_max = _read_text(os.path.join(directory, "memory.max"))
+    if memory_max and memory_max != "max":
+        try:
+            limits["memory_limit_mb"] = int(memory_max) / MB
+        except ValueError:
+            pass
+
+    memory_current = _read_text(os.path.join(directory, "memory.current"))
+    if memory_current:
+        try:
+            limits["memory_current_mb"] = int(memory_current) / MB
+        except ValueError:
+            pass
+
+    # cpu.max is "<quota> <period>" or "max <period>"
+    cpu_max = _read_text(os.path.join(directory, "cpu.max"))
+    if cpu_max:
+        parts = cpu_max.split()
+        if len(parts) == 2 and parts[0] != "max":
+            try:
+                limits["cpu_limit"] = int(parts[0]) / int(parts[1])
+            except (ValueError, ZeroDivisionError):
+                pass
+
+    return limits
+
+
+class ResourceSampler:
+    """
+    Samples process-tree and cgroup resources on a background thread.
+    """
+
+    def __init__(self, interval: float = 2.0, cgroup_root: str = CGROUP_ROOT):
+        """
+        Initialize the sampler (does not start the thread).
+
+        Args:
+            interval: Seconds between background samples
+            cgroup_root: cgroup v2 mount point
+        """
+        self.interval = interval
+        self.cgroup_root = cgroup_root
+        self._process = psutil.Process(os.getpid())
+        self._children: Dict[int, psutil.Process] = {}
+        self._latest: Optional[ResourceSnapshot] = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self.peak_tree_rss_mb = 0.0
+        self.peak_browser_processes = 0
+        self.samples = 0
+
+        # Prime CPU counters so the first real sample has a baseline
+        self._process.cpu_percent(None)
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def start(self) -> "ResourceSampler":
+        """Start background sampling (idempotent)."""
+        if self._thread and self._thread.is_alive():
+            return self
+        self._stop.clear()
+        self.sample()
+        self._thread = threading.Thread(target=self._run, name="bob-resource-sampler", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop background sampling."""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=self.interval + 1)
+            self._thread = None
+
+    @property
+    def running(self) -> bool:
+        return bool(self._thread and self._thread.is_alive())
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.sample()
+            except Exception:
+                # Never let accounting take down an extraction run
+                pass
+
+    # ------------------------------------------------------------------
+    # Sampling
+    # ------------------------------------------------------------------
+
+    def _child_processes(self):
+        """Current descendants, reusing Process objects for CPU deltas."""
+        try:
+            current = self._process.children(recursive=True)
+        except psutil.Error:
+            current = []
+
+        alive = {}
+        for child in current:
+            known = self._children.get(child.pid)
+            if known is None:
+                try:
+                    child.cpu_percent(None)  # prime; first reading is 0
+                except psutil.Error:
+                    continue
+                known = child
+            alive[child.pid] = known
+        self._children = alive
+        return list(alive.values())
+
+    def sample(self) -> ResourceSnapshot:
+        """Take a sample now and make it the latest snapshot."""
+        python_rss = self._process.memory_info().rss
+        cpu = self._process.cpu_percent(None)
+
+        browser_rss = 0
+        browser_count = 0
+        for child in self._child_processes():
+            try:
+                with child.oneshot():
+                    browser_rss += child.memory_info().rss
+                    cpu += child.cpu_percent(None)
+                browser_count += 1
+            except psutil.Error:
+                continue
+
+        host = psutil.virtual_memory()
+        cgroup = read_cgroup_limits(self.cgroup_root)
+
+        snapshot = ResourceSnapshot(
+            timestamp=time.time(),
+            python_rss_mb=python_rss / MB,
+            browser_rss_mb=browser_rss / MB,
+            browser_processes=browser_count,
+            cpu_percent=cpu,
+            host_used_mb=(host.total - host.available) / MB,
+            host_total_mb=host.total / MB,
+            cgroup_memory_limit_mb=cgroup["memory_limit_mb"],
+            cgroup_memory_current_mb=cgroup["memory_current_mb"],
+            cgroup_cpu_limit=cgroup["cpu_limit"],
+        )
+
+        with self._lock:
+            self._latest = snapshot
+            self.samples += 1
+            self.peak_tree_rss_mb = max(self.peak_tree_rss_mb, snapshot.tree_rss_mb)
+            self.peak_browser_processes = max(self.peak_browser_processes, browser_count)
+        return snapshot
+
+    def snapshot(self) -> ResourceSnapshot:
+        """Latest snapshot (samples synchronously only if none exists yet)."""
+        with self._lock:
+            latest = self._latest
+        return latest if latest is not None else self.sample()
+
+    # ------------------------------------------------------------------
+    # Probes for schedulers
+    # ------------------------------------------------------------------
+
+    def memory_percent(self) -> float:
+        """Effective memory usage percent (cgroup-aware)."""
+        return self.snapshot().memory_percent
+
+    def memory_probe(self) -> Tuple[float, float]:
+        """(used_mb, total_mb) against the effective limit (cgroup-aware)."""
+        snapshot = self.snapshot()
+        return snapshot.memory_used_mb, snapshot.memory_total_mb
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Latest snapshot plus peaks, rounded for display."""
+        snapshot = self.snapshot()
+        return {
+            "tree_rss_mb": round(snapshot.tree_rss_mb, 1),
+            "python_rss_mb": round(snapshot.python_rss_mb, 1),
+            "browser_rss_mb": round(snapshot.browser_rss_mb, 1),
+            "browser_processes": snapshot.browser_processes,
+            "cpu_percent": round(snapshot.cpu_percent, 1),
+            "memory_percent": round(snapshot.memory_percent, 1),
+            "cgroup_memory_limit_mb": (round(snapshot.cgroup_memory_limit_mb, 1)
+                                       if snapshot.cgroup_memory_limit_mb else None),
+            "cgroup_cpu_limit": snapshot.cgroup_cpu_limit,
+            "peak_tree_rss_mb": round(self.peak_tree_rss_mb, 1),
+            "peak_browser_processes": self.peak_browser_processes,
+            "samples": self.samples,
+        }
+
+
+# Process-wide sampler shared by all extractors and schedulers
+_sampler: Optional[ResourceSampler] = None
+_sampler_lock = threading.Lock()
+
+
+def get_resource_sampler(interval: float = 2.0) -> ResourceSampler:
+    """Get the process-wide sampler, starting it on first use."""
+    global _sampler
+    with _sampler_lock:
+        if _sampler is None:
+            _sampler = ResourceSampler(interval=interval)
+        if not _sampler.running:
+            _sampler.start()
+        return _sampler
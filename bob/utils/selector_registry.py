@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+BOB Selector Registry v4.3.1
+
+Process-wide, persisted hit-rate registry for CSS selectors.
+
+Default selectors per field and engine ship in bob/config/selectors.json.
+Every extraction records which selector produced the field (a hit) and
+which were tried before it and came up empty (misses). Counts are keyed by
+field and selector, so Playwright and Selenium learn from each other
+wherever they use the same selector, and are persisted to a JSON file
+shared by all workers. Strategies are then ordered by recent hit rate:
+counts are halved once a selector has seen `window` attempts, so a Google
+Maps DOM change re-orders the list within a few hundred extractions.
+
+Usage:
+    from bob.utils.selector_registry import get_selector_registry
+
+    registry = get_selector_registry()
+    for selector in registry.ordered("selenium", "phone"):
+        ...
+    registry.record_attempts("phone", tried=[".a", ".b"], winner=".b")
+"""
+
+import atexit
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from bob.utils.driver_cache import file_lock
+
+
+DEFAULT_DATA_FILE = Path(__file__).resolve().parent.parent / "config" / "selectors.json"
+DEFAULT_STATS_FILE = Path(os.getenv(
+    "BOB_SELECTOR_STATS",
+    Path.home() / ".cache" / "bob" / "selector_stats.json",
+))
+
+
+class SelectorRegistry:
+    """
+    Selector lists per (engine, field) ordered by learned hit rate.
+    """
+
+    def __init__(
+        self,
+        data_file: Optional[Path] = None,
+        stats_file: Optional[Path] = None,
+        window: int = 200,
+        flush_every: int = 50,
+    ):
+        """
+        Initialize the registry.
+
+        Args:
+            data_file: JSON with default selectors (bob/config/selectors.json)
+            stats_file: JSON where hit/miss counts are persisted (None disables persistence)
+            window: Attempts per selector after which counts are halved
+            flush_every: Persist after this many recorded attempts
+        """
+        self.data_file = Path(data_file or DEFAULT_DATA_FILE)
+        self.stats_file = Path(stats_file) if stats_file else None
+        self.window = window
+        self.flush_every = flush_every
+        self._lock = threading.Lock()
+
+        with open(self.data_file, encoding="utf-8") as handle:
+            self.defaults: Dict[str, Dict[str, List[str]]] = json.load(handle)["fields"]
+
+        # "field|selector" -> {"hits", "misses", "last_hit"}
+        self.counts: Dict[str, Dict[str, float]] = {}
+        self._pending: Dict[str, Dict[str, float]] = {}
+        self._pending_attempts = 0
+        self.stats = {"recorded": 0, "flushes": 0, "reorders": 0}
+
+        if self.stats_file:
+            self.counts = self._read_stats_file()
+
+    @staticmethod
+    def _key(field: str, selector: str) -> str:
+        return f"{field}|{selector}"
+
+    # ------------------------------------------------------------------
+    # Ordering
+    # ------------------------------------------------------------------
+
+    def score(self, field: str, selector: str) -> float:
+        """Laplace-smoothed hit rate (0.5 for an unseen selector)."""
+        entry = self.counts.get(self._key(field, selector), {})
+        hits = entry.get("hits", 0.0)
+        misses = entry.get("misses", 0.0)
+        return (hits + 1) / (hits + misses + 2)
+
+    def ordered(self, engine: str, field: str) -> List[str]:
+        """
+        Selectors for one engine and field, most likely hit first.
+
+        Ties keep the data-file order.
+        """
+        defaults = self.defaults.get(field, {}).get(engine, [])
+        with self._lock:
+            ordered = self._sorted(field, defaults)
+            if ordered != defaults:
+                self.stats["reorders"] += 1
+        return ordered
+
+    def _sorted(self, field: str, selectors: List[str]) -> List[str]:
+        return sorted(selectors, key=lambda selector: -self.score(field, selector))
+
+    def ordered_map(self, engine: str) -> Dict[str, List[str]]:
+        """{field: ordered selectors} for every field the engine has defaults for."""
+        return {
+            field: self.ordered(engine, field)
+            for field, engines in self.defaults.items()
+            if engine in engines
+        }
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+
+    def record(self, field: str, selector: str, hit: bool):
+        """Record one hit or miss."""
+        key = self._key(field, selector)
+        with self._lock:
+            for table in (self.counts, self._pending):
+                entry = table.setdefault(key, {"hits": 0.0, "misses": 0.0, "last_hit": 0.0})
+                entry["hits" if hit else "misses"] += 1
+                if hit:
+                    entry["last_hit"] = time.time()
+            self._decay(self.counts[key])
+            self.stats["recorded"] += 1
+            self._pending_attempts += 1
+            due = self.stats_file is not None and self._pending_attempts >= self.flush_every
+        if due:
+            self.flush()
+
+    def record_attempts(self, field: str, tried: List[str], winner: Optional[str]):
+        """
+        Record one field lookup: selectors before the winner missed.
+
+        Args:
+            field: Field name
+            tried: Selectors in the order they were tried
+            winner: Selector that produced the value (None if all missed)
+        """
+        for selector in tried:
+            if selector == winner:
+                self.record(field, selector, hit=True)
+                return
+            self.record(field, selector, hit=False)
+
+    def _decay(self, entry: Dict[str, float]):
+        """Halve counts once they exceed the window so recent results dominate."""
+        if entry["hits"] + entry["misses"] > self.window:
+            entry["hits"] /= 2
+            entry["misses"] /= 2
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def _read_stats_file(self) -> Dict[str, Dict[str, float]]:
+        try:
+            with open(self.stats_file, encoding="utf-8") as handle:
+                return json.load(handle).get("counts", {})
+        except (OSError, ValueError):
+            return {}
+
+    def flush(self):
+        """
+        Merge pending counts into the stats file.
+
+        Other workers write the same file, so pending deltas are added to
+        what is on disk (under a file lock) rather than overwriting it.
+        """
+        if not self.stats_file:
+            return
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._pending_attempts = 0
+        if not pending:
+            return
+
+        try:
+            with file_lock(self.stats_file.with_suffix(".lock")):
+                merged = self._read_stats_file()
+                for key, delta in pending.items():
+                    entry = merged.setdefault(key, {"hits": 0.0, "misses": 0.0, "last_hit": 0.0})
+                    entry["hits"] += delta["hits"]
+                    entry["misses"] += delta["misses"]
+                    entry["last_hit"] = max(entry.get("last_hit", 0.0), delta["last_hit"])
+                    self._decay(entry)
+
+                temp_file = self.stats_file.with_suffix(f".{os.getpid()}.tmp")
+                with open(temp_file, "w", encoding="utf-8") as handle:
+                    json.dump({"updated_at": time.time(), "counts": merged}, handle)
+                os.replace(temp_file, self.stats_file)
+
+            with self._lock:
+                # Pick up what other workers learned; keep anything recorded meanwhile
+                for key, delta in self._pending.items():
+                    entry = merged.setdefault(key, {"hits": 0.0, "misses": 0.0, "last_hit": 0.0})
+                    entry["hits"] += delta["hits"]
+                    entry["misses"] += delta["misses"]
+                self.counts = merged
+                self.stats["flushes"] += 1
+        except Exception as e:
+            print(f"⚠️ Could not persist selector stats: {str(e)[:60]}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Registry counters plus the top selector per field."""
+        with self._lock:
+            leaders = {
+                field: {
+                    engine: self._sorted(field, selectors)[0]
+                    for engine, selectors in engines.items()
+                    if selectors
+                }
+                for field, engines in self.defaults.items()
+            }
+            return {
+                **self.stats,
+                "tracked_selectors": len(self.counts),
+                "stats_file": str(self.stats_file) if self.stats_file else None,
+                "leaders": leaders,
+            }
+
+
+# Process-wide registry shared by every extractor
+_registry: Optional[SelectorRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_selector_registry() -> SelectorRegistry:
+    """Get the process-wide SelectorRegistry (persisted, flushed at exit)."""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = SelectorRegistry(stats_file=DEFAULT_STATS_FILE)
+            atexit.register(_registry.flush)
+        return _registry
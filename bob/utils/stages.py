@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+BOB Stage Graph v4.3.1
+
+Runs one extraction as a small dependency graph of stages instead of a
+fixed sequence.
+
+Each stage names the stages it needs (after=) and, optionally, a
+resource it occupies. A stage starts as soon as its dependencies have
+finished; stages sharing a resource (the WebDriver, which is not
+thread-safe) never overlap, while stages that need no resource - such as
+fetching emails from an already-known website - run alongside them.
+Per-stage timings and errors are collected in the StageRun.
+
+Usage:
+    from bob.utils.stages import StageGraph
+
+    graph = StageGraph()
+    graph.add("navigate", lambda results: load(driver), resource="driver", required=True)
+    graph.add("core", lambda results: fields(driver), after=["navigate"], resource="driver", required=True)
+    graph.add("reviews", lambda results: reviews(driver), after=["core"], resource="driver")
+    graph.add("emails", lambda results: emails(results["core"]["website"]), after=["core"])
+    run = graph.run()
+    print(run.timings)
+"""
+
+import concurrent.futures
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+
+@dataclass
+class Stage:
+    """One unit of extraction work."""
+    name: str
+    func: Callable[[Dict[str, Any]], Any]  # Receives the outputs of finished stages
+    after: Sequence[str] = ()
+    resource: Optional[str] = None          # Stages sharing a resource run one at a time
+    required: bool = False                  # A failure fails the whole run
+
+
+@dataclass
+class StageRun:
+    """Outcome of one StageGraph.run()."""
+    results: Dict[str, Any] = field(default_factory=dict)
+    errors: Dict[str, str] = field(default_factory=dict)
+    timings: Dict[str, float] = field(default_factory=dict)
+    skipped: List[str] = field(default_factory=list)   # Not run: a dependency failed
+    reused: List[str] = field(default_factory=list)    # Output supplied by the caller
+    seconds: float = 0.0
+    failure: Optional[BaseException] = None            # First required-stage exception
+
+    @property
+    def ok(self) -> bool:
+        return self.failure is None
+
+    def raise_for_failure(self):
+        """Re-raise the exception of a failed required stage, if any."""
+        if self.failure is not None:
+            raise self.failure
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Per-stage timings and status for inclusion in a result."""
+        return {
+            "stage_seconds": {name: round(seconds, 2) for name, seconds in self.timings.items()},
+            "stage_errors": dict(self.errors),
+            "stages_skipped": list(self.skipped),
+            "pipeline_seconds": round(self.seconds, 2),
+        }
+
+
+class StageGraph:
+    """
+    Dependency graph of extraction stages, run with bounded concurrency.
+    """
+
+    def __init__(self, max_workers: int = 3):
+        """
+        Args:
+            max_workers: Upper bound on stages running at the same time
+        """
+        self.max_workers = max_workers
+        self.stages: Dict[str, Stage] = {}
+
+    def add(
+        self,
+        name: str,
+        func: Callable[[Dict[str, Any]], Any],
+        after: Iterable[str] = (),
+        resource: Optional[str] = None,
+        required: bool = False,
+    ) -> "StageGraph":
+        """
+        Add a stage (dependencies must already be in the graph).
+
+        Raises:
+            ValueError: Duplicate stage or unknown dependency
+        """
+        after = tuple(after)
+        if name in self.stages:
+            raise ValueError(f"Stage '{name}' already defined")
+        missing = [dep for dep in after if dep not in self.stages]
+        if missing:
+            raise ValueError(f"Stage '{name}' depends on unknown stage(s): {', '.join(missing)}")
+        self.stages[name] = Stage(name, func, after, resource, required)
+        return self
+
+    def run(self, completed: Optional[Dict[str, Any]] = None) -> StageRun:
+        """
+        Run every stage once its dependencies have finished.
+
+        Args:
+            completed: Outputs of stages already done (e.g. by an earlier
+                       attempt); those stages are not run again
+
+        Returns:
+            StageRun with outputs, errors and timings. A failed required
+            stage stops new stages from starting; see raise_for_failure().
+        """
+        run = StageRun()
+        started = time.time()
+        for name, output in (completed or {}).items():
+            if name in self.stages:
+                run.results[name] = output
+                run.reused.append(name)
+
+        pending = [name for name in self.stages if name not in run.results]
+        busy_resources = set()
+        lock = threading.Lock()
+
+        def execute(stage: Stage):
+            with lock:
+                inputs = dict(run.results)
+            stage_started = time.time()
+            try:
+                return stage.func(inputs)
+            finally:
+                run.timings[stage.name] = time.time() - stage_started
+
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="bob-stage"
+        ) as executor:
+            running: Dict[concurrent.futures.Future, Stage] = {}
+            while pending or running:
+                # Drop stages whose dependencies failed or were skipped
+                for name in list(pending):
+                    if any(dep in run.errors or dep in run.skipped for dep in self.stages[name].after):
+                        pending.remove(name)
+                        run.skipped.append(name)
+
+                if run.failure is None:
+                    for name in list(pending):
+                        stage = self.stages[name]
+                        if len(running) >= self.max_workers:
+                            break
+                        if any(dep not in run.results for dep in stage.after):
+                            continue
+                        if stage.resource and stage.resource in busy_resources:
+                            continue
+                        pending.remove(name)
+                        if stage.resource:
+                            busy_resources.add(stage.resource)
+                        running[executor.submit(execute, stage)] = stage
+                elif not running:
+                    run.skipped.extend(pending)
+                    pending = []
+
+                if not running:
+                    if pending:
+                        # Nothing runnable and nothing running: unsatisfiable dependencies
+                        run.skipped.extend(pending)
+                        pending = []
+                    break
+
+                done, _ = concurrent.futures.wait(running, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    stage = running.pop(future)
+                    if stage.resource:
+                        busy_resources.discard(stage.resource)
+                    try:
+                        output = future.result()
+                        with lock:
+                            run.results[stage.name] = output
+                    except Exception as e:
+                        run.errors[stage.name] = str(e)
+                        if stage.required and run.failure is None:
+                            run.failure = e
+
+        run.seconds = time.time() - started
+        return run
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+BOB URL Classifier v4.3.1
+
+Compiled classification of candidate website URLs (and email domains):
+
+- direct:          a business's own website
+- redirect:        Google /url?q= redirect to a business website (target resolved)
+- booking:         booking / delivery intermediaries (Zomato, Booking.com, ...)
+- social:          social profiles (Facebook, Instagram, ...)
+- review:          review / rating sites (Trustpilot, Glassdoor, ...)
+- google-internal: Maps, provider choosers, ads and other Google pages
+- invalid:         not a usable website (mailto, localhost, private IPs, no host)
+
+Hosts are matched against a domain-suffix trie (m.facebook.com matches
+facebook.com), then one precompiled alternation of brand labels
+registered under many TLDs (tripadvisor.co.uk, maps.google.de); paths
+are checked for Google-internal pages. Results are cached, so repeated
+URLs in a batch cost a dict lookup.
+
+Usage:
+    from bob.utils.url_classifier import get_url_classifier, DIRECT
+
+    classifier = get_url_classifier()
+    for item in classifier.classify_many(urls):
+        if item.category in (DIRECT, REDIRECT):
+            print(item.url)
+
+    classifier.classify_host("zomato.com")   # "booking"
+"""
+
+import ipaddress
+import re
+import threading
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional
+from urllib.parse import parse_qs, unquote, urlparse
+
+
+DIRECT = "direct"
+REDIRECT = "redirect"
+BOOKING = "booking"
+SOCIAL = "social"
+REVIEW = "review"
+GOOGLE_INTERNAL = "google-internal"
+INVALID = "invalid"
+
+# Registered domains per category (subdomains match too)
+DOMAIN_RULES = {
+    GOOGLE_INTERNAL: ("google.com",),
+    SOCIAL: ("facebook.com", "instagram.com", "twitter.com", "youtube.com"),
+    BOOKING: ("zomato.com", "swiggy.com", "booking.com", "yelp.com"),
+    REVIEW: ("g2.com",),
+}
+
+# Host labels, under any TLD (tripadvisor.com, tripadvisor.co.uk, maps.google.de)
+LABEL_RULES = {
+    GOOGLE_INTERNAL: ("google",),
+    BOOKING: ("tripadvisor", "justdial", "urbanpiper", "deliveroo", "ubereats", "doordash", "grubhub"),
+    REVIEW: ("trustpilot", "glassdoor"),
+}
+
+# Google pages reached through other hosts or redirects
+GOOGLE_PATH_RE = re.compile(r'/maps/reserve|/maps/place|/viewer/choose|maps-booking|/aclk')
+
+
+@dataclass(frozen=True)
+class URLClass:
+    """Category of one URL."""
+    category: str
+    url: Optional[str]          # URL to use: redirect target for redirects, None if invalid
+    host: str = ""
+
+
+class DomainTrie:
+    """
+    Domain suffix trie: labels stored right to left (com -> facebook).
+
+    match() returns the category of the longest registered suffix of a host.
+    """
+
+    def __init__(self, rules: Optional[Dict[str, Iterable[str]]] = None):
+        self.root: Dict[str, dict] = {}
+        for category, domains in (rules or {}).items():
+            for domain in domains:
+                self.insert(domain, category)
+
+    def insert(self, domain: str, category: str):
+        node = self.root
+        for label in reversed(domain.lower().split(".")):
+            node = node.setdefault(label, {})
+        node[None] = category
+
+    def match(self, host: str) -> Optional[str]:
+        node, category = self.root, None
+        for label in reversed(host.split(".")):
+            node = node.get(label)
+            if node is None:
+                break
+            category = node.get(None, category)
+        return category
+
+
+def _group(category: str) -> str:
+    return category.replace("-", "_")
+
+
+def _compile_labels() -> "re.Pattern":
+    """One alternation over all brand labels, a named group per category."""
+    groups = "|".join(
+        f'(?P<{_group(category)}>{"|".join(map(re.escape, labels))})'
+        for category, labels in LABEL_RULES.items()
+    )
+    return re.compile(rf'(?:^|\.)(?:{groups})(?:\.|$)')
+
+
+class URLClassifier:
+    """
+    Classifies URLs and hosts with the rule tables above.
+    """
+
+    def __init__(self, cache_size: int = 8192):
+        self.trie = DomainTrie(DOMAIN_RULES)
+        self.labels = _compile_labels()
+        self._categories = {_group(category): category for category in LABEL_RULES}
+        # Per-instance caches (repeated URLs / domains)
+        self.classify = lru_cache(maxsize=cache_size)(self._classify)
+        self.classify_host = lru_cache(maxsize=cache_size)(self._classify_host)
+
+    def classify_many(self, urls: Iterable[str]) -> List[URLClass]:
+        """Classify a batch of URLs, in input order."""
+        return [self.classify(url) for url in urls]
+
+    def is_business_url(self, url: str) -> bool:
+        return self.classify(url).category == DIRECT
+
+    def redirect_target(self, url: str) -> Optional[str]:
+        """Target of a Google /url?q= redirect (None if url is not one)."""
+        parsed = urlparse(url)
+        host = (parsed.hostname or "").lower()
+        if parsed.path != "/url" or self._host_category(host) != GOOGLE_INTERNAL:
+            return None
+        target = parse_qs(parsed.query).get("q")
+        return unquote(target[0]) if target and target[0] else None
+
+    def _classify(self, url: str) -> URLClass:
+        """
+        Category of url (see module docstring); cached as classify().
+        """
+        if not url:
+            return URLClass(INVALID, None)
+        lowered = url.strip().lower()
+        if lowered.startswith("mailto:") or "@" in lowered:
+            return URLClass(INVALID, None)
+        try:
+            parsed = urlparse(url.strip())
+            host = (parsed.hostname or "").lower()
+        except ValueError:
+            return URLClass(INVALID, None)
+        if parsed.scheme not in ("http", "https", "") or not host:
+            return URLClass(INVALID, None, host)
+
+        category = self.classify_host(host)
+        if category == GOOGLE_INTERNAL:
+            target = self.redirect_target(url)
+            if target:
+                resolved = self.classify(target)
+                if resolved.category == DIRECT:
+                    return URLClass(REDIRECT, resolved.url, resolved.host)
+                return resolved
+            return URLClass(GOOGLE_INTERNAL, url, host)
+        if category != DIRECT:
+            return URLClass(category, url if category != INVALID else None, host)
+
+        if GOOGLE_PATH_RE.search(lowered, lowered.find(host) + len(host)):
+            return URLClass(GOOGLE_INTERNAL, url, host)
+        return URLClass(DIRECT, url, host)
+
+    def _classify_host(self, host: str) -> str:
+        """Category of a bare host or email domain; cached as classify_host()."""
+        host = host.lower().rstrip(".")
+        if host == "localhost" or host.endswith(".localhost"):
+            return INVALID
+        try:
+            address = ipaddress.ip_address(host.strip("[]"))
+            return INVALID if (address.is_private or address.is_loopback) else DIRECT
+        except ValueError:
+            pass
+        return self._host_category(host)
+
+    def _host_category(self, host: str) -> str:
+        category = self.trie.match(host)
+        if category:
+            return category
+        match = self.labels.search(host)
+        return self._categories[match.lastgroup] if match else DIRECT
+
+
+_classifier: Optional[URLClassifier] = None
+_classifier_lock = threading.Lock()
+
+
+def get_url_classifier() -> URLClassifier:
+    """Process-wide URL classifier."""
+    global _classifier
+    with _classifier_lock:
+        if _classifier is None:
+            _classifier = URLClassifier()
+        return _classifier
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+BOB Stage Waits v4.3.1
+
+Condition-based waits for the Selenium extractors. Each wait belongs to a
+named stage (page_load, place_navigation, scroll, ...) with its own
+timeout, returns as soon as its condition holds and records the time it
+actually waited, so stats show where extraction time goes instead of
+hiding it in fixed sleeps.
+
+Usage:
+    from bob.utils.waits import StageWaiter
+
+    waiter = StageWaiter()
+    driver.get(url)
+    waiter.element(driver, "page_load", "h1.DUwDvf, a[href*='/maps/place/']")
+    waiter.scroll_settled(driver, "scroll", panel)
+    print(waiter.get_stats())
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+import psutil
+from selenium.webdriver.common.by import By
+
+
+# Per-stage timeouts (seconds); a wait that times out simply moves on
+DEFAULT_STAGE_TIMEOUTS = {
+    "page_load": 10.0,          # Place page or search results rendered
+    "place_navigation": 10.0,   # Search result click lands on /maps/place/
+    "place_details": 6.0,       # Business header after navigation
+    "expand": 2.0,              # "More" buttons expanding content
+    "scroll": 3.0,              # Lazy content after one scroll
+    "reviews_tab": 5.0,         # Review cards after opening the tab
+    "share_dialog": 3.0,        # Share dialog's URL input filled in
+    "driver_exit": 10.0,        # chromedriver/Chrome processes gone after quit()
+}
+
+
+class StageWaiter:
+    """
+    Polling waits with per-stage timeouts and waited-time accounting.
+    """
+
+    def __init__(
+        self,
+        timeouts: Optional[Dict[str, float]] = None,
+        poll_interval: float = 0.1,
+        default_timeout: float = 5.0,
+    ):
+        """
+        Initialize the waiter.
+
+        Args:
+            timeouts: Per-stage overrides of DEFAULT_STAGE_TIMEOUTS
+            poll_interval: Seconds between condition checks
+            default_timeout: Timeout for stages without an entry
+        """
+        self.timeouts = dict(DEFAULT_STAGE_TIMEOUTS)
+        self.timeouts.update(timeouts or {})
+        self.poll_interval = poll_interval
+        self.default_timeout = default_timeout
+        self._lock = threading.Lock()
+        self.stats: Dict[str, Dict[str, Any]] = {}
+
+    def timeout_for(self, stage: str) -> float:
+        return self.timeouts.get(stage, self.default_timeout)
+
+    # ------------------------------------------------------------------
+    # Core loop
+    # ------------------------------------------------------------------
+
+    def until(self, stage: str, condition: Callable[[], Any], timeout: Optional[float] = None) -> Any:
+        """
+        Poll condition until it returns a truthy value or the stage times out.
+
+        Exceptions raised by condition count as "not yet" (stale elements,
+        pages mid-navigation).
+
+        Args:
+            stage: Stage name (selects the timeout and the stats bucket)
+            condition: Zero-argument callable
+            timeout: Override the stage timeout
+
+        Returns:
+            The truthy value from condition, or None on timeout
+        """
+        timeout = self.timeout_for(stage) if timeout is None else timeout
+        started = time.time()
+        deadline = started + timeout
+        value = None
+        while True:
+            try:
+                value = condition()
+            except Exception:
+                value = None
+            if value or time.time() >= deadline:
+                break
+            time.sleep(self.poll_interval)
+        self._record(stage, time.time() - started, satisfied=bool(value))
+        return value or None
+
+    def _record(self, stage: str, waited: float, satisfied: bool):
+        with self._lock:
+            bucket = self.stats.setdefault(stage, {
+                "waits": 0, "timeouts": 0, "waited_seconds": 0.0, "max_seconds": 0.0,
+            })
+            bucket["waits"] += 1
+            bucket["waited_seconds"] += waited
+            bucket["max_seconds"] = max(bucket["max_seconds"], waited)
+            if not satisfied:
+                bucket["timeouts"] += 1
+
+    # ------------------------------------------------------------------
+    # Conditions
+    # ------------------------------------------------------------------
+
+    def element(self, driver, stage: str, css: str, timeout: Optional[float] = None):
+        """Wait for the first element matching css; returns it or None."""
+        found = self.until(stage, lambda: driver.find_elements(By.CSS_SELECTOR, css), timeout)
+        return found[0] if found else None
+
+    def elements(self, driver, stage: str, css: str, timeout: Optional[float] = None) -> List[Any]:
+        """Wait until at least one element matches css; returns all matches."""
+        return self.until(stage, lambda: driver.find_elements(By.CSS_SELECTOR, css), timeout) or []
+
+    def url_change(
+        self,
+        driver,
+        stage: str,
+        old_url: str,
+        contains: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> Optional[str]:
+        """Wait until the URL differs from old_url (and contains a fragment, if given)."""
+        def changed():
+            url = driver.current_url
+            if url == old_url:
+                return None
+            return url if contains is None or contains in url else None
+
+        return self.until(stage, changed, timeout)
+
+    def scroll_settled(
+        self,
+        driver,
+        stage: str,
+        element,
+        stable_polls: int = 3,
+        timeout: Optional[float] = None,
+    ) -> bool:
+        """
+        Wait until element.scrollHeight stops changing.
+
+        Lazy lists grow after a scroll; once the height holds for
+        stable_polls consecutive checks there is nothing more to load.
+        """
+        state = {"height": None, "stable": 0}
+
+        def settled():
+            height = driver.execute_script("return arguments[0].scrollHeight", element)
+            if height == state["height"]:
+                state["stable"] += 1
+            else:
+                state["height"], state["stable"] = height, 0
+            return state["stable"] >= stable_polls
+
+        return bool(self.until(stage, settled, timeout))
+
+    def processes_exited(self, stage: str, pids: Iterable[int], timeout: Optional[float] = None) -> bool:
+        """Wait until none of pids is running (zombies count as exited)."""
+        pids = [pid for pid in pids if pid]
+
+        def exited():
+            for pid in pids:
+                try:
+                    if psutil.Process(pid).status() != psutil.STATUS_ZOMBIE:
+                        return False
+                except psutil.Error:
+                    continue
+            return True
+
+        return bool(self.until(stage, exited, timeout))
+
+    # ------------------------------------------------------------------
+    # Stats
+    # ------------------------------------------------------------------
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Per-stage wait counts, timeouts and waited seconds."""
+        with self._lock:
+            stages = {
+                stage: {
+                    **bucket,
+                    "waited_seconds": round(bucket["waited_seconds"], 2),
+                    "max_seconds": round(bucket["max_seconds"], 2),
+                    "avg_seconds": round(bucket["waited_seconds"] / bucket["waits"], 2),
+                }
+                for stage, bucket in self.stats.items()
+            }
+        return {
+            "total_waited_seconds": round(sum(s["waited_seconds"] for s in stages.values()), 2),
+            "stages": stages,
+        }
+
+
+def driver_pids(driver) -> List[int]:
+    """PIDs of a driver's chromedriver service and (undetected) Chrome browser."""
+    pids = []
+    try:
+        process = getattr(getattr(driver, "service", None), "process", None)
+        if process is not None:
+            pids.append(process.pid)
+    except Exception:
+        pass
+    browser_pid = getattr(driver, "browser_pid", None)
+    if isinstance(browser_pid, int):
+        pids.append(browser_pid)
+    return pids
+
+
+def quit_and_wait(driver, waiter: StageWaiter, stage: str = "driver_exit") -> bool:
+    """
+    Quit a driver and wait for its processes to exit.
+
+    Replaces quit() followed by a fixed sleep: returns as soon as
+    chromedriver and Chrome are gone, at most the stage timeout.
+    """
+    pids = driver_pids(driver)
+    try:
+        driver.quit()
+    except Exception:
+        pass
+    return waiter.processes_exited(stage, pids)
@@ -12,13 +12,27 @@ import re
 from urllib.parse import urlparse, parse_qs, unquote
 from typing import Optional
 
+from bob.utils.url_classifier import DIRECT, REDIRECT, get_url_classifier
+
+
+# "website: www.example.com", "visit: example.com", ...
+MENTION_RE = re.compile(
+    r'(?:website|visit|web|contact us at|our site|home page|homepage)[\s:]*(?:www\.)?([a-zA-Z0-9][a-zA-Z0-9-]*[a-zA-Z0-9](?:\.[a-zA-Z0-9][a-zA-Z0-9-]*[a-zA-Z0-9])*(?:\.[a-zA-Z]{2,})?)',
+    re.IGNORECASE,
+)
+# Direct URLs in text
+URL_RE = re.compile(r'https?://(?:www\.)?([a-zA-Z0-9][a-zA-Z0-9-]*[a-zA-Z0-9](?:\.[a-zA-Z0-9][a-zA-Z0-9-]*[a-zA-Z0-9])*(?:\.[a-zA-Z]{2,})(?:[/?#][^\s]*)?)')
+TRAILING_PUNCTUATION_RE = re.compile(r'[.,;:!?\)\]]+$')
+
 
 def extract_website_intelligent(page_text: str, available_urls: list) -> Optional[str]:
     """
     Smart website extraction using "indie hacker" methodology.
 
     Strategy:
-    1. Filter out Google internal URLs
+    1. Classify all URLs in one batch (URLClassifier): keep direct
+       websites and Google redirects to them, drop Google internal,
+       social, booking and review URLs
     2. Look for patterns like "website:", "visit:", "contact"
     3. Validate URLs for business legitimacy
     4. Prefer actual domains over Google URLs
@@ -33,25 +47,11 @@ def extract_website_intelligent(page_text: str, available_urls: list) -> Optiona
 
     filtered_urls = []
 
-    # Step 1: Filter and categorize URLs
-    for url in available_urls:
-        if not url:
-            continue
-
-        # Skip Google internal URLs UNLESS they're redirects we can parse
-        if 'google.com' in url.lower():
-            # Check if it's a redirect we can parse
-            if '/url?' in url or 'q=' in url:
-                # This might be a Google redirect with actual URL
-                actual = parse_google_redirect(url)
-                if actual and 'google.com' not in actual.lower():
-                    filtered_urls.append(('redirect', actual))
-            # Skip provider chooser URLs, Maps URLs, etc
-            continue
-
-        # Keep non-Google URLs
-        if _is_valid_business_url(url):
-            filtered_urls.append(('direct', url))
+    # Step 1: Filter and categorize URLs (redirect targets are resolved
+    # and classified too; provider choosers, Maps URLs etc are dropped)
+    for item in get_url_classifier().classify_many(url for url in available_urls if url):
+        if item.category in (DIRECT, REDIRECT):
+            filtered_urls.append((item.category, item.url))
 
     # Step 2: Look for website mentions in page text with context
     pattern_based_urls = _extract_urls_from_patterns(page_text)
@@ -98,7 +98,7 @@ def _is_valid_business_url(url: str) -> bool:
     """
     Check if URL looks like a legitimate business website.
 
-    Filters out:
+    Filters out (rules in bob.utils.url_classifier):
     - Google Maps/internal URLs (including provider choosers, viewers)
     - Facebook/Instagram profiles (not primary websites)
     - Booking platforms (ZomatoOneTableResy, etc) - these are intermediaries
@@ -106,71 +106,7 @@ def _is_valid_business_url(url: str) -> bool:
     - Email addresses (shouldn't be here but just in case)
     - localhost/private IPs
     """
-
-    if not url:
-        return False
-
-    url_lower = url.lower()
-
-    # Block specific intermediary platforms and Google services
-    blocked_keywords = [
-        # Google internal URLs - CRITICAL FILTER
-        'google.com/viewer',         # Provider chooser: https://google.com/viewer/chooseprovider?mid=...
-        'google.com/aclk',           # Google ads: https://google.com/aclk?sa=l&ai=...
-        '/maps/reserve',             # Maps booking
-        '/maps/place',               # Maps place redirect
-        '/viewer/choose',            # Viewer choice page
-        'viewer/chooseprovider',     # Provider selector
-        'maps.google',               # Maps domain
-        'google.com/maps',           # Maps redirect
-        'maps-booking',              # Maps booking
-        # Social media (not primary business website)
-        'facebook.com',
-        'instagram.com',
-        'twitter.com',
-        'youtube.com',
-        # Booking platforms (intermediaries, not business website)
-        'zomato.com',
-        'swiggy.com',
-        'booking.com',
-        'tripadvisor',
-        'yelp.com',
-        'justdial',
-        'urban piper',
-        'deliveroo',
-        'ubereats',
-        'doordash',
-        'grubhub',
-        # Review/rating sites
-        'trustpilot',
-        'glassdoor',
-        'g2.com',
-        # Email addresses
-        '@',
-        'mailto',
-        # Private/local IPs
-        'localhost',
-        '127.0.0.1',
-        '192.168',
-        '10.0',
-    ]
-
-    for keyword in blocked_keywords:
-        if keyword in url_lower:
-            return False
-
-    # Should look like a real URL
-    try:
-        parsed = urlparse(url)
-        # Must have a domain
-        if not parsed.netloc:
-            return False
-        # Should be http/https
-        if parsed.scheme not in ('http', 'https', ''):
-            return False
-        return True
-    except:
-        return False
+    return get_url_classifier().is_business_url(url)
 
 
 def _extract_urls_from_patterns(text: str) -> list:
@@ -185,8 +121,7 @@ def _extract_urls_from_patterns(text: str) -> list:
     urls = []
 
     # Pattern 1: "website:", "visit:", "web:", "contact us at:" followed by URL
-    pattern1 = r'(?:website|visit|web|contact us at|our site|home page|homepage)[\s:]*(?:www\.)?([a-zA-Z0-9][a-zA-Z0-9-]*[a-zA-Z0-9](?:\.[a-zA-Z0-9][a-zA-Z0-9-]*[a-zA-Z0-9])*(?:\.[a-zA-Z]{2,})?)'
-    matches = re.finditer(pattern1, text, re.IGNORECASE)
+    matches = MENTION_RE.finditer(text)
     for match in matches:
         domain = match.group(1)
         if not domain.startswith('www'):
@@ -196,12 +131,11 @@ def _extract_urls_from_patterns(text: str) -> list:
             urls.append(url)
 
     # Pattern 2: Direct URLs (but not Google/Maps URLs)
-    url_pattern = r'https?://(?:www\.)?([a-zA-Z0-9][a-zA-Z0-9-]*[a-zA-Z0-9](?:\.[a-zA-Z0-9][a-zA-Z0-9-]*[a-zA-Z0-9])*(?:\.[a-zA-Z]{2,})(?:[/?#][^\s]*)?)'
-    matches = re.finditer(url_pattern, text)
+    matches = URL_RE.finditer(text)
     for match in matches:
         url = match.group(0)
         # Remove trailing punctuation that isn't part of URL
-        url = re.sub(r'[.,;:!?\)\]]+$', '', url)
+        url = TRAILING_PUNCTUATION_RE.sub('', url)
         if _is_valid_business_url(url) and url not in urls:
             urls.append(url)
 
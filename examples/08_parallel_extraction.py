@@ -32,7 +32,7 @@ async def main():
     config = ParallelConfig(
         max_concurrent=2,           # 2 parallel browsers (safe default)
         delay_between_starts=3.0,   # 3 seconds between starting each browser
-        memory_limit_percent=80,    # Stop if memory > 80%
+        memory_limit_percent=80,    # Hold new jobs while memory > 80%
         include_reviews=False,      # Faster without reviews
         headless=True
     )
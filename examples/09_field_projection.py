@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Example 9: Field Projection Benchmark
+
+Extract only the fields you need and measure the latency saved.
+
+Each business is extracted once in full and once per projection; the
+table shows median time per projection, the saving against the full
+extraction, and which stages were skipped (stage timings come from the
+result's "stage_seconds").
+
+Usage:
+    python examples/09_field_projection.py
+    python examples/09_field_projection.py "Blue Bottle Coffee Oakland" "Tartine Bakery SF"
+"""
+
+import asyncio
+import statistics
+import sys
+from bob import PlaywrightExtractorOptimized
+
+
+PROJECTIONS = {
+    "full": None,
+    "contact": ["phone", "website"],
+    "location": ["address", "gps"],
+    "rating": ["rating", "reviews_count"],
+    "reviews": ["rating", "reviews"],
+}
+
+
+async def main():
+    """Time each projection against a full extraction."""
+    
+    print("🔱 BOB Google Maps v4.3.0 - Field Projection Benchmark")
+    print("=" * 60)
+    
+    businesses = sys.argv[1:] or [
+        "Starbucks Times Square NYC",
+        "Apple Store Fifth Avenue NYC",
+        "Empire State Building NYC",
+    ]
+    
+    extractor = PlaywrightExtractorOptimized(headless=True)
+    timings = {name: [] for name in PROJECTIONS}
+    skipped = {}
+    
+    for business in businesses:
+        for name, fields in PROJECTIONS.items():
+            result = await extractor.extract_business_optimized(business, max_reviews=5, fields=fields)
+            if not result.get('success'):
+                print(f"   ❌ {business} [{name}]: {result.get('error', 'failed')[:60]}")
+                continue
+            timings[name].append(result["extraction_time_seconds"])
+            ran = set(result.get("stage_seconds", {}))
+            skipped[name] = sorted({"images", "reviews", "photos"} - ran)
+    
+    if not timings["full"]:
+        print("\n❌ No full extraction succeeded - nothing to compare against")
+        return timings
+    
+    full = statistics.median(timings["full"])
+    print(f"\n📊 Median latency over {len(businesses)} businesses")
+    print(f"{'Projection':<12}{'Seconds':>9}{'Saved':>9}   Skipped stages")
+    print("-" * 60)
+    for name, samples in timings.items():
+        if not samples:
+            continue
+        median = statistics.median(samples)
+        saved = (full - median) / full * 100 if full else 0
+        print(f"{name:<12}{median:>9.1f}{saved:>8.0f}%   {', '.join(skipped.get(name, [])) or '-'}")
+    
+    return timings
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
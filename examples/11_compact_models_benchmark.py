@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Example 11: Compact Models Benchmark
+
+Compare memory and throughput of the Review/Business dataclasses with
+the slotted CompactReview/CompactBusiness on generated records. No
+network or browser needed.
+
+Measured per class:
+- Memory held by N live objects (tracemalloc)
+- Construction, to_dict() and from_dict() throughput
+
+CompactReview computes data_completeness on its first to_dict() rather
+than at construction, so that cost moves from Create/s to to_dict/s.
+CompactBusiness.to_dict() returns new empty lists/dicts for unused
+fields (Business returns its own), which shows up as garbage-collector
+work in bulk runs.
+
+Usage:
+    python examples/11_compact_models_benchmark.py
+    python examples/11_compact_models_benchmark.py 1000000 50000   # reviews, businesses
+"""
+
+import gc
+import random
+import sys
+import time
+import tracemalloc
+
+from bob.models import Business, CompactBusiness, CompactReview, Review
+
+
+def review_values(count):
+    """Review fields as extracted from Maps (typical fill rate)."""
+    rng = random.Random(42)
+    words = ["great", "coffee", "friendly", "staff", "slow", "service", "cozy", "place", "pricey", "tasty"]
+    return [
+        {
+            "review_index": i,
+            "reviewer_name": f"Reviewer {i}",
+            "rating": rng.randint(1, 5),
+            "review_text": " ".join(rng.choice(words) for _ in range(rng.randint(5, 40))),
+            "relative_time": f"{rng.randint(1, 11)} months ago",
+            "helpful_count": rng.randint(0, 20) if rng.random() < 0.3 else None,
+        }
+        for i in range(count)
+    ]
+
+
+def business_values(count):
+    rng = random.Random(7)
+    return [
+        {
+            "place_id": f"ChIJ{i:020d}",
+            "name": f"Cafe {i}",
+            "phone": f"+1-555-{i % 10000:04d}",
+            "address": f"{i} Main St, Springfield",
+            "latitude": rng.uniform(-90, 90),
+            "longitude": rng.uniform(-180, 180),
+            "category": "Coffee shop",
+            "rating": round(rng.uniform(3, 5), 1),
+            "review_count": rng.randint(0, 2000),
+            "website": f"https://cafe{i}.com" if rng.random() < 0.6 else None,
+            "photos": [f"https://lh5.googleusercontent.com/p/{i}-{n}" for n in range(rng.randint(0, 3))],
+        }
+        for i in range(count)
+    ]
+
+
+def held_bytes(build):
+    """Memory still allocated by build()'s result (objects kept alive)."""
+    gc.collect()
+    tracemalloc.start()
+    objects = build()
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current, objects
+
+
+def rate(func, count):
+    started = time.perf_counter()
+    func()
+    return count / (time.perf_counter() - started)
+
+
+def compare(label, count, values, classic, compact):
+    print(f"\n{label} ({count:,})")
+    print(f"{'Class':<18}{'Bytes/obj':>11}{'Create/s':>13}{'to_dict/s':>13}{'from_dict/s':>14}")
+    print("-" * 69)
+    baseline = None
+    for cls in (classic, compact):
+        memory, objects = held_bytes(lambda: [cls(**item) for item in values])
+        create = rate(lambda: [cls(**item) for item in values], count)
+        dicts = []
+        to_dict = rate(lambda: dicts.extend(obj.to_dict() for obj in objects), count)
+        from_dict = rate(lambda: [cls.from_dict(dict(item)) for item in dicts], count)
+        per_object = memory / count
+        baseline = baseline or per_object
+        print(f"{cls.__name__:<18}{per_object:>11.0f}{create:>13,.0f}{to_dict:>13,.0f}{from_dict:>14,.0f}"
+              + ("" if cls is classic else f"   ({per_object / baseline:.0%} memory)"))
+        del objects, dicts
+
+
+def main():
+    """Benchmark Review and Business against their compact variants."""
+
+    print("🔱 BOB Google Maps v4.3.1 - Compact Models Benchmark")
+    print("=" * 69)
+
+    reviews = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    businesses = int(sys.argv[2]) if len(sys.argv) > 2 else 50_000
+
+    # Memory includes each review's own strings (shared by both classes)
+    compare("Reviews", reviews, review_values(reviews), Review, CompactReview)
+    compare("Businesses", businesses, business_values(businesses), Business, CompactBusiness)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+"""
+BOB Google Maps v4.3.1 - Memory Admission Control Unit Tests
+
+Tests for MemoryAdmissionController (jobs wait for memory instead of failing)
+and its use in ParallelExtractor.
+"""
+
+import asyncio
+
+import pytest
+
+from bob.utils.admission import FootprintEstimator, MemoryAdmissionController
+from bob.utils.parallel_extractor import ParallelConfig, ParallelExtractor
+
+
+class FakeMemory:
+    """Memory probe returning a controllable (used_mb, total_mb) pair."""
+
+    def __init__(self, used_mb, total_mb=1000.0):
+        self.used_mb = used_mb
+        self.total_mb = total_mb
+
+    def __call__(self):
+        return self.used_mb, self.total_mb
+
+
+class TestFootprintEstimator:
+    """Test suite for FootprintEstimator."""
+
+    def test_first_sample_replaces_prior(self):
+        estimator = FootprintEstimator(initial_mb=300)
+        estimator.observe(120)
+        assert estimator.estimate_mb == 120
+
+    def test_smoothing(self):
+        estimator = FootprintEstimator(initial_mb=300, smoothing=0.5)
+        estimator.observe(100)
+        estimator.observe(200)
+        assert estimator.estimate_mb == 150
+
+    def test_ignores_non_positive_samples(self):
+        estimator = FootprintEstimator(initial_mb=300)
+        estimator.observe(-20)
+        assert estimator.estimate_mb == 300
+        assert estimator.samples == 0
+
+
+class TestMemoryAdmissionController:
+    """Test suite for MemoryAdmissionController."""
+
+    @pytest.mark.asyncio
+    async def test_admits_when_memory_available(self):
+        memory = FakeMemory(used_mb=200)
+        admission = MemoryAdmissionController(80, memory_probe=memory, poll_interval=0.01,
+                                              estimator=FootprintEstimator(100))
+        ticket = await admission.admit("job")
+
+        assert ticket.waited_seconds < 0.5
+        assert admission.get_stats()["delayed"] == 0
+
+    @pytest.mark.asyncio
+    async def test_forces_admission_when_idle(self):
+        memory = FakeMemory(used_mb=950)
+        admission = MemoryAdmissionController(80, memory_probe=memory, poll_interval=0.01)
+        await admission.admit("job")
+
+        assert admission.get_stats()["forced_admissions"] == 1
+
+    @pytest.mark.asyncio
+    async def test_holds_job_until_memory_recovers(self):
+        memory = FakeMemory(used_mb=500)
+        admission = MemoryAdmissionController(80, memory_probe=memory, poll_interval=0.01,
+                                              ramp_seconds=0, estimator=FootprintEstimator(200))
+        recycled = []
+        admission.add_recycle_callback(lambda: recycled.append(True))
+
+        first = await admission.admit("first")
+        memory.used_mb = 700  # 700 + 200 estimate > 800 limit
+        waiter = asyncio.ensure_future(admission.admit("second"))
+        await asyncio.sleep(0.05)
+
+        assert not waiter.done()
+        assert recycled == [True]
+
+        memory.used_mb = 500
+        admission.release(first)
+        second = await asyncio.wait_for(waiter, timeout=1)
+
+        assert second.waited_seconds > 0
+        stats = admission.get_stats()
+        assert stats["delayed"] == 1
+        assert stats["admitted"] == 2
+        assert stats["recycles"] == 1
+
+    @pytest.mark.asyncio
+    async def test_recent_admissions_count_towards_projection(self):
+        memory = FakeMemory(used_mb=400)
+        admission = MemoryAdmissionController(80, memory_probe=memory, poll_interval=0.01,
+                                              ramp_seconds=60, estimator=FootprintEstimator(250))
+        await admission.admit("first")
+
+        # 400 used + 250 ramping + 250 estimate = 900 > 800
+        assert admission.projected_percent() == 90
+
+    @pytest.mark.asyncio
+    async def test_waiting_job_keeps_reservation_until_started(self):
+        memory = FakeMemory(used_mb=400)
+        admission = MemoryAdmissionController(80, memory_probe=memory, poll_interval=0.01,
+                                              ramp_seconds=0, estimator=FootprintEstimator(250))
+        ticket = await admission.admit("queued", start=False)
+
+        # 400 used + 250 reserved for the queued job + 250 estimate
+        assert admission.projected_percent() == 90
+        admission.start(ticket)
+        assert admission.projected_percent() == 65
+
+    @pytest.mark.asyncio
+    async def test_release_learns_footprint(self):
+        memory = FakeMemory(used_mb=100)
+        admission = MemoryAdmissionController(80, memory_probe=memory, poll_interval=0.01)
+        first = await admission.admit("a")
+        second = await admission.admit("b")
+
+        memory.used_mb = 340  # two jobs added 240MB over the idle baseline
+        admission.release(first)
+        admission.release(second)
+
+        assert admission.estimator.samples == 2
+        assert admission.get_stats()["footprint_estimate_mb"] < 300
+
+
+class FakePool:
+    def __init__(self):
+        self.recycled = 0
+
+    async def recycle(self):
+        self.recycled += 1
+
+
+class TestParallelAdmission:
+    """Admission control inside ParallelExtractor."""
+
+    @pytest.mark.asyncio
+    async def test_held_job_does_not_occupy_a_slot(self, monkeypatch):
+        memory = FakeMemory(used_mb=500)
+        extractor = ParallelExtractor(ParallelConfig(max_concurrent=2, browser_pool=False))
+        extractor.admission = MemoryAdmissionController(80, memory_probe=memory, poll_interval=0.01,
+                                                        ramp_seconds=0, estimator=FootprintEstimator(200))
+        release = asyncio.Event()
+
+        async def run_job(url, index, total):
+            await release.wait()
+            return {"success": True, "url": url}
+
+        monkeypatch.setattr(extractor, "_run_job", run_job)
+        semaphore = asyncio.Semaphore(2)
+        first = asyncio.ensure_future(extractor._extract_single("a", semaphore, 1, 2))
+        await asyncio.sleep(0.02)
+        memory.used_mb = 700  # 700 + 200 estimate > 800 limit
+        second = asyncio.ensure_future(extractor._extract_single("b", semaphore, 2, 2))
+        await asyncio.sleep(0.05)
+
+        assert not second.done()
+        assert semaphore._value == 1  # Only the running job holds a slot
+
+        memory.used_mb = 500
+        release.set()
+        results = await asyncio.wait_for(asyncio.gather(first, second), timeout=1)
+        assert [r["url"] for r in results] == ["a", "b"]
+        assert extractor.admission.get_stats()["active"] == 0
+
+    @pytest.mark.asyncio
+    async def test_recycle_restarts_pooled_browser_and_trims_sessions(self, monkeypatch):
+        trimmed = []
+        monkeypatch.setattr("bob.utils.parallel_extractor.trim_session_pools", lambda: trimmed.append(True) or 0)
+        extractor = ParallelExtractor(ParallelConfig())
+        extractor.browser_pool = FakePool()
+
+        await extractor._recycle_browsers()
+
+        assert extractor.browser_pool.recycled == 1
+        assert trimmed == [True]
@@ -0,0 +1,192 @@
+"""
+BOB Google Maps v4.3.1 - Browser Pool Unit Tests
+
+Tests for the shared-browser pool and the hybrid engine's async path.
+Playwright is replaced by small fakes so no browser binary is needed.
+"""
+
+import asyncio
+
+import pytest
+
+import bob.extractors.browser_pool as browser_pool_module
+from bob.extractors.browser_pool import BrowserPool
+from bob.extractors.hybrid_optimized import HybridExtractorOptimized
+
+
+class FakeContext:
+    def __init__(self):
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.connected = True
+        self.contexts = []
+
+    def is_connected(self):
+        return self.connected
+
+    async def new_context(self, **options):
+        context = FakeContext()
+        self.contexts.append(context)
+        return context
+
+    async def close(self):
+        self.connected = False
+
+
+class FakePlaywright:
+    def __init__(self):
+        self.browsers = []
+        self.stopped = False
+        self.chromium = self
+
+    async def launch(self, **options):
+        browser = FakeBrowser()
+        self.browsers.append(browser)
+        return browser
+
+    async def stop(self):
+        self.stopped = True
+
+
+@pytest.fixture
+def fake_playwright(monkeypatch):
+    playwright = FakePlaywright()
+
+    class Starter:
+        async def start(self):
+            return playwright
+
+    monkeypatch.setattr(browser_pool_module, "async_playwright", lambda: Starter())
+    return playwright
+
+
+class TestBrowserPool:
+    """Test suite for BrowserPool."""
+
+    @pytest.mark.asyncio
+    async def test_contexts_share_one_browser(self, fake_playwright):
+        pool = BrowserPool()
+        contexts = await asyncio.gather(*[pool.new_context() for _ in range(3)])
+
+        assert len(fake_playwright.browsers) == 1
+        assert pool.active_contexts == 3
+
+        for context in contexts:
+            await pool.release(context)
+        assert all(context.closed for context in contexts)
+        assert pool.active_contexts == 0
+
+        await pool.close()
+        assert fake_playwright.stopped
+
+    @pytest.mark.asyncio
+    async def test_browser_restarts_after_max_contexts(self, fake_playwright):
+        pool = BrowserPool(max_contexts_per_browser=2)
+        for _ in range(3):
+            async with pool.context():
+                pass
+
+        assert len(fake_playwright.browsers) == 2
+        assert pool.get_stats()["restarts"] == 1
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_recycle_waits_for_running_contexts(self, fake_playwright):
+        pool = BrowserPool()
+        context = await pool.new_context()
+
+        await pool.recycle()
+        assert fake_playwright.browsers[0].connected
+
+        await pool.release(context)
+        assert not fake_playwright.browsers[0].connected
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_restart_under_steady_load_moves_new_jobs_to_fresh_browser(self, fake_playwright):
+        pool = BrowserPool(max_contexts_per_browser=2)
+        first = await pool.new_context()
+        second = await pool.new_context()  # Restart due; first is still running
+
+        third = await pool.new_context()
+        assert len(fake_playwright.browsers) == 2
+        assert fake_playwright.browsers[0].connected  # Kept for first and second
+        assert pool.get_stats()["retiring_browsers"] == 1
+
+        await pool.release(first)
+        assert fake_playwright.browsers[0].connected
+        await pool.release(second)
+        assert not fake_playwright.browsers[0].connected
+        assert fake_playwright.browsers[1].connected
+        assert pool.get_stats()["retiring_browsers"] == 0
+
+        await pool.release(third)
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_recycle_under_load_is_not_postponed(self, fake_playwright):
+        pool = BrowserPool()
+        running = await pool.new_context()
+        await pool.recycle()
+
+        # Jobs keep overlapping: the pool never goes idle
+        newer = await pool.new_context()
+        await pool.release(running)
+        assert not fake_playwright.browsers[0].connected
+        assert fake_playwright.browsers[1].connected
+        assert pool.active_contexts == 1
+
+        await pool.close()
+        assert not fake_playwright.browsers[1].connected
+
+    @pytest.mark.asyncio
+    async def test_closed_pool_rejects_new_contexts(self, fake_playwright):
+        pool = BrowserPool()
+        await pool.close()
+
+        with pytest.raises(RuntimeError):
+            await pool.new_context()
+
+
+class TestHybridAsync:
+    """extract_business_async runs on the caller's loop."""
+
+    @pytest.mark.asyncio
+    async def test_selenium_fallback_runs_in_bounded_executor(self, monkeypatch):
+        extractor = HybridExtractorOptimized(use_cache=False, selenium_workers=1)
+        extractor.selenium_enabled = True
+        loop = asyncio.get_running_loop()
+        seen = {}
+
+        async def failing_playwright(url, include_reviews, max_reviews, projection=None):
+            seen["playwright_loop"] = asyncio.get_running_loop()
+            return {"success": False}
+
+        def selenium(url, include_reviews, max_reviews, extractor=None, projection=None):
+            import threading
+            seen["selenium_thread"] = threading.current_thread().name
+            return {"success": True, "name": url}
+
+        monkeypatch.setattr(extractor, "_extract_with_playwright_optimized", failing_playwright)
+        monkeypatch.setattr(extractor, "_extract_with_selenium_optimized", selenium)
+
+        result = await extractor.extract_business_async("Test Cafe")
+
+        assert result["name"] == "Test Cafe"
+        assert seen["playwright_loop"] is loop
+        assert seen["selenium_thread"].startswith("bob-selenium")
+        assert extractor.stats["selenium_success"] == 1
+
+    @pytest.mark.asyncio
+    async def test_one_browser_pool_per_loop(self):
+        extractor = HybridExtractorOptimized(use_cache=False)
+
+        assert extractor._get_browser_pool() is extractor._get_browser_pool()
+        await extractor.close_browser_pool()
+        assert asyncio.get_running_loop() not in extractor._browser_pools
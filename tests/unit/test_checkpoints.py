@@ -0,0 +1,134 @@
+"""
+BOB Google Maps v4.3.1 - Stage Checkpoint Unit Tests
+
+Tests for StageCheckpoints: recording partial results, retry projections
+of the pending stages, merging retries, persistence, and the retry path
+in BatchProcessor.
+"""
+
+from bob.utils.batch_processor import BatchProcessor
+from bob.utils.checkpoints import StageCheckpoints, incomplete_stages
+
+
+def partial_result():
+    return {
+        "success": True,
+        "partial": True,
+        "name": "Blue Bottle Coffee",
+        "phone": "+1 510-653-3394",
+        "website": "https://bluebottlecoffee.com",
+        "images": ["https://lh5.googleusercontent.com/p/a=w1920"],
+        "reviews": [],
+        "stage_errors": {"reviews": "scroll failed"},
+        "stages_skipped": [],
+    }
+
+
+class TestStageCheckpoints:
+    """Test suite for StageCheckpoints."""
+
+    def test_incomplete_stages_normalizes_engine_names(self):
+        result = {"incomplete_stages": ["photos"], "stage_errors": {"emails": "x"}, "stages_skipped": ["core"]}
+        assert incomplete_stages(result) == {"images", "email", "fields"}
+        assert incomplete_stages({"stage_errors": {"navigate": "x"}}) == set()
+
+    def test_record_and_retry_fields(self):
+        checkpoints = StageCheckpoints()
+        checkpoints.record("Blue Bottle Coffee", partial_result())
+
+        assert checkpoints.pending_stages("blue  bottle coffee") == ["reviews"]
+        assert checkpoints.retry_fields("Blue Bottle Coffee") == ["reviews"]
+
+    def test_complete_and_failed_results_are_not_recorded(self):
+        checkpoints = StageCheckpoints()
+        checkpoints.record("a", {"success": True, "name": "A"})
+        checkpoints.record("b", {"success": False, "stage_errors": {"reviews": "x"}})
+
+        assert checkpoints.retry_fields("a") is None
+        assert checkpoints.retry_fields("b") is None
+        assert checkpoints.get_stats()["open_checkpoints"] == 0
+
+    def test_merge_takes_recovered_stage_and_reuses_rest(self):
+        checkpoints = StageCheckpoints()
+        checkpoints.record("Blue Bottle Coffee", partial_result())
+        retry = {
+            "success": True,
+            "name": "Blue Bottle Coffee",
+            "phone": None,  # Not requested by the retry; must not overwrite
+            "reviews": [{"text": "Great pour-over"}],
+            "fields": ["name", "reviews"],
+        }
+
+        merged = checkpoints.merge("Blue Bottle Coffee", retry)
+
+        assert merged["reviews"] == [{"text": "Great pour-over"}]
+        assert merged["phone"] == "+1 510-653-3394"
+        assert merged["images"] == ["https://lh5.googleusercontent.com/p/a=w1920"]
+        assert merged["resumed_stages"] == ["reviews"]
+        assert merged["stage_errors"] == {}
+        assert incomplete_stages(merged) == set()
+        assert "partial" not in merged
+        assert "fields" not in merged
+        assert checkpoints.retry_fields("Blue Bottle Coffee") is None
+        assert checkpoints.get_stats()["stages_recovered"] == 1
+
+    def test_failed_retry_keeps_stage_pending(self):
+        checkpoints = StageCheckpoints()
+        checkpoints.record("Blue Bottle Coffee", partial_result())
+
+        merged = checkpoints.merge("Blue Bottle Coffee", {"success": False, "error": "blocked"})
+
+        assert merged["partial"] is True
+        assert merged["incomplete_stages"] == ["reviews"]
+        assert merged["phone"] == "+1 510-653-3394"
+        assert checkpoints.pending_stages("Blue Bottle Coffee") == ["reviews"]
+
+    def test_directory_checkpoints_survive_restart(self, tmp_path):
+        StageCheckpoints(tmp_path).record("Blue Bottle Coffee", partial_result())
+
+        restarted = StageCheckpoints(tmp_path)
+        assert restarted.retry_fields("Blue Bottle Coffee") == ["reviews"]
+
+        restarted.merge("Blue Bottle Coffee", {"success": True, "name": "Blue Bottle Coffee", "reviews": []})
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestBatchRetry:
+    """Retry path of BatchProcessor.process_batch_with_retry."""
+
+    def test_partial_result_retries_only_pending_stages(self, monkeypatch):
+        processor = BatchProcessor()
+        calls = []
+
+        def fake_extract(business, fields=None):
+            calls.append(fields)
+            if fields is None:
+                return partial_result()
+            return {"success": True, "name": business, "reviews": [{"text": "Great"}], "fields": ["name", "reviews"]}
+
+        monkeypatch.setattr(processor, "extract_single_subprocess", fake_extract)
+        monkeypatch.setattr("bob.utils.batch_processor.time.sleep", lambda seconds: None)
+
+        results = processor.process_batch_with_retry(["Blue Bottle Coffee"], verbose=False)
+
+        assert calls == [None, ["reviews"]]
+        assert results[0]["reviews"] == [{"text": "Great"}]
+        assert results[0]["phone"] == "+1 510-653-3394"
+        assert "partial" not in results[0]
+
+    def test_partial_result_without_data_stages_is_not_retried(self, monkeypatch):
+        processor = BatchProcessor()
+        calls = []
+
+        def fake_extract(business, fields=None):
+            calls.append(fields)
+            return {**partial_result(), "stage_errors": {"readiness": "timeout"}}
+
+        monkeypatch.setattr(processor, "extract_single_subprocess", fake_extract)
+        monkeypatch.setattr("bob.utils.batch_processor.time.sleep", lambda seconds: None)
+
+        results = processor.process_batch_with_retry(["Blue Bottle Coffee"], verbose=False)
+
+        assert calls == [None]
+        assert results[0]["images"] == partial_result()["images"]
+        assert processor.checkpoints.get_stats()["open_checkpoints"] == 0
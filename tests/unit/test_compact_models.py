@@ -0,0 +1,127 @@
+"""
+BOB Google Maps v4.3.1 - Compact Models Unit Tests
+
+Tests for CompactReview and CompactBusiness: field parity with the
+dataclasses, identical to_dict() output, lazy fields, and round trips.
+"""
+
+import pickle
+from dataclasses import fields
+from datetime import datetime
+
+import pytest
+
+from bob.models import Business, CompactBusiness, CompactReview, Review
+
+
+EXTRACTED_AT = datetime(2025, 10, 3, 12, 30, 0, 123456)
+
+REVIEW = dict(
+    review_index=3, reviewer_name="Ann Lee", rating=5, review_text="Great coffee and friendly staff",
+    relative_time="2 months ago", helpful_count=4, owner_response="Thank you!", review_id="r-3",
+    extracted_at=EXTRACTED_AT,
+)
+
+
+class TestCompactReview:
+    """Test suite for CompactReview."""
+
+    def test_same_fields_as_review(self):
+        review = CompactReview(**REVIEW)
+        assert all(hasattr(review, f.name) for f in fields(Review))
+        assert not hasattr(review, "__dict__")
+
+    @pytest.mark.parametrize("values", [REVIEW, dict(review_index=0, extracted_at=EXTRACTED_AT)])
+    def test_to_dict_matches_review(self, values):
+        compact, review = CompactReview(**values), Review(**values)
+
+        assert compact.to_dict() == review.to_dict()
+        assert compact.get_quality_score() == review.get_quality_score()
+        assert str(compact) == str(review)
+
+    def test_derived_fields_are_lazy(self):
+        review = CompactReview(review_index=0, reviewer_name="Ann", review_text="Tasty")
+        assert review._completeness is None
+
+        assert review.text_length == 5
+        assert review.data_completeness == Review(review_index=0, reviewer_name="Ann", review_text="Tasty").data_completeness
+        assert review._completeness is not None
+
+        review = CompactReview(review_index=0, reviewer_name="Ann", review_text="Tasty")
+        assert review.to_dict()["data_completeness"] == review._completeness
+
+    def test_rare_fields_share_one_dict(self):
+        review = CompactReview(review_index=0, rating=4)
+        assert review._extra is None
+
+        review.text_language = "en"
+        review.owner_response = "Thanks"
+        assert review._extra == {"text_language": "en", "owner_response": "Thanks"}
+        review.text_language = None
+        assert review.text_language is None and review._extra == {"owner_response": "Thanks"}
+
+    def test_from_dict_parses_date_on_first_read(self):
+        data = Review(**REVIEW).to_dict()
+        review = CompactReview.from_dict(data)
+
+        assert review._extracted_at == EXTRACTED_AT.isoformat()
+        assert review.to_dict() == data
+        assert review.extracted_at == EXTRACTED_AT
+
+    def test_review_round_trip_and_pickle(self):
+        review = Review(**REVIEW)
+        compact = CompactReview.from_review(review)
+
+        assert compact.to_review() == review
+        assert pickle.loads(pickle.dumps(compact)).to_dict() == compact.to_dict()
+
+
+class TestCompactBusiness:
+    """Test suite for CompactBusiness."""
+
+    def test_to_dict_matches_business(self):
+        values = dict(name="Blue Bottle", rating=4.6, emails=["hello@bluebottlecoffee.com"],
+                      photos=["https://lh5.googleusercontent.com/p/1"], extracted_at=EXTRACTED_AT)
+        compact, business = CompactBusiness(**values), Business(**values)
+
+        assert compact.to_dict() == business.to_dict()
+        assert compact.calculate_quality_score() == business.calculate_quality_score()
+        assert compact.to_business() == business
+
+    def test_containers_allocated_on_first_use(self):
+        business = CompactBusiness(name="Blue Bottle")
+        assert business._photos is None
+        assert business.to_dict()["photos"] == []
+        assert business._photos is None
+
+        business.photos.append("https://lh5.googleusercontent.com/p/1")
+        assert business.to_dict()["photos"] == ["https://lh5.googleusercontent.com/p/1"]
+
+    def test_from_dict_round_trip(self):
+        data = Business(name="Blue Bottle", cid=123, reviews=[{"reviewer_name": "Ann"}],
+                        extracted_at=EXTRACTED_AT).to_dict()
+        business = CompactBusiness.from_dict(data)
+
+        assert business.to_dict() == data
+        assert isinstance(data["extracted_at"], str)  # Input not modified
+        assert business.extraction_method == "unknown" and business.is_real_cid is False
+
+    def test_from_dict_sets_every_field(self):
+        data = CompactBusiness().to_dict()
+        for index, name in enumerate(data):
+            if name != "extracted_at":
+                data[name] = [index] if isinstance(data[name], list) else {"n": index} if isinstance(data[name], dict) else index
+        data["reviews"] = [{"reviewer_name": "Ann"}]
+        data["extracted_at"] = EXTRACTED_AT.isoformat()
+
+        business = CompactBusiness.from_dict(data)
+        assert business.to_dict() == data
+        assert business.to_business().to_dict() == data
+
+    def test_compact_reviews_serialize_as_dicts(self):
+        business = CompactBusiness(name="Blue Bottle", reviews=[CompactReview(**REVIEW)])
+        assert business.to_dict()["reviews"] == [Review(**REVIEW).to_dict()]
+
+    def test_unknown_field(self):
+        with pytest.raises(TypeError):
+            CompactBusiness(nmae="typo")
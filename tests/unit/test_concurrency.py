@@ -0,0 +1,131 @@
+"""
+BOB Google Maps v4.3.1 - Adaptive Concurrency Unit Tests
+
+Tests for the AIMD concurrency controller used by ParallelExtractor.
+"""
+
+import asyncio
+
+import pytest
+
+from bob.utils.concurrency import (
+    AdaptiveConcurrencyController,
+    AIMDConfig,
+    classify_outcome,
+)
+from bob.utils.parallel_extractor import ParallelConfig
+
+
+def make_controller(**overrides):
+    """Controller with a fixed memory reading and no cooldown."""
+    settings = dict(initial_limit=2, max_limit=6, window_size=3, cooldown_seconds=0)
+    settings.update(overrides)
+    config = AIMDConfig(**settings)
+    return AdaptiveConcurrencyController(config, memory_probe=lambda: 40.0)
+
+
+class TestClassifyOutcome:
+    """Test suite for classify_outcome."""
+
+    def test_success(self):
+        assert classify_outcome({"success": True}) == "success"
+
+    def test_captcha_page(self):
+        result = {"success": False, "error": "Google blocked the request: unusual traffic (CAPTCHA) page"}
+        assert classify_outcome(result) == "blocked"
+
+    def test_timeout(self):
+        result = {"success": False, "error": "Page.goto: Timeout 30000ms exceeded."}
+        assert classify_outcome(result) == "timeout"
+
+    def test_generic_failure(self):
+        assert classify_outcome({"success": False, "error": "boom"}) == "failure"
+        assert classify_outcome(None) == "failure"
+
+
+class TestAdaptiveConcurrencyController:
+    """Test suite for AdaptiveConcurrencyController."""
+
+    def test_additive_increase_after_healthy_window(self):
+        controller = make_controller()
+
+        assert controller.record(5.0, "success") is None
+        assert controller.record(5.0, "success") is None
+        decision = controller.record(5.0, "success")
+
+        assert decision.action == "increase"
+        assert controller.limit == 3
+
+    def test_increase_stops_at_ceiling(self):
+        controller = make_controller()
+        for _ in range(30):
+            controller.record(1.0, "success")
+
+        assert controller.limit == 6
+        assert controller.metrics()[-1]["reason"] == "at ceiling"
+
+    def test_multiplicative_decrease_on_captcha(self):
+        controller = make_controller(initial_limit=6)
+        decision = controller.record(2.0, "blocked")
+
+        assert decision.action == "decrease"
+        assert controller.limit == 3
+
+    def test_decrease_never_below_minimum(self):
+        controller = make_controller(initial_limit=1)
+        controller.record(2.0, "timeout")
+        assert controller.limit == 1
+
+    def test_memory_pressure_backs_off(self):
+        config = AIMDConfig(initial_limit=4, max_limit=8, cooldown_seconds=0, memory_high_percent=80)
+        controller = AdaptiveConcurrencyController(config, memory_probe=lambda: 92.0)
+        decision = controller.record(3.0, "success")
+
+        assert decision.action == "decrease"
+        assert "memory" in decision.reason
+        assert controller.limit == 2
+
+    def test_slow_window_holds(self):
+        controller = make_controller(latency_target_seconds=10)
+        for _ in range(3):
+            decision = controller.record(25.0, "success")
+
+        assert decision.action == "hold"
+        assert controller.limit == 2
+
+    def test_cooldown_limits_consecutive_cuts(self):
+        config = AIMDConfig(initial_limit=8, max_limit=8, cooldown_seconds=60)
+        controller = AdaptiveConcurrencyController(config, memory_probe=lambda: 10.0)
+        controller.record(1.0, "timeout")
+        controller.record(1.0, "timeout")
+
+        assert controller.limit == 4
+
+    @pytest.mark.asyncio
+    async def test_limit_bounds_in_flight_jobs(self):
+        controller = make_controller()
+        peak = 0
+
+        async def job():
+            nonlocal peak
+            async with controller:
+                peak = max(peak, controller.in_flight)
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(*[job() for _ in range(10)])
+
+        assert peak == 2
+        assert controller.in_flight == 0
+
+
+class TestParallelConfigAdaptive:
+    """ParallelConfig safety cap vs adaptive ceiling."""
+
+    def test_fixed_mode_keeps_safety_cap(self):
+        config = ParallelConfig(max_concurrent=12)
+        assert config.max_concurrent == 5
+
+    def test_adaptive_mode_uses_ceiling(self):
+        config = ParallelConfig(max_concurrent=12, adaptive=True, max_concurrent_ceiling=16)
+        assert config.max_concurrent == 12
+        assert config.max_concurrent_ceiling == 16
@@ -0,0 +1,151 @@
+"""
+BOB Google Maps v4.3.1 - Contact Crawler Unit Tests
+
+Tests for ContactCrawler against a local website: contact link ranking,
+depth and page budgets, robots.txt, per-host politeness, and email
+extraction following contact pages.
+"""
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from bob.utils.contact_crawler import ContactCrawler, CrawlerConfig, contact_links
+from bob.utils.email_extractor import extract_emails_from_website_async
+from bob.utils.http_client import AsyncHTTPClient
+
+
+PAGES = {
+    "/": ("<a href='/menu'>Menu</a> <a href='/about'>About us</a> "
+          "<a href='/contact#form'><span>Contact</span></a> <a href='/private/kontakt'>Kontakt</a> "
+          "<a href='https://facebook.com/bluebottle'>Contact on Facebook</a> <a href='/contact.pdf'>Contact sheet</a>"),
+    "/menu": "<p>Espresso</p> <a href='mailto:menu@bluebottlecoffee.com'>x</a>",
+    "/contact": "<a href='mailto:hello@bluebottlecoffee.com'>Email us</a>",
+    "/about": "Press: press&#64;bluebottlecoffee&#46;com <a href='/about/team'>Our team</a>",
+    "/about/team": "Jobs: jobs [at] bluebottlecoffee [dot] com",
+    "/private/kontakt": "<a href='mailto:private@bluebottlecoffee.com'>x</a>",
+    "/robots.txt": "User-agent: *\nDisallow: /private/\n",
+}
+
+
+class SiteHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    hits = []
+
+    def do_GET(self):
+        type(self).hits.append((self.path, time.monotonic()))
+        body = PAGES.get(self.path)
+        if body is None:
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = body.encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain" if self.path.endswith(".txt") else "text/html")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def site():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), SiteHandler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+
+
+@pytest.fixture
+def hits():
+    SiteHandler.hits = []
+    return SiteHandler.hits
+
+
+def make_crawler(**overrides):
+    config = dict(per_host_delay=0, per_host_concurrency=4)
+    config.update(overrides)
+    return ContactCrawler(CrawlerConfig(**config))
+
+
+def test_contact_links_ranking():
+    links = contact_links(PAGES["/"], "http://127.0.0.1:8000/")
+    urls = [url for _, url in links]
+
+    assert urls[0] == "http://127.0.0.1:8000/contact"
+    assert "http://127.0.0.1:8000/about" in urls
+    assert "http://127.0.0.1:8000/menu" not in urls           # No contact keyword
+    assert not any("facebook" in url or url.endswith(".pdf") for url in urls)
+
+
+class TestContactCrawler:
+    """Test suite for ContactCrawler."""
+
+    @pytest.mark.asyncio
+    async def test_follows_contact_pages(self, site, hits):
+        crawler = make_crawler(max_depth=1, max_pages=4)
+        async with AsyncHTTPClient(backend="requests") as client:
+            crawl = await crawler.crawl(f"{site}/", client=client)
+
+        assert crawl.emails == ["hello@bluebottlecoffee.com", "press@bluebottlecoffee.com"]
+        assert crawl.pages == [f"{site}/", f"{site}/contact", f"{site}/about"]
+        assert crawl.robots_blocked == 1
+        assert crawler.get_stats()["found_on_followed"] == 2
+        fetched = [path for path, _ in hits]
+        assert "/menu" not in fetched and "/private/kontakt" not in fetched and "/about/team" not in fetched
+        assert fetched.count("/robots.txt") == 1
+
+    @pytest.mark.asyncio
+    async def test_depth_and_page_budget(self, site, hits):
+        async with AsyncHTTPClient(backend="requests") as client:
+            landing_only = await make_crawler(max_depth=0).crawl(f"{site}/", client=client)
+            deep = await make_crawler(max_depth=2, max_pages=10).crawl(f"{site}/", client=client)
+            budget = await make_crawler(max_depth=2, max_pages=2).crawl(f"{site}/", client=client)
+
+        assert landing_only.emails == [] and landing_only.pages == [f"{site}/"]
+        assert "jobs@bluebottlecoffee.com" in deep.emails
+        assert budget.pages == [f"{site}/", f"{site}/contact"]
+
+    @pytest.mark.asyncio
+    async def test_robots_txt_is_cached(self, site, hits):
+        crawler = make_crawler()
+        async with AsyncHTTPClient(backend="requests") as client:
+            await crawler.crawl(f"{site}/", client=client)
+            await crawler.crawl(f"{site}/", client=client)
+
+        assert [path for path, _ in hits].count("/robots.txt") == 1
+        assert crawler.get_stats()["robots_fetched"] == 1
+        assert crawler.get_stats()["crawls"] == 2
+
+    @pytest.mark.asyncio
+    async def test_per_host_delay(self, site, hits):
+        crawler = make_crawler(per_host_concurrency=1, per_host_delay=0.1, max_pages=4)
+        async with AsyncHTTPClient(backend="requests") as client:
+            await crawler.crawl(f"{site}/", client=client)
+
+        starts = [started for _, started in hits]
+        assert len(starts) == 4  # Landing, robots.txt, 2 contact pages
+        assert all(b - a >= 0.09 for a, b in zip(starts, starts[1:]))
+
+    @pytest.mark.asyncio
+    async def test_missing_landing_page(self, site, hits):
+        async with AsyncHTTPClient(backend="requests") as client:
+            crawl = await make_crawler().crawl(f"{site}/gone", client=client)
+
+        assert crawl.landing.status == 404
+        assert crawl.emails == [] and crawl.pages == [f"{site}/gone"]
+
+
+@pytest.mark.asyncio
+async def test_email_extraction_follows_contact_pages(site, hits):
+    async with AsyncHTTPClient(backend="requests") as client:
+        emails = await extract_emails_from_website_async(
+            f"{site}/", client=client, cache=False, crawler=make_crawler(max_depth=2, max_pages=10)
+        )
+
+    assert emails == ["hello@bluebottlecoffee.com", "press@bluebottlecoffee.com", "jobs@bluebottlecoffee.com"]
@@ -0,0 +1,169 @@
+"""
+BOB Google Maps v4.3.1 - Job Deadline Unit Tests
+
+Tests for per-job deadlines: remaining-time stage budgets, roll-over of
+unused time, stage timeouts and skipped stages marking a result partial.
+"""
+
+import asyncio
+
+import pytest
+
+from bob.extractors.playwright_optimized import PlaywrightExtractorOptimized
+from bob.utils.deadline import Deadline
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestDeadline:
+    """Test suite for Deadline."""
+
+    def test_budget_is_a_weighted_share_of_remaining_time(self):
+        clock = FakeClock()
+        deadline = Deadline(60, stages=["navigation", "fields"], weights={"navigation": 2, "fields": 1}, clock=clock)
+
+        assert deadline.budget("navigation") == pytest.approx(40)
+        assert deadline.budget("navigation", cap=30) == 30
+        assert deadline.budget_ms("navigation", cap=30) == 30000
+
+    def test_unused_time_rolls_over(self):
+        clock = FakeClock()
+        deadline = Deadline(60, stages=["navigation", "fields"], weights={"navigation": 2, "fields": 1}, clock=clock)
+
+        deadline.start("navigation")
+        clock.now += 5  # Navigation finished early
+
+        assert deadline.budget("fields") == pytest.approx(55)
+
+    def test_dropped_stages_give_up_their_share(self):
+        deadline = Deadline(30, stages=["fields", "reviews"], weights={"fields": 1, "reviews": 2}, clock=FakeClock())
+        deadline.drop("reviews")
+
+        assert deadline.budget("fields") == pytest.approx(30)
+
+    def test_time_left_shrinks_inside_a_stage(self):
+        clock = FakeClock()
+        deadline = Deadline(60, stages=["navigation", "fields"], weights={"navigation": 2, "fields": 1}, clock=clock)
+
+        deadline.start("navigation")  # 40s budget
+        clock.now += 25
+
+        assert deadline.time_left("navigation") == pytest.approx(15)
+        assert deadline.time_left_ms("navigation", cap=10) == 10000
+        clock.now += 20
+        assert deadline.time_left("navigation") == 0
+        assert deadline.time_left("fields") == pytest.approx(15)  # Not started: its budget()
+
+    def test_playwright_step_timeouts_follow_the_stage(self):
+        clock = FakeClock()
+        deadline = Deadline(8, stages=["readiness"], clock=clock)
+        deadline.start("readiness")
+        stage_ms = PlaywrightExtractorOptimized._stage_ms
+
+        assert stage_ms(None, "readiness", 3000, 0.25) == 3000
+        assert stage_ms(deadline, "readiness", 3000, 0.25) == 2000
+        assert stage_ms(deadline, "readiness", 10000) == 8000
+        clock.now += 7
+        assert stage_ms(deadline, "readiness", 10000) == 1000
+
+    @pytest.mark.asyncio
+    async def test_stage_helpers_get_the_capped_budget(self):
+        deadline = Deadline(60, stages=["navigation"])
+
+        async def navigate():
+            return deadline.time_left("navigation")
+
+        assert await deadline.run("navigation", navigate(), cap=2) <= 2
+
+    @pytest.mark.asyncio
+    async def test_stage_timeout_returns_default_and_marks_partial(self):
+        deadline = Deadline(0.2, stages=["fields", "reviews"], weights={"fields": 1, "reviews": 1})
+
+        fields = await deadline.run("fields", asyncio.sleep(0, result={"name": "Cafe"}))
+        reviews = await deadline.run("reviews", asyncio.sleep(5), default=[])
+
+        assert fields == {"name": "Cafe"}
+        assert reviews == []
+        assert deadline.partial
+        assert deadline.incomplete_stages() == ["reviews"]
+
+    @pytest.mark.asyncio
+    async def test_stages_after_the_deadline_are_skipped(self):
+        clock = FakeClock()
+        deadline = Deadline(10, stages=["fields", "images"], clock=clock)
+        clock.now += 11
+
+        assert await deadline.run("images", asyncio.sleep(0, result=["x"]), default=[]) == []
+        assert deadline.results["images"]["status"] == "skipped"
+        assert deadline.get_stats()["remaining_seconds"] == 0
+
+    @pytest.mark.asyncio
+    async def test_stage_errors_propagate(self):
+        async def fail():
+            raise ValueError("boom")
+
+        deadline = Deadline(10, stages=["navigation"])
+        with pytest.raises(ValueError):
+            await deadline.run("navigation", fail())
+        assert deadline.results["navigation"]["status"] == "failed"
+
+
+class FakePage:
+    async def close(self):
+        pass
+
+
+class FakeContext:
+    async def new_page(self):
+        return FakePage()
+
+
+class FakePool:
+    async def new_context(self, **options):
+        return FakeContext()
+
+    async def release(self, context):
+        pass
+
+
+class TestPlaywrightDeadline:
+    """PlaywrightExtractorOptimized with the page work faked."""
+
+    @pytest.mark.asyncio
+    async def test_unfinished_field_scan_fails_the_job(self, monkeypatch):
+        extractor = PlaywrightExtractorOptimized(browser_pool=FakePool())
+
+        async def nothing(*args, **kwargs):
+            return None
+
+        async def slow_fields(page, fields=None):
+            await asyncio.sleep(5)
+            return {"name": "Cafe"}
+
+        monkeypatch.setattr(extractor, "_setup_resource_blocking", nothing)
+        monkeypatch.setattr(extractor, "_navigate", nothing)
+        monkeypatch.setattr(extractor, "_wait_for_business_page", nothing)
+        monkeypatch.setattr(extractor, "_extract_all_data", slow_fields)
+
+        result = await extractor.extract_business_optimized(
+            "Cafe", include_reviews=False, deadline_seconds=0.3, fields=["name", "phone"]
+        )
+
+        assert result["success"] is False
+        assert "Field extraction" in result["error"]
+
+    def test_batch_subprocess_outlives_the_deadline(self):
+        from bob.config.settings import DEFAULT_EXTRACTOR_CONFIG
+        from bob.utils.batch_processor import BatchProcessor
+
+        processor = BatchProcessor()
+
+        assert processor.timeout == DEFAULT_EXTRACTOR_CONFIG.timeout + DEFAULT_EXTRACTOR_CONFIG.subprocess_margin
+        assert processor.timeout > DEFAULT_EXTRACTOR_CONFIG.timeout
+        assert BatchProcessor(timeout=30).timeout == 30
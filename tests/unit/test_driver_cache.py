@@ -0,0 +1,86 @@
+"""
+BOB Google Maps v4.3.1 - Driver Cache Unit Tests
+
+Tests for the shared, file-locked cache of the patched chromedriver.
+The real download/patch step is replaced by a fake builder.
+"""
+
+import threading
+import time
+
+import pytest
+
+from bob.utils.driver_cache import PATCH_MARKER, DriverCache, is_patched
+
+
+class FakeBuilder:
+    def __init__(self, delay=0.0, marker=PATCH_MARKER):
+        self.calls = 0
+        self.delay = delay
+        self.marker = marker
+        self._lock = threading.Lock()
+
+    def __call__(self, version_main, destination):
+        with self._lock:
+            self.calls += 1
+        time.sleep(self.delay)
+        destination.write_bytes(b"\x7fELF..." + self.marker + b"...")
+
+
+class TestDriverCache:
+    """Test suite for DriverCache."""
+
+    def test_builds_once_then_hits(self, tmp_path):
+        builder = FakeBuilder()
+        cache = DriverCache(cache_dir=tmp_path, builder=builder)
+
+        first = cache.get_path(140)
+        second = cache.get_path(140)
+
+        assert first == second
+        assert is_patched(tmp_path / "chromedriver-140-patched")
+        assert builder.calls == 1
+        assert cache.stats["builds"] == 1
+        assert cache.stats["hits"] == 1
+
+    def test_versions_are_cached_separately(self, tmp_path):
+        builder = FakeBuilder()
+        cache = DriverCache(cache_dir=tmp_path, builder=builder)
+
+        assert cache.get_path(139) != cache.get_path(140)
+        assert builder.calls == 2
+
+    def test_concurrent_workers_share_one_build(self, tmp_path):
+        builder = FakeBuilder(delay=0.2)
+        # Separate instances behave like separate processes: only the file lock is shared
+        caches = [DriverCache(cache_dir=tmp_path, builder=builder) for _ in range(4)]
+        paths = []
+
+        threads = [threading.Thread(target=lambda c=c: paths.append(c.get_path(140))) for c in caches]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert builder.calls == 1
+        assert len(set(paths)) == 1
+        assert sum(cache.stats["hits"] for cache in caches) == 3
+        assert sum(cache.get_stats()["estimated_seconds_saved"] for cache in caches) > 0
+
+    def test_unpatched_build_is_not_published(self, tmp_path):
+        cache = DriverCache(cache_dir=tmp_path, builder=FakeBuilder(marker=b"plain"))
+
+        with pytest.raises(RuntimeError):
+            cache.get_path(140)
+
+        assert not (tmp_path / "chromedriver-140-patched").exists()
+        assert not list(tmp_path.glob(".building-*"))
+
+    def test_launch_stats(self, tmp_path):
+        cache = DriverCache(cache_dir=tmp_path, builder=FakeBuilder())
+        cache.record_launch(2.0)
+        cache.record_launch(4.0)
+
+        stats = cache.get_stats()
+        assert stats["launches"] == 2
+        assert stats["avg_launch_seconds"] == 3.0
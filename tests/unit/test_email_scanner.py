@@ -0,0 +1,58 @@
+"""
+BOB Google Maps v4.3.1 - Email Scanner Unit Tests
+
+Tests for EmailScanner: plain and obfuscated addresses, filtering,
+chunk boundaries and early stopping.
+"""
+
+from bob.utils.email_scanner import EmailScanner, scan_emails
+
+
+class TestEmailScanner:
+    """Test suite for EmailScanner."""
+
+    def test_plain_and_mailto_addresses_in_page_order(self):
+        html = "<a href='mailto:Owner@Cafe.co.uk'>Owner</a> Contact: info@cafe.com owner@cafe.co.uk"
+        assert scan_emails(html) == ["owner@cafe.co.uk", "info@cafe.com"]
+
+    def test_obfuscated_forms(self):
+        html = (
+            "<a href='mailto:sales%40cafe.com'>Sales</a> "
+            "press&#64;cafe&#46;com jobs&#x40;cafe.com "
+            "events [at] cafe [dot] co [dot] uk hello(AT)cafe(DOT)com"
+        )
+        assert scan_emails(html, limit=None) == [
+            "sales@cafe.com", "press@cafe.com", "jobs@cafe.com", "events@cafe.co.uk", "hello@cafe.com",
+        ]
+
+    def test_spam_and_asset_names_are_filtered(self):
+        html = "noreply@cafe.com test@cafe.com me@gmail.com <img srcset='logo@2x.png 2x'> real@cafe.com"
+        assert scan_emails(html) == ["real@cafe.com"]
+
+    def test_platform_domains_are_filtered(self):
+        html = "bookings@zomato.com support@m.facebook.com info@localhost hello@cafe.com"
+        assert scan_emails(html) == ["hello@cafe.com"]
+
+    def test_address_split_across_chunks(self):
+        scanner = EmailScanner(limit=None)
+        scanner.feed("<p>" + "filler " * 50 + "</p><a>info@ca")
+        scanner.feed("fe.com</a> <b>press&#6")
+        scanner.feed("4;cafe.com</b>")
+
+        assert scanner.finish() == ["info@cafe.com", "press@cafe.com"]
+
+    def test_stops_once_limit_reached(self):
+        scanner = EmailScanner(limit=2)
+        assert not scanner.feed("<p>a@cafe.com</p>")
+        assert scanner.feed("<p>b@cafe.com</p><p>")
+        assert scanner.feed("<p>c@cafe.com</p>")  # Ignored
+
+        assert scanner.finish() == ["a@cafe.com", "b@cafe.com"]
+
+    def test_long_text_without_tags(self):
+        text = ("word " * 5000) + "info@cafe.com " + ("word " * 5000)
+        scanner = EmailScanner()
+        for start in range(0, len(text), 1000):
+            scanner.feed(text[start:start + 1000])
+
+        assert scanner.finish() == ["info@cafe.com"]
@@ -0,0 +1,107 @@
+"""
+BOB Google Maps v4.3.1 - Engine Router Unit Tests
+
+Tests for input-shape classification, learned engine ordering and the
+extraction_history columns the router is seeded from.
+"""
+
+import sqlite3
+
+import pytest
+
+from bob.cache.cache_manager import CacheManagerUltimate
+from bob.utils.engine_router import EngineRouter, classify_input
+
+
+class TestClassifyInput:
+    """Test suite for classify_input."""
+
+    @pytest.mark.parametrize("text,shape", [
+        ("Starbucks Times Square NYC", "query"),
+        ("coffee shops in Boston", "category"),
+        ("pizza near Central Park", "category"),
+        ("https://www.google.com/maps/place/Starbucks/@40.75,-73.98,17z", "place_url"),
+        ("https://www.google.com/maps?cid=12345678901234567890", "cid"),
+        ("12345678901234567890", "cid"),
+        ("0x89c25855c6480299:0x55194ec5a1ae072e", "cid"),
+        ("https://www.google.com/maps/search/starbucks", "maps_url"),
+    ])
+    def test_shapes(self, text, shape):
+        assert classify_input(text) == shape
+
+
+class TestEngineRouter:
+    """Test suite for EngineRouter."""
+
+    def test_default_order_without_history(self):
+        decision = EngineRouter().choose("Starbucks Times Square NYC")
+
+        assert decision.order == ["playwright", "selenium"]
+        assert decision.reason == "default order"
+        assert decision.confidence == 0
+
+    def test_learns_to_lead_with_selenium(self):
+        router = EngineRouter()
+        for _ in range(20):
+            router.record("playwright", "cid", complete=False, seconds=40)
+            router.record("selenium", "cid", complete=True, seconds=20)
+
+        decision = router.choose("0x89c25855c6480299:0x55194ec5a1ae072e")
+
+        assert decision.order == ["selenium", "playwright"]
+        assert decision.reason == "learned order"
+        assert decision.confidence > 0.5
+        # Other shapes keep the default
+        assert router.choose("Starbucks Times Square NYC").order == ["playwright", "selenium"]
+
+    def test_respects_available_engines(self):
+        router = EngineRouter()
+        assert router.choose("Starbucks", ["playwright"]).order == ["playwright"]
+        assert router.choose("Starbucks", []).order == []
+
+    def test_stats_expose_decisions(self):
+        router = EngineRouter()
+        router.record("playwright", "query", complete=True, seconds=12)
+        router.choose("Starbucks")
+
+        stats = router.get_stats()
+        assert stats["decisions"] == 1
+        assert stats["shapes"]["query"]["playwright"]["attempts"] == 1
+        assert stats["last_decision"]["input_shape"] == "query"
+
+
+class TestEngineHistory:
+    """extraction_history engine columns and seeding."""
+
+    def test_router_seeds_from_recorded_attempts(self, tmp_path):
+        cache = CacheManagerUltimate(db_path=str(tmp_path / "cache.db"))
+        for _ in range(15):
+            cache.record_attempt("playwright", "category", success=False, complete=False, seconds=45)
+            cache.record_attempt("selenium", "category", success=True, complete=True, seconds=18)
+
+        router = EngineRouter(cache_manager=cache)
+
+        assert router.stats["seeded_attempts"] == 30
+        assert router.choose("plumbers in Boston").order == ["selenium", "playwright"]
+
+    def test_old_history_table_is_migrated(self, tmp_path):
+        db_path = str(tmp_path / "old.db")
+        conn = sqlite3.connect(db_path)
+        conn.execute("""
+            CREATE TABLE extraction_history (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                place_id TEXT,
+                extraction_time_seconds REAL,
+                data_quality_score INTEGER,
+                extractor_version TEXT,
+                success BOOLEAN,
+                timestamp TIMESTAMP
+            )
+        """)
+        conn.commit()
+        conn.close()
+
+        cache = CacheManagerUltimate(db_path=db_path)
+        cache.record_attempt("selenium", "query", success=True, complete=True, seconds=20)
+
+        assert cache.get_engine_history()[0]["attempts"] == 1
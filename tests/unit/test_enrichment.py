@@ -0,0 +1,175 @@
+"""
+BOB Google Maps v4.3.1 - Enrichment Queue Unit Tests
+
+Tests for EnrichmentQueue: background email enrichment delivered through
+the future, merging on the caller's side, cache record updates and
+skipping results that need nothing.
+"""
+
+import threading
+
+import pytest
+
+from bob.cache.cache_manager import CacheManagerUltimate
+from bob.extractors.hybrid_optimized import HybridExtractorOptimized
+from bob.utils.enrichment import EnrichmentQueue, wants_emails
+
+
+def result(**extra):
+    data = {
+        "success": True,
+        "name": "Blue Bottle Coffee",
+        "place_id": "0x808f7e2a1c6b4f3d:0x1a2b3c4d5e6f7a8b",
+        "website": "https://bluebottlecoffee.com",
+    }
+    data.update(extra)
+    return data
+
+
+def email_tasks(release=None, emails=("hello@bluebottlecoffee.com",)):
+    def fetch(data, timeout):
+        if release:
+            release.wait(2)
+        return {"emails": list(emails)}
+    return {"emails": (wants_emails, fetch)}
+
+
+class TestEnrichmentQueue:
+    """Test suite for EnrichmentQueue."""
+
+    def test_submit_returns_before_fetch_finishes(self):
+        release = threading.Event()
+        queue = EnrichmentQueue(tasks=email_tasks(release))
+        data = result()
+
+        future = queue.submit(data)
+
+        assert future is not None and not future.done()
+        assert data["enrichment_pending"] == ["emails"]
+        release.set()
+        assert queue.wait(timeout=2)
+        assert future.result() == {"emails": ["hello@bluebottlecoffee.com"]}
+        assert queue.get_stats()["completed"] == 1
+        queue.shutdown()
+
+    def test_background_loop_leaves_result_alone(self):
+        queue = EnrichmentQueue(tasks=email_tasks())
+        data = result()
+
+        future = queue.submit(data)
+        future.result(timeout=2)
+
+        assert "emails" not in data
+        assert data["enrichment_pending"] == ["emails"]
+        queue.shutdown()
+
+    def test_collect_merges_on_caller(self):
+        queue = EnrichmentQueue(tasks=email_tasks())
+        data = result()
+
+        added = queue.collect(data, queue.submit(data), timeout=2)
+
+        assert added == {"emails": ["hello@bluebottlecoffee.com"]}
+        assert data["emails"] == ["hello@bluebottlecoffee.com"]
+        assert "enrichment_pending" not in data
+        queue.shutdown()
+
+    def test_nothing_to_enrich(self):
+        queue = EnrichmentQueue(tasks=email_tasks())
+
+        assert queue.submit(result(website=None)) is None
+        assert queue.submit(result(emails=["a@b.com"])) is None
+        assert queue.submit(result(fields=["name", "phone"])) is None
+        assert queue.submit({"success": False, "website": "https://x.com"}) is None
+        assert queue.get_stats()["submitted"] == 0
+
+    def test_failed_task_is_counted_and_cleared(self):
+        def broken(data, timeout):
+            raise ConnectionError("refused")
+
+        queue = EnrichmentQueue(tasks={"emails": (wants_emails, broken)})
+        data = result()
+        assert queue.collect(data, queue.submit(data), timeout=2) == {}
+
+        assert "emails" not in data
+        assert "enrichment_pending" not in data
+        assert queue.get_stats()["failed"] == 1
+        queue.shutdown()
+
+    def test_cache_record_is_updated(self, tmp_path):
+        cache = CacheManagerUltimate(db_path=str(tmp_path / "cache.db"))
+        data = result(phone="+1 510-653-3394")
+        cache.save_result(data)
+
+        queue = EnrichmentQueue(tasks=email_tasks())
+        queue.submit(data, cache_manager=cache).result(timeout=2)
+
+        cached = cache.get_cached(data["place_id"])
+        assert cached["emails"] == ["hello@bluebottlecoffee.com"]
+        assert "enrichment_pending" not in cached
+        assert queue.get_stats()["cache_updates"] == 1
+        queue.shutdown()
+
+    def test_update_fields_without_record(self, tmp_path):
+        cache = CacheManagerUltimate(db_path=str(tmp_path / "cache.db"))
+        assert cache.update_fields(result(), {"emails": []}) is False
+
+
+class TestHybridEnrichment:
+    """HybridExtractorOptimized returns results with deferred emails merged."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("parallel", [True, False])
+    async def test_batch_results_include_emails(self, tmp_path, monkeypatch, parallel):
+        extractor = HybridExtractorOptimized(use_cache=True)
+        extractor.cache_manager = CacheManagerUltimate(db_path=str(tmp_path / "cache.db"))
+        extractor.enrichment = EnrichmentQueue(tasks=email_tasks())
+        extractor.selenium_enabled = False
+
+        async def playwright(url, include_reviews, max_reviews, projection=None):
+            return result(name=url, place_id=f"id-{url}")
+
+        monkeypatch.setattr(extractor, "_extract_with_playwright_optimized", playwright)
+
+        results = await extractor.extract_multiple(["Cafe A", "Cafe B"], parallel=parallel)
+
+        assert [item["emails"] for item in results] == [["hello@bluebottlecoffee.com"]] * 2
+        assert not any("enrichment_pending" in item for item in results)
+        assert extractor.cache_manager.get_cached("id-Cafe A")["emails"] == ["hello@bluebottlecoffee.com"]
+        extractor.enrichment.shutdown()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("use_cache,fields", [(False, None), (True, ["phone", "emails"])])
+    async def test_emails_without_cache_or_with_projection(self, tmp_path, monkeypatch, use_cache, fields):
+        extractor = HybridExtractorOptimized(use_cache=use_cache)
+        if use_cache:
+            extractor.cache_manager = CacheManagerUltimate(db_path=str(tmp_path / "cache.db"))
+        extractor.enrichment = EnrichmentQueue(tasks=email_tasks())
+        extractor.selenium_enabled = False
+
+        async def playwright(url, include_reviews, max_reviews, projection=None):
+            return projection.apply(result(name=url, phone="+1 510-653-3394"))
+
+        monkeypatch.setattr(extractor, "_extract_with_playwright_optimized", playwright)
+
+        data = await extractor.extract_business_async("Cafe A", fields=fields)
+
+        assert data["emails"] == ["hello@bluebottlecoffee.com"]
+        assert extractor.enrichment.get_stats()["cache_updates"] == 0
+        extractor.enrichment.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_unrequested_emails_are_not_fetched(self, monkeypatch):
+        extractor = HybridExtractorOptimized(use_cache=False)
+        extractor.enrichment = EnrichmentQueue(tasks=email_tasks())
+        extractor.selenium_enabled = False
+
+        async def playwright(url, include_reviews, max_reviews, projection=None):
+            return projection.apply(result(name=url, phone="+1 510-653-3394"))
+
+        monkeypatch.setattr(extractor, "_extract_with_playwright_optimized", playwright)
+
+        data = await extractor.extract_business_async("Cafe A", fields=["phone"])
+
+        assert "emails" not in data
+        assert extractor.enrichment.get_stats()["submitted"] == 0
@@ -0,0 +1,144 @@
+"""
+BOB Google Maps v4.3.1 - Enrichment Cache Unit Tests
+
+Tests for EnrichmentCache: registered domains, fresh hits without
+requests, conditional revalidation (304) against a local HTTP server,
+refetch on change, shared fetches for concurrent chain lookups, and
+separate entries for tenants of shared hosting platforms.
+"""
+
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from bob.cache.enrichment_cache import EnrichmentCache, registered_domain
+from bob.utils.contact_crawler import CrawlResult
+from bob.utils.email_extractor import extract_emails_from_website, extract_emails_from_website_async
+from bob.utils.http_client import FetchResult
+
+
+class SiteHandler(BaseHTTPRequestHandler):
+    """Homepage with an ETag; counts full (200) and conditional (304) responses."""
+    protocol_version = "HTTP/1.1"
+    version = "v1"
+    full = 0
+    not_modified = 0
+
+    def do_GET(self):
+        cls = type(self)
+        etag = f'"{cls.version}"'
+        if self.headers.get("If-None-Match") == etag:
+            cls.not_modified += 1
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        cls.full += 1
+        body = f"<a href='mailto:{cls.version}@bluebottlecoffee.com'>Email</a>".encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def site():
+    SiteHandler.version, SiteHandler.full, SiteHandler.not_modified = "v1", 0, 0
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), SiteHandler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+
+
+def test_registered_domain():
+    assert registered_domain("https://www.starbucks.com/store/123") == "starbucks.com"
+    assert registered_domain("shop.cafe.co.uk") == "cafe.co.uk"
+    assert registered_domain("http://127.0.0.1:8080/") == "127.0.0.1"
+    assert registered_domain("") is None
+
+
+def test_shared_hosting_tenants_are_separate_domains():
+    assert registered_domain("https://joescafe.business.site/") == "joescafe.business.site"
+    assert registered_domain("https://www.annasbakery.business.site/menu") == "annasbakery.business.site"
+    assert registered_domain("https://shop.joescafe.wixsite.com/home") == "joescafe.wixsite.com"
+    assert registered_domain("business.site") == "business.site"
+
+
+class TestEnrichmentCache:
+    """Test suite for EnrichmentCache with email extraction."""
+
+    def test_fresh_entry_needs_no_request(self, site, tmp_path):
+        cache = EnrichmentCache(db_path=str(tmp_path / "cache.db"), fresh_hours=1)
+
+        first = extract_emails_from_website(f"{site}/", cache=cache)
+        second = extract_emails_from_website(f"{site}/locations/42", cache=cache)
+
+        assert first == second == ["v1@bluebottlecoffee.com"]
+        assert SiteHandler.full == 1 and SiteHandler.not_modified == 0
+        assert cache.get_stats()["fresh_hits"] == 1
+
+    def test_stale_entry_is_revalidated(self, site, tmp_path):
+        cache = EnrichmentCache(db_path=str(tmp_path / "cache.db"), fresh_hours=0)
+
+        extract_emails_from_website(f"{site}/", cache=cache)
+        assert extract_emails_from_website(f"{site}/", cache=cache) == ["v1@bluebottlecoffee.com"]
+        assert (SiteHandler.full, SiteHandler.not_modified) == (1, 1)
+
+        SiteHandler.version = "v2"
+        assert extract_emails_from_website(f"{site}/", cache=cache) == ["v2@bluebottlecoffee.com"]
+        assert SiteHandler.full == 2
+
+        stats = cache.get_stats()
+        assert (stats["misses"], stats["not_modified"], stats["refetched"]) == (1, 1, 1)
+
+    def test_entries_survive_restart(self, site, tmp_path):
+        db_path = str(tmp_path / "cache.db")
+        extract_emails_from_website(f"{site}/", cache=EnrichmentCache(db_path=db_path, fresh_hours=1))
+
+        entry = EnrichmentCache(db_path=db_path).lookup(f"{site}/contact")
+        assert entry.emails == ["v1@bluebottlecoffee.com"]
+        assert entry.etag == '"v1"'
+
+    @pytest.mark.asyncio
+    async def test_concurrent_chain_lookups_share_one_fetch(self, site, tmp_path):
+        cache = EnrichmentCache(db_path=str(tmp_path / "cache.db"), fresh_hours=1)
+
+        results = await asyncio.gather(*[
+            extract_emails_from_website_async(f"{site}/store/{i}", cache=cache) for i in range(10)
+        ])
+
+        assert all(emails == ["v1@bluebottlecoffee.com"] for emails in results)
+        assert SiteHandler.full == 1
+        assert cache.get_stats()["coalesced"] == 9
+
+    @pytest.mark.asyncio
+    async def test_shared_hosting_tenants_do_not_share_entries(self, tmp_path):
+        cache = EnrichmentCache(db_path=str(tmp_path / "cache.db"), fresh_hours=1)
+        crawled = []
+
+        class FakeCrawler:
+            async def crawl(self, url, client=None, timeout=None, headers=None):
+                crawled.append(url)
+                await asyncio.sleep(0.01)
+                host = url.split("//")[1].split(".")[0]
+                landing = FetchResult(url=url, status=200, final_url=url)
+                return CrawlResult(url=url, emails=[f"hello@{host}.com"], pages=[url], landing=landing)
+
+        tenants = ["https://joescafe.business.site/", "https://annasbakery.business.site/"]
+        results = await asyncio.gather(*[
+            extract_emails_from_website_async(url, cache=cache, crawler=FakeCrawler()) for url in tenants
+        ])
+
+        assert results == [["hello@joescafe.com"], ["hello@annasbakery.com"]]
+        assert sorted(crawled) == sorted(tenants)
+        assert cache.get_stats()["coalesced"] == 0
+        assert cache.lookup(tenants[0]).emails == ["hello@joescafe.com"]
+        assert cache.lookup(tenants[1]).emails == ["hello@annasbakery.com"]
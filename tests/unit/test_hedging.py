@@ -0,0 +1,156 @@
+"""
+BOB Google Maps v4.3.1 - Request Hedging Unit Tests
+
+Tests for the hedged Playwright/Selenium runner.
+"""
+
+import asyncio
+
+import pytest
+
+from bob.utils.hedging import HedgedRunner, HedgingPolicy, LatencyTracker, is_complete
+
+
+COMPLETE = {"success": True, "name": "Test Cafe", "address": "1 Main St"}
+
+
+def attempt(result, delay, log=None, name=None):
+    """Coroutine factory that returns result after delay seconds."""
+    async def run():
+        try:
+            await asyncio.sleep(delay)
+            return dict(result)
+        except asyncio.CancelledError:
+            if log is not None:
+                log.append(name)
+            raise
+    return run
+
+
+def fast_policy(**overrides):
+    settings = dict(enabled=True, min_samples=1, default_delay_seconds=0.05,
+                    min_delay_seconds=0.01, max_delay_seconds=1.0)
+    settings.update(overrides)
+    return HedgingPolicy(**settings)
+
+
+class TestHelpers:
+    """Completeness check and percentile tracking."""
+
+    def test_is_complete_requires_name_and_contact(self):
+        assert is_complete(COMPLETE)
+        assert is_complete({"success": True, "name": "X", "phone": "+1 555"})
+        assert not is_complete({"success": True, "name": "X"})
+        assert not is_complete({"success": False, "name": "X", "address": "Y"})
+
+    def test_is_complete_for_projected_results(self):
+        assert is_complete({"success": True, "name": "X", "website": "https://x.com", "fields": ["name", "website"]})
+        assert not is_complete({"success": True, "name": "X", "fields": ["name", "website"]})
+        assert is_complete({"success": True, "name": "X", "fields": ["name"]})
+
+    def test_percentile_nearest_rank(self):
+        tracker = LatencyTracker()
+        for value in range(1, 101):
+            tracker.observe(float(value))
+
+        assert tracker.percentile(95) == 95.0
+        assert tracker.percentile(50) == 50.0
+
+    def test_delay_uses_default_until_enough_samples(self):
+        policy = HedgingPolicy(min_samples=3, default_delay_seconds=30)
+        tracker = LatencyTracker()
+        tracker.observe(10.0)
+        assert policy.delay(tracker) == 30
+
+        tracker.observe(12.0)
+        tracker.observe(14.0)
+        assert policy.delay(tracker) == 14.0
+
+
+class TestHedgedRunner:
+    """Test suite for HedgedRunner."""
+
+    @pytest.mark.asyncio
+    async def test_fast_primary_never_hedges(self):
+        runner = HedgedRunner(fast_policy(default_delay_seconds=0.5))
+        result = await runner.run(attempt(COMPLETE, 0.01), attempt(COMPLETE, 0.01))
+
+        assert result["hedge"] == {"winner": "primary", "hedged": False, "seconds": result["hedge"]["seconds"]}
+        assert runner.stats["hedges"] == 0
+
+    @pytest.mark.asyncio
+    async def test_slow_primary_is_hedged_and_cancelled(self):
+        cancelled = []
+        runner = HedgedRunner(fast_policy())
+        result = await runner.run(
+            attempt(COMPLETE, 5.0, cancelled, "primary"),
+            attempt({**COMPLETE, "name": "From Selenium"}, 0.01),
+        )
+
+        assert result["name"] == "From Selenium"
+        assert result["hedge"]["winner"] == "fallback"
+        assert cancelled == ["primary"]
+        assert runner.stats["hedge_wins"] == 1
+        assert 0 < runner.stats["extra_browser_seconds"] < 1
+
+    @pytest.mark.asyncio
+    async def test_incomplete_hedge_waits_for_primary(self):
+        runner = HedgedRunner(fast_policy())
+        result = await runner.run(
+            attempt(COMPLETE, 0.2),
+            attempt({"success": True, "name": "Partial"}, 0.01),
+        )
+
+        assert result["hedge"]["winner"] == "primary"
+        assert result["hedge"]["hedged"]
+
+    @pytest.mark.asyncio
+    async def test_disabled_policy_falls_back_sequentially(self):
+        runner = HedgedRunner(HedgingPolicy(enabled=False))
+        result = await runner.run(attempt({"success": False}, 0.01), attempt(COMPLETE, 0.01))
+
+        assert result["hedge"]["winner"] == "fallback"
+        assert not result["hedge"]["hedged"]
+        assert runner.stats["fallbacks"] == 1
+
+    @pytest.mark.asyncio
+    async def test_primary_exception_is_reported_as_failure(self):
+        async def boom():
+            raise RuntimeError("browser crashed")
+
+        runner = HedgedRunner(fast_policy())
+        result = await runner.run(boom)
+
+        assert result["success"] is False
+        assert "browser crashed" in result["error"]
+
+
+class TestHybridHedging:
+    """The hybrid engine feeds hedged attempts to its router."""
+
+    @pytest.mark.asyncio
+    async def test_cancelled_loser_is_recorded_as_incomplete(self, monkeypatch):
+        from bob.extractors.hybrid_optimized import HybridExtractorOptimized
+        from bob.utils.engine_router import ENGINE_PLAYWRIGHT, ENGINE_SELENIUM, classify_input
+
+        extractor = HybridExtractorOptimized(use_cache=False, selenium_workers=1, hedging=fast_policy())
+        extractor.selenium_enabled = True
+
+        async def slow_playwright(url, include_reviews, max_reviews, projection=None):
+            await asyncio.sleep(5)
+            return COMPLETE
+
+        def selenium(url, include_reviews, max_reviews, extractor=None, projection=None):
+            return dict(COMPLETE)
+
+        monkeypatch.setattr(extractor, "_extract_with_playwright_optimized", slow_playwright)
+        monkeypatch.setattr(extractor, "_extract_with_selenium_optimized", selenium)
+
+        result = await extractor.extract_business_async("Test Cafe")
+
+        shape = classify_input("Test Cafe")
+        loser = extractor.router._estimate(ENGINE_PLAYWRIGHT, shape)
+        assert result["extraction_engine"] == ENGINE_SELENIUM
+        assert loser.attempts == 1 and loser.completes == 0
+        assert loser.total_seconds > 0
+        assert extractor.router._estimate(ENGINE_SELENIUM, shape).completes == 1
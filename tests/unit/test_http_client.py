@@ -0,0 +1,139 @@
+"""
+BOB Google Maps v4.3.1 - HTTP Client Unit Tests
+
+Tests for AsyncHTTPClient against a local HTTP server: fetching, the
+response byte cap, per-host connection limits, errors, and email
+extraction on top of the client.
+"""
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from bob.utils.email_extractor import extract_emails_from_website, extract_emails_from_website_async
+from bob.utils.http_client import AIOHTTP_AVAILABLE, AsyncHTTPClient, HTTPClientConfig
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def do_GET(self):
+        cls = type(self)
+        with cls.lock:
+            cls.active += 1
+            cls.peak = max(cls.peak, cls.active)
+        try:
+            if self.path == "/contact":
+                body = b"<a href='mailto:hello@bluebottlecoffee.com'>Email us</a>"
+            elif self.path == "/big":
+                body = b"x" * 200_000
+            elif self.path == "/slow":
+                time.sleep(0.1)
+                body = b"ok"
+            else:
+                self.send_response(404)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        finally:
+            with cls.lock:
+                cls.active -= 1
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+
+
+BACKENDS = [
+    "requests",
+    pytest.param("aiohttp", marks=pytest.mark.skipif(not AIOHTTP_AVAILABLE, reason="aiohttp not installed")),
+]
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+class TestAsyncHTTPClient:
+    """Test suite for AsyncHTTPClient (each backend)."""
+
+    @pytest.mark.asyncio
+    async def test_fetch_page(self, server, backend):
+        async with AsyncHTTPClient(backend=backend) as client:
+            page = await client.fetch(f"{server}/contact")
+
+        assert page.ok
+        assert "hello@bluebottlecoffee.com" in page.text
+        assert page.content_type.startswith("text/html")
+        assert not page.truncated
+
+    @pytest.mark.asyncio
+    async def test_body_is_capped(self, server, backend):
+        async with AsyncHTTPClient(HTTPClientConfig(max_body_bytes=1000), backend=backend) as client:
+            page = await client.fetch(f"{server}/big")
+
+        assert page.ok
+        assert page.bytes_read == 1000
+        assert page.truncated
+        assert client.get_stats()["truncated"] == 1
+
+    @pytest.mark.asyncio
+    async def test_per_host_limit(self, server, backend):
+        Handler.peak = 0
+        async with AsyncHTTPClient(HTTPClientConfig(max_per_host=2), backend=backend) as client:
+            pages = await client.fetch_many([f"{server}/slow"] * 6)
+
+        assert all(page.ok for page in pages)
+        assert Handler.peak <= 2
+
+    @pytest.mark.asyncio
+    async def test_errors_are_reported_not_raised(self, server, backend):
+        async with AsyncHTTPClient(HTTPClientConfig(timeout=2), backend=backend) as client:
+            missing = await client.fetch(f"{server}/missing")
+            refused = await client.fetch("http://127.0.0.1:9/")
+
+        assert missing.status == 404 and not missing.ok
+        assert refused.error and not refused.ok
+        assert client.get_stats()["errors"] == 2
+
+    @pytest.mark.asyncio
+    async def test_consumer_can_stop_download(self, server, backend):
+        chunks = []
+        async with AsyncHTTPClient(backend=backend) as client:
+            page = await client.fetch(f"{server}/big", consumer=lambda text: chunks.append(text) or True)
+
+        assert page.ok and page.stopped_early
+        assert page.text == ""
+        assert len(chunks) == 1 and page.bytes_read < 200_000
+
+    @pytest.mark.asyncio
+    async def test_email_extraction(self, server, backend):
+        async with AsyncHTTPClient(backend=backend) as client:
+            emails = await extract_emails_from_website_async(f"{server}/contact", client=client, cache=False)
+
+        assert emails == ["hello@bluebottlecoffee.com"]
+
+
+def test_blocking_email_extraction(server):
+    assert extract_emails_from_website(f"{server}/contact", cache=False) == ["hello@bluebottlecoffee.com"]
+    assert extract_emails_from_website("https://www.google.com/viewer/chooseprovider?mid=/g/1", cache=False) == []
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        AsyncHTTPClient(backend="curl")
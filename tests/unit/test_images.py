@@ -0,0 +1,84 @@
+"""
+BOB Google Maps v4.3.1 - Image Extractor Unit Tests
+
+Tests for the single-sweep AdvancedImageExtractor: one call per UI
+state, early stop at the target count and per-phase timing.
+"""
+
+from bob.utils.images import AdvancedImageExtractor
+
+
+def photo(n):
+    return f"https://lh3.googleusercontent.com/p/PHOTO{n}=w400-h300-k-no"
+
+
+class FakeDriver:
+    """Page with `immediate` photos, plus more behind each UI state."""
+
+    def __init__(self, immediate, gallery=(), photos_tab=(), scroll_pages=()):
+        self.immediate = list(immediate)
+        self.gallery = list(gallery)
+        self.photos_tab = list(photos_tab)
+        self.scroll_pages = [list(page) for page in scroll_pages]
+        self.calls = []
+
+    def execute_script(self, script, root_selector):
+        self.calls.append("scan")
+        return self.immediate + ["https://maps.gstatic.com/mapslogo.png"]
+
+    def execute_async_script(self, script, openers, indicators, text_fallback, scroll_selectors, timeout_ms):
+        if scroll_selectors:
+            self.calls.append("scroll")
+            if not self.scroll_pages:
+                return {"opened": None, "scrolled": False, "urls": []}
+            self.immediate += self.scroll_pages.pop(0)
+            return {"opened": None, "scrolled": True, "urls": self.immediate}
+        if text_fallback:
+            self.calls.append("photos_tab")
+            self.immediate += self.photos_tab
+            return {"opened": "button:photo", "scrolled": False, "urls": self.immediate}
+        self.calls.append("gallery")
+        if not self.gallery:
+            return {"opened": None, "scrolled": False, "urls": []}
+        self.immediate += self.gallery
+        return {"opened": openers[0], "scrolled": False, "urls": self.immediate}
+
+
+class TestAdvancedImageExtractor:
+    """Test suite for AdvancedImageExtractor."""
+
+    def test_stops_once_target_is_reached(self):
+        driver = FakeDriver(immediate=[photo(i) for i in range(5)], gallery=[photo(9)])
+        result = AdvancedImageExtractor(driver, target_images=5).extract_all_images_comprehensive()
+
+        assert driver.calls == ["scan"]
+        assert result["image_count"] == 5
+        assert set(result["image_phase_seconds"]) == {"immediate"}
+
+    def test_escalates_through_states(self):
+        driver = FakeDriver(
+            immediate=[photo(1)],
+            gallery=[photo(2)],
+            photos_tab=[photo(3)],
+            scroll_pages=[[photo(4)], [photo(5)]],
+        )
+        result = AdvancedImageExtractor(driver, target_images=5).extract_all_images_comprehensive()
+
+        assert driver.calls == ["scan", "gallery", "photos_tab", "scroll", "scroll"]
+        assert result["image_count"] == 5
+        assert set(result["image_phase_seconds"]) == {"immediate", "gallery", "photos_tab", "scroll"}
+        # High resolution: size suffix removed
+        assert "https://lh3.googleusercontent.com/p/PHOTO1" in result["photos"]
+
+    def test_scrolling_stops_when_nothing_new_loads(self):
+        driver = FakeDriver(immediate=[photo(1)], scroll_pages=[[], [], [photo(2)]])
+        result = AdvancedImageExtractor(driver, target_images=50).extract_all_images_comprehensive()
+
+        assert driver.calls.count("scroll") == 2
+        assert result["image_count"] == 1
+
+    def test_invalid_urls_are_filtered(self):
+        driver = FakeDriver(immediate=[photo(1)])
+        result = AdvancedImageExtractor(driver, target_images=1).extract_all_images_comprehensive()
+
+        assert result["photos"] == ["https://lh3.googleusercontent.com/p/PHOTO1"]
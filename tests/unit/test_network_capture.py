@@ -0,0 +1,99 @@
+"""
+BOB Google Maps v4.3.1 - Network Capture Unit Tests
+
+Tests for the bounded NetworkAPICapture: compiled URL rules, ring
+buffer eviction, lazy body parsing and byte caps.
+"""
+
+import json
+
+import pytest
+
+from bob.utils.network_capture import NetworkAPICapture
+
+
+PLACE_URL = "https://www.google.com/maps/preview/place?authuser=0&pb=!1m17"
+REVIEWS_URL = "https://www.google.com/maps/rpc/listugcposts?authuser=0&pb=!1m7"
+PHOTOS_URL = "https://www.google.com/maps/photometa/v1?authuser=0&pb=!1m4"
+
+
+class FakeResponse:
+    def __init__(self, url, payload=None, content_type="application/json; charset=UTF-8", content_length=None):
+        self.url = url
+        self.status = 200
+        self.payload = ")]}'\n" + json.dumps(payload if payload is not None else {"url": url})
+        self.headers = {"content-type": content_type}
+        if content_length is not None:
+            self.headers["content-length"] = str(content_length)
+        self.reads = 0
+
+    async def body(self):
+        self.reads += 1
+        return self.payload.encode()
+
+
+class TestNetworkAPICapture:
+    """Test suite for NetworkAPICapture."""
+
+    def test_compiled_rules(self):
+        capture = NetworkAPICapture()
+
+        assert capture.match(PLACE_URL) == "place"
+        assert capture.match(REVIEWS_URL) == "reviews"
+        assert capture.match(PHOTOS_URL) == "photos"
+        # Photo thumbnails and unrelated traffic are not captured
+        assert capture.match("https://lh5.googleusercontent.com/p/AF1Qip=w80-photo") is None
+        assert capture.match("https://www.google.com/maps/vt/pb=!1m5") is None
+
+    @pytest.mark.asyncio
+    async def test_bodies_are_read_lazily(self):
+        capture = NetworkAPICapture()
+        response = FakeResponse(PLACE_URL, payload=[None, ["Cafe", 4.5]])
+
+        capture.capture_response(response)
+        assert response.reads == 0
+
+        assert await capture.latest_json("place") == [None, ["Cafe", 4.5]]
+        assert await capture.latest_json("place") == [None, ["Cafe", 4.5]]
+        assert response.reads == 1
+        assert await capture.latest_json("reviews") is None
+
+    def test_skips_unparseable_content_types(self):
+        capture = NetworkAPICapture()
+        capture.capture_response(FakeResponse(PHOTOS_URL, content_type="image/jpeg"))
+
+        assert not capture.api_responses
+        assert capture.stats["skipped_content_type"] == 1
+
+    def test_ring_buffer_is_bounded(self):
+        capture = NetworkAPICapture(max_entries=3)
+        for n in range(5):
+            capture.capture_response(FakeResponse(f"{REVIEWS_URL}!{n}"))
+
+        assert len(capture.api_responses) == 3
+        assert capture.captured("reviews")[0].url.endswith("!2")
+        assert capture.stats["evicted"] == 2
+
+    @pytest.mark.asyncio
+    async def test_byte_caps(self):
+        capture = NetworkAPICapture(max_body_bytes=1000, max_job_bytes=40)
+        capture.capture_response(FakeResponse(PLACE_URL, content_length=5000))
+        assert await capture.latest_json("place") is None
+        assert capture.stats["over_budget"] == 1
+
+        capture.capture_response(FakeResponse(f"{REVIEWS_URL}!1", payload="x" * 20))
+        capture.capture_response(FakeResponse(f"{REVIEWS_URL}!2", payload="y" * 20))
+        assert await capture.all_json("reviews") == ["x" * 20]
+        assert capture.stats["over_budget"] == 2
+
+    @pytest.mark.asyncio
+    async def test_start_job_resets_buffer_and_budget(self):
+        capture = NetworkAPICapture(max_job_bytes=40)
+        capture.capture_response(FakeResponse(REVIEWS_URL, payload="x" * 20))
+        await capture.all_json("reviews")
+
+        capture.start_job()
+        capture.capture_response(FakeResponse(REVIEWS_URL, payload="y" * 20))
+
+        assert await capture.all_json("reviews") == ["y" * 20]
+        assert capture.get_stats()["buffered"] == 1
@@ -0,0 +1,120 @@
+"""
+BOB Google Maps v4.3.1 - Photo Harvester Unit Tests
+
+Tests for decoding gallery metadata responses and paging through them.
+Playwright pages and responses are replaced by small fakes.
+"""
+
+import json
+
+import pytest
+
+from bob.utils.photo_harvester import PhotoHarvester, decode_photometa, next_page_url
+
+
+def photo_id(n):
+    return f"AF1QipN{n:03d}abcdefghijklmnopqrstuvwxyz"
+
+
+def metadata_body(ids):
+    """Nested-list JSON behind the XSSI guard, like the Maps RPCs."""
+    entries = [[pid, None, [[f"https://lh5.googleusercontent.com/p/{pid}=w203-h152-k-no"]]] for pid in ids]
+    return ")]}'\n" + json.dumps([None, [entries, "token"]])
+
+
+LISTING_URL = "https://www.google.com/maps/rpc/photo/listentityphotos?pb=!1e3!5m45!2m2!1i0!2i10!3m3!1sen"
+
+
+class FakeResponse:
+    def __init__(self, url, body, content_type="application/json", ok=True):
+        self.url = url
+        self.body = body
+        self.headers = {"content-type": content_type}
+        self.ok = ok
+
+    async def text(self):
+        return self.body
+
+
+class FakeRequest:
+    def __init__(self, pages):
+        self.pages = pages
+        self.urls = []
+
+    async def get(self, url):
+        self.urls.append(url)
+        offset = int(url.split("!1i")[1].split("!")[0])
+        ids = self.pages.get(offset, [])
+        return FakeResponse(url, metadata_body(ids))
+
+
+class FakePage:
+    def __init__(self, pages):
+        self.request = FakeRequest(pages)
+        self.handlers = []
+
+    def on(self, event, handler):
+        self.handlers.append(handler)
+
+
+class TestDecodePhotometa:
+    """Test suite for decode_photometa."""
+
+    def test_decodes_ids_and_full_resolution_urls(self):
+        photos = decode_photometa(metadata_body([photo_id(1), photo_id(2)]))
+
+        assert list(photos) == [photo_id(1), photo_id(2)]
+        assert photos[photo_id(1)] == f"https://lh5.googleusercontent.com/p/{photo_id(1)}"
+
+    def test_falls_back_to_raw_text(self):
+        body = f'garbage "https:\\/\\/lh3.googleusercontent.com\\/p\\/{photo_id(7)}\\u003dw80" tail'
+
+        assert photo_id(7) in decode_photometa(body)
+
+    def test_next_page_url(self):
+        assert "!1i10!2i10" in next_page_url(LISTING_URL, 10)
+        assert next_page_url("https://www.google.com/maps/photometa/v1?pb=!1m4", 10) is None
+
+
+class TestPhotoHarvester:
+    """Test suite for PhotoHarvester."""
+
+    def test_url_predicate(self):
+        assert PhotoHarvester.matches(LISTING_URL)
+        assert PhotoHarvester.matches("https://www.google.com/maps/photometa/v1?pb=!1m4")
+        assert not PhotoHarvester.matches("https://lh5.googleusercontent.com/p/photo=w80")
+
+    @pytest.mark.asyncio
+    async def test_ignores_image_bodies(self):
+        harvester = PhotoHarvester(max_images=5)
+        await harvester.on_response(FakeResponse(LISTING_URL, "\x89PNG", content_type="image/png"))
+
+        assert harvester.stats["responses"] == 0
+
+    @pytest.mark.asyncio
+    async def test_pages_until_max_images(self):
+        pages = {
+            3: [photo_id(i) for i in range(3, 13)],
+            13: [photo_id(i) for i in range(13, 23)],
+        }
+        page = FakePage(pages)
+        harvester = PhotoHarvester(max_images=15)
+        harvester.attach(page)
+        await page.handlers[0](FakeResponse(LISTING_URL, metadata_body([photo_id(i) for i in range(3)])))
+
+        photos = await harvester.harvest(page, open_gallery=False)
+
+        assert len(photos) == 15
+        assert harvester.stats["pages_requested"] == 2
+        assert "!1i3!2i10" in page.request.urls[0]
+
+    @pytest.mark.asyncio
+    async def test_stops_when_a_page_adds_nothing(self):
+        page = FakePage({})
+        harvester = PhotoHarvester(max_images=50)
+        harvester.ingest(metadata_body([photo_id(1)]), LISTING_URL)
+
+        photos = await harvester.harvest(page, open_gallery=False)
+
+        assert len(photos) == 1
+        assert harvester.stats["pages_requested"] == 1
@@ -0,0 +1,80 @@
+"""
+BOB Google Maps v4.3.1 - Field Projection Unit Tests
+
+Tests for FieldProjection: alias resolution, stage pruning, result
+trimming and cache coverage.
+"""
+
+import pytest
+
+from bob.utils.parallel_extractor import ParallelConfig
+from bob.utils.projection import FieldProjection
+
+
+class TestFieldProjection:
+    """Test suite for FieldProjection."""
+
+    def test_default_is_everything(self):
+        projection = FieldProjection()
+
+        assert projection.is_full
+        assert projection.needs("reviews") and projection.needs("scroll")
+        assert projection.dom_fields() is None
+
+    def test_aliases_and_name_always_included(self):
+        projection = FieldProjection("phone, gps, photos")
+
+        assert projection.fields == {"name", "phone", "latitude", "longitude", "images"}
+        assert projection.wants("review_count") is False
+        assert projection.wants("photos")
+
+    def test_emails_bring_the_website(self):
+        projection = FieldProjection(["email"])
+
+        assert projection.fields == {"name", "emails", "website"}
+        assert projection.dom_fields() == ["name", "website"]
+
+    def test_unknown_field_is_rejected(self):
+        with pytest.raises(ValueError):
+            FieldProjection(["phone", "fax"])
+        with pytest.raises(ValueError):
+            ParallelConfig(fields=["fax"])
+
+    def test_stages_serving_no_requested_field_are_skipped(self):
+        projection = FieldProjection(["phone", "website"])
+
+        assert projection.needs("fields")
+        for stage in ("images", "photos", "reviews", "email", "scroll", "place_id"):
+            assert not projection.needs(stage)
+        assert projection.dom_fields() == ["name", "phone", "website"]
+        assert FieldProjection(["hours"]).needs("scroll")
+
+    def test_apply_drops_unrequested_fields_and_keeps_metadata(self):
+        data = {
+            "success": True,
+            "name": "Cafe",
+            "phone": "+1 555",
+            "website": "https://cafe.com",
+            "review_count": 12,
+            "photos": ["p1"],
+            "place_id_hex": "0x1:0x2",
+            "extraction_time_seconds": 3.2,
+        }
+        FieldProjection(["phone"]).apply(data)
+
+        assert data == {
+            "success": True,
+            "name": "Cafe",
+            "phone": "+1 555",
+            "extraction_time_seconds": 3.2,
+            "fields": ["name", "phone"],
+        }
+
+    def test_cache_coverage(self):
+        full_record = {"name": "Cafe", "phone": "+1 555"}
+        projected_record = {"name": "Cafe", "phone": "+1 555", "fields": ["name", "phone"]}
+
+        assert FieldProjection(["website"]).covered_by(full_record)
+        assert FieldProjection(["phone"]).covered_by(projected_record)
+        assert not FieldProjection(["website"]).covered_by(projected_record)
+        assert not FieldProjection().covered_by(projected_record)
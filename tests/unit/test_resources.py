@@ -0,0 +1,119 @@
+"""
+BOB Google Maps v4.3.1 - Resource Sampler Unit Tests
+
+Tests for cgroup v2 parsing and process-tree resource snapshots.
+"""
+
+import subprocess
+import sys
+
+from bob.utils.resources import ResourceSampler, ResourceSnapshot, read_cgroup_limits
+
+
+MB = 1024 * 1024
+
+
+def write_cgroup(path, memory_max="max", memory_current=None, cpu_max="max 100000"):
+    """Populate a fake cgroup v2 directory."""
+    (path / "memory.max").write_text(f"{memory_max}\n")
+    if memory_current is not None:
+        (path / "memory.current").write_text(f"{memory_current}\n")
+    (path / "cpu.max").write_text(f"{cpu_max}\n")
+
+
+def make_snapshot(**overrides):
+    settings = dict(
+        timestamp=0.0,
+        python_rss_mb=100.0,
+        browser_rss_mb=600.0,
+        browser_processes=6,
+        cpu_percent=50.0,
+        host_used_mb=8000.0,
+        host_total_mb=16000.0,
+    )
+    settings.update(overrides)
+    return ResourceSnapshot(**settings)
+
+
+class TestReadCgroupLimits:
+    """Test suite for read_cgroup_limits."""
+
+    def test_limited_container(self, tmp_path):
+        write_cgroup(tmp_path, memory_max=2048 * MB, memory_current=512 * MB, cpu_max="150000 100000")
+        limits = read_cgroup_limits(str(tmp_path))
+
+        assert limits["memory_limit_mb"] == 2048
+        assert limits["memory_current_mb"] == 512
+        assert limits["cpu_limit"] == 1.5
+
+    def test_unlimited_container(self, tmp_path):
+        write_cgroup(tmp_path, memory_current=512 * MB)
+        limits = read_cgroup_limits(str(tmp_path))
+
+        assert limits["memory_limit_mb"] is None
+        assert limits["cpu_limit"] is None
+        assert limits["memory_current_mb"] == 512
+
+    def test_missing_cgroup(self, tmp_path):
+        limits = read_cgroup_limits(str(tmp_path / "absent"))
+        assert limits == {"memory_limit_mb": None, "memory_current_mb": None, "cpu_limit": None}
+
+
+class TestResourceSnapshot:
+    """Effective limits: cgroup when set, host otherwise."""
+
+    def test_host_limits_without_cgroup(self):
+        snapshot = make_snapshot()
+
+        assert snapshot.tree_rss_mb == 700
+        assert snapshot.memory_percent == 50
+
+    def test_cgroup_limit_takes_precedence(self):
+        snapshot = make_snapshot(cgroup_memory_limit_mb=2000.0, cgroup_memory_current_mb=1500.0)
+
+        assert snapshot.memory_used_mb == 1500
+        assert snapshot.memory_total_mb == 2000
+        assert snapshot.memory_percent == 75
+
+
+class TestResourceSampler:
+    """Test suite for ResourceSampler."""
+
+    def test_counts_child_processes(self, tmp_path):
+        sampler = ResourceSampler(interval=0.05, cgroup_root=str(tmp_path))
+        child = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(5)"])
+        try:
+            snapshot = sampler.sample()
+        finally:
+            child.kill()
+            child.wait()
+
+        assert snapshot.browser_processes >= 1
+        assert snapshot.browser_rss_mb > 0
+        assert snapshot.tree_rss_mb > snapshot.python_rss_mb
+        assert sampler.peak_tree_rss_mb >= snapshot.tree_rss_mb
+
+    def test_background_thread_refreshes_snapshot(self, tmp_path):
+        sampler = ResourceSampler(interval=0.05, cgroup_root=str(tmp_path)).start()
+        try:
+            first = sampler.snapshot()
+            for _ in range(50):
+                if sampler.samples > 2:
+                    break
+                subprocess.run([sys.executable, "-c", "pass"])
+            assert sampler.samples > 1
+            assert sampler.snapshot().timestamp >= first.timestamp
+        finally:
+            sampler.stop()
+
+        assert not sampler.running
+
+    def test_memory_probe_matches_snapshot(self, tmp_path):
+        write_cgroup(tmp_path, memory_max=4096 * MB, memory_current=1024 * MB)
+        sampler = ResourceSampler(cgroup_root=str(tmp_path))
+
+        used_mb, total_mb = sampler.memory_probe()
+
+        assert used_mb == 1024
+        assert total_mb <= 4096
+        assert sampler.memory_percent() > 0
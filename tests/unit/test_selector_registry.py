@@ -0,0 +1,64 @@
+"""
+BOB Google Maps v4.3.1 - Selector Registry Unit Tests
+
+Tests for the shared selector hit-rate registry: default loading,
+reordering by hit rate, decay and persistence across workers.
+"""
+
+import json
+
+from bob.utils.selector_registry import SelectorRegistry
+
+
+class TestSelectorRegistry:
+    """Test suite for SelectorRegistry."""
+
+    def test_defaults_load_from_package_data(self):
+        registry = SelectorRegistry()
+
+        assert registry.ordered("playwright", "name")[0] == "h1.DUwDvf"
+        assert "price_range" in registry.ordered_map("selenium")
+        assert "price_range" not in registry.ordered_map("playwright")
+
+    def test_reorders_by_hit_rate(self):
+        registry = SelectorRegistry()
+        defaults = registry.ordered("selenium", "address")
+
+        for _ in range(5):
+            registry.record_attempts("address", defaults[:2], winner=defaults[1])
+
+        ordered = registry.ordered("selenium", "address")
+        assert ordered[0] == defaults[1]
+        assert ordered[-1] == defaults[0]
+        assert registry.stats["reorders"] == 1
+
+    def test_counts_decay_to_recent_window(self):
+        registry = SelectorRegistry(window=10)
+        for _ in range(11):
+            registry.record("name", "h1", hit=False)
+
+        entry = registry.counts["name|h1"]
+        assert entry["hits"] + entry["misses"] <= 10
+
+    def test_counts_are_shared_across_engines(self):
+        registry = SelectorRegistry()
+        registry.record("rating", ".MW4etd", hit=True)
+
+        assert registry.score("rating", ".MW4etd") > 0.5
+
+    def test_flush_merges_workers(self, tmp_path):
+        stats_file = tmp_path / "selector_stats.json"
+        first = SelectorRegistry(stats_file=stats_file, flush_every=1000)
+        second = SelectorRegistry(stats_file=stats_file, flush_every=1000)
+
+        first.record("phone", "[data-item-id*='phone']", hit=True)
+        second.record("phone", "[data-item-id*='phone']", hit=True)
+        second.record("phone", ".RcCsl", hit=False)
+        first.flush()
+        second.flush()
+
+        counts = json.loads(stats_file.read_text())["counts"]
+        assert counts["phone|[data-item-id*='phone']"]["hits"] == 2
+        assert counts["phone|.RcCsl"]["misses"] == 1
+        # A new worker starts from the merged history
+        assert SelectorRegistry(stats_file=stats_file).counts == counts
@@ -0,0 +1,175 @@
+"""
+BOB Google Maps v4.3.1 - Selenium Session Pool Unit Tests
+
+Tests for warm WebDriver reuse. Drivers are small fakes so no Chrome
+binary is needed.
+"""
+
+import threading
+
+import pytest
+
+from bob.extractors.selenium_pool import SeleniumSessionPool
+
+
+class FakeSwitch:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def window(self, handle):
+        self.driver.current = handle
+
+
+class FakeDriver:
+    def __init__(self):
+        self.handles = ["main"]
+        self.current = "main"
+        self.cookies_cleared = 0
+        self.url = None
+        self.quit_called = False
+        self.switch_to = FakeSwitch(self)
+
+    @property
+    def window_handles(self):
+        if self.quit_called:
+            raise RuntimeError("invalid session id")
+        return list(self.handles)
+
+    def close(self):
+        self.handles.remove(self.current)
+
+    def execute_cdp_cmd(self, command, params):
+        if command == "Network.clearBrowserCookies":
+            self.cookies_cleared += 1
+
+    def get(self, url):
+        self.url = url
+
+    def quit(self):
+        self.quit_called = True
+
+
+def make_pool(**overrides):
+    drivers = []
+
+    def factory():
+        driver = FakeDriver()
+        drivers.append(driver)
+        return driver
+
+    settings = dict(max_sessions=2)
+    settings.update(overrides)
+    return SeleniumSessionPool(factory, **settings), drivers
+
+
+class TestSeleniumSessionPool:
+    """Test suite for SeleniumSessionPool."""
+
+    def test_reuses_and_resets_driver(self):
+        pool, drivers = make_pool()
+
+        with pool.session() as driver:
+            driver.handles.append("popup")
+        with pool.session() as second:
+            pass
+
+        assert second is driver
+        assert len(drivers) == 1
+        assert driver.handles == ["main"]
+        assert driver.cookies_cleared == 2
+        assert driver.url == "about:blank"
+        assert pool.get_stats()["reuses"] == 1
+
+    def test_dead_session_is_recycled(self):
+        pool, drivers = make_pool()
+
+        with pool.session() as driver:
+            driver.quit()
+        with pool.session() as replacement:
+            pass
+
+        assert replacement is not driver
+        assert len(drivers) == 2
+        assert pool.stats["health_failures"] == 1
+
+    def test_recycles_after_max_uses(self):
+        pool, drivers = make_pool(max_uses=2)
+        for _ in range(3):
+            with pool.session():
+                pass
+
+        assert len(drivers) == 2
+        assert drivers[0].quit_called
+
+    def test_discard_quits_driver(self):
+        pool, drivers = make_pool()
+        lease = pool.acquire()
+        pool.release(lease, discard=True)
+
+        assert drivers[0].quit_called
+        assert pool.get_stats()["idle"] == 0
+
+    def test_max_sessions_bounds_live_drivers(self):
+        pool, drivers = make_pool(max_sessions=1)
+        lease = pool.acquire()
+
+        with pytest.raises(TimeoutError):
+            pool.acquire(timeout=0.05)
+
+        releaser = threading.Timer(0.05, pool.release, args=(lease,))
+        releaser.start()
+        second = pool.acquire(timeout=2)
+        releaser.join()
+
+        assert second.driver is drivers[0]
+        assert len(drivers) == 1
+
+    def test_close_quits_idle_drivers(self):
+        pool, drivers = make_pool()
+        with pool.session():
+            pass
+        pool.close()
+
+        assert drivers[0].quit_called
+        with pytest.raises(RuntimeError):
+            pool.acquire()
+
+    def test_trim_quits_idle_drivers_only(self):
+        pool, drivers = make_pool()
+        with pool.session():
+            pass
+        lease = pool.acquire()          # Reuses drivers[0]
+        with pool.session():            # Launches drivers[1], idle afterwards
+            pass
+
+        assert pool.trim() == 1
+        assert drivers[1].quit_called and not drivers[0].quit_called
+        pool.release(lease)
+        assert pool.get_stats()["idle"] == 1
+
+    def test_idle_drivers_are_pruned_outside_the_lock(self):
+        pool, drivers = make_pool(max_idle_seconds=0)
+        with pool.session():
+            pass
+        lock_free = []
+
+        def probe():
+            acquired = pool._condition.acquire(timeout=1)
+            lock_free.append(acquired)
+            if acquired:
+                pool._condition.release()
+
+        def quit_and_probe():
+            # Another thread must be able to take the pool lock while Chrome shuts down
+            thread = threading.Thread(target=probe)
+            thread.start()
+            thread.join()
+            drivers[0].quit_called = True
+
+        drivers[0].quit = quit_and_probe
+        with pool.session() as driver:
+            pass
+
+        assert driver is drivers[1]
+        assert lock_free == [True]
+        assert drivers[0].quit_called
@@ -0,0 +1,110 @@
+"""
+BOB Google Maps v4.3.1 - SmartElementFinder Unit Tests
+
+Tests for batched field harvesting: strategy plans, the single
+execute_script round trip and the per-field fallback.
+"""
+
+import pytest
+
+from bob.extractors.selenium import BATCH_FIELDS_SCRIPT, SmartElementFinder
+from bob.utils.selector_registry import SelectorRegistry
+
+
+FIELD_CONFIGS = {
+    "name": {"selectors": [".DUwDvf", "h1"], "xpath": ["//h1"], "text": None},
+    "phone": {"selectors": ["[data-item-id*='phone']"], "xpath": None, "text": None},
+}
+
+
+class FakeElement:
+    def __init__(self, text):
+        self.text = text
+
+    def get_attribute(self, name):
+        return None
+
+
+class FakeDriver:
+    def __init__(self, batch_result=None, fail_script=False):
+        self.batch_result = batch_result or {}
+        self.fail_script = fail_script
+        self.scripts = []
+        self.find_calls = 0
+
+    def execute_script(self, script, *args):
+        self.scripts.append((script, args))
+        if self.fail_script:
+            raise RuntimeError("javascript error")
+        return self.batch_result
+
+    def find_element(self, by, value):
+        self.find_calls += 1
+        if value == ".DUwDvf":
+            return FakeElement("Test Cafe")
+        raise LookupError(value)
+
+    def find_elements(self, by, value):
+        self.find_calls += 1
+        return []
+
+
+@pytest.fixture
+def registry():
+    return SelectorRegistry()  # In-memory: nothing persisted
+
+
+class TestSmartElementFinder:
+    """Test suite for SmartElementFinder batched mode."""
+
+    def test_plan_keeps_strategy_order(self, registry):
+        finder = SmartElementFinder(FakeDriver(), registry=registry)
+        finder.selector_success_cache["phone"] = ".cached"
+
+        plan = finder.build_strategy_plan("phone", [".a", ".cached"], ["//a"], ["Call"])
+
+        assert [step["type"] for step in plan] == ["css", "css", "xpath", "text", "aria", "aria", "aria", "js"]
+        assert plan[0]["value"] == ".cached"
+        assert plan[1]["value"] == ".a"
+
+    def test_batched_mode_uses_one_round_trip(self, registry):
+        driver = FakeDriver(batch_result={
+            "name": {"value": " Test Cafe ", "strategy": "css:.DUwDvf"},
+            "phone": {"value": "+1 555 0100", "strategy": "aria:phone"},
+        })
+        finder = SmartElementFinder(driver, registry=registry)
+
+        results = finder.find_fields(FIELD_CONFIGS)
+
+        assert results == {"name": "Test Cafe", "phone": "+1 555 0100"}
+        assert len(driver.scripts) == 1
+        assert driver.scripts[0][0] == BATCH_FIELDS_SCRIPT
+        assert set(driver.scripts[0][1][0]) == {"name", "phone"}
+        assert driver.find_calls == 0
+        assert finder.winning_strategies["phone"] == "aria:phone"
+        # CSS winners feed the selector cache like per-field mode
+        assert finder.selector_success_cache == {"name": ".DUwDvf"}
+        # ...and the shared registry: ".DUwDvf" hit, nothing else tried for name
+        assert registry.counts["name|.DUwDvf"]["hits"] == 1
+        assert registry.counts["phone|[data-item-id*='phone']"]["misses"] == 1
+
+    def test_missing_fields_are_none(self, registry):
+        finder = SmartElementFinder(FakeDriver(batch_result={"name": None}), registry=registry)
+
+        assert finder.find_fields(FIELD_CONFIGS) == {"name": None, "phone": None}
+
+    def test_falls_back_to_per_field_strategies(self, registry):
+        driver = FakeDriver(fail_script=True)
+        finder = SmartElementFinder(driver, registry=registry)
+
+        results = finder.find_fields(FIELD_CONFIGS)
+
+        assert results["name"] == "Test Cafe"
+        assert driver.find_calls > 0
+
+    def test_unbatched_mode_skips_script(self, registry):
+        driver = FakeDriver()
+        finder = SmartElementFinder(driver, batched=False, registry=registry)
+
+        assert finder.find_fields({"name": FIELD_CONFIGS["name"]}) == {"name": "Test Cafe"}
+        assert driver.scripts == []
@@ -0,0 +1,175 @@
+"""
+BOB Google Maps v4.3.1 - Stage Graph Unit Tests
+
+Tests for StageGraph: dependency order, concurrent independent stages,
+serialized shared resources, failure handling and reuse of finished
+stage outputs.
+"""
+
+import threading
+import time
+
+import pytest
+
+from bob.utils.stages import StageGraph
+
+
+class Recorder:
+    """Stage functions that log start/end and track overlap per resource."""
+
+    def __init__(self):
+        self.events = []
+        self.active = set()
+        self.overlaps = []
+        self.lock = threading.Lock()
+
+    def stage(self, name, output=None, seconds=0.05, error=None):
+        def run(results):
+            with self.lock:
+                if self.active:
+                    self.overlaps.append((name, set(self.active)))
+                self.active.add(name)
+                self.events.append(f"start:{name}")
+            time.sleep(seconds)
+            with self.lock:
+                self.active.discard(name)
+                self.events.append(f"end:{name}")
+            if error:
+                raise error
+            return output if output is not None else name
+        return run
+
+
+def extraction_graph(recorder, reviews_error=None):
+    graph = StageGraph()
+    graph.add("navigate", recorder.stage("navigate"), resource="driver", required=True)
+    graph.add("core", recorder.stage("core", {"website": "https://cafe.com"}),
+              after=["navigate"], resource="driver", required=True)
+    graph.add("images", recorder.stage("images"), after=["core"], resource="driver")
+    graph.add("reviews", recorder.stage("reviews", error=reviews_error), after=["core"], resource="driver")
+    graph.add("emails", recorder.stage("emails", seconds=0.15), after=["core"])
+    return graph
+
+
+class TestStageGraph:
+    """Test suite for StageGraph."""
+
+    def test_independent_stage_runs_alongside_driver_stages(self):
+        recorder = Recorder()
+        run = extraction_graph(recorder).run()
+
+        assert run.ok
+        assert run.results["core"] == {"website": "https://cafe.com"}
+        assert set(run.timings) == {"navigate", "core", "images", "reviews", "emails"}
+        # Emails overlapped with driver work; driver stages never overlapped each other
+        assert any(name == "emails" or "emails" in active for name, active in recorder.overlaps)
+        for name, active in recorder.overlaps:
+            assert not ({name} | active) >= {"images", "reviews"}
+        assert recorder.events.index("end:core") < recorder.events.index("start:emails")
+
+    def test_optional_failure_keeps_other_outputs(self):
+        run = extraction_graph(Recorder(), reviews_error=RuntimeError("scroll failed")).run()
+
+        assert run.ok
+        assert run.errors == {"reviews": "scroll failed"}
+        assert "images" in run.results and "emails" in run.results
+        assert run.to_dict()["stage_errors"] == {"reviews": "scroll failed"}
+
+    def test_required_failure_skips_dependents(self):
+        recorder = Recorder()
+        graph = StageGraph()
+        graph.add("navigate", recorder.stage("navigate", error=TimeoutError("no page")), required=True)
+        graph.add("core", recorder.stage("core"), after=["navigate"])
+
+        run = graph.run()
+
+        assert not run.ok
+        assert run.skipped == ["core"]
+        with pytest.raises(TimeoutError):
+            run.raise_for_failure()
+
+    def test_completed_stages_are_not_rerun(self):
+        recorder = Recorder()
+        run = extraction_graph(recorder).run(completed={"navigate": None, "core": {"website": None}})
+
+        assert "start:navigate" not in recorder.events
+        assert "start:core" not in recorder.events
+        assert run.reused == ["navigate", "core"]
+        assert run.results["core"] == {"website": None}
+
+    def test_unknown_dependency_is_rejected(self):
+        with pytest.raises(ValueError):
+            StageGraph().add("core", lambda results: None, after=["navigate"])
+
+
+class TestSeleniumStageGraph:
+    """SeleniumExtractor's stage graph, with the browser work faked."""
+
+    def make_extractor(self, monkeypatch, defer_enrichment=False):
+        from bob.extractors.selenium import SeleniumExtractor
+
+        extractor = SeleniumExtractor(reuse_sessions=False, defer_enrichment=defer_enrichment)
+        events = []
+
+        def stage(name, value, seconds=0.0):
+            def run(*args):
+                events.append(f"start:{name}")
+                time.sleep(seconds)
+                events.append(f"end:{name}")
+                return value
+            return run
+
+        monkeypatch.setattr(extractor, "_create_browser_session", lambda: object())
+        monkeypatch.setattr(extractor, "_cleanup_browser_safely", lambda driver: None)
+        monkeypatch.setattr(extractor, "_stage_navigate", stage("navigate", None))
+        monkeypatch.setattr(extractor, "_stage_core", stage("core", {"name": "Cafe", "website": "https://cafe.com"}))
+        monkeypatch.setattr(extractor, "_stage_images", stage("images", {"photos": []}, 0.1))
+        monkeypatch.setattr(extractor, "_extract_reviews_enhanced", stage("reviews", [{"text": "Nice"}], 0.1))
+        monkeypatch.setattr(extractor, "_stage_emails", stage("emails", ["hello@cafe.com"], 0.15))
+        return extractor, events
+
+    def test_emails_run_alongside_driver_stages_and_are_returned(self, monkeypatch):
+        extractor, events = self.make_extractor(monkeypatch)
+
+        data = extractor.extract_business("Cafe", max_reviews=1)
+
+        assert extractor.enrichment is None
+        assert data["emails"] == ["hello@cafe.com"]
+        assert "enrichment_pending" not in data
+        # The email fetch overlaps the driver stages, which stay serialized
+        assert events.index("start:emails") < events.index("end:images")
+        driver_events = [e for e in events if e.endswith(("images", "reviews"))]
+        assert driver_events in (
+            ["start:images", "end:images", "start:reviews", "end:reviews"],
+            ["start:reviews", "end:reviews", "start:images", "end:images"],
+        )
+
+    def test_deferred_emails_are_merged_after_the_driver_is_released(self, monkeypatch):
+        from bob.utils.enrichment import EnrichmentQueue, wants_emails
+
+        extractor, events = self.make_extractor(monkeypatch)
+
+        def fetch(data, timeout):
+            events.append("fetch:emails")
+            return {"emails": ["hello@cafe.com"]}
+
+        monkeypatch.setattr(extractor, "_cleanup_browser_safely", lambda driver: events.append("released"))
+        extractor.enrichment = EnrichmentQueue(tasks={"emails": (wants_emails, fetch)})
+
+        data = extractor.extract_business("Cafe", max_reviews=1)
+
+        assert data["emails"] == ["hello@cafe.com"]
+        assert "enrichment_pending" not in data
+        assert "start:emails" not in events
+        assert events.index("released") < events.index("fetch:emails")
+        extractor.enrichment.shutdown()
+
+    @pytest.mark.parametrize("configured", [True, False])
+    def test_deferral_follows_the_config_by_default(self, monkeypatch, configured):
+        from bob.config.settings import DEFAULT_EXTRACTOR_CONFIG
+        from bob.extractors.selenium import SeleniumExtractor
+
+        monkeypatch.setattr(DEFAULT_EXTRACTOR_CONFIG, "defer_enrichment", configured)
+
+        assert (SeleniumExtractor(reuse_sessions=False).enrichment is not None) is configured
+        assert SeleniumExtractor(reuse_sessions=False, defer_enrichment=False).enrichment is None
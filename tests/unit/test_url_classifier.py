@@ -0,0 +1,87 @@
+"""
+BOB Google Maps v4.3.1 - URL Classifier Unit Tests
+
+Tests for URLClassifier: categories, the domain suffix trie, Google
+redirects, email domains, and website selection on top of it.
+"""
+
+import pytest
+
+from bob.utils.url_classifier import (
+    BOOKING, DIRECT, GOOGLE_INTERNAL, INVALID, REDIRECT, REVIEW, SOCIAL,
+    DomainTrie, URLClassifier,
+)
+from bob.utils.website_extractor import _is_valid_business_url, extract_website_intelligent
+
+
+@pytest.fixture
+def classifier():
+    return URLClassifier()
+
+
+@pytest.mark.parametrize("url,category", [
+    ("https://www.bluebottlecoffee.com/", DIRECT),
+    ("https://8.8.8.8/", DIRECT),
+    ("https://m.facebook.com/bluebottle", SOCIAL),
+    ("https://www.instagram.com/bluebottle/", SOCIAL),
+    ("https://business.zomato.com/r/1", BOOKING),
+    ("https://www.tripadvisor.co.uk/Restaurant_Review", BOOKING),
+    ("https://uk.trustpilot.com/review/cafe.com", REVIEW),
+    ("https://www.google.com/viewer/chooseprovider?mid=/g/1", GOOGLE_INTERNAL),
+    ("https://maps.google.de/maps/place/Cafe", GOOGLE_INTERNAL),
+    ("https://www.google.co.in/search?q=cafe", GOOGLE_INTERNAL),
+    ("https://cafe.com/maps/reserve/1", GOOGLE_INTERNAL),
+    ("https://cafe.com/?ref=tripadvisor.com", DIRECT),
+    ("mailto:info@cafe.com", INVALID),
+    ("http://localhost:8000/", INVALID),
+    ("http://192.168.1.20/", INVALID),
+    ("www.cafe.com", INVALID),
+    ("", INVALID),
+])
+def test_categories(classifier, url, category):
+    assert classifier.classify(url).category == category
+
+
+class TestURLClassifier:
+    """Test suite for URLClassifier."""
+
+    def test_google_redirect_is_resolved(self, classifier):
+        item = classifier.classify("https://www.google.com/url?q=http://www.lallgarhpalace.com/&opi=89978449")
+        assert (item.category, item.url) == (REDIRECT, "http://www.lallgarhpalace.com/")
+
+        # A redirect to a social profile is a social profile
+        item = classifier.classify("https://www.google.com/url?q=https%3A%2F%2Fwww.facebook.com%2Fcafe")
+        assert (item.category, item.url) == (SOCIAL, "https://www.facebook.com/cafe")
+
+    def test_batch_keeps_order_and_caches(self, classifier):
+        urls = ["https://cafe.com/", "https://facebook.com/cafe"] * 50
+        items = classifier.classify_many(urls)
+
+        assert [item.category for item in items[:2]] == [DIRECT, SOCIAL]
+        assert len(items) == 100
+        assert classifier.classify.cache_info().misses == 2
+
+    def test_email_domains(self, classifier):
+        assert classifier.classify_host("zomato.com") == BOOKING
+        assert classifier.classify_host("localhost") == INVALID
+        assert classifier.classify_host("bluebottlecoffee.com") == DIRECT
+
+    def test_trie_matches_longest_suffix(self):
+        trie = DomainTrie({"social": ["facebook.com"], "booking": ["events.facebook.com"]})
+
+        assert trie.match("m.facebook.com") == "social"
+        assert trie.match("my.events.facebook.com") == "booking"
+        assert trie.match("notfacebook.com") is None
+        assert trie.match("com") is None
+
+
+def test_website_selection():
+    urls = [
+        "https://www.google.com/viewer/chooseprovider?mid=/g/1td74zyg",
+        "https://www.zomato.com/jaipur/cafe",
+        "https://www.google.com/url?q=http://www.lallgarhpalace.com/&opi=1",
+    ]
+    assert extract_website_intelligent("", urls) == "http://www.lallgarhpalace.com/"
+    assert extract_website_intelligent("", urls + ["https://lallgarhpalace.com/"]) == "https://lallgarhpalace.com/"
+    assert extract_website_intelligent("", urls[:2]) is None
+    assert not _is_valid_business_url("https://www.yelp.com/biz/cafe")
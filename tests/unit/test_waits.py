@@ -0,0 +1,142 @@
+"""
+BOB Google Maps v4.3.1 - Stage Wait Unit Tests
+
+Tests for the condition waits that replaced fixed sleeps in the
+Selenium extractors. WebDriver is replaced by a small fake.
+"""
+
+import subprocess
+import sys
+import time
+
+from bob.utils.place_id import PlaceIDExtractor
+from bob.utils.waits import StageWaiter, driver_pids, quit_and_wait
+
+
+class FakeDriver:
+    def __init__(self, appear_after=0.0, heights=None):
+        self.started = time.time()
+        self.appear_after = appear_after
+        self.heights = list(heights or [])
+        self.current_url = "https://www.google.com/maps/search/cafe"
+
+    def find_elements(self, by, css):
+        return ["element"] if time.time() - self.started >= self.appear_after else []
+
+    def execute_script(self, script, element):
+        return self.heights.pop(0) if len(self.heights) > 1 else self.heights[0]
+
+
+class TestStageWaiter:
+    """Test suite for StageWaiter."""
+
+    def test_returns_as_soon_as_element_appears(self):
+        waiter = StageWaiter(poll_interval=0.01)
+
+        assert waiter.element(FakeDriver(appear_after=0.05), "page_load", "h1") == "element"
+
+        stage = waiter.get_stats()["stages"]["page_load"]
+        assert stage["waits"] == 1
+        assert stage["timeouts"] == 0
+        assert stage["waited_seconds"] < 1
+
+    def test_timeout_is_recorded(self):
+        waiter = StageWaiter(timeouts={"page_load": 0.05}, poll_interval=0.01)
+
+        assert waiter.element(FakeDriver(appear_after=10), "page_load", "h1") is None
+        assert waiter.get_stats()["stages"]["page_load"]["timeouts"] == 1
+
+    def test_condition_errors_count_as_not_ready(self):
+        waiter = StageWaiter(poll_interval=0.01)
+        calls = {"n": 0}
+
+        def flaky():
+            calls["n"] += 1
+            if calls["n"] < 3:
+                raise RuntimeError("stale element")
+            return "ready"
+
+        assert waiter.until("expand", flaky) == "ready"
+
+    def test_url_change_with_fragment(self):
+        waiter = StageWaiter(poll_interval=0.01, timeouts={"place_navigation": 0.05})
+        driver = FakeDriver()
+        old = driver.current_url
+
+        assert waiter.url_change(driver, "place_navigation", old, contains="/place/") is None
+        driver.current_url = "https://www.google.com/maps/place/Cafe"
+        assert waiter.url_change(driver, "place_navigation", old, contains="/place/") == driver.current_url
+
+    def test_scroll_settles_when_height_stops_growing(self):
+        waiter = StageWaiter(poll_interval=0.01)
+        driver = FakeDriver(heights=[100, 200, 300, 300])
+
+        assert waiter.scroll_settled(driver, "scroll", object(), stable_polls=2)
+        assert waiter.get_stats()["stages"]["scroll"]["timeouts"] == 0
+
+
+
+class ShareDriver:
+    """Maps page whose share dialog fills its URL input after a delay."""
+
+    URL = "https://www.google.com/maps/place/Cafe/data=!1sChIJN1t_tDeuEmsRUsoyG83frY4"
+
+    def __init__(self, fill_after):
+        self.clicked = None
+        self.fill_after = fill_after
+
+    def find_element(self, by, css):
+        driver = self
+
+        class Element:
+            def click(self):
+                driver.clicked = driver.clicked or time.time()
+
+            def get_attribute(self, name):
+                filled = driver.clicked and time.time() - driver.clicked >= driver.fill_after
+                return driver.URL if filled else ""
+
+            def send_keys(self, keys):
+                pass
+
+        return Element()
+
+
+class TestShareDialogWait:
+    """Share URL extraction waits for the dialog instead of sleeping."""
+
+    def test_returns_once_share_url_is_filled(self):
+        waiter = StageWaiter(poll_interval=0.01)
+        extractor = PlaceIDExtractor(ShareDriver(fill_after=0.05), waiter)
+
+        started = time.time()
+        assert extractor._extract_from_share_url() == "ChIJN1t_tDeuEmsRUsoyG83frY4"
+        assert time.time() - started < 1
+
+        stage = waiter.get_stats()["stages"]["share_dialog"]
+        assert stage["waits"] == 1
+        assert stage["timeouts"] == 0
+
+class TestQuitAndWait:
+    """Driver shutdown waits for process exit."""
+
+    def test_waits_for_service_process(self):
+        process = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+
+        class Service:
+            pass
+
+        class Driver:
+            service = Service()
+
+            def quit(self):
+                process.terminate()
+
+        Driver.service.process = process
+        driver = Driver()
+        assert driver_pids(driver) == [process.pid]
+
+        waiter = StageWaiter(poll_interval=0.01)
+        assert quit_and_wait(driver, waiter)
+        assert waiter.get_stats()["stages"]["driver_exit"]["waited_seconds"] < 5
+        process.wait()